@@ -48,6 +48,7 @@ classes = [
     compositor.ui.NTPCompositorPanel,
     #geometry
     geometry.operator.NTPGeoNodesOperator,
+    geometry.operator.NTPGeoNodesBatchOperator,
     geometry.ui.NTPGeoNodesMenu,
     geometry.ui.NTPGeoNodesPanel,
     #material
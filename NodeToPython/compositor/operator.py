@@ -1,13 +1,14 @@
 import bpy
 
-from bpy.types import Node, CompositorNodeColorBalance, CompositorNodeTree
+from bpy.types import CompositorNodeTree
 
+from ..ntp_emitter import NTP_Emitter
 from ..ntp_operator import NTP_Operator, INDEX
 from ..ntp_node_tree import NTP_NodeTree
+from ..ntp_tree_ir import NTP_NodeIR
 from ..utils import *
 from ..node_settings import NTPNodeSetting, ST
-from io import StringIO
-from ..node_settings import node_settings
+from ..node_settings import filter_settings, get_node_settings
 
 SCENE = "scene"
 BASE_NAME = "base_name"
@@ -16,6 +17,36 @@ NODE = "node"
 
 COMP_OP_RESERVED_NAMES = {SCENE, BASE_NAME, END_NAME, NODE} 
 
+# Settings that are active for each color balance correction method
+COLOR_BALANCE_SETTINGS: dict[str, list[NTPNodeSetting]] = {
+    'LIFT_GAMMA_GAIN': [
+        NTPNodeSetting("correction_method", ST.ENUM),
+        NTPNodeSetting("gain",  ST.VEC3,  max_version_=(3, 5, 0)),
+        NTPNodeSetting("gain",  ST.COLOR, min_version_=(3, 5, 0)),
+        NTPNodeSetting("gamma", ST.VEC3,  max_version_=(3, 5, 0)),
+        NTPNodeSetting("gamma", ST.COLOR, min_version_=(3, 5, 0)),
+        NTPNodeSetting("lift",  ST.VEC3,  max_version_=(3, 5, 0)),
+        NTPNodeSetting("lift",  ST.COLOR, min_version_=(3, 5, 0))
+    ],
+    'OFFSET_POWER_SLOPE': [
+        NTPNodeSetting("correction_method", ST.ENUM),
+        NTPNodeSetting("offset", ST.VEC3,  max_version_=(3, 5, 0)),
+        NTPNodeSetting("offset", ST.COLOR, min_version_=(3, 5, 0)),
+        NTPNodeSetting("offset_basis", ST.FLOAT),
+        NTPNodeSetting("power", ST.VEC3,  max_version_=(3, 5, 0)),
+        NTPNodeSetting("power", ST.COLOR, min_version_=(3, 5, 0)),
+        NTPNodeSetting("slope", ST.VEC3,  max_version_=(3, 5, 0)),
+        NTPNodeSetting("slope", ST.COLOR, min_version_=(3, 5, 0))
+    ],
+    'WHITEPOINT': [
+        NTPNodeSetting("correction_method", ST.ENUM),
+        NTPNodeSetting("input_temperature", ST.FLOAT),
+        NTPNodeSetting("input_tint", ST.FLOAT),
+        NTPNodeSetting("output_temperature", ST.FLOAT),
+        NTPNodeSetting("output_tint", ST.FLOAT)
+    ]
+}
+
 class NTPCompositorOperator(NTP_Operator):
     bl_idname = "node.ntp_compositor"
     bl_label =  "Compositor to Python"
@@ -23,52 +54,56 @@ class NTPCompositorOperator(NTP_Operator):
     
     compositor_name: bpy.props.StringProperty(name="Node Group")
     is_scene : bpy.props.BoolProperty(name="Is Scene", description="Blender stores compositing node trees differently for scenes and in groups")
+    options_json: bpy.props.StringProperty(
+        name="Options JSON",
+        description="Options as a JSON object, used instead of the scene's "
+                    "NodeToPython options",
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
 
     def __init__(self):
         super().__init__()
-        self._node_infos = node_settings
+        # copied, since color balance settings are added per correction method
+        self._node_infos = dict(get_node_settings('CompositorNodeTree'))
         for name in COMP_OP_RESERVED_NAMES:
-            self._used_vars[name] = 0
+            self._identifiers.reserve(name)
 
 
     def _create_scene(self, indent_level: int):
         #TODO: wrap in more general unique name util function
-        self._write(f"# Generate unique scene name", indent_level)
-        self._write(f"{BASE_NAME} = {str_to_py_str(self.compositor_name)}",
-                    indent_level)
-        self._write(f"{END_NAME} = {BASE_NAME}", indent_level)
-        self._write(f"if bpy.data.scenes.get({END_NAME}) != None:", indent_level)
-
-        self._write(f"{INDEX} = 1", indent_level + 1)
-        self._write(f"{END_NAME} = {BASE_NAME} + f\".{{i:03d}}\"", 
-                    indent_level + 1)
-        self._write(f"while bpy.data.scenes.get({END_NAME}) != None:",
-                    indent_level + 1)
+        self._emitter.write(f"# Generate unique scene name", indent_level)
+        self._emitter.write(f"{BASE_NAME} = {str_to_py_str(self.compositor_name)}",
+                            indent_level)
+        self._emitter.write(f"{END_NAME} = {BASE_NAME}", indent_level)
+        self._emitter.write(f"if bpy.data.scenes.get({END_NAME}) != None:", indent_level)
+
+        self._emitter.write(f"{INDEX} = 1", indent_level + 1)
+        self._emitter.write(f"{END_NAME} = {BASE_NAME} + f\".{{i:03d}}\"", 
+                            indent_level + 1)
+        self._emitter.write(f"while bpy.data.scenes.get({END_NAME}) != None:",
+                            indent_level + 1)
         
-        self._write(f"{END_NAME} = {BASE_NAME} + f\".{{{INDEX}:03d}}\"", 
-                    indent_level + 2)
-        self._write(f"{INDEX} += 1\n", indent_level + 2)
+        self._emitter.write(f"{END_NAME} = {BASE_NAME} + f\".{{{INDEX}:03d}}\"", 
+                            indent_level + 2)
+        self._emitter.write(f"{INDEX} += 1\n", indent_level + 2)
 
-        self._write(f"{SCENE} = bpy.context.window.scene.copy()\n", indent_level) 
-        self._write(f"{SCENE}.name = {END_NAME}", indent_level)
-        self._write(f"{SCENE}.use_fake_user = True", indent_level)
-        self._write(f"bpy.context.window.scene = {SCENE}", indent_level)
+        self._emitter.write(f"{SCENE} = bpy.context.window.scene.copy()\n", indent_level) 
+        self._emitter.write(f"{SCENE}.name = {END_NAME}", indent_level)
+        self._emitter.write(f"{SCENE}.use_fake_user = True", indent_level)
+        self._emitter.write(f"bpy.context.window.scene = {SCENE}", indent_level)
 
     def _initialize_compositor_node_tree(self, ntp_nt, nt_name):
         #initialize node group
-        self._write(f"#initialize {nt_name} node group", self._outer_indent_level)
-        self._write(f"def {ntp_nt.var}_node_group():", self._outer_indent_level)
+        self._emitter.write(f"#initialize {nt_name} node group", self._outer_indent_level)
+        self._emitter.write(f"def {ntp_nt.var}_node_group():", self._outer_indent_level)
 
         if ntp_nt.node_tree == self._base_node_tree:
-            self._write(f"{ntp_nt.var} = {SCENE}.node_tree")
-            self._write(f"#start with a clean node tree")
-            self._write(f"for {NODE} in {ntp_nt.var}.nodes:")
-            self._write(f"{ntp_nt.var}.nodes.remove({NODE})", self._inner_indent_level + 1)
+            self._emitter.write(f"{ntp_nt.var} = {SCENE}.node_tree")
+            self._emitter.write(f"#start with a clean node tree")
+            self._emitter.write(f"{ntp_nt.var}.nodes.clear()")
         else:
-            self._write((f"{ntp_nt.var} = bpy.data.node_groups.new("
-                         f"type = \'CompositorNodeTree\', "
-                         f"name = {str_to_py_str(nt_name)})"))
-            self._write("", 0)
+            self._new_node_group(ntp_nt.var, 'CompositorNodeTree', nt_name)
+            self._emitter.write("", 0)
 
         # Compositor node tree settings
         #TODO: might be good to make this optional
@@ -80,7 +115,7 @@ class NTPCompositorOperator(NTP_Operator):
             setting = getattr(ntp_nt.node_tree, enum)
             if setting != None and setting != "":
                 py_str = enum_to_py_str(setting)
-                self._write(f"{ntp_nt.var}.{enum} = {py_str}")
+                self._emitter.write(f"{ntp_nt.var}.{enum} = {py_str}")
         
         bool_settings = ["use_groupnode_buffer", "use_opencl", "use_two_pass",
                          "use_viewer_border"]
@@ -88,63 +123,47 @@ class NTPCompositorOperator(NTP_Operator):
             if not hasattr(ntp_nt.node_tree, bool_setting):
                 continue
             if getattr(ntp_nt.node_tree, bool_setting) is True:
-                self._write(f"{ntp_nt.var}.{bool_setting} = True")
+                self._emitter.write(f"{ntp_nt.var}.{bool_setting} = True")
         
 
-    def _set_color_balance_settings(self, node: CompositorNodeColorBalance
-                                   ) -> None:
+    def _set_color_balance_settings(self, node: NTP_NodeIR) -> None:
         """
         Sets the color balance settings so we only set the active variables,
         preventing conflict
 
-        node (CompositorNodeColorBalance): the color balance node
+        node (NTP_NodeIR): the color balance node
         """
-        if node.correction_method == 'LIFT_GAMMA_GAIN':
-            lst = [NTPNodeSetting("correction_method", ST.ENUM),                 
-                   NTPNodeSetting("gain",  ST.VEC3,  max_version_=(3, 5, 0)),
-                   NTPNodeSetting("gain",  ST.COLOR, min_version_=(3, 5, 0)),
-                   NTPNodeSetting("gamma", ST.VEC3,  max_version_=(3, 5, 0)),
-                   NTPNodeSetting("gamma", ST.COLOR, min_version_=(3, 5, 0)),
-                   NTPNodeSetting("lift",  ST.VEC3,  max_version_=(3, 5, 0)),
-                   NTPNodeSetting("lift",  ST.COLOR, min_version_=(3, 5, 0))]
-        elif node.correction_method == 'OFFSET_POWER_SLOPE':
-            lst = [NTPNodeSetting("correction_method", ST.ENUM),
-                   NTPNodeSetting("offset", ST.VEC3,  max_version_=(3, 5, 0)),
-                   NTPNodeSetting("offset", ST.COLOR, min_version_=(3, 5, 0)),
-                   NTPNodeSetting("offset_basis", ST.FLOAT),
-                   NTPNodeSetting("power", ST.VEC3,  max_version_=(3, 5, 0)),
-                   NTPNodeSetting("power", ST.COLOR, min_version_=(3, 5, 0)),
-                   NTPNodeSetting("slope", ST.VEC3,  max_version_=(3, 5, 0)),
-                   NTPNodeSetting("slope", ST.COLOR, min_version_=(3, 5, 0))]
-        elif node.correction_method == 'WHITEPOINT':
-            lst = [NTPNodeSetting("correction_method", ST.ENUM),
-                   NTPNodeSetting("input_temperature", ST.FLOAT),
-                   NTPNodeSetting("input_tint", ST.FLOAT),
-                   NTPNodeSetting("output_temperature", ST.FLOAT),
-                   NTPNodeSetting("output_tint", ST.FLOAT)]
-        else:
+        correction_method = node.node.correction_method
+        if correction_method not in COLOR_BALANCE_SETTINGS:
             self.report({'ERROR'},
                         f"Unknown color balance correction method "
-                        f"{enum_to_py_str(node.correction_method)}")
+                        f"{enum_to_py_str(correction_method)}")
+            self._set_settings_defaults(node)
             return
 
-        color_balance_info = self._node_infos['CompositorNodeColorBalance']
-        self._node_infos['CompositorNodeColorBalance'] = color_balance_info._replace(attributes_ = lst)
+        info_key = f"{node.bl_idname}:{correction_method}"
+        if info_key not in self._node_infos:
+            color_balance_info = self._node_infos[node.bl_idname]
+            self._node_infos[info_key] = color_balance_info._replace(
+                attributes_ = filter_settings(
+                    COLOR_BALANCE_SETTINGS[correction_method],
+                    bpy.app.version))
+        self._set_settings_defaults(node, info_key)
 
-    def _process_node(self, node: Node, ntp_nt: NTP_NodeTree):
+    def _process_node(self, node: NTP_NodeIR, ntp_nt: NTP_NodeTree):
         """
         Create node and set settings, defaults, and cosmetics
 
         Parameters:
-        node (Node): node to process
+        node (NTP_NodeIR): node to process
         ntp_nt (NTP_NodeTree): the node tree that node belongs to
         """
         node_var: str = self._create_node(node, ntp_nt.var)
         
         if node.bl_idname == 'CompositorNodeColorBalance':
             self._set_color_balance_settings(node)
-
-        self._set_settings_defaults(node)
+        else:
+            self._set_settings_defaults(node)
         self._hide_hidden_sockets(node)
 
         if bpy.app.version < (4, 0, 0):
@@ -158,6 +177,10 @@ class NTPCompositorOperator(NTP_Operator):
 
         self._set_socket_defaults(node)
     
+    def _cache_key_context(self, node_tree: CompositorNodeTree) -> tuple:
+        # the base node tree is generated under the compositor's name
+        return (node_tree == self._base_node_tree, self.compositor_name)
+
     def _process_node_tree(self, node_tree: CompositorNodeTree):
         """
         Generates a Python function to recreate a compositor node tree
@@ -175,6 +198,7 @@ class NTPCompositorOperator(NTP_Operator):
         self._node_tree_vars[node_tree] = nt_var
 
         ntp_nt = NTP_NodeTree(node_tree, nt_var)
+        self._read_node_tree(ntp_nt)
         self._initialize_compositor_node_tree(ntp_nt, nt_name)
 
         self._set_node_tree_properties(node_tree)
@@ -183,26 +207,29 @@ class NTPCompositorOperator(NTP_Operator):
             self._tree_interface_settings(ntp_nt)
 
         #initialize nodes
-        self._write(f"#initialize {nt_var} nodes")
+        self._emitter.write(f"#initialize {nt_var} nodes")
+        self._start_node_table(nt_var)
 
-        for node in node_tree.nodes:
+        for node in ntp_nt.ir.nodes:
             self._process_node(node, ntp_nt)
-        
+
+        self._write_node_table(nt_var)
+
         #set look of nodes
-        self._set_parents(node_tree)
-        self._set_locations(node_tree)
-        self._set_dimensions(node_tree)
+        self._set_parents(ntp_nt)
+        self._set_locations(ntp_nt)
+        self._set_dimensions(ntp_nt)
 
         #create connections
-        self._init_links(node_tree)
+        self._init_links(ntp_nt)
         
-        self._write(f"return {nt_var}\n")
+        self._end_node_group(nt_var)
 
         #create node group
-        self._write(f"{nt_var} = {nt_var}_node_group()\n", self._outer_indent_level)
+        self._emitter.write(f"{nt_var} = {nt_var}_node_group()\n", self._outer_indent_level)
     
     def execute(self, context):
-        if not self._setup_options(context.scene.ntp_options):
+        if not self._setup_options(self._get_options(context)):
             return {'CANCELLED'}
 
         #find node group to replicate
@@ -225,20 +252,25 @@ class NTPCompositorOperator(NTP_Operator):
             self._outer_indent_level = 2
             self._inner_indent_level = 3
 
-            if not self._setup_addon_directories(context, comp_var):
+            if not self._setup_addon_zip(context, comp_var):
                 return {'CANCELLED'}
 
-            self._file = open(f"{self._addon_dir}/__init__.py", "w")
+            file = self._addon_zip.open_text("__init__.py")
+            self._emitter = NTP_Emitter(file, self._indentation,
+                                        self._inner_indent_level)
 
             self._create_header(self.compositor_name)
+            self._create_loader()
             self._class_name = clean_string(self.compositor_name, lower=False)
             self._init_operator(comp_var, self.compositor_name)
 
-            self._write("def execute(self, context):", 1)
+            self._emitter.write("def execute(self, context):", 1)
         else:
-            self._file = StringIO("")
+            self._emitter = NTP_Emitter(None, self._indentation,
+                                        self._inner_indent_level)
             if self._include_imports:
-                self._file.write("import bpy, mathutils\n\n")
+                self._emitter.write("import bpy, mathutils\n", 0)
+            self._create_loader()
 
         if self.is_scene:
             if self._mode == 'ADDON':
@@ -249,24 +281,25 @@ class NTPCompositorOperator(NTP_Operator):
         node_trees_to_process = self._topological_sort(self._base_node_tree)
 
         for node_tree in node_trees_to_process:  
-            self._process_node_tree(node_tree)
+            self._process_node_tree_cached(node_tree)
 
         if self._mode == 'ADDON':
-            self._write("return {'FINISHED'}\n", self._outer_indent_level)
+            self._emitter.write("return {'FINISHED'}\n", self._outer_indent_level)
 
             self._create_menu_func()
             self._create_register_func()
             self._create_unregister_func()
             self._create_main_func()
-            self._create_license()
-            if bpy.app.version >= (4, 2, 0):
-                self._create_manifest()
         else:
-            context.window_manager.clipboard = self._file.getvalue()
+            context.window_manager.clipboard = self._emitter.getvalue()
 
-        self._file.close()
+        self._emitter.close()
         
         if self._mode == 'ADDON':
+            self._write_images()
+            self._create_license()
+            if bpy.app.version >= (4, 2, 0):
+                self._create_manifest()
             self._zip_addon()
         
         self._report_finished("compositor nodes")
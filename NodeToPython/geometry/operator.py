@@ -1,20 +1,21 @@
 import bpy
-from bpy.types import GeometryNode, GeometryNodeTree
-from bpy.types import Node
-
-from io import StringIO
+from bpy.types import GeometryNodeTree
 
+from ..ntp_emitter import NTP_Emitter
 from ..ntp_operator import NTP_Operator
+from ..ntp_tree_ir import NTP_NodeIR
 from ..utils import *
 from .node_tree import NTP_GeoNodeTree
-from ..node_settings import node_settings
+from ..node_settings import get_node_settings
 
-OBJECT_NAME = "name"
+OBJECTS = "objs"
 OBJECT = "obj"
 MODIFIER = "mod"
-GEO_OP_RESERVED_NAMES = {OBJECT_NAME, 
+COLLECTION = "collection"
+GEO_OP_RESERVED_NAMES = {OBJECTS, 
                          OBJECT,
-                         MODIFIER}
+                         MODIFIER,
+                         COLLECTION}
 
 class NTPGeoNodesOperator(NTP_Operator):
     bl_idname = "node.ntp_geo_nodes"
@@ -22,19 +23,26 @@ class NTPGeoNodesOperator(NTP_Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     geo_nodes_group_name: bpy.props.StringProperty(name="Node Group")
+    options_json: bpy.props.StringProperty(
+        name="Options JSON",
+        description="Options as a JSON object, used instead of the scene's "
+                    "NodeToPython options",
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
 
     def __init__(self):
         super().__init__()
-        self._node_infos = node_settings
+        self._node_infos = get_node_settings('GeometryNodeTree')
         for name in GEO_OP_RESERVED_NAMES:
-            self._used_vars[name] = 0
+            self._identifiers.reserve(name)
 
-    def _process_node(self, node: Node, ntp_nt: NTP_GeoNodeTree) -> None:
+    def _process_node(self, node: NTP_NodeIR, ntp_nt: NTP_GeoNodeTree
+                      ) -> None:
         """
         Create node and set settings, defaults, and cosmetics
 
         Parameters:
-        node (Node): node to process
+        node (NTP_NodeIR): node to process
         ntp_nt (NTP_NodeTree): the node tree that node belongs to
         """
         node_var: str = self._create_node(node, ntp_nt.var)
@@ -58,26 +66,27 @@ class NTPGeoNodesOperator(NTP_Operator):
             self._set_socket_defaults(node)
 
     if bpy.app.version >= (3, 6, 0):
-        def _process_zones(self, zone_inputs: list[GeometryNode]) -> None:
+        def _process_zones(self, zone_inputs: list[NTP_NodeIR],
+                           ntp_nt: NTP_GeoNodeTree) -> None:
             """
             Recreates a zone
-            zone_inputs (list[GeometryNodeSimulationInput]): list of 
-                simulation input nodes
+            zone_inputs (list[NTP_NodeIR]): list of zone input nodes
+            ntp_nt (NTP_GeoNodeTree): the node tree the zones belong to
             """
             for zone_input in zone_inputs:
-                zone_output = zone_input.paired_output
+                zone_output = ntp_nt.ir.find(zone_input.node.paired_output)
 
-                zone_input_var = self._node_vars[zone_input]
-                zone_output_var = self._node_vars[zone_output]
+                zone_input_var = zone_input.var
+                zone_output_var = zone_output.var
 
-                self._write(f"#Process zone input {zone_input.name}")
-                self._write(f"{zone_input_var}.pair_with_output"
-                            f"({zone_output_var})")
+                self._emitter.write(f"#Process zone input {zone_input.name}")
+                self._emitter.write(f"{zone_input_var}.pair_with_output"
+                                    f"({zone_output_var})")
 
                 #must set defaults after paired with output
                 self._set_socket_defaults(zone_input)
                 self._set_socket_defaults(zone_output)
-            self._write("", 0)
+            self._emitter.write("", 0)
 
     if bpy.app.version >= (4, 0, 0):
         def _set_geo_tree_properties(self, node_tree: GeometryNodeTree) -> None:
@@ -87,9 +96,9 @@ class NTPGeoNodesOperator(NTP_Operator):
             nt_var = self._node_tree_vars[node_tree]
 
             if is_mod:
-                self._write(f"{nt_var}.is_modifier = True")
+                self._emitter.write(f"{nt_var}.is_modifier = True")
             if is_tool:
-                self._write(f"{nt_var}.is_tool = True")
+                self._emitter.write(f"{nt_var}.is_tool = True")
 
                 tool_flags =  ["is_mode_object",
                                "is_mode_edit", 
@@ -100,8 +109,8 @@ class NTPGeoNodesOperator(NTP_Operator):
             
                 for flag in tool_flags:
                     if hasattr(node_tree, flag) is True:
-                        self._write(f"{nt_var}.{flag} = {getattr(node_tree, flag)}")
-            self._write("", 0)
+                        self._emitter.write(f"{nt_var}.{flag} = {getattr(node_tree, flag)}")
+            self._emitter.write("", 0)
 
     def _process_node_tree(self, node_tree: GeometryNodeTree) -> None:
         """
@@ -115,106 +124,257 @@ class NTPGeoNodesOperator(NTP_Operator):
         self._node_tree_vars[node_tree] = nt_var
 
         #initialize node group
-        self._write(f"#initialize {nt_var} node group", self._outer_indent_level)
-        self._write(f"def {nt_var}_node_group():", self._outer_indent_level)
-        self._write(f"{nt_var} = bpy.data.node_groups.new("
-                    f"type = \'GeometryNodeTree\', "
-                    f"name = {str_to_py_str(node_tree.name)})\n")
+        self._emitter.write(f"#initialize {nt_var} node group", self._outer_indent_level)
+        self._emitter.write(f"def {nt_var}_node_group():", self._outer_indent_level)
+        self._new_node_group(nt_var, 'GeometryNodeTree', node_tree.name)
+        self._emitter.write("", 0)
 
         self._set_node_tree_properties(node_tree)
         if bpy.app.version >= (4, 0, 0):
             self._set_geo_tree_properties(node_tree)
     
         ntp_nt = NTP_GeoNodeTree(node_tree, nt_var)
+        self._read_node_tree(ntp_nt)
 
         if bpy.app.version >= (4, 0, 0):
             self._tree_interface_settings(ntp_nt)
 
         #initialize nodes
-        self._write(f"#initialize {nt_var} nodes")
-        for node in node_tree.nodes:
+        self._emitter.write(f"#initialize {nt_var} nodes")
+        self._start_node_table(nt_var)
+        for node in ntp_nt.ir.nodes:
             self._process_node(node, ntp_nt)
 
         for zone_list in ntp_nt.zone_inputs.values():
-            self._process_zones(zone_list)
+            self._process_zones(zone_list, ntp_nt)
+
+        self._write_node_table(nt_var)
 
         #set look of nodes
-        self._set_parents(node_tree)
-        self._set_locations(node_tree)
-        self._set_dimensions(node_tree)
+        self._set_parents(ntp_nt)
+        self._set_locations(ntp_nt)
+        self._set_dimensions(ntp_nt)
 
         #create connections
-        self._init_links(node_tree)
+        self._init_links(ntp_nt)
         
-        self._write(f"return {nt_var}\n")
+        self._end_node_group(nt_var)
 
         #create node group
-        self._write(f"{nt_var} = {nt_var}_node_group()\n", self._outer_indent_level)
+        self._emitter.write(f"{nt_var} = {nt_var}_node_group()\n", self._outer_indent_level)
 
 
-    def _apply_modifier(self, nt: GeometryNodeTree, nt_var: str):
-        #get object
-        self._write(f"{OBJECT_NAME} = bpy.context.object.name", self._outer_indent_level)
-        self._write(f"{OBJECT} = bpy.data.objects[{OBJECT_NAME}]", self._outer_indent_level)
+    def _create_target_property(self) -> None:
+        """
+        Adds a property to the add-on's operator for choosing a collection
+        to add the modifier to, shown in the redo panel
+        """
+        self._emitter.write(f"{COLLECTION}: bpy.props.StringProperty(", 1)
+        self._emitter.write("name = \"Collection\",", 2)
+        self._emitter.write("description = \"Add the modifier to the objects "
+                            "of this collection instead of the selected "
+                            "objects\"", 2)
+        self._emitter.write(")\n", 1)
+
+    def _find_modifier_targets(self) -> None:
+        """
+        Finds the objects the add-on adds the modifier to, before building
+        any node groups, so a missing collection cancels the operator
+        """
+        indent_level = self._outer_indent_level
+        self._emitter.write("#objects to add the modifier to", indent_level)
+        self._emitter.write(f"if self.{COLLECTION}:", indent_level)
+        self._emitter.write(f"{COLLECTION} = bpy.data.collections.get("
+                            f"self.{COLLECTION})", indent_level + 1)
+        self._emitter.write(f"if {COLLECTION} is None:", indent_level + 1)
+        self._emitter.write("self.report({'ERROR'}, f\"Collection "
+                            f"\\\"{{self.{COLLECTION}}}\\\" not found\")",
+                            indent_level + 2)
+        self._emitter.write("return {'CANCELLED'}", indent_level + 2)
+        self._emitter.write(f"{OBJECTS} = {COLLECTION}.all_objects",
+                            indent_level + 1)
+        self._emitter.write("else:", indent_level)
+        self._emitter.write(f"{OBJECTS} = context.selected_objects",
+                            indent_level + 1)
+        self._emitter.write(f"if not {OBJECTS} and context.object is not None:",
+                            indent_level + 1)
+        self._emitter.write(f"{OBJECTS} = [context.object]", indent_level + 2)
+        self._emitter.write("", 0)
 
-        #set modifier to the one we just created
+    def _apply_modifier(self, nt: GeometryNodeTree, nt_var: str):
+        """
+        Adds a modifier using the node group we just created to each of the
+        objects found by _find_modifier_targets(), building the node group
+        only once
+        """
+        indent_level = self._outer_indent_level
         mod_name = str_to_py_str(nt.name)
-        self._write(f"{MODIFIER} = obj.modifiers.new(name = {mod_name}, "
-                    f"type = 'NODES')", self._outer_indent_level)
-        self._write(f"{MODIFIER}.node_group = {nt_var}", self._outer_indent_level)
-
-
-    def execute(self, context):
-        if not self._setup_options(context.scene.ntp_options):
-            return {'CANCELLED'}
-
-        #find node group to replicate
-        nt = bpy.data.node_groups[self.geo_nodes_group_name]
+        self._emitter.write("#add the modifier to each object", indent_level)
+        self._emitter.write(f"for {OBJECT} in {OBJECTS}:", indent_level)
+        self._emitter.write("try:", indent_level + 1)
+        self._emitter.write(f"{MODIFIER} = {OBJECT}.modifiers.new("
+                            f"name = {mod_name}, type = 'NODES')",
+                            indent_level + 2)
+        self._emitter.write("except RuntimeError:", indent_level + 1)
+        self._emitter.write("#object type without geometry nodes modifiers",
+                            indent_level + 2)
+        self._emitter.write("continue", indent_level + 2)
+        self._emitter.write(f"{MODIFIER}.node_group = {nt_var}",
+                            indent_level + 1)
+
+
+    def _generate(self, context: bpy.types.Context,
+                  node_trees: list[GeometryNodeTree], name: str,
+                  modifier_tree: GeometryNodeTree = None) -> bool:
+        """
+        Generates the script/add-on recreating the given node trees. Node
+        groups they have in common are only generated once
 
+        Parameters:
+        context (Context): the current scene context
+        node_trees (list[GeometryNodeTree]): base node trees to replicate
+        name (str): name of the generated add-on
+        modifier_tree (GeometryNodeTree): node tree the generated add-on adds
+            as a modifier to the selected objects, if any
+
+        Returns:
+        (bool): success of the generation
+        """
         #set up names to use in generated addon
-        nt_var = clean_string(nt.name)
+        nt_var = clean_string(name)
 
         if self._mode == 'ADDON':
             self._outer_indent_level = 2
             self._inner_indent_level = 3
 
-            if not self._setup_addon_directories(context, nt_var):
-                return {'CANCELLED'}
+            if not self._setup_addon_zip(context, nt_var):
+                return False
 
-            self._file = open(f"{self._addon_dir}/__init__.py", "w")
+            file = self._addon_zip.open_text("__init__.py")
+            self._emitter = NTP_Emitter(file, self._indentation,
+                                        self._inner_indent_level)
             
-            self._create_header(nt.name)
-            self._class_name = clean_string(nt.name, lower = False)
-            self._init_operator(nt_var, nt.name)
-            self._write("def execute(self, context):", 1)
+            self._create_header(name)
+            self._create_loader()
+            self._class_name = clean_string(name, lower = False)
+            self._init_operator(nt_var, name)
+            if modifier_tree is not None:
+                self._create_target_property()
+            self._emitter.write("def execute(self, context):", 1)
+            if modifier_tree is not None:
+                self._find_modifier_targets()
         else:
-            self._file = StringIO("")
+            self._emitter = NTP_Emitter(None, self._indentation,
+                                        self._inner_indent_level)
             if self._include_imports:
-                self._file.write("import bpy, mathutils\n\n")
+                self._emitter.write("import bpy, mathutils\n", 0)
+            self._create_loader()
 
 
-        node_trees_to_process = self._topological_sort(nt)
+        node_trees_to_process = self._topological_sort_trees(node_trees)
 
         for node_tree in node_trees_to_process:  
-            self._process_node_tree(node_tree)
+            self._process_node_tree_cached(node_tree)
 
         if self._mode == 'ADDON':
-            self._apply_modifier(nt, nt_var)
-            self._write("return {'FINISHED'}\n", self._outer_indent_level)
+            if modifier_tree is not None:
+                self._apply_modifier(modifier_tree,
+                                     self._node_tree_vars[modifier_tree])
+            self._emitter.write("return {'FINISHED'}\n", self._outer_indent_level)
             self._create_menu_func()
             self._create_register_func()
             self._create_unregister_func()
             self._create_main_func()
-            self._create_license()
-            if bpy.app.version >= (4, 2, 0):
-                self._create_manifest()
         else:
-            context.window_manager.clipboard = self._file.getvalue()
-        self._file.close()
+            context.window_manager.clipboard = self._emitter.getvalue()
+        self._emitter.close()
 
         if self._mode == 'ADDON':
+            self._write_images()
+            self._create_license()
+            if bpy.app.version >= (4, 2, 0):
+                self._create_manifest()
             self._zip_addon()
 
+        return True
+
+    def execute(self, context):
+        if not self._setup_options(self._get_options(context)):
+            return {'CANCELLED'}
+
+        #find node group to replicate
+        nt = bpy.data.node_groups[self.geo_nodes_group_name]
+
+        if not self._generate(context, [nt], nt.name, modifier_tree=nt):
+            return {'CANCELLED'}
+
         self._report_finished("geometry node group")
 
-        return {'FINISHED'}
\ No newline at end of file
+        return {'FINISHED'}
+
+
+class NTPGeoNodesBatchOperator(NTPGeoNodesOperator):
+    bl_idname = "node.ntp_geo_nodes_batch"
+    bl_label = "Geo Nodes Library to Python"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    geo_nodes_group_names: bpy.props.CollectionProperty(
+        type=bpy.types.PropertyGroup,
+        name="Node Groups",
+        description="Geometry node groups to export. If empty, every geometry "
+                    "node group in the file is exported"
+    )
+    library_name: bpy.props.StringProperty(
+        name="Library Name",
+        description="Name of the generated add-on",
+        default="Geometry Nodes Library"
+    )
+    options_json: bpy.props.StringProperty(
+        name="Options JSON",
+        description="Options as a JSON object, used instead of the scene's "
+                    "NodeToPython options",
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
+
+    def _get_node_trees(self) -> list[GeometryNodeTree]:
+        """
+        Finds the node groups to export
+
+        Returns:
+        (list[GeometryNodeTree]): the node groups, or None if one of the
+            requested ones doesn't exist
+        """
+        if len(self.geo_nodes_group_names) == 0:
+            return [node_tree for node_tree in bpy.data.node_groups
+                    if node_tree.bl_idname == 'GeometryNodeTree']
+
+        node_trees: list[GeometryNodeTree] = []
+        for item in self.geo_nodes_group_names:
+            node_tree = bpy.data.node_groups.get(item.name)
+            if node_tree is None or node_tree.bl_idname != 'GeometryNodeTree':
+                self.report({'ERROR'},
+                            f"NodeToPython: Couldn't find geometry node group "
+                            f"{str_to_py_str(item.name)}")
+                return None
+            if node_tree not in node_trees:
+                node_trees.append(node_tree)
+        return node_trees
+
+    def execute(self, context):
+        if not self._setup_options(self._get_options(context)):
+            return {'CANCELLED'}
+
+        node_trees = self._get_node_trees()
+        if node_trees is None:
+            return {'CANCELLED'}
+        if len(node_trees) == 0:
+            self.report({'WARNING'},
+                        "NodeToPython: No geometry node groups to export")
+            return {'CANCELLED'}
+
+        if not self._generate(context, node_trees, self.library_name):
+            return {'CANCELLED'}
+
+        self._report_finished(f"{len(node_trees)} geometry node groups")
+
+        return {'FINISHED'}
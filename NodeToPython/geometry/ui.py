@@ -2,7 +2,7 @@ import bpy
 from bpy.types import Panel
 from bpy.types import Menu
 
-from .operator import NTPGeoNodesOperator
+from .operator import NTPGeoNodesOperator, NTPGeoNodesBatchOperator
 
 class NTPGeoNodesPanel(Panel):
     bl_label = "Geometry Nodes to Python"
@@ -34,6 +34,13 @@ class NTPGeoNodesPanel(Panel):
         row.operator_context = 'INVOKE_DEFAULT'
         row.menu("NODE_MT_ntp_geo_nodes", text="Geometry Nodes")
 
+        # Exports every geometry node group into a single add-on
+        row = col.row()
+        row.enabled = geo_node_groups_exist
+        row.alignment = 'EXPAND'
+        row.operator(NTPGeoNodesBatchOperator.bl_idname,
+                     text="All Geometry Nodes")
+
 class NTPGeoNodesMenu(Menu):
     bl_idname = "NODE_MT_ntp_geo_nodes"
     bl_label = "Select Geo Nodes"
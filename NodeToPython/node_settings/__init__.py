@@ -0,0 +1,165 @@
+import bpy
+
+import importlib
+from enum import Enum, auto
+from typing import NamedTuple
+
+class ST(Enum):
+	"""
+	Settings Types
+	"""
+	BOOL = auto()
+	COLOR = auto()
+	ENUM = auto()
+	ENUM_SET = auto()
+	EULER = auto()
+	FLOAT = auto()
+	INT = auto()
+	STRING = auto()
+	VEC1 = auto()
+	VEC2 = auto()
+	VEC3 = auto()
+	VEC4 = auto()
+	BAKE_ITEMS = auto()
+	CAPTURE_ATTRIBUTE_ITEMS = auto()
+	COLOR_RAMP = auto()
+	CURVE_MAPPING = auto()
+	ENUM_DEFINITION = auto()
+	ENUM_ITEM = auto()
+	FOREACH_GEO_ELEMENT_GENERATION_ITEMS = auto()
+	FOREACH_GEO_ELEMENT_INPUT_ITEMS = auto()
+	FOREACH_GEO_ELEMENT_MAIN_ITEMS = auto()
+	INDEX_SWITCH_ITEMS = auto()
+	MENU_SWITCH_ITEMS = auto()
+	NODE_TREE = auto()
+	REPEAT_OUTPUT_ITEMS = auto()
+	SIM_OUTPUT_ITEMS = auto()
+	IMAGE = auto()
+	IMAGE_USER = auto()
+	CRYPTOMATTE_ENTRIES = auto()
+	FILE_SLOTS = auto()
+	FONT = auto()
+	IMAGE_FORMAT_SETTINGS = auto()
+	LAYER_SLOTS = auto()
+	MASK = auto()
+	MATERIAL = auto()
+	MOVIE_CLIP = auto()
+	OBJECT = auto()
+	PARTICLE_SYSTEM = auto()
+	SCENE = auto()
+	TEXT = auto()
+	TEXTURE = auto()
+
+class NTPNodeSetting(NamedTuple):
+	name_: str
+	st_: ST
+	min_version_: tuple = (3, 0, 0)
+	max_version_: tuple = (4, 4, 0)
+
+class NodeInfo(NamedTuple):
+	attributes_: list[NTPNodeSetting]
+	min_version_: tuple = (3, 0, 0)
+	max_version_: tuple = (4, 4, 0)
+
+# Blender versions (major, minor) with tables of just the settings valid in
+# them, in the v<major>_<minor> packages
+SETTINGS_VERSIONS : tuple[tuple[int, int], ...] = (
+	(3, 0),
+	(3, 1),
+	(3, 2),
+	(3, 3),
+	(3, 4),
+	(3, 5),
+	(3, 6),
+	(4, 0),
+	(4, 1),
+	(4, 2),
+	(4, 3),
+)
+
+# Settings tables each node tree type uses, by module. Geometry node trees
+# also use shader and function nodes, e.g. Math and Compare
+TREE_TYPE_TABLES : dict[str, tuple[str, ...]] = {
+	'GeometryNodeTree' : ("common", "function", "geometry", "shader"),
+	'ShaderNodeTree' : ("common", "shader"),
+	'CompositorNodeTree' : ("common", "compositor"),
+}
+
+# Node tree type -> settings of the nodes it can contain
+_tree_type_settings : dict[str, dict[str, NodeInfo]] = {}
+
+def filter_settings(settings: list[NTPNodeSetting], version: tuple
+				   ) -> list[NTPNodeSetting]:
+	"""
+	Keeps the settings that are valid in a version of Blender
+
+	Parameters:
+	settings (list[NTPNodeSetting]): settings to filter
+	version (tuple): version of Blender, e.g. bpy.app.version
+
+	Returns:
+	(list[NTPNodeSetting]): the valid settings, in order
+	"""
+	return [setting for setting in settings
+			if setting.min_version_ <= version < setting.max_version_]
+
+def _load_table(table: str, version: tuple) -> dict[str, NodeInfo]:
+	"""
+	Loads the settings of a table valid in a version of Blender: the table
+	written for that version if there is one, otherwise the table of all
+	versions filtered down
+
+	Parameters:
+	table (str): table module, e.g. "shader"
+	version (tuple): version of Blender
+
+	Returns:
+	(dict[str, NodeInfo]): node bl_idname -> settings
+	"""
+	if tuple(version[:2]) in SETTINGS_VERSIONS:
+		module = importlib.import_module(
+			f".v{version[0]}_{version[1]}.{table}", __name__)
+		return module.node_settings
+
+	module = importlib.import_module(f".{table}", __name__)
+	settings = {}
+	for name, node_info in module.node_settings.items():
+		if node_info.min_version_ <= version < node_info.max_version_:
+			settings[name] = NodeInfo(filter_settings(node_info.attributes_,
+													  version))
+		else:
+			settings[name] = NodeInfo([])
+	return settings
+
+def get_node_settings(tree_type: str) -> dict[str, NodeInfo]:
+	"""
+	Gets the settings of the nodes a node tree type can contain that are
+	valid in the running version of Blender, importing their tables the
+	first time they're needed
+
+	Parameters:
+	tree_type (str): bl_idname of the node tree type, e.g. 'ShaderNodeTree'
+
+	Returns:
+	(dict[str, NodeInfo]): node bl_idname -> settings. Shared between calls,
+		so copy it before changing it
+	"""
+	settings = _tree_type_settings.get(tree_type)
+	if settings is None:
+		settings = {}
+		for table in TREE_TYPE_TABLES[tree_type]:
+			settings.update(_load_table(table, bpy.app.version))
+		_tree_type_settings[tree_type] = settings
+	return settings
+
+def __getattr__(name: str):
+	# The settings of every node in every version, for tools that don't work
+	# on one tree type
+	if name == "node_settings":
+		settings = {}
+		for tables in TREE_TYPE_TABLES.values():
+			for table in tables:
+				module = importlib.import_module(f".{table}", __name__)
+				settings.update(module.node_settings)
+		return settings
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
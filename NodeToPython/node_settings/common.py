@@ -0,0 +1,34 @@
+from . import NTPNodeSetting, NodeInfo, ST
+
+node_settings : dict[str, NodeInfo] = {
+	'NodeFrame' : NodeInfo(
+		[
+			NTPNodeSetting("label_size", ST.INT),
+			NTPNodeSetting("shrink", ST.BOOL),
+			NTPNodeSetting("text", ST.TEXT),
+		]
+	),
+
+	'NodeGroup' : NodeInfo(
+		[
+			NTPNodeSetting("node_tree", ST.NODE_TREE),
+		]
+	),
+
+	'NodeGroupInput' : NodeInfo(
+		[]
+	),
+
+	'NodeGroupOutput' : NodeInfo(
+		[
+			NTPNodeSetting("is_active_output", ST.BOOL),
+		]
+	),
+
+	'NodeReroute' : NodeInfo(
+		[
+			NTPNodeSetting("socket_idname", ST.STRING, min_version_=(4, 3, 0)),
+		]
+	),
+
+}
\ No newline at end of file
@@ -0,0 +1,838 @@
+from . import NTPNodeSetting, NodeInfo, ST
+
+node_settings : dict[str, NodeInfo] = {
+	'CompositorNodeAlphaOver' : NodeInfo(
+		[
+			NTPNodeSetting("premul", ST.FLOAT),
+			NTPNodeSetting("use_premultiply", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeAntiAliasing' : NodeInfo(
+		[
+			NTPNodeSetting("contrast_limit", ST.FLOAT),
+			NTPNodeSetting("corner_rounding", ST.FLOAT),
+			NTPNodeSetting("threshold", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeBilateralblur' : NodeInfo(
+		[
+			NTPNodeSetting("iterations", ST.INT),
+			NTPNodeSetting("sigma_color", ST.FLOAT),
+			NTPNodeSetting("sigma_space", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeBlur' : NodeInfo(
+		[
+			NTPNodeSetting("aspect_correction", ST.ENUM),
+			NTPNodeSetting("factor", ST.FLOAT),
+			NTPNodeSetting("factor_x", ST.FLOAT),
+			NTPNodeSetting("factor_y", ST.FLOAT),
+			NTPNodeSetting("filter_type", ST.ENUM),
+			NTPNodeSetting("size_x", ST.INT),
+			NTPNodeSetting("size_y", ST.INT),
+			NTPNodeSetting("use_bokeh", ST.BOOL),
+			NTPNodeSetting("use_extended_bounds", ST.BOOL),
+			NTPNodeSetting("use_gamma_correction", ST.BOOL),
+			NTPNodeSetting("use_relative", ST.BOOL),
+			NTPNodeSetting("use_variable_size", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeBokehBlur' : NodeInfo(
+		[
+			NTPNodeSetting("blur_max", ST.FLOAT),
+			NTPNodeSetting("use_extended_bounds", ST.BOOL),
+			NTPNodeSetting("use_variable_size", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeBokehImage' : NodeInfo(
+		[
+			NTPNodeSetting("angle", ST.FLOAT),
+			NTPNodeSetting("catadioptric", ST.FLOAT),
+			NTPNodeSetting("flaps", ST.INT),
+			NTPNodeSetting("rounding", ST.FLOAT),
+			NTPNodeSetting("shift", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeBoxMask' : NodeInfo(
+		[
+			NTPNodeSetting("height", ST.FLOAT, max_version_=(4, 2, 0)),
+			NTPNodeSetting("mask_height", ST.FLOAT, min_version_=(4, 2, 0)),
+			NTPNodeSetting("mask_type", ST.ENUM),
+			NTPNodeSetting("mask_width", ST.FLOAT, min_version_=(4, 2, 0)),
+			NTPNodeSetting("rotation", ST.FLOAT),
+			NTPNodeSetting("width", ST.FLOAT, max_version_=(4, 2, 0)),
+			NTPNodeSetting("x", ST.FLOAT),
+			NTPNodeSetting("y", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeBrightContrast' : NodeInfo(
+		[
+			NTPNodeSetting("use_premultiply", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeChannelMatte' : NodeInfo(
+		[
+			NTPNodeSetting("color_space", ST.ENUM),
+			NTPNodeSetting("limit_channel", ST.ENUM),
+			NTPNodeSetting("limit_max", ST.FLOAT),
+			NTPNodeSetting("limit_method", ST.ENUM),
+			NTPNodeSetting("limit_min", ST.FLOAT),
+			NTPNodeSetting("matte_channel", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeChromaMatte' : NodeInfo(
+		[
+			NTPNodeSetting("gain", ST.FLOAT),
+			NTPNodeSetting("lift", ST.FLOAT),
+			NTPNodeSetting("shadow_adjust", ST.FLOAT),
+			NTPNodeSetting("threshold", ST.FLOAT),
+			NTPNodeSetting("tolerance", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeColorBalance' : NodeInfo(
+		[
+			NTPNodeSetting("correction_method", ST.ENUM),
+			NTPNodeSetting("gain", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("gain", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("gamma", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("gamma", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("input_temperature", ST.FLOAT, min_version_=(4, 3, 0)),
+			NTPNodeSetting("input_tint", ST.FLOAT, min_version_=(4, 3, 0)),
+			NTPNodeSetting("input_whitepoint", ST.COLOR, min_version_=(4, 3, 0)),
+			NTPNodeSetting("lift", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("lift", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("offset", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("offset", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("offset_basis", ST.FLOAT),
+			NTPNodeSetting("output_temperature", ST.FLOAT, min_version_=(4, 3, 0)),
+			NTPNodeSetting("output_tint", ST.FLOAT, min_version_=(4, 3, 0)),
+			NTPNodeSetting("output_whitepoint", ST.COLOR, min_version_=(4, 3, 0)),
+			NTPNodeSetting("power", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("power", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("slope", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("slope", ST.COLOR, min_version_=(3, 5, 0)),
+		]
+	),
+
+	'CompositorNodeColorCorrection' : NodeInfo(
+		[
+			NTPNodeSetting("blue", ST.BOOL),
+			NTPNodeSetting("green", ST.BOOL),
+			NTPNodeSetting("highlights_contrast", ST.FLOAT),
+			NTPNodeSetting("highlights_gain", ST.FLOAT),
+			NTPNodeSetting("highlights_gamma", ST.FLOAT),
+			NTPNodeSetting("highlights_lift", ST.FLOAT),
+			NTPNodeSetting("highlights_saturation", ST.FLOAT),
+			NTPNodeSetting("master_contrast", ST.FLOAT),
+			NTPNodeSetting("master_gain", ST.FLOAT),
+			NTPNodeSetting("master_gamma", ST.FLOAT),
+			NTPNodeSetting("master_lift", ST.FLOAT),
+			NTPNodeSetting("master_saturation", ST.FLOAT),
+			NTPNodeSetting("midtones_contrast", ST.FLOAT),
+			NTPNodeSetting("midtones_end", ST.FLOAT),
+			NTPNodeSetting("midtones_gain", ST.FLOAT),
+			NTPNodeSetting("midtones_gamma", ST.FLOAT),
+			NTPNodeSetting("midtones_lift", ST.FLOAT),
+			NTPNodeSetting("midtones_saturation", ST.FLOAT),
+			NTPNodeSetting("midtones_start", ST.FLOAT),
+			NTPNodeSetting("red", ST.BOOL),
+			NTPNodeSetting("shadows_contrast", ST.FLOAT),
+			NTPNodeSetting("shadows_gain", ST.FLOAT),
+			NTPNodeSetting("shadows_gamma", ST.FLOAT),
+			NTPNodeSetting("shadows_lift", ST.FLOAT),
+			NTPNodeSetting("shadows_saturation", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeColorMatte' : NodeInfo(
+		[
+			NTPNodeSetting("color_hue", ST.FLOAT),
+			NTPNodeSetting("color_saturation", ST.FLOAT),
+			NTPNodeSetting("color_value", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeColorSpill' : NodeInfo(
+		[
+			NTPNodeSetting("channel", ST.ENUM),
+			NTPNodeSetting("limit_channel", ST.ENUM),
+			NTPNodeSetting("limit_method", ST.ENUM),
+			NTPNodeSetting("ratio", ST.FLOAT),
+			NTPNodeSetting("unspill_blue", ST.FLOAT),
+			NTPNodeSetting("unspill_green", ST.FLOAT),
+			NTPNodeSetting("unspill_red", ST.FLOAT),
+			NTPNodeSetting("use_unspill", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeCombHSVA' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeCombRGBA' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeCombYCCA' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeCombYUVA' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeCombineColor' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+			NTPNodeSetting("ycc_mode", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'CompositorNodeCombineXYZ' : NodeInfo(
+		[],
+		min_version_ = (3, 2, 0)
+	),
+
+	'CompositorNodeComposite' : NodeInfo(
+		[
+			NTPNodeSetting("use_alpha", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeConvertColorSpace' : NodeInfo(
+		[
+			NTPNodeSetting("from_color_space", ST.ENUM),
+			NTPNodeSetting("to_color_space", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'CompositorNodeCornerPin' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeCrop' : NodeInfo(
+		[
+			NTPNodeSetting("max_x", ST.INT),
+			NTPNodeSetting("max_y", ST.INT),
+			NTPNodeSetting("min_x", ST.INT),
+			NTPNodeSetting("min_y", ST.INT),
+			NTPNodeSetting("rel_max_x", ST.FLOAT),
+			NTPNodeSetting("rel_max_y", ST.FLOAT),
+			NTPNodeSetting("rel_min_x", ST.FLOAT),
+			NTPNodeSetting("rel_min_y", ST.FLOAT),
+			NTPNodeSetting("relative", ST.BOOL),
+			NTPNodeSetting("use_crop_size", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeCryptomatte' : NodeInfo(
+		[
+			NTPNodeSetting("add", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("add", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("matte_id", ST.STRING),
+			NTPNodeSetting("remove", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("remove", ST.COLOR, min_version_=(3, 5, 0)),
+		]
+	),
+
+	'CompositorNodeCryptomatteV2' : NodeInfo(
+		[
+			NTPNodeSetting("add", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("add", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("entries", ST.CRYPTOMATTE_ENTRIES),
+			NTPNodeSetting("frame_duration", ST.INT),
+			NTPNodeSetting("frame_offset", ST.INT),
+			NTPNodeSetting("frame_start", ST.INT),
+			NTPNodeSetting("image", ST.IMAGE),
+			NTPNodeSetting("layer", ST.ENUM),
+			NTPNodeSetting("layer_name", ST.ENUM),
+			NTPNodeSetting("matte_id", ST.STRING),
+			NTPNodeSetting("remove", ST.VEC3, max_version_=(3, 5, 0)),
+			NTPNodeSetting("remove", ST.COLOR, min_version_=(3, 5, 0)),
+			NTPNodeSetting("scene", ST.SCENE),
+			NTPNodeSetting("source", ST.ENUM),
+			NTPNodeSetting("use_auto_refresh", ST.BOOL),
+			NTPNodeSetting("use_cyclic", ST.BOOL),
+			NTPNodeSetting("view", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeCurveRGB' : NodeInfo(
+		[
+			NTPNodeSetting("mapping", ST.CURVE_MAPPING),
+		]
+	),
+
+	'CompositorNodeCurveVec' : NodeInfo(
+		[
+			NTPNodeSetting("mapping", ST.CURVE_MAPPING),
+		]
+	),
+
+	'CompositorNodeCustomGroup' : NodeInfo(
+		[
+			NTPNodeSetting("node_tree", ST.NODE_TREE),
+		]
+	),
+
+	'CompositorNodeDBlur' : NodeInfo(
+		[
+			NTPNodeSetting("angle", ST.FLOAT),
+			NTPNodeSetting("center_x", ST.FLOAT),
+			NTPNodeSetting("center_y", ST.FLOAT),
+			NTPNodeSetting("distance", ST.FLOAT),
+			NTPNodeSetting("iterations", ST.INT),
+			NTPNodeSetting("spin", ST.FLOAT),
+			NTPNodeSetting("use_wrap", ST.BOOL, max_version_=(3, 5, 0)),
+			NTPNodeSetting("zoom", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeDefocus' : NodeInfo(
+		[
+			NTPNodeSetting("angle", ST.FLOAT),
+			NTPNodeSetting("blur_max", ST.FLOAT),
+			NTPNodeSetting("bokeh", ST.ENUM),
+			NTPNodeSetting("f_stop", ST.FLOAT),
+			NTPNodeSetting("scene", ST.SCENE),
+			NTPNodeSetting("threshold", ST.FLOAT),
+			NTPNodeSetting("use_gamma_correction", ST.BOOL),
+			NTPNodeSetting("use_preview", ST.BOOL),
+			NTPNodeSetting("use_zbuffer", ST.BOOL),
+			NTPNodeSetting("z_scale", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeDenoise' : NodeInfo(
+		[
+			NTPNodeSetting("prefilter", ST.ENUM),
+			NTPNodeSetting("use_hdr", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeDespeckle' : NodeInfo(
+		[
+			NTPNodeSetting("threshold", ST.FLOAT),
+			NTPNodeSetting("threshold_neighbor", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeDiffMatte' : NodeInfo(
+		[
+			NTPNodeSetting("falloff", ST.FLOAT),
+			NTPNodeSetting("tolerance", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeDilateErode' : NodeInfo(
+		[
+			NTPNodeSetting("distance", ST.INT),
+			NTPNodeSetting("edge", ST.FLOAT),
+			NTPNodeSetting("falloff", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeDisplace' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeDistanceMatte' : NodeInfo(
+		[
+			NTPNodeSetting("channel", ST.ENUM),
+			NTPNodeSetting("falloff", ST.FLOAT),
+			NTPNodeSetting("tolerance", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeDoubleEdgeMask' : NodeInfo(
+		[
+			NTPNodeSetting("edge_mode", ST.ENUM),
+			NTPNodeSetting("inner_mode", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeEllipseMask' : NodeInfo(
+		[
+			NTPNodeSetting("height", ST.FLOAT, max_version_=(4, 2, 0)),
+			NTPNodeSetting("mask_height", ST.FLOAT, min_version_=(4, 2, 0)),
+			NTPNodeSetting("mask_type", ST.ENUM),
+			NTPNodeSetting("mask_width", ST.FLOAT, min_version_=(4, 2, 0)),
+			NTPNodeSetting("rotation", ST.FLOAT),
+			NTPNodeSetting("width", ST.FLOAT, max_version_=(4, 2, 0)),
+			NTPNodeSetting("x", ST.FLOAT),
+			NTPNodeSetting("y", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeExposure' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeFilter' : NodeInfo(
+		[
+			NTPNodeSetting("filter_type", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeFlip' : NodeInfo(
+		[
+			NTPNodeSetting("axis", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeGamma' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeGlare' : NodeInfo(
+		[
+			NTPNodeSetting("angle_offset", ST.FLOAT),
+			NTPNodeSetting("color_modulation", ST.FLOAT),
+			NTPNodeSetting("fade", ST.FLOAT),
+			NTPNodeSetting("glare_type", ST.ENUM),
+			NTPNodeSetting("iterations", ST.INT),
+			NTPNodeSetting("mix", ST.FLOAT),
+			NTPNodeSetting("quality", ST.ENUM),
+			NTPNodeSetting("size", ST.INT),
+			NTPNodeSetting("streaks", ST.INT),
+			NTPNodeSetting("threshold", ST.FLOAT),
+			NTPNodeSetting("use_rotate_45", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeGroup' : NodeInfo(
+		[
+			NTPNodeSetting("node_tree", ST.NODE_TREE),
+		]
+	),
+
+	'CompositorNodeHueCorrect' : NodeInfo(
+		[
+			NTPNodeSetting("mapping", ST.CURVE_MAPPING),
+		]
+	),
+
+	'CompositorNodeHueSat' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeIDMask' : NodeInfo(
+		[
+			NTPNodeSetting("index", ST.INT),
+			NTPNodeSetting("use_antialiasing", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeImage' : NodeInfo(
+		[
+			NTPNodeSetting("frame_duration", ST.INT),
+			NTPNodeSetting("frame_offset", ST.INT),
+			NTPNodeSetting("frame_start", ST.INT),
+			NTPNodeSetting("image", ST.IMAGE),
+			NTPNodeSetting("layer", ST.ENUM),
+			NTPNodeSetting("use_auto_refresh", ST.BOOL),
+			NTPNodeSetting("use_cyclic", ST.BOOL),
+			NTPNodeSetting("use_straight_alpha_output", ST.BOOL),
+			NTPNodeSetting("view", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeInpaint' : NodeInfo(
+		[
+			NTPNodeSetting("distance", ST.INT),
+		]
+	),
+
+	'CompositorNodeInvert' : NodeInfo(
+		[
+			NTPNodeSetting("invert_alpha", ST.BOOL),
+			NTPNodeSetting("invert_rgb", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeKeying' : NodeInfo(
+		[
+			NTPNodeSetting("blur_post", ST.INT),
+			NTPNodeSetting("blur_pre", ST.INT),
+			NTPNodeSetting("clip_black", ST.FLOAT),
+			NTPNodeSetting("clip_white", ST.FLOAT),
+			NTPNodeSetting("despill_balance", ST.FLOAT),
+			NTPNodeSetting("despill_factor", ST.FLOAT),
+			NTPNodeSetting("dilate_distance", ST.INT),
+			NTPNodeSetting("edge_kernel_radius", ST.INT),
+			NTPNodeSetting("edge_kernel_tolerance", ST.FLOAT),
+			NTPNodeSetting("feather_distance", ST.INT),
+			NTPNodeSetting("feather_falloff", ST.ENUM),
+			NTPNodeSetting("screen_balance", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeKeyingScreen' : NodeInfo(
+		[
+			NTPNodeSetting("clip", ST.MOVIE_CLIP),
+			NTPNodeSetting("smoothness", ST.FLOAT, min_version_=(4, 1, 0)),
+			NTPNodeSetting("tracking_object", ST.STRING),
+		]
+	),
+
+	'CompositorNodeKuwahara' : NodeInfo(
+		[
+			NTPNodeSetting("eccentricity", ST.FLOAT),
+			NTPNodeSetting("sharpness", ST.FLOAT),
+			NTPNodeSetting("size", ST.INT, max_version_=(4, 1, 0)),
+			NTPNodeSetting("uniformity", ST.INT),
+			NTPNodeSetting("use_high_precision", ST.BOOL, min_version_=(4, 1, 0)),
+			NTPNodeSetting("variation", ST.ENUM),
+		],
+		min_version_ = (4, 0, 0)
+	),
+
+	'CompositorNodeLensdist' : NodeInfo(
+		[
+			NTPNodeSetting("use_fit", ST.BOOL),
+			NTPNodeSetting("use_jitter", ST.BOOL),
+			NTPNodeSetting("use_projector", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeLevels' : NodeInfo(
+		[
+			NTPNodeSetting("channel", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeLumaMatte' : NodeInfo(
+		[
+			NTPNodeSetting("limit_max", ST.FLOAT),
+			NTPNodeSetting("limit_min", ST.FLOAT),
+		]
+	),
+
+	'CompositorNodeMapRange' : NodeInfo(
+		[
+			NTPNodeSetting("use_clamp", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeMapUV' : NodeInfo(
+		[
+			NTPNodeSetting("alpha", ST.INT),
+			NTPNodeSetting("filter_type", ST.ENUM, min_version_=(4, 1, 0)),
+		]
+	),
+
+	'CompositorNodeMapValue' : NodeInfo(
+		[
+			NTPNodeSetting("max", ST.VEC1),
+			NTPNodeSetting("min", ST.VEC1),
+			NTPNodeSetting("offset", ST.VEC1),
+			NTPNodeSetting("size", ST.VEC1),
+			NTPNodeSetting("use_max", ST.BOOL),
+			NTPNodeSetting("use_min", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeMask' : NodeInfo(
+		[
+			NTPNodeSetting("mask", ST.MASK),
+			NTPNodeSetting("motion_blur_samples", ST.INT),
+			NTPNodeSetting("motion_blur_shutter", ST.FLOAT),
+			NTPNodeSetting("size_source", ST.ENUM),
+			NTPNodeSetting("size_x", ST.INT),
+			NTPNodeSetting("size_y", ST.INT),
+			NTPNodeSetting("use_feather", ST.BOOL),
+			NTPNodeSetting("use_motion_blur", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeMath' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+			NTPNodeSetting("use_clamp", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeMixRGB' : NodeInfo(
+		[
+			NTPNodeSetting("blend_type", ST.ENUM),
+			NTPNodeSetting("use_alpha", ST.BOOL),
+			NTPNodeSetting("use_clamp", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeMovieClip' : NodeInfo(
+		[
+			NTPNodeSetting("clip", ST.MOVIE_CLIP),
+		]
+	),
+
+	'CompositorNodeMovieDistortion' : NodeInfo(
+		[
+			NTPNodeSetting("clip", ST.MOVIE_CLIP),
+			NTPNodeSetting("distortion_type", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeNormal' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeNormalize' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeOutputFile' : NodeInfo(
+		[
+			NTPNodeSetting("active_input_index", ST.INT),
+			NTPNodeSetting("base_path", ST.STRING),
+			NTPNodeSetting("file_slots", ST.FILE_SLOTS),
+			NTPNodeSetting("format", ST.IMAGE_FORMAT_SETTINGS),
+			NTPNodeSetting("layer_slots", ST.LAYER_SLOTS),
+			NTPNodeSetting("save_as_render", ST.BOOL, min_version_=(4, 3, 0)),
+		]
+	),
+
+	'CompositorNodePixelate' : NodeInfo(
+		[
+			NTPNodeSetting("pixel_size", ST.INT, min_version_=(4, 1, 0)),
+		]
+	),
+
+	'CompositorNodePlaneTrackDeform' : NodeInfo(
+		[
+			NTPNodeSetting("clip", ST.MOVIE_CLIP),
+			NTPNodeSetting("motion_blur_samples", ST.INT),
+			NTPNodeSetting("motion_blur_shutter", ST.FLOAT),
+			NTPNodeSetting("plane_track_name", ST.STRING),
+			NTPNodeSetting("tracking_object", ST.STRING),
+			NTPNodeSetting("use_motion_blur", ST.BOOL),
+		]
+	),
+
+	'CompositorNodePosterize' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodePremulKey' : NodeInfo(
+		[
+			NTPNodeSetting("mapping", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeRGB' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeRGBToBW' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeRLayers' : NodeInfo(
+		[
+			NTPNodeSetting("layer", ST.ENUM),
+			NTPNodeSetting("scene", ST.SCENE),
+		]
+	),
+
+	'CompositorNodeRotate' : NodeInfo(
+		[
+			NTPNodeSetting("filter_type", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeScale' : NodeInfo(
+		[
+			NTPNodeSetting("frame_method", ST.ENUM),
+			NTPNodeSetting("offset_x", ST.FLOAT),
+			NTPNodeSetting("offset_y", ST.FLOAT),
+			NTPNodeSetting("space", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeSceneTime' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'CompositorNodeSepHSVA' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeSepRGBA' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeSepYCCA' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeSepYUVA' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeSeparateColor' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+			NTPNodeSetting("ycc_mode", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'CompositorNodeSeparateXYZ' : NodeInfo(
+		[],
+		min_version_ = (3, 2, 0)
+	),
+
+	'CompositorNodeSetAlpha' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeSplit' : NodeInfo(
+		[
+			NTPNodeSetting("axis", ST.ENUM),
+			NTPNodeSetting("factor", ST.INT),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'CompositorNodeSplitViewer' : NodeInfo(
+		[
+			NTPNodeSetting("axis", ST.ENUM),
+			NTPNodeSetting("factor", ST.INT),
+		],
+		max_version_ = (4, 1, 0)
+	),
+
+	'CompositorNodeStabilize' : NodeInfo(
+		[
+			NTPNodeSetting("clip", ST.MOVIE_CLIP),
+			NTPNodeSetting("filter_type", ST.ENUM),
+			NTPNodeSetting("invert", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeSunBeams' : NodeInfo(
+		[
+			NTPNodeSetting("ray_length", ST.FLOAT),
+			NTPNodeSetting("source", ST.VEC2),
+		]
+	),
+
+	'CompositorNodeSwitch' : NodeInfo(
+		[
+			NTPNodeSetting("check", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeSwitchView' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeTexture' : NodeInfo(
+		[
+			NTPNodeSetting("node_output", ST.INT),
+			NTPNodeSetting("texture", ST.TEXTURE),
+		]
+	),
+
+	'CompositorNodeTime' : NodeInfo(
+		[
+			NTPNodeSetting("curve", ST.CURVE_MAPPING),
+			NTPNodeSetting("frame_end", ST.INT),
+			NTPNodeSetting("frame_start", ST.INT),
+		]
+	),
+
+	'CompositorNodeTonemap' : NodeInfo(
+		[
+			NTPNodeSetting("adaptation", ST.FLOAT),
+			NTPNodeSetting("contrast", ST.FLOAT),
+			NTPNodeSetting("correction", ST.FLOAT),
+			NTPNodeSetting("gamma", ST.FLOAT),
+			NTPNodeSetting("intensity", ST.FLOAT),
+			NTPNodeSetting("key", ST.FLOAT),
+			NTPNodeSetting("offset", ST.FLOAT),
+			NTPNodeSetting("tonemap_type", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeTrackPos' : NodeInfo(
+		[
+			NTPNodeSetting("clip", ST.MOVIE_CLIP),
+			NTPNodeSetting("frame_relative", ST.INT),
+			NTPNodeSetting("position", ST.ENUM),
+			NTPNodeSetting("track_name", ST.STRING),
+			NTPNodeSetting("tracking_object", ST.STRING),
+		]
+	),
+
+	'CompositorNodeTransform' : NodeInfo(
+		[
+			NTPNodeSetting("filter_type", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeTranslate' : NodeInfo(
+		[
+			NTPNodeSetting("interpolation", ST.ENUM, min_version_=(4, 2, 0)),
+			NTPNodeSetting("use_relative", ST.BOOL),
+			NTPNodeSetting("wrap_axis", ST.ENUM),
+		]
+	),
+
+	'CompositorNodeValToRGB' : NodeInfo(
+		[
+			NTPNodeSetting("color_ramp", ST.COLOR_RAMP),
+		]
+	),
+
+	'CompositorNodeValue' : NodeInfo(
+		[]
+	),
+
+	'CompositorNodeVecBlur' : NodeInfo(
+		[
+			NTPNodeSetting("factor", ST.FLOAT),
+			NTPNodeSetting("samples", ST.INT),
+			NTPNodeSetting("speed_max", ST.INT),
+			NTPNodeSetting("speed_min", ST.INT),
+			NTPNodeSetting("use_curved", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeViewer' : NodeInfo(
+		[
+			NTPNodeSetting("center_x", ST.FLOAT, max_version_=(4, 2, 0)),
+			NTPNodeSetting("center_y", ST.FLOAT, max_version_=(4, 2, 0)),
+			NTPNodeSetting("tile_order", ST.ENUM, max_version_=(4, 2, 0)),
+			NTPNodeSetting("use_alpha", ST.BOOL),
+		]
+	),
+
+	'CompositorNodeZcombine' : NodeInfo(
+		[
+			NTPNodeSetting("use_alpha", ST.BOOL),
+			NTPNodeSetting("use_antialias_z", ST.BOOL),
+		]
+	),
+
+}
\ No newline at end of file
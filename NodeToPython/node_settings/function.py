@@ -0,0 +1,264 @@
+from . import NTPNodeSetting, NodeInfo, ST
+
+node_settings : dict[str, NodeInfo] = {
+	'FunctionNodeAlignEulerToVector' : NodeInfo(
+		[
+			NTPNodeSetting("axis", ST.ENUM),
+			NTPNodeSetting("pivot_axis", ST.ENUM),
+		]
+	),
+
+	'FunctionNodeAlignRotationToVector' : NodeInfo(
+		[
+			NTPNodeSetting("axis", ST.ENUM),
+			NTPNodeSetting("pivot_axis", ST.ENUM),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeAxesToRotation' : NodeInfo(
+		[
+			NTPNodeSetting("primary_axis", ST.ENUM),
+			NTPNodeSetting("secondary_axis", ST.ENUM),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeAxisAngleToRotation' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeBooleanMath' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+		]
+	),
+
+	'FunctionNodeCombineColor' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'FunctionNodeCombineMatrix' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeCombineTransform' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeCompare' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM),
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'FunctionNodeCompareFloats' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		max_version_ = (3, 1, 0)
+	),
+
+	'FunctionNodeEulerToRotation' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeFloatToInt' : NodeInfo(
+		[
+			NTPNodeSetting("rounding_mode", ST.ENUM),
+		]
+	),
+
+	'FunctionNodeHashValue' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'FunctionNodeInputBool' : NodeInfo(
+		[
+			NTPNodeSetting("boolean", ST.BOOL),
+		]
+	),
+
+	'FunctionNodeInputColor' : NodeInfo(
+		[
+			NTPNodeSetting("color", ST.VEC4, max_version_=(4, 2, 0)),
+			NTPNodeSetting("value", ST.VEC4, min_version_=(4, 2, 0)),
+		]
+	),
+
+	'FunctionNodeInputInt' : NodeInfo(
+		[
+			NTPNodeSetting("integer", ST.INT),
+		]
+	),
+
+	'FunctionNodeInputRotation' : NodeInfo(
+		[
+			NTPNodeSetting("rotation_euler", ST.EULER),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeInputSpecialCharacters' : NodeInfo(
+		[]
+	),
+
+	'FunctionNodeInputString' : NodeInfo(
+		[
+			NTPNodeSetting("string", ST.STRING),
+		]
+	),
+
+	'FunctionNodeInputVector' : NodeInfo(
+		[
+			NTPNodeSetting("vector", ST.VEC3),
+		]
+	),
+
+	'FunctionNodeIntegerMath' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'FunctionNodeInvertMatrix' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeInvertRotation' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeLegacyRandomFloat' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'FunctionNodeMatrixDeterminant' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'FunctionNodeMatrixMultiply' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeProjectPoint' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeQuaternionToRotation' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeRandomValue' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		]
+	),
+
+	'FunctionNodeReplaceString' : NodeInfo(
+		[]
+	),
+
+	'FunctionNodeRotateEuler' : NodeInfo(
+		[
+			NTPNodeSetting("rotation_type", ST.ENUM, min_version_=(4, 1, 0)),
+			NTPNodeSetting("space", ST.ENUM),
+			NTPNodeSetting("type", ST.ENUM, max_version_=(4, 1, 0)),
+		]
+	),
+
+	'FunctionNodeRotateRotation' : NodeInfo(
+		[
+			NTPNodeSetting("rotation_space", ST.ENUM),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'FunctionNodeRotateVector' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeRotationToAxisAngle' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeRotationToEuler' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeRotationToQuaternion' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'FunctionNodeSeparateColor' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'FunctionNodeSeparateMatrix' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeSeparateTransform' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeSliceString' : NodeInfo(
+		[]
+	),
+
+	'FunctionNodeStringLength' : NodeInfo(
+		[]
+	),
+
+	'FunctionNodeTransformDirection' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeTransformPoint' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeTransposeMatrix' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'FunctionNodeValueToString' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM, min_version_=(4, 3, 0)),
+		]
+	),
+
+}
\ No newline at end of file
@@ -0,0 +1,1512 @@
+from . import NTPNodeSetting, NodeInfo, ST
+
+node_settings : dict[str, NodeInfo] = {
+	'GeometryNodeAccumulateField' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeAttributeDomainSize' : NodeInfo(
+		[
+			NTPNodeSetting("component", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeAttributeRemove' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeAttributeStatistic' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeAttributeTransfer' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+			NTPNodeSetting("mapping", ST.ENUM),
+		],
+		max_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeBake' : NodeInfo(
+		[
+			NTPNodeSetting("active_index", ST.INT),
+			NTPNodeSetting("bake_items", ST.BAKE_ITEMS),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeBlurAttribute' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (3, 5, 0)
+	),
+
+	'GeometryNodeBoundBox' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCaptureAttribute' : NodeInfo(
+		[
+			NTPNodeSetting("active_index", ST.INT, min_version_=(4, 2, 0)),
+			NTPNodeSetting("capture_items", ST.CAPTURE_ATTRIBUTE_ITEMS, min_version_=(4, 2, 0)),
+			NTPNodeSetting("data_type", ST.ENUM, max_version_=(4, 2, 0)),
+			NTPNodeSetting("domain", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeCollectionInfo' : NodeInfo(
+		[
+			NTPNodeSetting("transform_space", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeConvexHull' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCornersOfEdge' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeCornersOfFace' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeCornersOfVertex' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeCurveArc' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeCurveEndpointSelection' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCurveHandleTypeSelection' : NodeInfo(
+		[
+			NTPNodeSetting("handle_type", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM_SET),
+		]
+	),
+
+	'GeometryNodeCurveLength' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCurveOfPoint' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeCurveParameter' : NodeInfo(
+		[],
+		max_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeCurvePrimitiveBezierSegment' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeCurvePrimitiveCircle' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeCurvePrimitiveLine' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeCurvePrimitiveQuadrilateral' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeCurveQuadraticBezier' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCurveSetHandles' : NodeInfo(
+		[
+			NTPNodeSetting("handle_type", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM_SET),
+		]
+	),
+
+	'GeometryNodeCurveSpiral' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCurveSplineType' : NodeInfo(
+		[
+			NTPNodeSetting("spline_type", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeCurveStar' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCurveToMesh' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeCurveToPoints' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeCurvesToGreasePencil' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeCustomGroup' : NodeInfo(
+		[
+			NTPNodeSetting("node_tree", ST.NODE_TREE),
+		]
+	),
+
+	'GeometryNodeDeformCurvesOnSurface' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeDeleteGeometry' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeDistributePointsInGrid' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeDistributePointsInVolume' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeDistributePointsOnFaces' : NodeInfo(
+		[
+			NTPNodeSetting("distribute_method", ST.ENUM),
+			NTPNodeSetting("use_legacy_normal", ST.BOOL, min_version_=(3, 5, 0)),
+		]
+	),
+
+	'GeometryNodeDualMesh' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeDuplicateElements' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeEdgePathsToCurves' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeEdgePathsToSelection' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeEdgesOfCorner' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeEdgesOfVertex' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeEdgesToFaceGroups' : NodeInfo(
+		[],
+		min_version_ = (3, 5, 0)
+	),
+
+	'GeometryNodeExtrudeMesh' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeFaceOfCorner' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeFieldAtIndex' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeFieldOnDomain' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeFillCurve' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeFilletCurve' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeFlipFaces' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeForeachGeometryElementInput' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeForeachGeometryElementOutput' : NodeInfo(
+		[
+			NTPNodeSetting("active_generation_index", ST.INT),
+			NTPNodeSetting("active_input_index", ST.INT),
+			NTPNodeSetting("active_main_index", ST.INT),
+			NTPNodeSetting("domain", ST.ENUM),
+			NTPNodeSetting("generation_items", ST.FOREACH_GEO_ELEMENT_GENERATION_ITEMS),
+			NTPNodeSetting("input_items", ST.FOREACH_GEO_ELEMENT_INPUT_ITEMS),
+			NTPNodeSetting("inspection_index", ST.INT),
+			NTPNodeSetting("main_items", ST.FOREACH_GEO_ELEMENT_MAIN_ITEMS),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeGeometryToInstance' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeGetNamedGrid' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeGizmoDial' : NodeInfo(
+		[
+			NTPNodeSetting("color_id", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeGizmoLinear' : NodeInfo(
+		[
+			NTPNodeSetting("color_id", ST.ENUM),
+			NTPNodeSetting("draw_style", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeGizmoTransform' : NodeInfo(
+		[
+			NTPNodeSetting("use_rotation_x", ST.BOOL),
+			NTPNodeSetting("use_rotation_y", ST.BOOL),
+			NTPNodeSetting("use_rotation_z", ST.BOOL),
+			NTPNodeSetting("use_scale_x", ST.BOOL),
+			NTPNodeSetting("use_scale_y", ST.BOOL),
+			NTPNodeSetting("use_scale_z", ST.BOOL),
+			NTPNodeSetting("use_translation_x", ST.BOOL),
+			NTPNodeSetting("use_translation_y", ST.BOOL),
+			NTPNodeSetting("use_translation_z", ST.BOOL),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeGreasePencilToCurves' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeGridToMesh' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeGroup' : NodeInfo(
+		[
+			NTPNodeSetting("node_tree", ST.NODE_TREE),
+		]
+	),
+
+	'GeometryNodeImageInfo' : NodeInfo(
+		[],
+		min_version_ = (3, 5, 0)
+	),
+
+	'GeometryNodeImageTexture' : NodeInfo(
+		[
+			NTPNodeSetting("extension", ST.ENUM),
+			NTPNodeSetting("interpolation", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeImportOBJ' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeImportPLY' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeImportSTL' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeIndexOfNearest' : NodeInfo(
+		[],
+		min_version_ = (3, 6, 0)
+	),
+
+	'GeometryNodeIndexSwitch' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("index_switch_items", ST.INDEX_SWITCH_ITEMS),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeInputActiveCamera' : NodeInfo(
+		[],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeInputCurveHandlePositions' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputCurveTilt' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputEdgeSmooth' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeInputID' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputImage' : NodeInfo(
+		[
+			NTPNodeSetting("image", ST.IMAGE),
+		],
+		min_version_ = (3, 5, 0)
+	),
+
+	'GeometryNodeInputIndex' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputInstanceRotation' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeInputInstanceScale' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeInputMaterial' : NodeInfo(
+		[
+			NTPNodeSetting("material", ST.MATERIAL),
+		]
+	),
+
+	'GeometryNodeInputMaterialIndex' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputMeshEdgeAngle' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputMeshEdgeNeighbors' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputMeshEdgeVertices' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputMeshFaceArea' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputMeshFaceIsPlanar' : NodeInfo(
+		[],
+		min_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeInputMeshFaceNeighbors' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputMeshIsland' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputMeshVertexNeighbors' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputNamedAttribute' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeInputNamedLayerSelection' : NodeInfo(
+		[],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeInputNormal' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputPosition' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputRadius' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputSceneTime' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeInputShadeSmooth' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputShortestEdgePaths' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeInputSignedDistance' : NodeInfo(
+		[],
+		min_version_ = (3, 6, 0),
+		max_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeInputSplineCyclic' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputSplineResolution' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInputTangent' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInstanceOnPoints' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInstanceTransform' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeInstancesToPoints' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeInterpolateCurves' : NodeInfo(
+		[],
+		min_version_ = (3, 5, 0)
+	),
+
+	'GeometryNodeIsViewport' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeJoinGeometry' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeLegacyAlignRotationToVector' : NodeInfo(
+		[
+			NTPNodeSetting("axis", ST.ENUM),
+			NTPNodeSetting("input_type_factor", ST.ENUM),
+			NTPNodeSetting("input_type_vector", ST.ENUM),
+			NTPNodeSetting("pivot_axis", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeClamp' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeColorRamp' : NodeInfo(
+		[
+			NTPNodeSetting("color_ramp", ST.COLOR_RAMP),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeCombineXYZ' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_x", ST.ENUM),
+			NTPNodeSetting("input_type_y", ST.ENUM),
+			NTPNodeSetting("input_type_z", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeCompare' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_a", ST.ENUM),
+			NTPNodeSetting("input_type_b", ST.ENUM),
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeConvert' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeCurveMap' : NodeInfo(
+		[
+			NTPNodeSetting("curve_rgb", ST.CURVE_MAPPING),
+			NTPNodeSetting("curve_vec", ST.CURVE_MAPPING),
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeFill' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeMapRange' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("interpolation_type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeMath' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_a", ST.ENUM),
+			NTPNodeSetting("input_type_b", ST.ENUM),
+			NTPNodeSetting("input_type_c", ST.ENUM),
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeMix' : NodeInfo(
+		[
+			NTPNodeSetting("blend_type", ST.ENUM),
+			NTPNodeSetting("input_type_a", ST.ENUM),
+			NTPNodeSetting("input_type_b", ST.ENUM),
+			NTPNodeSetting("input_type_factor", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeProximity' : NodeInfo(
+		[
+			NTPNodeSetting("target_geometry_element", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeRandomize' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeSampleTexture' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeSeparateXYZ' : NodeInfo(
+		[
+			NTPNodeSetting("input_type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeTransfer' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+			NTPNodeSetting("mapping", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeVectorMath' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_a", ST.ENUM),
+			NTPNodeSetting("input_type_b", ST.ENUM),
+			NTPNodeSetting("input_type_c", ST.ENUM),
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyAttributeVectorRotate' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_angle", ST.ENUM),
+			NTPNodeSetting("input_type_axis", ST.ENUM),
+			NTPNodeSetting("input_type_center", ST.ENUM),
+			NTPNodeSetting("input_type_rotation", ST.ENUM),
+			NTPNodeSetting("input_type_vector", ST.ENUM),
+			NTPNodeSetting("rotation_mode", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyCurveEndpoints' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyCurveReverse' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyCurveSelectHandles' : NodeInfo(
+		[
+			NTPNodeSetting("handle_type", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM_SET),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyCurveSetHandles' : NodeInfo(
+		[
+			NTPNodeSetting("handle_type", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM_SET),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyCurveSplineType' : NodeInfo(
+		[
+			NTPNodeSetting("spline_type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyCurveSubdivide' : NodeInfo(
+		[
+			NTPNodeSetting("cuts_type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyCurveToPoints' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyDeleteGeometry' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyEdgeSplit' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyMaterialAssign' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyMeshToCurve' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyPointDistribute' : NodeInfo(
+		[
+			NTPNodeSetting("distribute_method", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyPointInstance' : NodeInfo(
+		[
+			NTPNodeSetting("instance_type", ST.ENUM),
+			NTPNodeSetting("use_whole_collection", ST.BOOL),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyPointScale' : NodeInfo(
+		[
+			NTPNodeSetting("input_type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyPointSeparate' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyPointTranslate' : NodeInfo(
+		[
+			NTPNodeSetting("input_type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyPointsToVolume' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_radius", ST.ENUM),
+			NTPNodeSetting("resolution_mode", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyRaycast' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_ray_direction", ST.ENUM),
+			NTPNodeSetting("input_type_ray_length", ST.ENUM),
+			NTPNodeSetting("mapping", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyRotatePoints' : NodeInfo(
+		[
+			NTPNodeSetting("input_type_angle", ST.ENUM),
+			NTPNodeSetting("input_type_axis", ST.ENUM),
+			NTPNodeSetting("input_type_rotation", ST.ENUM),
+			NTPNodeSetting("space", ST.ENUM),
+			NTPNodeSetting("type", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacySelectByMaterial' : NodeInfo(
+		[],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacySubdivisionSurface' : NodeInfo(
+		[
+			NTPNodeSetting("boundary_smooth", ST.ENUM),
+			NTPNodeSetting("uv_smooth", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeLegacyVolumeToMesh' : NodeInfo(
+		[
+			NTPNodeSetting("resolution_mode", ST.ENUM),
+		],
+		max_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeMaterialSelection' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeMeanFilterSDFVolume' : NodeInfo(
+		[],
+		min_version_ = (3, 6, 0),
+		max_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeMenuSwitch' : NodeInfo(
+		[
+			NTPNodeSetting("active_index", ST.INT, min_version_=(4, 2, 0)),
+			NTPNodeSetting("active_item", ST.ENUM_ITEM, min_version_=(4, 2, 0)),
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("enum_definition", ST.ENUM_DEFINITION, max_version_=(4, 2, 0)),
+			NTPNodeSetting("enum_items", ST.MENU_SWITCH_ITEMS, min_version_=(4, 2, 0)),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeMergeByDistance' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM, min_version_=(3, 2, 0)),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeMergeLayers' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeMeshBoolean' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+			NTPNodeSetting("solver", ST.ENUM, min_version_=(4, 2, 0)),
+		]
+	),
+
+	'GeometryNodeMeshCircle' : NodeInfo(
+		[
+			NTPNodeSetting("fill_type", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeMeshCone' : NodeInfo(
+		[
+			NTPNodeSetting("fill_type", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeMeshCube' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeMeshCylinder' : NodeInfo(
+		[
+			NTPNodeSetting("fill_type", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeMeshFaceSetBoundaries' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeMeshGrid' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeMeshIcoSphere' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeMeshLine' : NodeInfo(
+		[
+			NTPNodeSetting("count_mode", ST.ENUM),
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeMeshToCurve' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeMeshToDensityGrid' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeMeshToPoints' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeMeshToSDFGrid' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeMeshToSDFVolume' : NodeInfo(
+		[
+			NTPNodeSetting("resolution_mode", ST.ENUM),
+		],
+		min_version_ = (3, 6, 0),
+		max_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeMeshToVolume' : NodeInfo(
+		[
+			NTPNodeSetting("resolution_mode", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeMeshUVSphere' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeObjectInfo' : NodeInfo(
+		[
+			NTPNodeSetting("transform_space", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeOffsetCornerInFace' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeOffsetPointInCurve' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeOffsetSDFVolume' : NodeInfo(
+		[],
+		min_version_ = (3, 6, 0),
+		max_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodePoints' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodePointsOfCurve' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodePointsToCurves' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodePointsToSDFGrid' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodePointsToSDFVolume' : NodeInfo(
+		[
+			NTPNodeSetting("resolution_mode", ST.ENUM),
+		],
+		min_version_ = (3, 6, 0),
+		max_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodePointsToVertices' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodePointsToVolume' : NodeInfo(
+		[
+			NTPNodeSetting("resolution_mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeProximity' : NodeInfo(
+		[
+			NTPNodeSetting("target_element", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeRaycast' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("mapping", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeRealizeInstances' : NodeInfo(
+		[
+			NTPNodeSetting("legacy_behavior", ST.BOOL, min_version_=(3, 1, 0), max_version_=(4, 0, 0)),
+		]
+	),
+
+	'GeometryNodeRemoveAttribute' : NodeInfo(
+		[
+			NTPNodeSetting("pattern_mode", ST.ENUM, min_version_=(4, 2, 0)),
+		],
+		min_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeRepeatInput' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeRepeatOutput' : NodeInfo(
+		[
+			NTPNodeSetting("active_index", ST.INT),
+			NTPNodeSetting("inspection_index", ST.INT),
+			NTPNodeSetting("repeat_items", ST.REPEAT_OUTPUT_ITEMS),
+		],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeReplaceMaterial' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeResampleCurve' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeReverseCurve' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeRotateInstances' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSDFGridBoolean' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeSDFVolumeSphere' : NodeInfo(
+		[],
+		min_version_ = (3, 6, 0),
+		max_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeSampleCurve' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM, min_version_=(3, 4, 0)),
+			NTPNodeSetting("mode", ST.ENUM),
+			NTPNodeSetting("use_all_curves", ST.BOOL, min_version_=(3, 4, 0)),
+		]
+	),
+
+	'GeometryNodeSampleGrid' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("interpolation_mode", ST.ENUM),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeSampleGridIndex' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeSampleIndex' : NodeInfo(
+		[
+			NTPNodeSetting("clamp", ST.BOOL),
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeSampleNearest' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeSampleNearestSurface' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeSampleUVSurface' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeSampleVolume' : NodeInfo(
+		[
+			NTPNodeSetting("grid_type", ST.ENUM),
+			NTPNodeSetting("interpolation_mode", ST.ENUM),
+		],
+		min_version_ = (3, 6, 0),
+		max_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeScaleElements' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+			NTPNodeSetting("scale_mode", ST.ENUM),
+		],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeScaleInstances' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSelfObject' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeSeparateComponents' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSeparateGeometry' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeSetCurveHandlePositions' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeSetCurveNormal' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeSetCurveRadius' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetCurveTilt' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetGeometryName' : NodeInfo(
+		[],
+		min_version_ = (4, 3, 0)
+	),
+
+	'GeometryNodeSetID' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetInstanceTransform' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeSetMaterial' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetMaterialIndex' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetPointRadius' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetPosition' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetShadeSmooth' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM, min_version_=(4, 0, 0)),
+		]
+	),
+
+	'GeometryNodeSetSplineCyclic' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSetSplineResolution' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSimulationInput' : NodeInfo(
+		[],
+		min_version_ = (3, 6, 0)
+	),
+
+	'GeometryNodeSimulationOutput' : NodeInfo(
+		[
+			NTPNodeSetting("active_index", ST.INT),
+			NTPNodeSetting("state_items", ST.SIM_OUTPUT_ITEMS),
+		],
+		min_version_ = (3, 6, 0)
+	),
+
+	'GeometryNodeSortElements' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeSplineLength' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSplineParameter' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'GeometryNodeSplitEdges' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSplitToInstances' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeStoreNamedAttribute' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (3, 2, 0)
+	),
+
+	'GeometryNodeStoreNamedGrid' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+		],
+		min_version_ = (4, 1, 0)
+	),
+
+	'GeometryNodeStringJoin' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeStringToCurves' : NodeInfo(
+		[
+			NTPNodeSetting("align_x", ST.ENUM),
+			NTPNodeSetting("align_y", ST.ENUM),
+			NTPNodeSetting("font", ST.FONT),
+			NTPNodeSetting("overflow", ST.ENUM),
+			NTPNodeSetting("pivot_mode", ST.ENUM, min_version_=(3, 1, 0)),
+		]
+	),
+
+	'GeometryNodeSubdivideCurve' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSubdivideMesh' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeSubdivisionSurface' : NodeInfo(
+		[
+			NTPNodeSetting("boundary_smooth", ST.ENUM),
+			NTPNodeSetting("uv_smooth", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeSwitch' : NodeInfo(
+		[
+			NTPNodeSetting("input_type", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeTool3DCursor' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeToolActiveElement' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+		],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeToolFaceSet' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeToolMousePosition' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeToolSelection' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeToolSetFaceSet' : NodeInfo(
+		[],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeToolSetSelection' : NodeInfo(
+		[
+			NTPNodeSetting("domain", ST.ENUM),
+			NTPNodeSetting("selection_type", ST.ENUM, min_version_=(4, 3, 0)),
+		],
+		min_version_ = (4, 0, 0)
+	),
+
+	'GeometryNodeTransform' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM, min_version_=(4, 2, 0)),
+		]
+	),
+
+	'GeometryNodeTranslateInstances' : NodeInfo(
+		[]
+	),
+
+	'GeometryNodeTriangulate' : NodeInfo(
+		[
+			NTPNodeSetting("ngon_method", ST.ENUM),
+			NTPNodeSetting("quad_method", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeTrimCurve' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeUVPackIslands' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeUVUnwrap' : NodeInfo(
+		[
+			NTPNodeSetting("method", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeVertexOfCorner' : NodeInfo(
+		[],
+		min_version_ = (3, 4, 0)
+	),
+
+	'GeometryNodeViewer' : NodeInfo(
+		[
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("domain", ST.ENUM, min_version_=(3, 4, 0)),
+		]
+	),
+
+	'GeometryNodeViewportTransform' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'GeometryNodeVolumeCube' : NodeInfo(
+		[],
+		min_version_ = (3, 3, 0)
+	),
+
+	'GeometryNodeVolumeToMesh' : NodeInfo(
+		[
+			NTPNodeSetting("resolution_mode", ST.ENUM),
+		]
+	),
+
+	'GeometryNodeWarning' : NodeInfo(
+		[
+			NTPNodeSetting("warning_type", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+}
\ No newline at end of file
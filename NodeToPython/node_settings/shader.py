@@ -0,0 +1,638 @@
+from . import NTPNodeSetting, NodeInfo, ST
+
+node_settings : dict[str, NodeInfo] = {
+	'ShaderNodeAddShader' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeAmbientOcclusion' : NodeInfo(
+		[
+			NTPNodeSetting("inside", ST.BOOL),
+			NTPNodeSetting("only_local", ST.BOOL),
+			NTPNodeSetting("samples", ST.INT),
+		]
+	),
+
+	'ShaderNodeAttribute' : NodeInfo(
+		[
+			NTPNodeSetting("attribute_name", ST.STRING),
+			NTPNodeSetting("attribute_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBackground' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeBevel' : NodeInfo(
+		[
+			NTPNodeSetting("samples", ST.INT),
+		]
+	),
+
+	'ShaderNodeBlackbody' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeBrightContrast' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeBsdfAnisotropic' : NodeInfo(
+		[
+			NTPNodeSetting("distribution", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBsdfDiffuse' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeBsdfGlass' : NodeInfo(
+		[
+			NTPNodeSetting("distribution", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBsdfGlossy' : NodeInfo(
+		[
+			NTPNodeSetting("distribution", ST.ENUM),
+		],
+		max_version_ = (4, 0, 0)
+	),
+
+	'ShaderNodeBsdfHair' : NodeInfo(
+		[
+			NTPNodeSetting("component", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBsdfHairPrincipled' : NodeInfo(
+		[
+			NTPNodeSetting("model", ST.ENUM, min_version_=(4, 0, 0)),
+			NTPNodeSetting("parametrization", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBsdfMetallic' : NodeInfo(
+		[
+			NTPNodeSetting("distribution", ST.ENUM),
+			NTPNodeSetting("fresnel_type", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'ShaderNodeBsdfPrincipled' : NodeInfo(
+		[
+			NTPNodeSetting("distribution", ST.ENUM),
+			NTPNodeSetting("subsurface_method", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBsdfRayPortal' : NodeInfo(
+		[],
+		min_version_ = (4, 2, 0)
+	),
+
+	'ShaderNodeBsdfRefraction' : NodeInfo(
+		[
+			NTPNodeSetting("distribution", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBsdfSheen' : NodeInfo(
+		[
+			NTPNodeSetting("distribution", ST.ENUM),
+		],
+		min_version_ = (4, 0, 0)
+	),
+
+	'ShaderNodeBsdfToon' : NodeInfo(
+		[
+			NTPNodeSetting("component", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeBsdfTranslucent' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeBsdfTransparent' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeBsdfVelvet' : NodeInfo(
+		[],
+		max_version_ = (4, 0, 0)
+	),
+
+	'ShaderNodeBump' : NodeInfo(
+		[
+			NTPNodeSetting("invert", ST.BOOL),
+		]
+	),
+
+	'ShaderNodeCameraData' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeClamp' : NodeInfo(
+		[
+			NTPNodeSetting("clamp_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeCombineColor' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'ShaderNodeCombineHSV' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeCombineRGB' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeCombineXYZ' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeCustomGroup' : NodeInfo(
+		[
+			NTPNodeSetting("node_tree", ST.NODE_TREE),
+		]
+	),
+
+	'ShaderNodeDisplacement' : NodeInfo(
+		[
+			NTPNodeSetting("space", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeEeveeSpecular' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeEmission' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeFloatCurve' : NodeInfo(
+		[
+			NTPNodeSetting("mapping", ST.CURVE_MAPPING),
+		]
+	),
+
+	'ShaderNodeFresnel' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeGamma' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeGroup' : NodeInfo(
+		[
+			NTPNodeSetting("node_tree", ST.NODE_TREE),
+		]
+	),
+
+	'ShaderNodeHairInfo' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeHoldout' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeHueSaturation' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeInvert' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeLayerWeight' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeLightFalloff' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeLightPath' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeMapRange' : NodeInfo(
+		[
+			NTPNodeSetting("clamp", ST.BOOL),
+			NTPNodeSetting("data_type", ST.ENUM, min_version_=(3, 1, 0)),
+			NTPNodeSetting("interpolation_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeMapping' : NodeInfo(
+		[
+			NTPNodeSetting("vector_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeMath' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+			NTPNodeSetting("use_clamp", ST.BOOL),
+		]
+	),
+
+	'ShaderNodeMix' : NodeInfo(
+		[
+			NTPNodeSetting("blend_type", ST.ENUM),
+			NTPNodeSetting("clamp_factor", ST.BOOL),
+			NTPNodeSetting("clamp_result", ST.BOOL),
+			NTPNodeSetting("data_type", ST.ENUM),
+			NTPNodeSetting("factor_mode", ST.ENUM),
+		],
+		min_version_ = (3, 4, 0)
+	),
+
+	'ShaderNodeMixRGB' : NodeInfo(
+		[
+			NTPNodeSetting("blend_type", ST.ENUM),
+			NTPNodeSetting("use_alpha", ST.BOOL),
+			NTPNodeSetting("use_clamp", ST.BOOL),
+		]
+	),
+
+	'ShaderNodeMixShader' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeNewGeometry' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeNormal' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeNormalMap' : NodeInfo(
+		[
+			NTPNodeSetting("space", ST.ENUM),
+			NTPNodeSetting("uv_map", ST.STRING),
+		]
+	),
+
+	'ShaderNodeObjectInfo' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeOutputAOV' : NodeInfo(
+		[
+			NTPNodeSetting("aov_name", ST.STRING, min_version_=(4, 2, 0)),
+			NTPNodeSetting("name", ST.STRING, max_version_=(4, 2, 0)),
+		]
+	),
+
+	'ShaderNodeOutputLight' : NodeInfo(
+		[
+			NTPNodeSetting("is_active_output", ST.BOOL),
+			NTPNodeSetting("target", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeOutputLineStyle' : NodeInfo(
+		[
+			NTPNodeSetting("blend_type", ST.ENUM),
+			NTPNodeSetting("is_active_output", ST.BOOL),
+			NTPNodeSetting("target", ST.ENUM),
+			NTPNodeSetting("use_alpha", ST.BOOL),
+			NTPNodeSetting("use_clamp", ST.BOOL),
+		]
+	),
+
+	'ShaderNodeOutputMaterial' : NodeInfo(
+		[
+			NTPNodeSetting("is_active_output", ST.BOOL),
+			NTPNodeSetting("target", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeOutputWorld' : NodeInfo(
+		[
+			NTPNodeSetting("is_active_output", ST.BOOL),
+			NTPNodeSetting("target", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeParticleInfo' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodePointInfo' : NodeInfo(
+		[],
+		min_version_ = (3, 1, 0)
+	),
+
+	'ShaderNodeRGB' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeRGBCurve' : NodeInfo(
+		[
+			NTPNodeSetting("mapping", ST.CURVE_MAPPING),
+		]
+	),
+
+	'ShaderNodeRGBToBW' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeScript' : NodeInfo(
+		[
+			NTPNodeSetting("bytecode", ST.STRING),
+			NTPNodeSetting("bytecode_hash", ST.STRING),
+			NTPNodeSetting("filepath", ST.STRING),
+			NTPNodeSetting("mode", ST.ENUM),
+			NTPNodeSetting("script", ST.TEXT),
+			NTPNodeSetting("use_auto_update", ST.BOOL),
+		]
+	),
+
+	'ShaderNodeSeparateColor' : NodeInfo(
+		[
+			NTPNodeSetting("mode", ST.ENUM),
+		],
+		min_version_ = (3, 3, 0)
+	),
+
+	'ShaderNodeSeparateHSV' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeSeparateRGB' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeSeparateXYZ' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeShaderToRGB' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeSqueeze' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeSubsurfaceScattering' : NodeInfo(
+		[
+			NTPNodeSetting("falloff", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeTangent' : NodeInfo(
+		[
+			NTPNodeSetting("axis", ST.ENUM),
+			NTPNodeSetting("direction_type", ST.ENUM),
+			NTPNodeSetting("uv_map", ST.STRING),
+		]
+	),
+
+	'ShaderNodeTexBrick' : NodeInfo(
+		[
+			NTPNodeSetting("offset", ST.FLOAT),
+			NTPNodeSetting("offset_frequency", ST.INT),
+			NTPNodeSetting("squash", ST.FLOAT),
+			NTPNodeSetting("squash_frequency", ST.INT),
+		]
+	),
+
+	'ShaderNodeTexChecker' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeTexCoord' : NodeInfo(
+		[
+			NTPNodeSetting("from_instancer", ST.BOOL),
+			NTPNodeSetting("object", ST.OBJECT),
+		]
+	),
+
+	'ShaderNodeTexEnvironment' : NodeInfo(
+		[
+			NTPNodeSetting("image", ST.IMAGE),
+			NTPNodeSetting("image_user", ST.IMAGE_USER),
+			NTPNodeSetting("interpolation", ST.ENUM),
+			NTPNodeSetting("projection", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeTexGabor' : NodeInfo(
+		[
+			NTPNodeSetting("gabor_type", ST.ENUM),
+		],
+		min_version_ = (4, 3, 0)
+	),
+
+	'ShaderNodeTexGradient' : NodeInfo(
+		[
+			NTPNodeSetting("gradient_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeTexIES' : NodeInfo(
+		[
+			NTPNodeSetting("filepath", ST.STRING),
+			NTPNodeSetting("ies", ST.TEXT),
+			NTPNodeSetting("mode", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeTexImage' : NodeInfo(
+		[
+			NTPNodeSetting("extension", ST.ENUM),
+			NTPNodeSetting("image", ST.IMAGE),
+			NTPNodeSetting("image_user", ST.IMAGE_USER),
+			NTPNodeSetting("interpolation", ST.ENUM),
+			NTPNodeSetting("projection", ST.ENUM),
+			NTPNodeSetting("projection_blend", ST.FLOAT),
+		]
+	),
+
+	'ShaderNodeTexMagic' : NodeInfo(
+		[
+			NTPNodeSetting("turbulence_depth", ST.INT),
+		]
+	),
+
+	'ShaderNodeTexMusgrave' : NodeInfo(
+		[
+			NTPNodeSetting("musgrave_dimensions", ST.ENUM),
+			NTPNodeSetting("musgrave_type", ST.ENUM),
+		],
+		max_version_ = (4, 1, 0)
+	),
+
+	'ShaderNodeTexNoise' : NodeInfo(
+		[
+			NTPNodeSetting("noise_dimensions", ST.ENUM),
+			NTPNodeSetting("noise_type", ST.ENUM, min_version_=(4, 1, 0)),
+			NTPNodeSetting("normalize", ST.BOOL, min_version_=(4, 0, 0)),
+		]
+	),
+
+	'ShaderNodeTexPointDensity' : NodeInfo(
+		[
+			NTPNodeSetting("interpolation", ST.ENUM),
+			NTPNodeSetting("object", ST.OBJECT),
+			NTPNodeSetting("particle_color_source", ST.ENUM),
+			NTPNodeSetting("particle_system", ST.PARTICLE_SYSTEM),
+			NTPNodeSetting("point_source", ST.ENUM),
+			NTPNodeSetting("radius", ST.FLOAT),
+			NTPNodeSetting("resolution", ST.INT),
+			NTPNodeSetting("space", ST.ENUM),
+			NTPNodeSetting("vertex_attribute_name", ST.STRING),
+			NTPNodeSetting("vertex_color_source", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeTexSky' : NodeInfo(
+		[
+			NTPNodeSetting("air_density", ST.FLOAT),
+			NTPNodeSetting("altitude", ST.FLOAT),
+			NTPNodeSetting("dust_density", ST.FLOAT),
+			NTPNodeSetting("ground_albedo", ST.FLOAT),
+			NTPNodeSetting("ozone_density", ST.FLOAT),
+			NTPNodeSetting("sky_type", ST.ENUM),
+			NTPNodeSetting("sun_direction", ST.VEC3),
+			NTPNodeSetting("sun_disc", ST.BOOL),
+			NTPNodeSetting("sun_elevation", ST.FLOAT),
+			NTPNodeSetting("sun_intensity", ST.FLOAT),
+			NTPNodeSetting("sun_rotation", ST.FLOAT),
+			NTPNodeSetting("sun_size", ST.FLOAT),
+			NTPNodeSetting("turbidity", ST.FLOAT),
+		]
+	),
+
+	'ShaderNodeTexVoronoi' : NodeInfo(
+		[
+			NTPNodeSetting("distance", ST.ENUM),
+			NTPNodeSetting("feature", ST.ENUM),
+			NTPNodeSetting("normalize", ST.BOOL, min_version_=(4, 0, 0)),
+			NTPNodeSetting("voronoi_dimensions", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeTexWave' : NodeInfo(
+		[
+			NTPNodeSetting("bands_direction", ST.ENUM),
+			NTPNodeSetting("rings_direction", ST.ENUM),
+			NTPNodeSetting("wave_profile", ST.ENUM),
+			NTPNodeSetting("wave_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeTexWhiteNoise' : NodeInfo(
+		[
+			NTPNodeSetting("noise_dimensions", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeUVAlongStroke' : NodeInfo(
+		[
+			NTPNodeSetting("use_tips", ST.BOOL),
+		]
+	),
+
+	'ShaderNodeUVMap' : NodeInfo(
+		[
+			NTPNodeSetting("from_instancer", ST.BOOL),
+			NTPNodeSetting("uv_map", ST.STRING),
+		]
+	),
+
+	'ShaderNodeValToRGB' : NodeInfo(
+		[
+			NTPNodeSetting("color_ramp", ST.COLOR_RAMP),
+		]
+	),
+
+	'ShaderNodeValue' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeVectorCurve' : NodeInfo(
+		[
+			NTPNodeSetting("mapping", ST.CURVE_MAPPING),
+		]
+	),
+
+	'ShaderNodeVectorDisplacement' : NodeInfo(
+		[
+			NTPNodeSetting("space", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeVectorMath' : NodeInfo(
+		[
+			NTPNodeSetting("operation", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeVectorRotate' : NodeInfo(
+		[
+			NTPNodeSetting("invert", ST.BOOL),
+			NTPNodeSetting("rotation_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeVectorTransform' : NodeInfo(
+		[
+			NTPNodeSetting("convert_from", ST.ENUM),
+			NTPNodeSetting("convert_to", ST.ENUM),
+			NTPNodeSetting("vector_type", ST.ENUM),
+		]
+	),
+
+	'ShaderNodeVertexColor' : NodeInfo(
+		[
+			NTPNodeSetting("layer_name", ST.STRING),
+		]
+	),
+
+	'ShaderNodeVolumeAbsorption' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeVolumeInfo' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeVolumePrincipled' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeVolumeScatter' : NodeInfo(
+		[
+			NTPNodeSetting("phase", ST.ENUM, min_version_=(4, 3, 0)),
+		]
+	),
+
+	'ShaderNodeWavelength' : NodeInfo(
+		[]
+	),
+
+	'ShaderNodeWireframe' : NodeInfo(
+		[
+			NTPNodeSetting("use_pixel_size", ST.BOOL),
+		]
+	),
+
+}
\ No newline at end of file
@@ -0,0 +1,251 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_align_x_enum = NTPNodeSetting("align_x", ST.ENUM)
+_align_y_enum = NTPNodeSetting("align_y", ST.ENUM)
+_axis_enum = NTPNodeSetting("axis", ST.ENUM)
+_blend_type_enum = NTPNodeSetting("blend_type", ST.ENUM)
+_boundary_smooth_enum = NTPNodeSetting("boundary_smooth", ST.ENUM)
+_color_ramp_color_ramp = NTPNodeSetting("color_ramp", ST.COLOR_RAMP)
+_component_enum = NTPNodeSetting("component", ST.ENUM)
+_count_mode_enum = NTPNodeSetting("count_mode", ST.ENUM)
+_curve_rgb_curve_mapping = NTPNodeSetting("curve_rgb", ST.CURVE_MAPPING)
+_curve_vec_curve_mapping = NTPNodeSetting("curve_vec", ST.CURVE_MAPPING)
+_cuts_type_enum = NTPNodeSetting("cuts_type", ST.ENUM)
+_data_type_enum = NTPNodeSetting("data_type", ST.ENUM)
+_distribute_method_enum = NTPNodeSetting("distribute_method", ST.ENUM)
+_domain_enum = NTPNodeSetting("domain", ST.ENUM)
+_extension_enum = NTPNodeSetting("extension", ST.ENUM)
+_fill_type_enum = NTPNodeSetting("fill_type", ST.ENUM)
+_font_font = NTPNodeSetting("font", ST.FONT)
+_handle_type_enum = NTPNodeSetting("handle_type", ST.ENUM)
+_input_type_enum = NTPNodeSetting("input_type", ST.ENUM)
+_input_type_a_enum = NTPNodeSetting("input_type_a", ST.ENUM)
+_input_type_angle_enum = NTPNodeSetting("input_type_angle", ST.ENUM)
+_input_type_axis_enum = NTPNodeSetting("input_type_axis", ST.ENUM)
+_input_type_b_enum = NTPNodeSetting("input_type_b", ST.ENUM)
+_input_type_c_enum = NTPNodeSetting("input_type_c", ST.ENUM)
+_input_type_center_enum = NTPNodeSetting("input_type_center", ST.ENUM)
+_input_type_factor_enum = NTPNodeSetting("input_type_factor", ST.ENUM)
+_input_type_radius_enum = NTPNodeSetting("input_type_radius", ST.ENUM)
+_input_type_ray_direction_enum = NTPNodeSetting("input_type_ray_direction", ST.ENUM)
+_input_type_ray_length_enum = NTPNodeSetting("input_type_ray_length", ST.ENUM)
+_input_type_rotation_enum = NTPNodeSetting("input_type_rotation", ST.ENUM)
+_input_type_vector_enum = NTPNodeSetting("input_type_vector", ST.ENUM)
+_input_type_x_enum = NTPNodeSetting("input_type_x", ST.ENUM)
+_input_type_y_enum = NTPNodeSetting("input_type_y", ST.ENUM)
+_input_type_z_enum = NTPNodeSetting("input_type_z", ST.ENUM)
+_instance_type_enum = NTPNodeSetting("instance_type", ST.ENUM)
+_interpolation_enum = NTPNodeSetting("interpolation", ST.ENUM)
+_interpolation_type_enum = NTPNodeSetting("interpolation_type", ST.ENUM)
+_legacy_behavior_bool = NTPNodeSetting("legacy_behavior", ST.BOOL)
+_mapping_enum = NTPNodeSetting("mapping", ST.ENUM)
+_material_material = NTPNodeSetting("material", ST.MATERIAL)
+_mode_enum = NTPNodeSetting("mode", ST.ENUM)
+_mode_enum_set = NTPNodeSetting("mode", ST.ENUM_SET)
+_ngon_method_enum = NTPNodeSetting("ngon_method", ST.ENUM)
+_node_tree_node_tree = NTPNodeSetting("node_tree", ST.NODE_TREE)
+_operation_enum = NTPNodeSetting("operation", ST.ENUM)
+_overflow_enum = NTPNodeSetting("overflow", ST.ENUM)
+_pivot_axis_enum = NTPNodeSetting("pivot_axis", ST.ENUM)
+_pivot_mode_enum = NTPNodeSetting("pivot_mode", ST.ENUM)
+_quad_method_enum = NTPNodeSetting("quad_method", ST.ENUM)
+_resolution_mode_enum = NTPNodeSetting("resolution_mode", ST.ENUM)
+_rotation_mode_enum = NTPNodeSetting("rotation_mode", ST.ENUM)
+_scale_mode_enum = NTPNodeSetting("scale_mode", ST.ENUM)
+_space_enum = NTPNodeSetting("space", ST.ENUM)
+_spline_type_enum = NTPNodeSetting("spline_type", ST.ENUM)
+_target_element_enum = NTPNodeSetting("target_element", ST.ENUM)
+_target_geometry_element_enum = NTPNodeSetting("target_geometry_element", ST.ENUM)
+_transform_space_enum = NTPNodeSetting("transform_space", ST.ENUM)
+_type_enum = NTPNodeSetting("type", ST.ENUM)
+_use_whole_collection_bool = NTPNodeSetting("use_whole_collection", ST.BOOL)
+_uv_smooth_enum = NTPNodeSetting("uv_smooth", ST.ENUM)
+
+node_settings : dict[str, NodeInfo] = {
+	'GeometryNodeAccumulateField' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeAttributeDomainSize' : NodeInfo((_component_enum,)),
+	'GeometryNodeAttributeRemove' : NodeInfo(()),
+	'GeometryNodeAttributeStatistic' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeAttributeTransfer' : NodeInfo((_data_type_enum, _domain_enum,
+		_mapping_enum)),
+	'GeometryNodeBoundBox' : NodeInfo(()),
+	'GeometryNodeCaptureAttribute' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeCollectionInfo' : NodeInfo((_transform_space_enum,)),
+	'GeometryNodeConvexHull' : NodeInfo(()),
+	'GeometryNodeCurveArc' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurveEndpointSelection' : NodeInfo(()),
+	'GeometryNodeCurveHandleTypeSelection' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeCurveLength' : NodeInfo(()),
+	'GeometryNodeCurvePrimitiveBezierSegment' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveCircle' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveLine' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveQuadrilateral' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurveQuadraticBezier' : NodeInfo(()),
+	'GeometryNodeCurveSetHandles' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeCurveSpiral' : NodeInfo(()),
+	'GeometryNodeCurveSplineType' : NodeInfo((_spline_type_enum,)),
+	'GeometryNodeCurveStar' : NodeInfo(()),
+	'GeometryNodeCurveToMesh' : NodeInfo(()),
+	'GeometryNodeCurveToPoints' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCustomGroup' : NodeInfo((_node_tree_node_tree,)),
+	'GeometryNodeDeleteGeometry' : NodeInfo((_domain_enum, _mode_enum)),
+	'GeometryNodeDistributePointsOnFaces' : NodeInfo((_distribute_method_enum,)),
+	'GeometryNodeDualMesh' : NodeInfo(()),
+	'GeometryNodeExtrudeMesh' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFieldAtIndex' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeFillCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFilletCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFlipFaces' : NodeInfo(()),
+	'GeometryNodeGeometryToInstance' : NodeInfo(()),
+	'GeometryNodeGroup' : NodeInfo((_node_tree_node_tree,)),
+	'GeometryNodeImageTexture' : NodeInfo((_extension_enum,
+		_interpolation_enum)),
+	'GeometryNodeInputCurveHandlePositions' : NodeInfo(()),
+	'GeometryNodeInputCurveTilt' : NodeInfo(()),
+	'GeometryNodeInputID' : NodeInfo(()),
+	'GeometryNodeInputIndex' : NodeInfo(()),
+	'GeometryNodeInputMaterial' : NodeInfo((_material_material,)),
+	'GeometryNodeInputMaterialIndex' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeAngle' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeNeighbors' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeVertices' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceArea' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceNeighbors' : NodeInfo(()),
+	'GeometryNodeInputMeshIsland' : NodeInfo(()),
+	'GeometryNodeInputMeshVertexNeighbors' : NodeInfo(()),
+	'GeometryNodeInputNormal' : NodeInfo(()),
+	'GeometryNodeInputPosition' : NodeInfo(()),
+	'GeometryNodeInputRadius' : NodeInfo(()),
+	'GeometryNodeInputSceneTime' : NodeInfo(()),
+	'GeometryNodeInputShadeSmooth' : NodeInfo(()),
+	'GeometryNodeInputSplineCyclic' : NodeInfo(()),
+	'GeometryNodeInputSplineResolution' : NodeInfo(()),
+	'GeometryNodeInputTangent' : NodeInfo(()),
+	'GeometryNodeInstanceOnPoints' : NodeInfo(()),
+	'GeometryNodeInstancesToPoints' : NodeInfo(()),
+	'GeometryNodeIsViewport' : NodeInfo(()),
+	'GeometryNodeJoinGeometry' : NodeInfo(()),
+	'GeometryNodeLegacyAlignRotationToVector' : NodeInfo((_axis_enum,
+		_input_type_factor_enum, _input_type_vector_enum, _pivot_axis_enum)),
+	'GeometryNodeLegacyAttributeClamp' : NodeInfo((_data_type_enum,
+		_operation_enum)),
+	'GeometryNodeLegacyAttributeColorRamp' : NodeInfo((_color_ramp_color_ramp,)),
+	'GeometryNodeLegacyAttributeCombineXYZ' : NodeInfo((_input_type_x_enum,
+		_input_type_y_enum, _input_type_z_enum)),
+	'GeometryNodeLegacyAttributeCompare' : NodeInfo((_input_type_a_enum,
+		_input_type_b_enum, _operation_enum)),
+	'GeometryNodeLegacyAttributeConvert' : NodeInfo((_data_type_enum,
+		_domain_enum)),
+	'GeometryNodeLegacyAttributeCurveMap' : NodeInfo((_curve_rgb_curve_mapping,
+		_curve_vec_curve_mapping, _data_type_enum)),
+	'GeometryNodeLegacyAttributeFill' : NodeInfo((_data_type_enum,
+		_domain_enum)),
+	'GeometryNodeLegacyAttributeMapRange' : NodeInfo((_data_type_enum,
+		_interpolation_type_enum)),
+	'GeometryNodeLegacyAttributeMath' : NodeInfo((_input_type_a_enum,
+		_input_type_b_enum, _input_type_c_enum, _operation_enum)),
+	'GeometryNodeLegacyAttributeMix' : NodeInfo((_blend_type_enum,
+		_input_type_a_enum, _input_type_b_enum, _input_type_factor_enum)),
+	'GeometryNodeLegacyAttributeProximity' : NodeInfo((
+		_target_geometry_element_enum,)),
+	'GeometryNodeLegacyAttributeRandomize' : NodeInfo((_data_type_enum,
+		_operation_enum)),
+	'GeometryNodeLegacyAttributeSampleTexture' : NodeInfo(()),
+	'GeometryNodeLegacyAttributeSeparateXYZ' : NodeInfo((_input_type_enum,)),
+	'GeometryNodeLegacyAttributeTransfer' : NodeInfo((_domain_enum,
+		_mapping_enum)),
+	'GeometryNodeLegacyAttributeVectorMath' : NodeInfo((_input_type_a_enum,
+		_input_type_b_enum, _input_type_c_enum, _operation_enum)),
+	'GeometryNodeLegacyAttributeVectorRotate' : NodeInfo((
+		_input_type_angle_enum, _input_type_axis_enum, _input_type_center_enum,
+		_input_type_rotation_enum, _input_type_vector_enum,
+		_rotation_mode_enum)),
+	'GeometryNodeLegacyCurveEndpoints' : NodeInfo(()),
+	'GeometryNodeLegacyCurveReverse' : NodeInfo(()),
+	'GeometryNodeLegacyCurveSelectHandles' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeLegacyCurveSetHandles' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeLegacyCurveSplineType' : NodeInfo((_spline_type_enum,)),
+	'GeometryNodeLegacyCurveSubdivide' : NodeInfo((_cuts_type_enum,)),
+	'GeometryNodeLegacyCurveToPoints' : NodeInfo((_mode_enum,)),
+	'GeometryNodeLegacyDeleteGeometry' : NodeInfo(()),
+	'GeometryNodeLegacyEdgeSplit' : NodeInfo(()),
+	'GeometryNodeLegacyMaterialAssign' : NodeInfo(()),
+	'GeometryNodeLegacyMeshToCurve' : NodeInfo(()),
+	'GeometryNodeLegacyPointDistribute' : NodeInfo((_distribute_method_enum,)),
+	'GeometryNodeLegacyPointInstance' : NodeInfo((_instance_type_enum,
+		_use_whole_collection_bool)),
+	'GeometryNodeLegacyPointScale' : NodeInfo((_input_type_enum,)),
+	'GeometryNodeLegacyPointSeparate' : NodeInfo(()),
+	'GeometryNodeLegacyPointTranslate' : NodeInfo((_input_type_enum,)),
+	'GeometryNodeLegacyPointsToVolume' : NodeInfo((_input_type_radius_enum,
+		_resolution_mode_enum)),
+	'GeometryNodeLegacyRaycast' : NodeInfo((_input_type_ray_direction_enum,
+		_input_type_ray_length_enum, _mapping_enum)),
+	'GeometryNodeLegacyRotatePoints' : NodeInfo((_input_type_angle_enum,
+		_input_type_axis_enum, _input_type_rotation_enum, _space_enum,
+		_type_enum)),
+	'GeometryNodeLegacySelectByMaterial' : NodeInfo(()),
+	'GeometryNodeLegacySubdivisionSurface' : NodeInfo((_boundary_smooth_enum,
+		_uv_smooth_enum)),
+	'GeometryNodeLegacyVolumeToMesh' : NodeInfo((_resolution_mode_enum,)),
+	'GeometryNodeMaterialSelection' : NodeInfo(()),
+	'GeometryNodeMergeByDistance' : NodeInfo(()),
+	'GeometryNodeMeshBoolean' : NodeInfo((_operation_enum,)),
+	'GeometryNodeMeshCircle' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshCone' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshCube' : NodeInfo(()),
+	'GeometryNodeMeshCylinder' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshGrid' : NodeInfo(()),
+	'GeometryNodeMeshIcoSphere' : NodeInfo(()),
+	'GeometryNodeMeshLine' : NodeInfo((_count_mode_enum, _mode_enum)),
+	'GeometryNodeMeshToCurve' : NodeInfo(()),
+	'GeometryNodeMeshToPoints' : NodeInfo((_mode_enum,)),
+	'GeometryNodeMeshUVSphere' : NodeInfo(()),
+	'GeometryNodeObjectInfo' : NodeInfo((_transform_space_enum,)),
+	'GeometryNodePointsToVertices' : NodeInfo(()),
+	'GeometryNodePointsToVolume' : NodeInfo((_resolution_mode_enum,)),
+	'GeometryNodeProximity' : NodeInfo((_target_element_enum,)),
+	'GeometryNodeRaycast' : NodeInfo((_data_type_enum, _mapping_enum)),
+	'GeometryNodeRealizeInstances' : NodeInfo((_legacy_behavior_bool,)),
+	'GeometryNodeReplaceMaterial' : NodeInfo(()),
+	'GeometryNodeResampleCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeReverseCurve' : NodeInfo(()),
+	'GeometryNodeRotateInstances' : NodeInfo(()),
+	'GeometryNodeSampleCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeScaleElements' : NodeInfo((_domain_enum, _scale_mode_enum)),
+	'GeometryNodeScaleInstances' : NodeInfo(()),
+	'GeometryNodeSeparateComponents' : NodeInfo(()),
+	'GeometryNodeSeparateGeometry' : NodeInfo((_domain_enum,)),
+	'GeometryNodeSetCurveHandlePositions' : NodeInfo((_mode_enum,)),
+	'GeometryNodeSetCurveRadius' : NodeInfo(()),
+	'GeometryNodeSetCurveTilt' : NodeInfo(()),
+	'GeometryNodeSetID' : NodeInfo(()),
+	'GeometryNodeSetMaterial' : NodeInfo(()),
+	'GeometryNodeSetMaterialIndex' : NodeInfo(()),
+	'GeometryNodeSetPointRadius' : NodeInfo(()),
+	'GeometryNodeSetPosition' : NodeInfo(()),
+	'GeometryNodeSetShadeSmooth' : NodeInfo(()),
+	'GeometryNodeSetSplineCyclic' : NodeInfo(()),
+	'GeometryNodeSetSplineResolution' : NodeInfo(()),
+	'GeometryNodeSplineLength' : NodeInfo(()),
+	'GeometryNodeSplineParameter' : NodeInfo(()),
+	'GeometryNodeSplitEdges' : NodeInfo(()),
+	'GeometryNodeStringJoin' : NodeInfo(()),
+	'GeometryNodeStringToCurves' : NodeInfo((_align_x_enum, _align_y_enum,
+		_font_font, _overflow_enum, _pivot_mode_enum)),
+	'GeometryNodeSubdivideCurve' : NodeInfo(()),
+	'GeometryNodeSubdivideMesh' : NodeInfo(()),
+	'GeometryNodeSubdivisionSurface' : NodeInfo((_boundary_smooth_enum,
+		_uv_smooth_enum)),
+	'GeometryNodeSwitch' : NodeInfo((_input_type_enum,)),
+	'GeometryNodeTransform' : NodeInfo(()),
+	'GeometryNodeTranslateInstances' : NodeInfo(()),
+	'GeometryNodeTriangulate' : NodeInfo((_ngon_method_enum, _quad_method_enum)),
+	'GeometryNodeTrimCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeViewer' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeVolumeToMesh' : NodeInfo((_resolution_mode_enum,)),
+}
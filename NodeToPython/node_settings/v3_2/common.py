@@ -0,0 +1,15 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_is_active_output_bool = NTPNodeSetting("is_active_output", ST.BOOL)
+_label_size_int = NTPNodeSetting("label_size", ST.INT)
+_node_tree_node_tree = NTPNodeSetting("node_tree", ST.NODE_TREE)
+_shrink_bool = NTPNodeSetting("shrink", ST.BOOL)
+_text_text = NTPNodeSetting("text", ST.TEXT)
+
+node_settings : dict[str, NodeInfo] = {
+	'NodeFrame' : NodeInfo((_label_size_int, _shrink_bool, _text_text)),
+	'NodeGroup' : NodeInfo((_node_tree_node_tree,)),
+	'NodeGroupInput' : NodeInfo(()),
+	'NodeGroupOutput' : NodeInfo((_is_active_output_bool,)),
+	'NodeReroute' : NodeInfo(()),
+}
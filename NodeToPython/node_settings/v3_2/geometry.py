@@ -0,0 +1,162 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_align_x_enum = NTPNodeSetting("align_x", ST.ENUM)
+_align_y_enum = NTPNodeSetting("align_y", ST.ENUM)
+_boundary_smooth_enum = NTPNodeSetting("boundary_smooth", ST.ENUM)
+_component_enum = NTPNodeSetting("component", ST.ENUM)
+_count_mode_enum = NTPNodeSetting("count_mode", ST.ENUM)
+_data_type_enum = NTPNodeSetting("data_type", ST.ENUM)
+_distribute_method_enum = NTPNodeSetting("distribute_method", ST.ENUM)
+_domain_enum = NTPNodeSetting("domain", ST.ENUM)
+_extension_enum = NTPNodeSetting("extension", ST.ENUM)
+_fill_type_enum = NTPNodeSetting("fill_type", ST.ENUM)
+_font_font = NTPNodeSetting("font", ST.FONT)
+_handle_type_enum = NTPNodeSetting("handle_type", ST.ENUM)
+_input_type_enum = NTPNodeSetting("input_type", ST.ENUM)
+_interpolation_enum = NTPNodeSetting("interpolation", ST.ENUM)
+_legacy_behavior_bool = NTPNodeSetting("legacy_behavior", ST.BOOL)
+_mapping_enum = NTPNodeSetting("mapping", ST.ENUM)
+_material_material = NTPNodeSetting("material", ST.MATERIAL)
+_mode_enum = NTPNodeSetting("mode", ST.ENUM)
+_mode_enum_set = NTPNodeSetting("mode", ST.ENUM_SET)
+_ngon_method_enum = NTPNodeSetting("ngon_method", ST.ENUM)
+_node_tree_node_tree = NTPNodeSetting("node_tree", ST.NODE_TREE)
+_operation_enum = NTPNodeSetting("operation", ST.ENUM)
+_overflow_enum = NTPNodeSetting("overflow", ST.ENUM)
+_pivot_mode_enum = NTPNodeSetting("pivot_mode", ST.ENUM)
+_quad_method_enum = NTPNodeSetting("quad_method", ST.ENUM)
+_resolution_mode_enum = NTPNodeSetting("resolution_mode", ST.ENUM)
+_scale_mode_enum = NTPNodeSetting("scale_mode", ST.ENUM)
+_spline_type_enum = NTPNodeSetting("spline_type", ST.ENUM)
+_target_element_enum = NTPNodeSetting("target_element", ST.ENUM)
+_transform_space_enum = NTPNodeSetting("transform_space", ST.ENUM)
+_uv_smooth_enum = NTPNodeSetting("uv_smooth", ST.ENUM)
+
+node_settings : dict[str, NodeInfo] = {
+	'GeometryNodeAccumulateField' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeAttributeDomainSize' : NodeInfo((_component_enum,)),
+	'GeometryNodeAttributeStatistic' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeAttributeTransfer' : NodeInfo((_data_type_enum, _domain_enum,
+		_mapping_enum)),
+	'GeometryNodeBoundBox' : NodeInfo(()),
+	'GeometryNodeCaptureAttribute' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeCollectionInfo' : NodeInfo((_transform_space_enum,)),
+	'GeometryNodeConvexHull' : NodeInfo(()),
+	'GeometryNodeCurveArc' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurveEndpointSelection' : NodeInfo(()),
+	'GeometryNodeCurveHandleTypeSelection' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeCurveLength' : NodeInfo(()),
+	'GeometryNodeCurvePrimitiveBezierSegment' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveCircle' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveLine' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveQuadrilateral' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurveQuadraticBezier' : NodeInfo(()),
+	'GeometryNodeCurveSetHandles' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeCurveSpiral' : NodeInfo(()),
+	'GeometryNodeCurveSplineType' : NodeInfo((_spline_type_enum,)),
+	'GeometryNodeCurveStar' : NodeInfo(()),
+	'GeometryNodeCurveToMesh' : NodeInfo(()),
+	'GeometryNodeCurveToPoints' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCustomGroup' : NodeInfo((_node_tree_node_tree,)),
+	'GeometryNodeDeleteGeometry' : NodeInfo((_domain_enum, _mode_enum)),
+	'GeometryNodeDistributePointsOnFaces' : NodeInfo((_distribute_method_enum,)),
+	'GeometryNodeDualMesh' : NodeInfo(()),
+	'GeometryNodeDuplicateElements' : NodeInfo((_domain_enum,)),
+	'GeometryNodeExtrudeMesh' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFieldAtIndex' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeFillCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFilletCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFlipFaces' : NodeInfo(()),
+	'GeometryNodeGeometryToInstance' : NodeInfo(()),
+	'GeometryNodeGroup' : NodeInfo((_node_tree_node_tree,)),
+	'GeometryNodeImageTexture' : NodeInfo((_extension_enum,
+		_interpolation_enum)),
+	'GeometryNodeInputCurveHandlePositions' : NodeInfo(()),
+	'GeometryNodeInputCurveTilt' : NodeInfo(()),
+	'GeometryNodeInputID' : NodeInfo(()),
+	'GeometryNodeInputIndex' : NodeInfo(()),
+	'GeometryNodeInputMaterial' : NodeInfo((_material_material,)),
+	'GeometryNodeInputMaterialIndex' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeAngle' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeNeighbors' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeVertices' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceArea' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceIsPlanar' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceNeighbors' : NodeInfo(()),
+	'GeometryNodeInputMeshIsland' : NodeInfo(()),
+	'GeometryNodeInputMeshVertexNeighbors' : NodeInfo(()),
+	'GeometryNodeInputNamedAttribute' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeInputNormal' : NodeInfo(()),
+	'GeometryNodeInputPosition' : NodeInfo(()),
+	'GeometryNodeInputRadius' : NodeInfo(()),
+	'GeometryNodeInputSceneTime' : NodeInfo(()),
+	'GeometryNodeInputShadeSmooth' : NodeInfo(()),
+	'GeometryNodeInputSplineCyclic' : NodeInfo(()),
+	'GeometryNodeInputSplineResolution' : NodeInfo(()),
+	'GeometryNodeInputTangent' : NodeInfo(()),
+	'GeometryNodeInstanceOnPoints' : NodeInfo(()),
+	'GeometryNodeInstancesToPoints' : NodeInfo(()),
+	'GeometryNodeIsViewport' : NodeInfo(()),
+	'GeometryNodeJoinGeometry' : NodeInfo(()),
+	'GeometryNodeMaterialSelection' : NodeInfo(()),
+	'GeometryNodeMergeByDistance' : NodeInfo((_mode_enum,)),
+	'GeometryNodeMeshBoolean' : NodeInfo((_operation_enum,)),
+	'GeometryNodeMeshCircle' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshCone' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshCube' : NodeInfo(()),
+	'GeometryNodeMeshCylinder' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshGrid' : NodeInfo(()),
+	'GeometryNodeMeshIcoSphere' : NodeInfo(()),
+	'GeometryNodeMeshLine' : NodeInfo((_count_mode_enum, _mode_enum)),
+	'GeometryNodeMeshToCurve' : NodeInfo(()),
+	'GeometryNodeMeshToPoints' : NodeInfo((_mode_enum,)),
+	'GeometryNodeMeshUVSphere' : NodeInfo(()),
+	'GeometryNodeObjectInfo' : NodeInfo((_transform_space_enum,)),
+	'GeometryNodePointsToVertices' : NodeInfo(()),
+	'GeometryNodePointsToVolume' : NodeInfo((_resolution_mode_enum,)),
+	'GeometryNodeProximity' : NodeInfo((_target_element_enum,)),
+	'GeometryNodeRaycast' : NodeInfo((_data_type_enum, _mapping_enum)),
+	'GeometryNodeRealizeInstances' : NodeInfo((_legacy_behavior_bool,)),
+	'GeometryNodeRemoveAttribute' : NodeInfo(()),
+	'GeometryNodeReplaceMaterial' : NodeInfo(()),
+	'GeometryNodeResampleCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeReverseCurve' : NodeInfo(()),
+	'GeometryNodeRotateInstances' : NodeInfo(()),
+	'GeometryNodeSampleCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeScaleElements' : NodeInfo((_domain_enum, _scale_mode_enum)),
+	'GeometryNodeScaleInstances' : NodeInfo(()),
+	'GeometryNodeSeparateComponents' : NodeInfo(()),
+	'GeometryNodeSeparateGeometry' : NodeInfo((_domain_enum,)),
+	'GeometryNodeSetCurveHandlePositions' : NodeInfo((_mode_enum,)),
+	'GeometryNodeSetCurveRadius' : NodeInfo(()),
+	'GeometryNodeSetCurveTilt' : NodeInfo(()),
+	'GeometryNodeSetID' : NodeInfo(()),
+	'GeometryNodeSetMaterial' : NodeInfo(()),
+	'GeometryNodeSetMaterialIndex' : NodeInfo(()),
+	'GeometryNodeSetPointRadius' : NodeInfo(()),
+	'GeometryNodeSetPosition' : NodeInfo(()),
+	'GeometryNodeSetShadeSmooth' : NodeInfo(()),
+	'GeometryNodeSetSplineCyclic' : NodeInfo(()),
+	'GeometryNodeSetSplineResolution' : NodeInfo(()),
+	'GeometryNodeSplineLength' : NodeInfo(()),
+	'GeometryNodeSplineParameter' : NodeInfo(()),
+	'GeometryNodeSplitEdges' : NodeInfo(()),
+	'GeometryNodeStoreNamedAttribute' : NodeInfo((_data_type_enum,
+		_domain_enum)),
+	'GeometryNodeStringJoin' : NodeInfo(()),
+	'GeometryNodeStringToCurves' : NodeInfo((_align_x_enum, _align_y_enum,
+		_font_font, _overflow_enum, _pivot_mode_enum)),
+	'GeometryNodeSubdivideCurve' : NodeInfo(()),
+	'GeometryNodeSubdivideMesh' : NodeInfo(()),
+	'GeometryNodeSubdivisionSurface' : NodeInfo((_boundary_smooth_enum,
+		_uv_smooth_enum)),
+	'GeometryNodeSwitch' : NodeInfo((_input_type_enum,)),
+	'GeometryNodeTransform' : NodeInfo(()),
+	'GeometryNodeTranslateInstances' : NodeInfo(()),
+	'GeometryNodeTriangulate' : NodeInfo((_ngon_method_enum, _quad_method_enum)),
+	'GeometryNodeTrimCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeViewer' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeVolumeToMesh' : NodeInfo((_resolution_mode_enum,)),
+}
@@ -0,0 +1,404 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_active_input_index_int = NTPNodeSetting("active_input_index", ST.INT)
+_adaptation_float = NTPNodeSetting("adaptation", ST.FLOAT)
+_add_vec3 = NTPNodeSetting("add", ST.VEC3)
+_alpha_int = NTPNodeSetting("alpha", ST.INT)
+_angle_float = NTPNodeSetting("angle", ST.FLOAT)
+_angle_offset_float = NTPNodeSetting("angle_offset", ST.FLOAT)
+_aspect_correction_enum = NTPNodeSetting("aspect_correction", ST.ENUM)
+_axis_enum = NTPNodeSetting("axis", ST.ENUM)
+_base_path_string = NTPNodeSetting("base_path", ST.STRING)
+_blend_type_enum = NTPNodeSetting("blend_type", ST.ENUM)
+_blue_bool = NTPNodeSetting("blue", ST.BOOL)
+_blur_max_float = NTPNodeSetting("blur_max", ST.FLOAT)
+_blur_post_int = NTPNodeSetting("blur_post", ST.INT)
+_blur_pre_int = NTPNodeSetting("blur_pre", ST.INT)
+_bokeh_enum = NTPNodeSetting("bokeh", ST.ENUM)
+_catadioptric_float = NTPNodeSetting("catadioptric", ST.FLOAT)
+_center_x_float = NTPNodeSetting("center_x", ST.FLOAT)
+_center_y_float = NTPNodeSetting("center_y", ST.FLOAT)
+_channel_enum = NTPNodeSetting("channel", ST.ENUM)
+_check_bool = NTPNodeSetting("check", ST.BOOL)
+_clip_movie_clip = NTPNodeSetting("clip", ST.MOVIE_CLIP)
+_clip_black_float = NTPNodeSetting("clip_black", ST.FLOAT)
+_clip_white_float = NTPNodeSetting("clip_white", ST.FLOAT)
+_color_hue_float = NTPNodeSetting("color_hue", ST.FLOAT)
+_color_modulation_float = NTPNodeSetting("color_modulation", ST.FLOAT)
+_color_ramp_color_ramp = NTPNodeSetting("color_ramp", ST.COLOR_RAMP)
+_color_saturation_float = NTPNodeSetting("color_saturation", ST.FLOAT)
+_color_space_enum = NTPNodeSetting("color_space", ST.ENUM)
+_color_value_float = NTPNodeSetting("color_value", ST.FLOAT)
+_contrast_float = NTPNodeSetting("contrast", ST.FLOAT)
+_contrast_limit_float = NTPNodeSetting("contrast_limit", ST.FLOAT)
+_corner_rounding_float = NTPNodeSetting("corner_rounding", ST.FLOAT)
+_correction_float = NTPNodeSetting("correction", ST.FLOAT)
+_correction_method_enum = NTPNodeSetting("correction_method", ST.ENUM)
+_curve_curve_mapping = NTPNodeSetting("curve", ST.CURVE_MAPPING)
+_despill_balance_float = NTPNodeSetting("despill_balance", ST.FLOAT)
+_despill_factor_float = NTPNodeSetting("despill_factor", ST.FLOAT)
+_dilate_distance_int = NTPNodeSetting("dilate_distance", ST.INT)
+_distance_float = NTPNodeSetting("distance", ST.FLOAT)
+_distance_int = NTPNodeSetting("distance", ST.INT)
+_distortion_type_enum = NTPNodeSetting("distortion_type", ST.ENUM)
+_edge_float = NTPNodeSetting("edge", ST.FLOAT)
+_edge_kernel_radius_int = NTPNodeSetting("edge_kernel_radius", ST.INT)
+_edge_kernel_tolerance_float = NTPNodeSetting("edge_kernel_tolerance", ST.FLOAT)
+_edge_mode_enum = NTPNodeSetting("edge_mode", ST.ENUM)
+_entries_cryptomatte_entries = NTPNodeSetting("entries", ST.CRYPTOMATTE_ENTRIES)
+_f_stop_float = NTPNodeSetting("f_stop", ST.FLOAT)
+_factor_float = NTPNodeSetting("factor", ST.FLOAT)
+_factor_int = NTPNodeSetting("factor", ST.INT)
+_factor_x_float = NTPNodeSetting("factor_x", ST.FLOAT)
+_factor_y_float = NTPNodeSetting("factor_y", ST.FLOAT)
+_fade_float = NTPNodeSetting("fade", ST.FLOAT)
+_falloff_enum = NTPNodeSetting("falloff", ST.ENUM)
+_falloff_float = NTPNodeSetting("falloff", ST.FLOAT)
+_feather_distance_int = NTPNodeSetting("feather_distance", ST.INT)
+_feather_falloff_enum = NTPNodeSetting("feather_falloff", ST.ENUM)
+_file_slots_file_slots = NTPNodeSetting("file_slots", ST.FILE_SLOTS)
+_filter_type_enum = NTPNodeSetting("filter_type", ST.ENUM)
+_flaps_int = NTPNodeSetting("flaps", ST.INT)
+_format_image_format_settings = NTPNodeSetting("format", ST.IMAGE_FORMAT_SETTINGS)
+_frame_duration_int = NTPNodeSetting("frame_duration", ST.INT)
+_frame_end_int = NTPNodeSetting("frame_end", ST.INT)
+_frame_method_enum = NTPNodeSetting("frame_method", ST.ENUM)
+_frame_offset_int = NTPNodeSetting("frame_offset", ST.INT)
+_frame_relative_int = NTPNodeSetting("frame_relative", ST.INT)
+_frame_start_int = NTPNodeSetting("frame_start", ST.INT)
+_from_color_space_enum = NTPNodeSetting("from_color_space", ST.ENUM)
+_gain_float = NTPNodeSetting("gain", ST.FLOAT)
+_gain_vec3 = NTPNodeSetting("gain", ST.VEC3)
+_gamma_float = NTPNodeSetting("gamma", ST.FLOAT)
+_gamma_vec3 = NTPNodeSetting("gamma", ST.VEC3)
+_glare_type_enum = NTPNodeSetting("glare_type", ST.ENUM)
+_green_bool = NTPNodeSetting("green", ST.BOOL)
+_height_float = NTPNodeSetting("height", ST.FLOAT)
+_highlights_contrast_float = NTPNodeSetting("highlights_contrast", ST.FLOAT)
+_highlights_gain_float = NTPNodeSetting("highlights_gain", ST.FLOAT)
+_highlights_gamma_float = NTPNodeSetting("highlights_gamma", ST.FLOAT)
+_highlights_lift_float = NTPNodeSetting("highlights_lift", ST.FLOAT)
+_highlights_saturation_float = NTPNodeSetting("highlights_saturation", ST.FLOAT)
+_image_image = NTPNodeSetting("image", ST.IMAGE)
+_index_int = NTPNodeSetting("index", ST.INT)
+_inner_mode_enum = NTPNodeSetting("inner_mode", ST.ENUM)
+_intensity_float = NTPNodeSetting("intensity", ST.FLOAT)
+_invert_bool = NTPNodeSetting("invert", ST.BOOL)
+_invert_alpha_bool = NTPNodeSetting("invert_alpha", ST.BOOL)
+_invert_rgb_bool = NTPNodeSetting("invert_rgb", ST.BOOL)
+_iterations_int = NTPNodeSetting("iterations", ST.INT)
+_key_float = NTPNodeSetting("key", ST.FLOAT)
+_layer_enum = NTPNodeSetting("layer", ST.ENUM)
+_layer_name_enum = NTPNodeSetting("layer_name", ST.ENUM)
+_layer_slots_layer_slots = NTPNodeSetting("layer_slots", ST.LAYER_SLOTS)
+_lift_float = NTPNodeSetting("lift", ST.FLOAT)
+_lift_vec3 = NTPNodeSetting("lift", ST.VEC3)
+_limit_channel_enum = NTPNodeSetting("limit_channel", ST.ENUM)
+_limit_max_float = NTPNodeSetting("limit_max", ST.FLOAT)
+_limit_method_enum = NTPNodeSetting("limit_method", ST.ENUM)
+_limit_min_float = NTPNodeSetting("limit_min", ST.FLOAT)
+_mapping_curve_mapping = NTPNodeSetting("mapping", ST.CURVE_MAPPING)
+_mapping_enum = NTPNodeSetting("mapping", ST.ENUM)
+_mask_mask = NTPNodeSetting("mask", ST.MASK)
+_mask_type_enum = NTPNodeSetting("mask_type", ST.ENUM)
+_master_contrast_float = NTPNodeSetting("master_contrast", ST.FLOAT)
+_master_gain_float = NTPNodeSetting("master_gain", ST.FLOAT)
+_master_gamma_float = NTPNodeSetting("master_gamma", ST.FLOAT)
+_master_lift_float = NTPNodeSetting("master_lift", ST.FLOAT)
+_master_saturation_float = NTPNodeSetting("master_saturation", ST.FLOAT)
+_matte_channel_enum = NTPNodeSetting("matte_channel", ST.ENUM)
+_matte_id_string = NTPNodeSetting("matte_id", ST.STRING)
+_max_vec1 = NTPNodeSetting("max", ST.VEC1)
+_max_x_int = NTPNodeSetting("max_x", ST.INT)
+_max_y_int = NTPNodeSetting("max_y", ST.INT)
+_midtones_contrast_float = NTPNodeSetting("midtones_contrast", ST.FLOAT)
+_midtones_end_float = NTPNodeSetting("midtones_end", ST.FLOAT)
+_midtones_gain_float = NTPNodeSetting("midtones_gain", ST.FLOAT)
+_midtones_gamma_float = NTPNodeSetting("midtones_gamma", ST.FLOAT)
+_midtones_lift_float = NTPNodeSetting("midtones_lift", ST.FLOAT)
+_midtones_saturation_float = NTPNodeSetting("midtones_saturation", ST.FLOAT)
+_midtones_start_float = NTPNodeSetting("midtones_start", ST.FLOAT)
+_min_vec1 = NTPNodeSetting("min", ST.VEC1)
+_min_x_int = NTPNodeSetting("min_x", ST.INT)
+_min_y_int = NTPNodeSetting("min_y", ST.INT)
+_mix_float = NTPNodeSetting("mix", ST.FLOAT)
+_mode_enum = NTPNodeSetting("mode", ST.ENUM)
+_motion_blur_samples_int = NTPNodeSetting("motion_blur_samples", ST.INT)
+_motion_blur_shutter_float = NTPNodeSetting("motion_blur_shutter", ST.FLOAT)
+_node_output_int = NTPNodeSetting("node_output", ST.INT)
+_node_tree_node_tree = NTPNodeSetting("node_tree", ST.NODE_TREE)
+_offset_float = NTPNodeSetting("offset", ST.FLOAT)
+_offset_vec1 = NTPNodeSetting("offset", ST.VEC1)
+_offset_vec3 = NTPNodeSetting("offset", ST.VEC3)
+_offset_basis_float = NTPNodeSetting("offset_basis", ST.FLOAT)
+_offset_x_float = NTPNodeSetting("offset_x", ST.FLOAT)
+_offset_y_float = NTPNodeSetting("offset_y", ST.FLOAT)
+_operation_enum = NTPNodeSetting("operation", ST.ENUM)
+_plane_track_name_string = NTPNodeSetting("plane_track_name", ST.STRING)
+_position_enum = NTPNodeSetting("position", ST.ENUM)
+_power_vec3 = NTPNodeSetting("power", ST.VEC3)
+_prefilter_enum = NTPNodeSetting("prefilter", ST.ENUM)
+_premul_float = NTPNodeSetting("premul", ST.FLOAT)
+_quality_enum = NTPNodeSetting("quality", ST.ENUM)
+_ratio_float = NTPNodeSetting("ratio", ST.FLOAT)
+_ray_length_float = NTPNodeSetting("ray_length", ST.FLOAT)
+_red_bool = NTPNodeSetting("red", ST.BOOL)
+_rel_max_x_float = NTPNodeSetting("rel_max_x", ST.FLOAT)
+_rel_max_y_float = NTPNodeSetting("rel_max_y", ST.FLOAT)
+_rel_min_x_float = NTPNodeSetting("rel_min_x", ST.FLOAT)
+_rel_min_y_float = NTPNodeSetting("rel_min_y", ST.FLOAT)
+_relative_bool = NTPNodeSetting("relative", ST.BOOL)
+_remove_vec3 = NTPNodeSetting("remove", ST.VEC3)
+_rotation_float = NTPNodeSetting("rotation", ST.FLOAT)
+_rounding_float = NTPNodeSetting("rounding", ST.FLOAT)
+_samples_int = NTPNodeSetting("samples", ST.INT)
+_scene_scene = NTPNodeSetting("scene", ST.SCENE)
+_screen_balance_float = NTPNodeSetting("screen_balance", ST.FLOAT)
+_shadow_adjust_float = NTPNodeSetting("shadow_adjust", ST.FLOAT)
+_shadows_contrast_float = NTPNodeSetting("shadows_contrast", ST.FLOAT)
+_shadows_gain_float = NTPNodeSetting("shadows_gain", ST.FLOAT)
+_shadows_gamma_float = NTPNodeSetting("shadows_gamma", ST.FLOAT)
+_shadows_lift_float = NTPNodeSetting("shadows_lift", ST.FLOAT)
+_shadows_saturation_float = NTPNodeSetting("shadows_saturation", ST.FLOAT)
+_shift_float = NTPNodeSetting("shift", ST.FLOAT)
+_sigma_color_float = NTPNodeSetting("sigma_color", ST.FLOAT)
+_sigma_space_float = NTPNodeSetting("sigma_space", ST.FLOAT)
+_size_int = NTPNodeSetting("size", ST.INT)
+_size_vec1 = NTPNodeSetting("size", ST.VEC1)
+_size_source_enum = NTPNodeSetting("size_source", ST.ENUM)
+_size_x_int = NTPNodeSetting("size_x", ST.INT)
+_size_y_int = NTPNodeSetting("size_y", ST.INT)
+_slope_vec3 = NTPNodeSetting("slope", ST.VEC3)
+_source_enum = NTPNodeSetting("source", ST.ENUM)
+_source_vec2 = NTPNodeSetting("source", ST.VEC2)
+_space_enum = NTPNodeSetting("space", ST.ENUM)
+_speed_max_int = NTPNodeSetting("speed_max", ST.INT)
+_speed_min_int = NTPNodeSetting("speed_min", ST.INT)
+_spin_float = NTPNodeSetting("spin", ST.FLOAT)
+_streaks_int = NTPNodeSetting("streaks", ST.INT)
+_texture_texture = NTPNodeSetting("texture", ST.TEXTURE)
+_threshold_float = NTPNodeSetting("threshold", ST.FLOAT)
+_threshold_neighbor_float = NTPNodeSetting("threshold_neighbor", ST.FLOAT)
+_tile_order_enum = NTPNodeSetting("tile_order", ST.ENUM)
+_to_color_space_enum = NTPNodeSetting("to_color_space", ST.ENUM)
+_tolerance_float = NTPNodeSetting("tolerance", ST.FLOAT)
+_tonemap_type_enum = NTPNodeSetting("tonemap_type", ST.ENUM)
+_track_name_string = NTPNodeSetting("track_name", ST.STRING)
+_tracking_object_string = NTPNodeSetting("tracking_object", ST.STRING)
+_unspill_blue_float = NTPNodeSetting("unspill_blue", ST.FLOAT)
+_unspill_green_float = NTPNodeSetting("unspill_green", ST.FLOAT)
+_unspill_red_float = NTPNodeSetting("unspill_red", ST.FLOAT)
+_use_alpha_bool = NTPNodeSetting("use_alpha", ST.BOOL)
+_use_antialias_z_bool = NTPNodeSetting("use_antialias_z", ST.BOOL)
+_use_antialiasing_bool = NTPNodeSetting("use_antialiasing", ST.BOOL)
+_use_auto_refresh_bool = NTPNodeSetting("use_auto_refresh", ST.BOOL)
+_use_bokeh_bool = NTPNodeSetting("use_bokeh", ST.BOOL)
+_use_clamp_bool = NTPNodeSetting("use_clamp", ST.BOOL)
+_use_crop_size_bool = NTPNodeSetting("use_crop_size", ST.BOOL)
+_use_curved_bool = NTPNodeSetting("use_curved", ST.BOOL)
+_use_cyclic_bool = NTPNodeSetting("use_cyclic", ST.BOOL)
+_use_extended_bounds_bool = NTPNodeSetting("use_extended_bounds", ST.BOOL)
+_use_feather_bool = NTPNodeSetting("use_feather", ST.BOOL)
+_use_fit_bool = NTPNodeSetting("use_fit", ST.BOOL)
+_use_gamma_correction_bool = NTPNodeSetting("use_gamma_correction", ST.BOOL)
+_use_hdr_bool = NTPNodeSetting("use_hdr", ST.BOOL)
+_use_jitter_bool = NTPNodeSetting("use_jitter", ST.BOOL)
+_use_max_bool = NTPNodeSetting("use_max", ST.BOOL)
+_use_min_bool = NTPNodeSetting("use_min", ST.BOOL)
+_use_motion_blur_bool = NTPNodeSetting("use_motion_blur", ST.BOOL)
+_use_premultiply_bool = NTPNodeSetting("use_premultiply", ST.BOOL)
+_use_preview_bool = NTPNodeSetting("use_preview", ST.BOOL)
+_use_projector_bool = NTPNodeSetting("use_projector", ST.BOOL)
+_use_relative_bool = NTPNodeSetting("use_relative", ST.BOOL)
+_use_rotate_45_bool = NTPNodeSetting("use_rotate_45", ST.BOOL)
+_use_straight_alpha_output_bool = NTPNodeSetting("use_straight_alpha_output", ST.BOOL)
+_use_unspill_bool = NTPNodeSetting("use_unspill", ST.BOOL)
+_use_variable_size_bool = NTPNodeSetting("use_variable_size", ST.BOOL)
+_use_wrap_bool = NTPNodeSetting("use_wrap", ST.BOOL)
+_use_zbuffer_bool = NTPNodeSetting("use_zbuffer", ST.BOOL)
+_view_enum = NTPNodeSetting("view", ST.ENUM)
+_width_float = NTPNodeSetting("width", ST.FLOAT)
+_wrap_axis_enum = NTPNodeSetting("wrap_axis", ST.ENUM)
+_x_float = NTPNodeSetting("x", ST.FLOAT)
+_y_float = NTPNodeSetting("y", ST.FLOAT)
+_ycc_mode_enum = NTPNodeSetting("ycc_mode", ST.ENUM)
+_z_scale_float = NTPNodeSetting("z_scale", ST.FLOAT)
+_zoom_float = NTPNodeSetting("zoom", ST.FLOAT)
+
+node_settings : dict[str, NodeInfo] = {
+	'CompositorNodeAlphaOver' : NodeInfo((_premul_float, _use_premultiply_bool)),
+	'CompositorNodeAntiAliasing' : NodeInfo((_contrast_limit_float,
+		_corner_rounding_float, _threshold_float)),
+	'CompositorNodeBilateralblur' : NodeInfo((_iterations_int,
+		_sigma_color_float, _sigma_space_float)),
+	'CompositorNodeBlur' : NodeInfo((_aspect_correction_enum, _factor_float,
+		_factor_x_float, _factor_y_float, _filter_type_enum, _size_x_int,
+		_size_y_int, _use_bokeh_bool, _use_extended_bounds_bool,
+		_use_gamma_correction_bool, _use_relative_bool,
+		_use_variable_size_bool)),
+	'CompositorNodeBokehBlur' : NodeInfo((_blur_max_float,
+		_use_extended_bounds_bool, _use_variable_size_bool)),
+	'CompositorNodeBokehImage' : NodeInfo((_angle_float, _catadioptric_float,
+		_flaps_int, _rounding_float, _shift_float)),
+	'CompositorNodeBoxMask' : NodeInfo((_height_float, _mask_type_enum,
+		_rotation_float, _width_float, _x_float, _y_float)),
+	'CompositorNodeBrightContrast' : NodeInfo((_use_premultiply_bool,)),
+	'CompositorNodeChannelMatte' : NodeInfo((_color_space_enum,
+		_limit_channel_enum, _limit_max_float, _limit_method_enum,
+		_limit_min_float, _matte_channel_enum)),
+	'CompositorNodeChromaMatte' : NodeInfo((_gain_float, _lift_float,
+		_shadow_adjust_float, _threshold_float, _tolerance_float)),
+	'CompositorNodeColorBalance' : NodeInfo((_correction_method_enum,
+		_gain_vec3, _gamma_vec3, _lift_vec3, _offset_vec3, _offset_basis_float,
+		_power_vec3, _slope_vec3)),
+	'CompositorNodeColorCorrection' : NodeInfo((_blue_bool, _green_bool,
+		_highlights_contrast_float, _highlights_gain_float,
+		_highlights_gamma_float, _highlights_lift_float,
+		_highlights_saturation_float, _master_contrast_float,
+		_master_gain_float, _master_gamma_float, _master_lift_float,
+		_master_saturation_float, _midtones_contrast_float,
+		_midtones_end_float, _midtones_gain_float, _midtones_gamma_float,
+		_midtones_lift_float, _midtones_saturation_float,
+		_midtones_start_float, _red_bool, _shadows_contrast_float,
+		_shadows_gain_float, _shadows_gamma_float, _shadows_lift_float,
+		_shadows_saturation_float)),
+	'CompositorNodeColorMatte' : NodeInfo((_color_hue_float,
+		_color_saturation_float, _color_value_float)),
+	'CompositorNodeColorSpill' : NodeInfo((_channel_enum, _limit_channel_enum,
+		_limit_method_enum, _ratio_float, _unspill_blue_float,
+		_unspill_green_float, _unspill_red_float, _use_unspill_bool)),
+	'CompositorNodeCombHSVA' : NodeInfo(()),
+	'CompositorNodeCombRGBA' : NodeInfo(()),
+	'CompositorNodeCombYCCA' : NodeInfo((_mode_enum,)),
+	'CompositorNodeCombYUVA' : NodeInfo(()),
+	'CompositorNodeCombineColor' : NodeInfo((_mode_enum, _ycc_mode_enum)),
+	'CompositorNodeCombineXYZ' : NodeInfo(()),
+	'CompositorNodeComposite' : NodeInfo((_use_alpha_bool,)),
+	'CompositorNodeConvertColorSpace' : NodeInfo((_from_color_space_enum,
+		_to_color_space_enum)),
+	'CompositorNodeCornerPin' : NodeInfo(()),
+	'CompositorNodeCrop' : NodeInfo((_max_x_int, _max_y_int, _min_x_int,
+		_min_y_int, _rel_max_x_float, _rel_max_y_float, _rel_min_x_float,
+		_rel_min_y_float, _relative_bool, _use_crop_size_bool)),
+	'CompositorNodeCryptomatte' : NodeInfo((_add_vec3, _matte_id_string,
+		_remove_vec3)),
+	'CompositorNodeCryptomatteV2' : NodeInfo((_add_vec3,
+		_entries_cryptomatte_entries, _frame_duration_int, _frame_offset_int,
+		_frame_start_int, _image_image, _layer_enum, _layer_name_enum,
+		_matte_id_string, _remove_vec3, _scene_scene, _source_enum,
+		_use_auto_refresh_bool, _use_cyclic_bool, _view_enum)),
+	'CompositorNodeCurveRGB' : NodeInfo((_mapping_curve_mapping,)),
+	'CompositorNodeCurveVec' : NodeInfo((_mapping_curve_mapping,)),
+	'CompositorNodeCustomGroup' : NodeInfo((_node_tree_node_tree,)),
+	'CompositorNodeDBlur' : NodeInfo((_angle_float, _center_x_float,
+		_center_y_float, _distance_float, _iterations_int, _spin_float,
+		_use_wrap_bool, _zoom_float)),
+	'CompositorNodeDefocus' : NodeInfo((_angle_float, _blur_max_float,
+		_bokeh_enum, _f_stop_float, _scene_scene, _threshold_float,
+		_use_gamma_correction_bool, _use_preview_bool, _use_zbuffer_bool,
+		_z_scale_float)),
+	'CompositorNodeDenoise' : NodeInfo((_prefilter_enum, _use_hdr_bool)),
+	'CompositorNodeDespeckle' : NodeInfo((_threshold_float,
+		_threshold_neighbor_float)),
+	'CompositorNodeDiffMatte' : NodeInfo((_falloff_float, _tolerance_float)),
+	'CompositorNodeDilateErode' : NodeInfo((_distance_int, _edge_float,
+		_falloff_enum, _mode_enum)),
+	'CompositorNodeDisplace' : NodeInfo(()),
+	'CompositorNodeDistanceMatte' : NodeInfo((_channel_enum, _falloff_float,
+		_tolerance_float)),
+	'CompositorNodeDoubleEdgeMask' : NodeInfo((_edge_mode_enum,
+		_inner_mode_enum)),
+	'CompositorNodeEllipseMask' : NodeInfo((_height_float, _mask_type_enum,
+		_rotation_float, _width_float, _x_float, _y_float)),
+	'CompositorNodeExposure' : NodeInfo(()),
+	'CompositorNodeFilter' : NodeInfo((_filter_type_enum,)),
+	'CompositorNodeFlip' : NodeInfo((_axis_enum,)),
+	'CompositorNodeGamma' : NodeInfo(()),
+	'CompositorNodeGlare' : NodeInfo((_angle_offset_float,
+		_color_modulation_float, _fade_float, _glare_type_enum,
+		_iterations_int, _mix_float, _quality_enum, _size_int, _streaks_int,
+		_threshold_float, _use_rotate_45_bool)),
+	'CompositorNodeGroup' : NodeInfo((_node_tree_node_tree,)),
+	'CompositorNodeHueCorrect' : NodeInfo((_mapping_curve_mapping,)),
+	'CompositorNodeHueSat' : NodeInfo(()),
+	'CompositorNodeIDMask' : NodeInfo((_index_int, _use_antialiasing_bool)),
+	'CompositorNodeImage' : NodeInfo((_frame_duration_int, _frame_offset_int,
+		_frame_start_int, _image_image, _layer_enum, _use_auto_refresh_bool,
+		_use_cyclic_bool, _use_straight_alpha_output_bool, _view_enum)),
+	'CompositorNodeInpaint' : NodeInfo((_distance_int,)),
+	'CompositorNodeInvert' : NodeInfo((_invert_alpha_bool, _invert_rgb_bool)),
+	'CompositorNodeKeying' : NodeInfo((_blur_post_int, _blur_pre_int,
+		_clip_black_float, _clip_white_float, _despill_balance_float,
+		_despill_factor_float, _dilate_distance_int, _edge_kernel_radius_int,
+		_edge_kernel_tolerance_float, _feather_distance_int,
+		_feather_falloff_enum, _screen_balance_float)),
+	'CompositorNodeKeyingScreen' : NodeInfo((_clip_movie_clip,
+		_tracking_object_string)),
+	'CompositorNodeLensdist' : NodeInfo((_use_fit_bool, _use_jitter_bool,
+		_use_projector_bool)),
+	'CompositorNodeLevels' : NodeInfo((_channel_enum,)),
+	'CompositorNodeLumaMatte' : NodeInfo((_limit_max_float, _limit_min_float)),
+	'CompositorNodeMapRange' : NodeInfo((_use_clamp_bool,)),
+	'CompositorNodeMapUV' : NodeInfo((_alpha_int,)),
+	'CompositorNodeMapValue' : NodeInfo((_max_vec1, _min_vec1, _offset_vec1,
+		_size_vec1, _use_max_bool, _use_min_bool)),
+	'CompositorNodeMask' : NodeInfo((_mask_mask, _motion_blur_samples_int,
+		_motion_blur_shutter_float, _size_source_enum, _size_x_int,
+		_size_y_int, _use_feather_bool, _use_motion_blur_bool)),
+	'CompositorNodeMath' : NodeInfo((_operation_enum, _use_clamp_bool)),
+	'CompositorNodeMixRGB' : NodeInfo((_blend_type_enum, _use_alpha_bool,
+		_use_clamp_bool)),
+	'CompositorNodeMovieClip' : NodeInfo((_clip_movie_clip,)),
+	'CompositorNodeMovieDistortion' : NodeInfo((_clip_movie_clip,
+		_distortion_type_enum)),
+	'CompositorNodeNormal' : NodeInfo(()),
+	'CompositorNodeNormalize' : NodeInfo(()),
+	'CompositorNodeOutputFile' : NodeInfo((_active_input_index_int,
+		_base_path_string, _file_slots_file_slots,
+		_format_image_format_settings, _layer_slots_layer_slots)),
+	'CompositorNodePixelate' : NodeInfo(()),
+	'CompositorNodePlaneTrackDeform' : NodeInfo((_clip_movie_clip,
+		_motion_blur_samples_int, _motion_blur_shutter_float,
+		_plane_track_name_string, _tracking_object_string,
+		_use_motion_blur_bool)),
+	'CompositorNodePosterize' : NodeInfo(()),
+	'CompositorNodePremulKey' : NodeInfo((_mapping_enum,)),
+	'CompositorNodeRGB' : NodeInfo(()),
+	'CompositorNodeRGBToBW' : NodeInfo(()),
+	'CompositorNodeRLayers' : NodeInfo((_layer_enum, _scene_scene)),
+	'CompositorNodeRotate' : NodeInfo((_filter_type_enum,)),
+	'CompositorNodeScale' : NodeInfo((_frame_method_enum, _offset_x_float,
+		_offset_y_float, _space_enum)),
+	'CompositorNodeSceneTime' : NodeInfo(()),
+	'CompositorNodeSepHSVA' : NodeInfo(()),
+	'CompositorNodeSepRGBA' : NodeInfo(()),
+	'CompositorNodeSepYCCA' : NodeInfo((_mode_enum,)),
+	'CompositorNodeSepYUVA' : NodeInfo(()),
+	'CompositorNodeSeparateColor' : NodeInfo((_mode_enum, _ycc_mode_enum)),
+	'CompositorNodeSeparateXYZ' : NodeInfo(()),
+	'CompositorNodeSetAlpha' : NodeInfo((_mode_enum,)),
+	'CompositorNodeSplitViewer' : NodeInfo((_axis_enum, _factor_int)),
+	'CompositorNodeStabilize' : NodeInfo((_clip_movie_clip, _filter_type_enum,
+		_invert_bool)),
+	'CompositorNodeSunBeams' : NodeInfo((_ray_length_float, _source_vec2)),
+	'CompositorNodeSwitch' : NodeInfo((_check_bool,)),
+	'CompositorNodeSwitchView' : NodeInfo(()),
+	'CompositorNodeTexture' : NodeInfo((_node_output_int, _texture_texture)),
+	'CompositorNodeTime' : NodeInfo((_curve_curve_mapping, _frame_end_int,
+		_frame_start_int)),
+	'CompositorNodeTonemap' : NodeInfo((_adaptation_float, _contrast_float,
+		_correction_float, _gamma_float, _intensity_float, _key_float,
+		_offset_float, _tonemap_type_enum)),
+	'CompositorNodeTrackPos' : NodeInfo((_clip_movie_clip, _frame_relative_int,
+		_position_enum, _track_name_string, _tracking_object_string)),
+	'CompositorNodeTransform' : NodeInfo((_filter_type_enum,)),
+	'CompositorNodeTranslate' : NodeInfo((_use_relative_bool, _wrap_axis_enum)),
+	'CompositorNodeValToRGB' : NodeInfo((_color_ramp_color_ramp,)),
+	'CompositorNodeValue' : NodeInfo(()),
+	'CompositorNodeVecBlur' : NodeInfo((_factor_float, _samples_int,
+		_speed_max_int, _speed_min_int, _use_curved_bool)),
+	'CompositorNodeViewer' : NodeInfo((_center_x_float, _center_y_float,
+		_tile_order_enum, _use_alpha_bool)),
+	'CompositorNodeZcombine' : NodeInfo((_use_alpha_bool,
+		_use_antialias_z_bool)),
+}
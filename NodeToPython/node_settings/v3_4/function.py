@@ -0,0 +1,37 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_axis_enum = NTPNodeSetting("axis", ST.ENUM)
+_boolean_bool = NTPNodeSetting("boolean", ST.BOOL)
+_color_vec4 = NTPNodeSetting("color", ST.VEC4)
+_data_type_enum = NTPNodeSetting("data_type", ST.ENUM)
+_integer_int = NTPNodeSetting("integer", ST.INT)
+_mode_enum = NTPNodeSetting("mode", ST.ENUM)
+_operation_enum = NTPNodeSetting("operation", ST.ENUM)
+_pivot_axis_enum = NTPNodeSetting("pivot_axis", ST.ENUM)
+_rounding_mode_enum = NTPNodeSetting("rounding_mode", ST.ENUM)
+_space_enum = NTPNodeSetting("space", ST.ENUM)
+_string_string = NTPNodeSetting("string", ST.STRING)
+_type_enum = NTPNodeSetting("type", ST.ENUM)
+_vector_vec3 = NTPNodeSetting("vector", ST.VEC3)
+
+node_settings : dict[str, NodeInfo] = {
+	'FunctionNodeAlignEulerToVector' : NodeInfo((_axis_enum, _pivot_axis_enum)),
+	'FunctionNodeBooleanMath' : NodeInfo((_operation_enum,)),
+	'FunctionNodeCombineColor' : NodeInfo((_mode_enum,)),
+	'FunctionNodeCompare' : NodeInfo((_data_type_enum, _mode_enum,
+		_operation_enum)),
+	'FunctionNodeFloatToInt' : NodeInfo((_rounding_mode_enum,)),
+	'FunctionNodeInputBool' : NodeInfo((_boolean_bool,)),
+	'FunctionNodeInputColor' : NodeInfo((_color_vec4,)),
+	'FunctionNodeInputInt' : NodeInfo((_integer_int,)),
+	'FunctionNodeInputSpecialCharacters' : NodeInfo(()),
+	'FunctionNodeInputString' : NodeInfo((_string_string,)),
+	'FunctionNodeInputVector' : NodeInfo((_vector_vec3,)),
+	'FunctionNodeRandomValue' : NodeInfo((_data_type_enum,)),
+	'FunctionNodeReplaceString' : NodeInfo(()),
+	'FunctionNodeRotateEuler' : NodeInfo((_space_enum, _type_enum)),
+	'FunctionNodeSeparateColor' : NodeInfo((_mode_enum,)),
+	'FunctionNodeSliceString' : NodeInfo(()),
+	'FunctionNodeStringLength' : NodeInfo(()),
+	'FunctionNodeValueToString' : NodeInfo(()),
+}
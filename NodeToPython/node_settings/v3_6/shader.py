@@ -0,0 +1,222 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_air_density_float = NTPNodeSetting("air_density", ST.FLOAT)
+_altitude_float = NTPNodeSetting("altitude", ST.FLOAT)
+_attribute_name_string = NTPNodeSetting("attribute_name", ST.STRING)
+_attribute_type_enum = NTPNodeSetting("attribute_type", ST.ENUM)
+_axis_enum = NTPNodeSetting("axis", ST.ENUM)
+_bands_direction_enum = NTPNodeSetting("bands_direction", ST.ENUM)
+_blend_type_enum = NTPNodeSetting("blend_type", ST.ENUM)
+_bytecode_string = NTPNodeSetting("bytecode", ST.STRING)
+_bytecode_hash_string = NTPNodeSetting("bytecode_hash", ST.STRING)
+_clamp_bool = NTPNodeSetting("clamp", ST.BOOL)
+_clamp_factor_bool = NTPNodeSetting("clamp_factor", ST.BOOL)
+_clamp_result_bool = NTPNodeSetting("clamp_result", ST.BOOL)
+_clamp_type_enum = NTPNodeSetting("clamp_type", ST.ENUM)
+_color_ramp_color_ramp = NTPNodeSetting("color_ramp", ST.COLOR_RAMP)
+_component_enum = NTPNodeSetting("component", ST.ENUM)
+_convert_from_enum = NTPNodeSetting("convert_from", ST.ENUM)
+_convert_to_enum = NTPNodeSetting("convert_to", ST.ENUM)
+_data_type_enum = NTPNodeSetting("data_type", ST.ENUM)
+_direction_type_enum = NTPNodeSetting("direction_type", ST.ENUM)
+_distance_enum = NTPNodeSetting("distance", ST.ENUM)
+_distribution_enum = NTPNodeSetting("distribution", ST.ENUM)
+_dust_density_float = NTPNodeSetting("dust_density", ST.FLOAT)
+_extension_enum = NTPNodeSetting("extension", ST.ENUM)
+_factor_mode_enum = NTPNodeSetting("factor_mode", ST.ENUM)
+_falloff_enum = NTPNodeSetting("falloff", ST.ENUM)
+_feature_enum = NTPNodeSetting("feature", ST.ENUM)
+_filepath_string = NTPNodeSetting("filepath", ST.STRING)
+_from_instancer_bool = NTPNodeSetting("from_instancer", ST.BOOL)
+_gradient_type_enum = NTPNodeSetting("gradient_type", ST.ENUM)
+_ground_albedo_float = NTPNodeSetting("ground_albedo", ST.FLOAT)
+_ies_text = NTPNodeSetting("ies", ST.TEXT)
+_image_image = NTPNodeSetting("image", ST.IMAGE)
+_image_user_image_user = NTPNodeSetting("image_user", ST.IMAGE_USER)
+_inside_bool = NTPNodeSetting("inside", ST.BOOL)
+_interpolation_enum = NTPNodeSetting("interpolation", ST.ENUM)
+_interpolation_type_enum = NTPNodeSetting("interpolation_type", ST.ENUM)
+_invert_bool = NTPNodeSetting("invert", ST.BOOL)
+_is_active_output_bool = NTPNodeSetting("is_active_output", ST.BOOL)
+_layer_name_string = NTPNodeSetting("layer_name", ST.STRING)
+_mapping_curve_mapping = NTPNodeSetting("mapping", ST.CURVE_MAPPING)
+_mode_enum = NTPNodeSetting("mode", ST.ENUM)
+_musgrave_dimensions_enum = NTPNodeSetting("musgrave_dimensions", ST.ENUM)
+_musgrave_type_enum = NTPNodeSetting("musgrave_type", ST.ENUM)
+_name_string = NTPNodeSetting("name", ST.STRING)
+_node_tree_node_tree = NTPNodeSetting("node_tree", ST.NODE_TREE)
+_noise_dimensions_enum = NTPNodeSetting("noise_dimensions", ST.ENUM)
+_object_object = NTPNodeSetting("object", ST.OBJECT)
+_offset_float = NTPNodeSetting("offset", ST.FLOAT)
+_offset_frequency_int = NTPNodeSetting("offset_frequency", ST.INT)
+_only_local_bool = NTPNodeSetting("only_local", ST.BOOL)
+_operation_enum = NTPNodeSetting("operation", ST.ENUM)
+_ozone_density_float = NTPNodeSetting("ozone_density", ST.FLOAT)
+_parametrization_enum = NTPNodeSetting("parametrization", ST.ENUM)
+_particle_color_source_enum = NTPNodeSetting("particle_color_source", ST.ENUM)
+_particle_system_particle_system = NTPNodeSetting("particle_system", ST.PARTICLE_SYSTEM)
+_point_source_enum = NTPNodeSetting("point_source", ST.ENUM)
+_projection_enum = NTPNodeSetting("projection", ST.ENUM)
+_projection_blend_float = NTPNodeSetting("projection_blend", ST.FLOAT)
+_radius_float = NTPNodeSetting("radius", ST.FLOAT)
+_resolution_int = NTPNodeSetting("resolution", ST.INT)
+_rings_direction_enum = NTPNodeSetting("rings_direction", ST.ENUM)
+_rotation_type_enum = NTPNodeSetting("rotation_type", ST.ENUM)
+_samples_int = NTPNodeSetting("samples", ST.INT)
+_script_text = NTPNodeSetting("script", ST.TEXT)
+_sky_type_enum = NTPNodeSetting("sky_type", ST.ENUM)
+_space_enum = NTPNodeSetting("space", ST.ENUM)
+_squash_float = NTPNodeSetting("squash", ST.FLOAT)
+_squash_frequency_int = NTPNodeSetting("squash_frequency", ST.INT)
+_subsurface_method_enum = NTPNodeSetting("subsurface_method", ST.ENUM)
+_sun_direction_vec3 = NTPNodeSetting("sun_direction", ST.VEC3)
+_sun_disc_bool = NTPNodeSetting("sun_disc", ST.BOOL)
+_sun_elevation_float = NTPNodeSetting("sun_elevation", ST.FLOAT)
+_sun_intensity_float = NTPNodeSetting("sun_intensity", ST.FLOAT)
+_sun_rotation_float = NTPNodeSetting("sun_rotation", ST.FLOAT)
+_sun_size_float = NTPNodeSetting("sun_size", ST.FLOAT)
+_target_enum = NTPNodeSetting("target", ST.ENUM)
+_turbidity_float = NTPNodeSetting("turbidity", ST.FLOAT)
+_turbulence_depth_int = NTPNodeSetting("turbulence_depth", ST.INT)
+_use_alpha_bool = NTPNodeSetting("use_alpha", ST.BOOL)
+_use_auto_update_bool = NTPNodeSetting("use_auto_update", ST.BOOL)
+_use_clamp_bool = NTPNodeSetting("use_clamp", ST.BOOL)
+_use_pixel_size_bool = NTPNodeSetting("use_pixel_size", ST.BOOL)
+_use_tips_bool = NTPNodeSetting("use_tips", ST.BOOL)
+_uv_map_string = NTPNodeSetting("uv_map", ST.STRING)
+_vector_type_enum = NTPNodeSetting("vector_type", ST.ENUM)
+_vertex_attribute_name_string = NTPNodeSetting("vertex_attribute_name", ST.STRING)
+_vertex_color_source_enum = NTPNodeSetting("vertex_color_source", ST.ENUM)
+_voronoi_dimensions_enum = NTPNodeSetting("voronoi_dimensions", ST.ENUM)
+_wave_profile_enum = NTPNodeSetting("wave_profile", ST.ENUM)
+_wave_type_enum = NTPNodeSetting("wave_type", ST.ENUM)
+
+node_settings : dict[str, NodeInfo] = {
+	'ShaderNodeAddShader' : NodeInfo(()),
+	'ShaderNodeAmbientOcclusion' : NodeInfo((_inside_bool, _only_local_bool,
+		_samples_int)),
+	'ShaderNodeAttribute' : NodeInfo((_attribute_name_string,
+		_attribute_type_enum)),
+	'ShaderNodeBackground' : NodeInfo(()),
+	'ShaderNodeBevel' : NodeInfo((_samples_int,)),
+	'ShaderNodeBlackbody' : NodeInfo(()),
+	'ShaderNodeBrightContrast' : NodeInfo(()),
+	'ShaderNodeBsdfAnisotropic' : NodeInfo((_distribution_enum,)),
+	'ShaderNodeBsdfDiffuse' : NodeInfo(()),
+	'ShaderNodeBsdfGlass' : NodeInfo((_distribution_enum,)),
+	'ShaderNodeBsdfGlossy' : NodeInfo((_distribution_enum,)),
+	'ShaderNodeBsdfHair' : NodeInfo((_component_enum,)),
+	'ShaderNodeBsdfHairPrincipled' : NodeInfo((_parametrization_enum,)),
+	'ShaderNodeBsdfPrincipled' : NodeInfo((_distribution_enum,
+		_subsurface_method_enum)),
+	'ShaderNodeBsdfRefraction' : NodeInfo((_distribution_enum,)),
+	'ShaderNodeBsdfToon' : NodeInfo((_component_enum,)),
+	'ShaderNodeBsdfTranslucent' : NodeInfo(()),
+	'ShaderNodeBsdfTransparent' : NodeInfo(()),
+	'ShaderNodeBsdfVelvet' : NodeInfo(()),
+	'ShaderNodeBump' : NodeInfo((_invert_bool,)),
+	'ShaderNodeCameraData' : NodeInfo(()),
+	'ShaderNodeClamp' : NodeInfo((_clamp_type_enum,)),
+	'ShaderNodeCombineColor' : NodeInfo((_mode_enum,)),
+	'ShaderNodeCombineHSV' : NodeInfo(()),
+	'ShaderNodeCombineRGB' : NodeInfo(()),
+	'ShaderNodeCombineXYZ' : NodeInfo(()),
+	'ShaderNodeCustomGroup' : NodeInfo((_node_tree_node_tree,)),
+	'ShaderNodeDisplacement' : NodeInfo((_space_enum,)),
+	'ShaderNodeEeveeSpecular' : NodeInfo(()),
+	'ShaderNodeEmission' : NodeInfo(()),
+	'ShaderNodeFloatCurve' : NodeInfo((_mapping_curve_mapping,)),
+	'ShaderNodeFresnel' : NodeInfo(()),
+	'ShaderNodeGamma' : NodeInfo(()),
+	'ShaderNodeGroup' : NodeInfo((_node_tree_node_tree,)),
+	'ShaderNodeHairInfo' : NodeInfo(()),
+	'ShaderNodeHoldout' : NodeInfo(()),
+	'ShaderNodeHueSaturation' : NodeInfo(()),
+	'ShaderNodeInvert' : NodeInfo(()),
+	'ShaderNodeLayerWeight' : NodeInfo(()),
+	'ShaderNodeLightFalloff' : NodeInfo(()),
+	'ShaderNodeLightPath' : NodeInfo(()),
+	'ShaderNodeMapRange' : NodeInfo((_clamp_bool, _data_type_enum,
+		_interpolation_type_enum)),
+	'ShaderNodeMapping' : NodeInfo((_vector_type_enum,)),
+	'ShaderNodeMath' : NodeInfo((_operation_enum, _use_clamp_bool)),
+	'ShaderNodeMix' : NodeInfo((_blend_type_enum, _clamp_factor_bool,
+		_clamp_result_bool, _data_type_enum, _factor_mode_enum)),
+	'ShaderNodeMixRGB' : NodeInfo((_blend_type_enum, _use_alpha_bool,
+		_use_clamp_bool)),
+	'ShaderNodeMixShader' : NodeInfo(()),
+	'ShaderNodeNewGeometry' : NodeInfo(()),
+	'ShaderNodeNormal' : NodeInfo(()),
+	'ShaderNodeNormalMap' : NodeInfo((_space_enum, _uv_map_string)),
+	'ShaderNodeObjectInfo' : NodeInfo(()),
+	'ShaderNodeOutputAOV' : NodeInfo((_name_string,)),
+	'ShaderNodeOutputLight' : NodeInfo((_is_active_output_bool, _target_enum)),
+	'ShaderNodeOutputLineStyle' : NodeInfo((_blend_type_enum,
+		_is_active_output_bool, _target_enum, _use_alpha_bool, _use_clamp_bool)),
+	'ShaderNodeOutputMaterial' : NodeInfo((_is_active_output_bool,
+		_target_enum)),
+	'ShaderNodeOutputWorld' : NodeInfo((_is_active_output_bool, _target_enum)),
+	'ShaderNodeParticleInfo' : NodeInfo(()),
+	'ShaderNodePointInfo' : NodeInfo(()),
+	'ShaderNodeRGB' : NodeInfo(()),
+	'ShaderNodeRGBCurve' : NodeInfo((_mapping_curve_mapping,)),
+	'ShaderNodeRGBToBW' : NodeInfo(()),
+	'ShaderNodeScript' : NodeInfo((_bytecode_string, _bytecode_hash_string,
+		_filepath_string, _mode_enum, _script_text, _use_auto_update_bool)),
+	'ShaderNodeSeparateColor' : NodeInfo((_mode_enum,)),
+	'ShaderNodeSeparateHSV' : NodeInfo(()),
+	'ShaderNodeSeparateRGB' : NodeInfo(()),
+	'ShaderNodeSeparateXYZ' : NodeInfo(()),
+	'ShaderNodeShaderToRGB' : NodeInfo(()),
+	'ShaderNodeSqueeze' : NodeInfo(()),
+	'ShaderNodeSubsurfaceScattering' : NodeInfo((_falloff_enum,)),
+	'ShaderNodeTangent' : NodeInfo((_axis_enum, _direction_type_enum,
+		_uv_map_string)),
+	'ShaderNodeTexBrick' : NodeInfo((_offset_float, _offset_frequency_int,
+		_squash_float, _squash_frequency_int)),
+	'ShaderNodeTexChecker' : NodeInfo(()),
+	'ShaderNodeTexCoord' : NodeInfo((_from_instancer_bool, _object_object)),
+	'ShaderNodeTexEnvironment' : NodeInfo((_image_image,
+		_image_user_image_user, _interpolation_enum, _projection_enum)),
+	'ShaderNodeTexGradient' : NodeInfo((_gradient_type_enum,)),
+	'ShaderNodeTexIES' : NodeInfo((_filepath_string, _ies_text, _mode_enum)),
+	'ShaderNodeTexImage' : NodeInfo((_extension_enum, _image_image,
+		_image_user_image_user, _interpolation_enum, _projection_enum,
+		_projection_blend_float)),
+	'ShaderNodeTexMagic' : NodeInfo((_turbulence_depth_int,)),
+	'ShaderNodeTexMusgrave' : NodeInfo((_musgrave_dimensions_enum,
+		_musgrave_type_enum)),
+	'ShaderNodeTexNoise' : NodeInfo((_noise_dimensions_enum,)),
+	'ShaderNodeTexPointDensity' : NodeInfo((_interpolation_enum,
+		_object_object, _particle_color_source_enum,
+		_particle_system_particle_system, _point_source_enum, _radius_float,
+		_resolution_int, _space_enum, _vertex_attribute_name_string,
+		_vertex_color_source_enum)),
+	'ShaderNodeTexSky' : NodeInfo((_air_density_float, _altitude_float,
+		_dust_density_float, _ground_albedo_float, _ozone_density_float,
+		_sky_type_enum, _sun_direction_vec3, _sun_disc_bool,
+		_sun_elevation_float, _sun_intensity_float, _sun_rotation_float,
+		_sun_size_float, _turbidity_float)),
+	'ShaderNodeTexVoronoi' : NodeInfo((_distance_enum, _feature_enum,
+		_voronoi_dimensions_enum)),
+	'ShaderNodeTexWave' : NodeInfo((_bands_direction_enum,
+		_rings_direction_enum, _wave_profile_enum, _wave_type_enum)),
+	'ShaderNodeTexWhiteNoise' : NodeInfo((_noise_dimensions_enum,)),
+	'ShaderNodeUVAlongStroke' : NodeInfo((_use_tips_bool,)),
+	'ShaderNodeUVMap' : NodeInfo((_from_instancer_bool, _uv_map_string)),
+	'ShaderNodeValToRGB' : NodeInfo((_color_ramp_color_ramp,)),
+	'ShaderNodeValue' : NodeInfo(()),
+	'ShaderNodeVectorCurve' : NodeInfo((_mapping_curve_mapping,)),
+	'ShaderNodeVectorDisplacement' : NodeInfo((_space_enum,)),
+	'ShaderNodeVectorMath' : NodeInfo((_operation_enum,)),
+	'ShaderNodeVectorRotate' : NodeInfo((_invert_bool, _rotation_type_enum)),
+	'ShaderNodeVectorTransform' : NodeInfo((_convert_from_enum,
+		_convert_to_enum, _vector_type_enum)),
+	'ShaderNodeVertexColor' : NodeInfo((_layer_name_string,)),
+	'ShaderNodeVolumeAbsorption' : NodeInfo(()),
+	'ShaderNodeVolumeInfo' : NodeInfo(()),
+	'ShaderNodeVolumePrincipled' : NodeInfo(()),
+	'ShaderNodeVolumeScatter' : NodeInfo(()),
+	'ShaderNodeWavelength' : NodeInfo(()),
+	'ShaderNodeWireframe' : NodeInfo((_use_pixel_size_bool,)),
+}
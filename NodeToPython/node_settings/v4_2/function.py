@@ -0,0 +1,65 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_axis_enum = NTPNodeSetting("axis", ST.ENUM)
+_boolean_bool = NTPNodeSetting("boolean", ST.BOOL)
+_data_type_enum = NTPNodeSetting("data_type", ST.ENUM)
+_integer_int = NTPNodeSetting("integer", ST.INT)
+_mode_enum = NTPNodeSetting("mode", ST.ENUM)
+_operation_enum = NTPNodeSetting("operation", ST.ENUM)
+_pivot_axis_enum = NTPNodeSetting("pivot_axis", ST.ENUM)
+_primary_axis_enum = NTPNodeSetting("primary_axis", ST.ENUM)
+_rotation_euler_euler = NTPNodeSetting("rotation_euler", ST.EULER)
+_rotation_space_enum = NTPNodeSetting("rotation_space", ST.ENUM)
+_rotation_type_enum = NTPNodeSetting("rotation_type", ST.ENUM)
+_rounding_mode_enum = NTPNodeSetting("rounding_mode", ST.ENUM)
+_secondary_axis_enum = NTPNodeSetting("secondary_axis", ST.ENUM)
+_space_enum = NTPNodeSetting("space", ST.ENUM)
+_string_string = NTPNodeSetting("string", ST.STRING)
+_value_vec4 = NTPNodeSetting("value", ST.VEC4)
+_vector_vec3 = NTPNodeSetting("vector", ST.VEC3)
+
+node_settings : dict[str, NodeInfo] = {
+	'FunctionNodeAlignEulerToVector' : NodeInfo((_axis_enum, _pivot_axis_enum)),
+	'FunctionNodeAlignRotationToVector' : NodeInfo((_axis_enum,
+		_pivot_axis_enum)),
+	'FunctionNodeAxesToRotation' : NodeInfo((_primary_axis_enum,
+		_secondary_axis_enum)),
+	'FunctionNodeAxisAngleToRotation' : NodeInfo(()),
+	'FunctionNodeBooleanMath' : NodeInfo((_operation_enum,)),
+	'FunctionNodeCombineColor' : NodeInfo((_mode_enum,)),
+	'FunctionNodeCombineMatrix' : NodeInfo(()),
+	'FunctionNodeCombineTransform' : NodeInfo(()),
+	'FunctionNodeCompare' : NodeInfo((_data_type_enum, _mode_enum,
+		_operation_enum)),
+	'FunctionNodeEulerToRotation' : NodeInfo(()),
+	'FunctionNodeFloatToInt' : NodeInfo((_rounding_mode_enum,)),
+	'FunctionNodeInputBool' : NodeInfo((_boolean_bool,)),
+	'FunctionNodeInputColor' : NodeInfo((_value_vec4,)),
+	'FunctionNodeInputInt' : NodeInfo((_integer_int,)),
+	'FunctionNodeInputRotation' : NodeInfo((_rotation_euler_euler,)),
+	'FunctionNodeInputSpecialCharacters' : NodeInfo(()),
+	'FunctionNodeInputString' : NodeInfo((_string_string,)),
+	'FunctionNodeInputVector' : NodeInfo((_vector_vec3,)),
+	'FunctionNodeInvertMatrix' : NodeInfo(()),
+	'FunctionNodeInvertRotation' : NodeInfo(()),
+	'FunctionNodeMatrixMultiply' : NodeInfo(()),
+	'FunctionNodeProjectPoint' : NodeInfo(()),
+	'FunctionNodeQuaternionToRotation' : NodeInfo(()),
+	'FunctionNodeRandomValue' : NodeInfo((_data_type_enum,)),
+	'FunctionNodeReplaceString' : NodeInfo(()),
+	'FunctionNodeRotateEuler' : NodeInfo((_rotation_type_enum, _space_enum)),
+	'FunctionNodeRotateRotation' : NodeInfo((_rotation_space_enum,)),
+	'FunctionNodeRotateVector' : NodeInfo(()),
+	'FunctionNodeRotationToAxisAngle' : NodeInfo(()),
+	'FunctionNodeRotationToEuler' : NodeInfo(()),
+	'FunctionNodeRotationToQuaternion' : NodeInfo(()),
+	'FunctionNodeSeparateColor' : NodeInfo((_mode_enum,)),
+	'FunctionNodeSeparateMatrix' : NodeInfo(()),
+	'FunctionNodeSeparateTransform' : NodeInfo(()),
+	'FunctionNodeSliceString' : NodeInfo(()),
+	'FunctionNodeStringLength' : NodeInfo(()),
+	'FunctionNodeTransformDirection' : NodeInfo(()),
+	'FunctionNodeTransformPoint' : NodeInfo(()),
+	'FunctionNodeTransposeMatrix' : NodeInfo(()),
+	'FunctionNodeValueToString' : NodeInfo(()),
+}
@@ -0,0 +1,296 @@
+from .. import NTPNodeSetting, NodeInfo, ST
+
+_active_generation_index_int = NTPNodeSetting("active_generation_index", ST.INT)
+_active_index_int = NTPNodeSetting("active_index", ST.INT)
+_active_input_index_int = NTPNodeSetting("active_input_index", ST.INT)
+_active_item_enum_item = NTPNodeSetting("active_item", ST.ENUM_ITEM)
+_active_main_index_int = NTPNodeSetting("active_main_index", ST.INT)
+_align_x_enum = NTPNodeSetting("align_x", ST.ENUM)
+_align_y_enum = NTPNodeSetting("align_y", ST.ENUM)
+_bake_items_bake_items = NTPNodeSetting("bake_items", ST.BAKE_ITEMS)
+_boundary_smooth_enum = NTPNodeSetting("boundary_smooth", ST.ENUM)
+_capture_items_capture_attribute_items = NTPNodeSetting("capture_items", ST.CAPTURE_ATTRIBUTE_ITEMS)
+_clamp_bool = NTPNodeSetting("clamp", ST.BOOL)
+_color_id_enum = NTPNodeSetting("color_id", ST.ENUM)
+_component_enum = NTPNodeSetting("component", ST.ENUM)
+_count_mode_enum = NTPNodeSetting("count_mode", ST.ENUM)
+_data_type_enum = NTPNodeSetting("data_type", ST.ENUM)
+_distribute_method_enum = NTPNodeSetting("distribute_method", ST.ENUM)
+_domain_enum = NTPNodeSetting("domain", ST.ENUM)
+_draw_style_enum = NTPNodeSetting("draw_style", ST.ENUM)
+_enum_items_menu_switch_items = NTPNodeSetting("enum_items", ST.MENU_SWITCH_ITEMS)
+_extension_enum = NTPNodeSetting("extension", ST.ENUM)
+_fill_type_enum = NTPNodeSetting("fill_type", ST.ENUM)
+_font_font = NTPNodeSetting("font", ST.FONT)
+_generation_items_foreach_geo_element_generation_items = NTPNodeSetting("generation_items", ST.FOREACH_GEO_ELEMENT_GENERATION_ITEMS)
+_handle_type_enum = NTPNodeSetting("handle_type", ST.ENUM)
+_image_image = NTPNodeSetting("image", ST.IMAGE)
+_index_switch_items_index_switch_items = NTPNodeSetting("index_switch_items", ST.INDEX_SWITCH_ITEMS)
+_input_items_foreach_geo_element_input_items = NTPNodeSetting("input_items", ST.FOREACH_GEO_ELEMENT_INPUT_ITEMS)
+_input_type_enum = NTPNodeSetting("input_type", ST.ENUM)
+_inspection_index_int = NTPNodeSetting("inspection_index", ST.INT)
+_interpolation_enum = NTPNodeSetting("interpolation", ST.ENUM)
+_interpolation_mode_enum = NTPNodeSetting("interpolation_mode", ST.ENUM)
+_main_items_foreach_geo_element_main_items = NTPNodeSetting("main_items", ST.FOREACH_GEO_ELEMENT_MAIN_ITEMS)
+_mapping_enum = NTPNodeSetting("mapping", ST.ENUM)
+_material_material = NTPNodeSetting("material", ST.MATERIAL)
+_method_enum = NTPNodeSetting("method", ST.ENUM)
+_mode_enum = NTPNodeSetting("mode", ST.ENUM)
+_mode_enum_set = NTPNodeSetting("mode", ST.ENUM_SET)
+_ngon_method_enum = NTPNodeSetting("ngon_method", ST.ENUM)
+_node_tree_node_tree = NTPNodeSetting("node_tree", ST.NODE_TREE)
+_operation_enum = NTPNodeSetting("operation", ST.ENUM)
+_overflow_enum = NTPNodeSetting("overflow", ST.ENUM)
+_pattern_mode_enum = NTPNodeSetting("pattern_mode", ST.ENUM)
+_pivot_mode_enum = NTPNodeSetting("pivot_mode", ST.ENUM)
+_quad_method_enum = NTPNodeSetting("quad_method", ST.ENUM)
+_repeat_items_repeat_output_items = NTPNodeSetting("repeat_items", ST.REPEAT_OUTPUT_ITEMS)
+_resolution_mode_enum = NTPNodeSetting("resolution_mode", ST.ENUM)
+_scale_mode_enum = NTPNodeSetting("scale_mode", ST.ENUM)
+_selection_type_enum = NTPNodeSetting("selection_type", ST.ENUM)
+_solver_enum = NTPNodeSetting("solver", ST.ENUM)
+_spline_type_enum = NTPNodeSetting("spline_type", ST.ENUM)
+_state_items_sim_output_items = NTPNodeSetting("state_items", ST.SIM_OUTPUT_ITEMS)
+_target_element_enum = NTPNodeSetting("target_element", ST.ENUM)
+_transform_space_enum = NTPNodeSetting("transform_space", ST.ENUM)
+_use_all_curves_bool = NTPNodeSetting("use_all_curves", ST.BOOL)
+_use_legacy_normal_bool = NTPNodeSetting("use_legacy_normal", ST.BOOL)
+_use_rotation_x_bool = NTPNodeSetting("use_rotation_x", ST.BOOL)
+_use_rotation_y_bool = NTPNodeSetting("use_rotation_y", ST.BOOL)
+_use_rotation_z_bool = NTPNodeSetting("use_rotation_z", ST.BOOL)
+_use_scale_x_bool = NTPNodeSetting("use_scale_x", ST.BOOL)
+_use_scale_y_bool = NTPNodeSetting("use_scale_y", ST.BOOL)
+_use_scale_z_bool = NTPNodeSetting("use_scale_z", ST.BOOL)
+_use_translation_x_bool = NTPNodeSetting("use_translation_x", ST.BOOL)
+_use_translation_y_bool = NTPNodeSetting("use_translation_y", ST.BOOL)
+_use_translation_z_bool = NTPNodeSetting("use_translation_z", ST.BOOL)
+_uv_smooth_enum = NTPNodeSetting("uv_smooth", ST.ENUM)
+_warning_type_enum = NTPNodeSetting("warning_type", ST.ENUM)
+
+node_settings : dict[str, NodeInfo] = {
+	'GeometryNodeAccumulateField' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeAttributeDomainSize' : NodeInfo((_component_enum,)),
+	'GeometryNodeAttributeStatistic' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeBake' : NodeInfo((_active_index_int, _bake_items_bake_items)),
+	'GeometryNodeBlurAttribute' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeBoundBox' : NodeInfo(()),
+	'GeometryNodeCaptureAttribute' : NodeInfo((_active_index_int,
+		_capture_items_capture_attribute_items, _domain_enum)),
+	'GeometryNodeCollectionInfo' : NodeInfo((_transform_space_enum,)),
+	'GeometryNodeConvexHull' : NodeInfo(()),
+	'GeometryNodeCornersOfEdge' : NodeInfo(()),
+	'GeometryNodeCornersOfFace' : NodeInfo(()),
+	'GeometryNodeCornersOfVertex' : NodeInfo(()),
+	'GeometryNodeCurveArc' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurveEndpointSelection' : NodeInfo(()),
+	'GeometryNodeCurveHandleTypeSelection' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeCurveLength' : NodeInfo(()),
+	'GeometryNodeCurveOfPoint' : NodeInfo(()),
+	'GeometryNodeCurvePrimitiveBezierSegment' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveCircle' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveLine' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvePrimitiveQuadrilateral' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurveQuadraticBezier' : NodeInfo(()),
+	'GeometryNodeCurveSetHandles' : NodeInfo((_handle_type_enum,
+		_mode_enum_set)),
+	'GeometryNodeCurveSpiral' : NodeInfo(()),
+	'GeometryNodeCurveSplineType' : NodeInfo((_spline_type_enum,)),
+	'GeometryNodeCurveStar' : NodeInfo(()),
+	'GeometryNodeCurveToMesh' : NodeInfo(()),
+	'GeometryNodeCurveToPoints' : NodeInfo((_mode_enum,)),
+	'GeometryNodeCurvesToGreasePencil' : NodeInfo(()),
+	'GeometryNodeCustomGroup' : NodeInfo((_node_tree_node_tree,)),
+	'GeometryNodeDeformCurvesOnSurface' : NodeInfo(()),
+	'GeometryNodeDeleteGeometry' : NodeInfo((_domain_enum, _mode_enum)),
+	'GeometryNodeDistributePointsInGrid' : NodeInfo((_mode_enum,)),
+	'GeometryNodeDistributePointsInVolume' : NodeInfo((_mode_enum,)),
+	'GeometryNodeDistributePointsOnFaces' : NodeInfo((_distribute_method_enum,
+		_use_legacy_normal_bool)),
+	'GeometryNodeDualMesh' : NodeInfo(()),
+	'GeometryNodeDuplicateElements' : NodeInfo((_domain_enum,)),
+	'GeometryNodeEdgePathsToCurves' : NodeInfo(()),
+	'GeometryNodeEdgePathsToSelection' : NodeInfo(()),
+	'GeometryNodeEdgesOfCorner' : NodeInfo(()),
+	'GeometryNodeEdgesOfVertex' : NodeInfo(()),
+	'GeometryNodeEdgesToFaceGroups' : NodeInfo(()),
+	'GeometryNodeExtrudeMesh' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFaceOfCorner' : NodeInfo(()),
+	'GeometryNodeFieldAtIndex' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeFieldOnDomain' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeFillCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFilletCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeFlipFaces' : NodeInfo(()),
+	'GeometryNodeForeachGeometryElementInput' : NodeInfo(()),
+	'GeometryNodeForeachGeometryElementOutput' : NodeInfo((
+		_active_generation_index_int, _active_input_index_int,
+		_active_main_index_int, _domain_enum,
+		_generation_items_foreach_geo_element_generation_items,
+		_input_items_foreach_geo_element_input_items, _inspection_index_int,
+		_main_items_foreach_geo_element_main_items)),
+	'GeometryNodeGeometryToInstance' : NodeInfo(()),
+	'GeometryNodeGetNamedGrid' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeGizmoDial' : NodeInfo((_color_id_enum,)),
+	'GeometryNodeGizmoLinear' : NodeInfo((_color_id_enum, _draw_style_enum)),
+	'GeometryNodeGizmoTransform' : NodeInfo((_use_rotation_x_bool,
+		_use_rotation_y_bool, _use_rotation_z_bool, _use_scale_x_bool,
+		_use_scale_y_bool, _use_scale_z_bool, _use_translation_x_bool,
+		_use_translation_y_bool, _use_translation_z_bool)),
+	'GeometryNodeGreasePencilToCurves' : NodeInfo(()),
+	'GeometryNodeGridToMesh' : NodeInfo(()),
+	'GeometryNodeGroup' : NodeInfo((_node_tree_node_tree,)),
+	'GeometryNodeImageInfo' : NodeInfo(()),
+	'GeometryNodeImageTexture' : NodeInfo((_extension_enum,
+		_interpolation_enum)),
+	'GeometryNodeImportOBJ' : NodeInfo(()),
+	'GeometryNodeImportPLY' : NodeInfo(()),
+	'GeometryNodeImportSTL' : NodeInfo(()),
+	'GeometryNodeIndexOfNearest' : NodeInfo(()),
+	'GeometryNodeIndexSwitch' : NodeInfo((_data_type_enum,
+		_index_switch_items_index_switch_items)),
+	'GeometryNodeInputActiveCamera' : NodeInfo(()),
+	'GeometryNodeInputCurveHandlePositions' : NodeInfo(()),
+	'GeometryNodeInputCurveTilt' : NodeInfo(()),
+	'GeometryNodeInputEdgeSmooth' : NodeInfo(()),
+	'GeometryNodeInputID' : NodeInfo(()),
+	'GeometryNodeInputImage' : NodeInfo((_image_image,)),
+	'GeometryNodeInputIndex' : NodeInfo(()),
+	'GeometryNodeInputInstanceRotation' : NodeInfo(()),
+	'GeometryNodeInputInstanceScale' : NodeInfo(()),
+	'GeometryNodeInputMaterial' : NodeInfo((_material_material,)),
+	'GeometryNodeInputMaterialIndex' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeAngle' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeNeighbors' : NodeInfo(()),
+	'GeometryNodeInputMeshEdgeVertices' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceArea' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceIsPlanar' : NodeInfo(()),
+	'GeometryNodeInputMeshFaceNeighbors' : NodeInfo(()),
+	'GeometryNodeInputMeshIsland' : NodeInfo(()),
+	'GeometryNodeInputMeshVertexNeighbors' : NodeInfo(()),
+	'GeometryNodeInputNamedAttribute' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeInputNamedLayerSelection' : NodeInfo(()),
+	'GeometryNodeInputNormal' : NodeInfo(()),
+	'GeometryNodeInputPosition' : NodeInfo(()),
+	'GeometryNodeInputRadius' : NodeInfo(()),
+	'GeometryNodeInputSceneTime' : NodeInfo(()),
+	'GeometryNodeInputShadeSmooth' : NodeInfo(()),
+	'GeometryNodeInputShortestEdgePaths' : NodeInfo(()),
+	'GeometryNodeInputSplineCyclic' : NodeInfo(()),
+	'GeometryNodeInputSplineResolution' : NodeInfo(()),
+	'GeometryNodeInputTangent' : NodeInfo(()),
+	'GeometryNodeInstanceOnPoints' : NodeInfo(()),
+	'GeometryNodeInstanceTransform' : NodeInfo(()),
+	'GeometryNodeInstancesToPoints' : NodeInfo(()),
+	'GeometryNodeInterpolateCurves' : NodeInfo(()),
+	'GeometryNodeIsViewport' : NodeInfo(()),
+	'GeometryNodeJoinGeometry' : NodeInfo(()),
+	'GeometryNodeMaterialSelection' : NodeInfo(()),
+	'GeometryNodeMenuSwitch' : NodeInfo((_active_index_int,
+		_active_item_enum_item, _data_type_enum, _enum_items_menu_switch_items)),
+	'GeometryNodeMergeByDistance' : NodeInfo((_mode_enum,)),
+	'GeometryNodeMergeLayers' : NodeInfo((_mode_enum,)),
+	'GeometryNodeMeshBoolean' : NodeInfo((_operation_enum, _solver_enum)),
+	'GeometryNodeMeshCircle' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshCone' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshCube' : NodeInfo(()),
+	'GeometryNodeMeshCylinder' : NodeInfo((_fill_type_enum,)),
+	'GeometryNodeMeshFaceSetBoundaries' : NodeInfo(()),
+	'GeometryNodeMeshGrid' : NodeInfo(()),
+	'GeometryNodeMeshIcoSphere' : NodeInfo(()),
+	'GeometryNodeMeshLine' : NodeInfo((_count_mode_enum, _mode_enum)),
+	'GeometryNodeMeshToCurve' : NodeInfo(()),
+	'GeometryNodeMeshToDensityGrid' : NodeInfo(()),
+	'GeometryNodeMeshToPoints' : NodeInfo((_mode_enum,)),
+	'GeometryNodeMeshToSDFGrid' : NodeInfo(()),
+	'GeometryNodeMeshToVolume' : NodeInfo((_resolution_mode_enum,)),
+	'GeometryNodeMeshUVSphere' : NodeInfo(()),
+	'GeometryNodeObjectInfo' : NodeInfo((_transform_space_enum,)),
+	'GeometryNodeOffsetCornerInFace' : NodeInfo(()),
+	'GeometryNodeOffsetPointInCurve' : NodeInfo(()),
+	'GeometryNodePoints' : NodeInfo(()),
+	'GeometryNodePointsOfCurve' : NodeInfo(()),
+	'GeometryNodePointsToCurves' : NodeInfo(()),
+	'GeometryNodePointsToSDFGrid' : NodeInfo(()),
+	'GeometryNodePointsToVertices' : NodeInfo(()),
+	'GeometryNodePointsToVolume' : NodeInfo((_resolution_mode_enum,)),
+	'GeometryNodeProximity' : NodeInfo((_target_element_enum,)),
+	'GeometryNodeRaycast' : NodeInfo((_data_type_enum, _mapping_enum)),
+	'GeometryNodeRealizeInstances' : NodeInfo(()),
+	'GeometryNodeRemoveAttribute' : NodeInfo((_pattern_mode_enum,)),
+	'GeometryNodeRepeatInput' : NodeInfo(()),
+	'GeometryNodeRepeatOutput' : NodeInfo((_active_index_int,
+		_inspection_index_int, _repeat_items_repeat_output_items)),
+	'GeometryNodeReplaceMaterial' : NodeInfo(()),
+	'GeometryNodeResampleCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeReverseCurve' : NodeInfo(()),
+	'GeometryNodeRotateInstances' : NodeInfo(()),
+	'GeometryNodeSDFGridBoolean' : NodeInfo((_operation_enum,)),
+	'GeometryNodeSampleCurve' : NodeInfo((_data_type_enum, _mode_enum,
+		_use_all_curves_bool)),
+	'GeometryNodeSampleGrid' : NodeInfo((_data_type_enum,
+		_interpolation_mode_enum)),
+	'GeometryNodeSampleGridIndex' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeSampleIndex' : NodeInfo((_clamp_bool, _data_type_enum,
+		_domain_enum)),
+	'GeometryNodeSampleNearest' : NodeInfo((_domain_enum,)),
+	'GeometryNodeSampleNearestSurface' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeSampleUVSurface' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeScaleElements' : NodeInfo((_domain_enum, _scale_mode_enum)),
+	'GeometryNodeScaleInstances' : NodeInfo(()),
+	'GeometryNodeSelfObject' : NodeInfo(()),
+	'GeometryNodeSeparateComponents' : NodeInfo(()),
+	'GeometryNodeSeparateGeometry' : NodeInfo((_domain_enum,)),
+	'GeometryNodeSetCurveHandlePositions' : NodeInfo((_mode_enum,)),
+	'GeometryNodeSetCurveNormal' : NodeInfo((_mode_enum,)),
+	'GeometryNodeSetCurveRadius' : NodeInfo(()),
+	'GeometryNodeSetCurveTilt' : NodeInfo(()),
+	'GeometryNodeSetGeometryName' : NodeInfo(()),
+	'GeometryNodeSetID' : NodeInfo(()),
+	'GeometryNodeSetInstanceTransform' : NodeInfo(()),
+	'GeometryNodeSetMaterial' : NodeInfo(()),
+	'GeometryNodeSetMaterialIndex' : NodeInfo(()),
+	'GeometryNodeSetPointRadius' : NodeInfo(()),
+	'GeometryNodeSetPosition' : NodeInfo(()),
+	'GeometryNodeSetShadeSmooth' : NodeInfo((_domain_enum,)),
+	'GeometryNodeSetSplineCyclic' : NodeInfo(()),
+	'GeometryNodeSetSplineResolution' : NodeInfo(()),
+	'GeometryNodeSimulationInput' : NodeInfo(()),
+	'GeometryNodeSimulationOutput' : NodeInfo((_active_index_int,
+		_state_items_sim_output_items)),
+	'GeometryNodeSortElements' : NodeInfo((_domain_enum,)),
+	'GeometryNodeSplineLength' : NodeInfo(()),
+	'GeometryNodeSplineParameter' : NodeInfo(()),
+	'GeometryNodeSplitEdges' : NodeInfo(()),
+	'GeometryNodeSplitToInstances' : NodeInfo((_domain_enum,)),
+	'GeometryNodeStoreNamedAttribute' : NodeInfo((_data_type_enum,
+		_domain_enum)),
+	'GeometryNodeStoreNamedGrid' : NodeInfo((_data_type_enum,)),
+	'GeometryNodeStringJoin' : NodeInfo(()),
+	'GeometryNodeStringToCurves' : NodeInfo((_align_x_enum, _align_y_enum,
+		_font_font, _overflow_enum, _pivot_mode_enum)),
+	'GeometryNodeSubdivideCurve' : NodeInfo(()),
+	'GeometryNodeSubdivideMesh' : NodeInfo(()),
+	'GeometryNodeSubdivisionSurface' : NodeInfo((_boundary_smooth_enum,
+		_uv_smooth_enum)),
+	'GeometryNodeSwitch' : NodeInfo((_input_type_enum,)),
+	'GeometryNodeTool3DCursor' : NodeInfo(()),
+	'GeometryNodeToolActiveElement' : NodeInfo((_domain_enum,)),
+	'GeometryNodeToolFaceSet' : NodeInfo(()),
+	'GeometryNodeToolMousePosition' : NodeInfo(()),
+	'GeometryNodeToolSelection' : NodeInfo(()),
+	'GeometryNodeToolSetFaceSet' : NodeInfo(()),
+	'GeometryNodeToolSetSelection' : NodeInfo((_domain_enum,
+		_selection_type_enum)),
+	'GeometryNodeTransform' : NodeInfo((_mode_enum,)),
+	'GeometryNodeTranslateInstances' : NodeInfo(()),
+	'GeometryNodeTriangulate' : NodeInfo((_ngon_method_enum, _quad_method_enum)),
+	'GeometryNodeTrimCurve' : NodeInfo((_mode_enum,)),
+	'GeometryNodeUVPackIslands' : NodeInfo(()),
+	'GeometryNodeUVUnwrap' : NodeInfo((_method_enum,)),
+	'GeometryNodeVertexOfCorner' : NodeInfo(()),
+	'GeometryNodeViewer' : NodeInfo((_data_type_enum, _domain_enum)),
+	'GeometryNodeViewportTransform' : NodeInfo(()),
+	'GeometryNodeVolumeCube' : NodeInfo(()),
+	'GeometryNodeVolumeToMesh' : NodeInfo((_resolution_mode_enum,)),
+	'GeometryNodeWarning' : NodeInfo((_warning_type_enum,)),
+}
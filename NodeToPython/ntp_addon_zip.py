@@ -0,0 +1,104 @@
+import io
+from typing import TextIO
+import zipfile
+
+# Image formats that are already compressed, so deflating them again only
+# costs time
+COMPRESSED_IMAGE_FORMATS = {
+    'JPEG',
+    'JPEG2000',
+    'OPEN_EXR',
+    'OPEN_EXR_MULTILAYER',
+    'PNG',
+    'WEBP',
+}
+
+class NTP_AddonZip:
+    """
+    Writes the files of a generated add-on straight into a zip archive,
+    without creating them on disk first
+    """
+    def __init__(self, zip_path: str, addon_name: str,
+                 compression_level: int = 6):
+        """
+        Parameters:
+        zip_path (str): path of the zip archive to create
+        addon_name (str): name of the add-on's directory inside the archive
+        compression_level (int): deflate level from 1 to 9, or 0 to store
+            files without compressing them
+        """
+        # Path of the zip archive being written
+        self.zip_path: str = zip_path
+
+        # Name of the add-on's directory inside the archive
+        self.addon_name: str = addon_name
+
+        if compression_level == 0:
+            self._compression = zipfile.ZIP_STORED
+            self._compression_level = None
+        else:
+            self._compression = zipfile.ZIP_DEFLATED
+            self._compression_level = compression_level
+
+        self._zip_file = zipfile.ZipFile(zip_path, "w", self._compression,
+                                         compresslevel=self._compression_level)
+
+    def _arcname(self, name: str) -> str:
+        return f"{self.addon_name}/{name}"
+
+    def open_text(self, name: str) -> TextIO:
+        """
+        Opens a text file in the add-on for streaming writes. No other file
+        can be written until it's closed
+
+        Parameters:
+        name (str): path of the file inside the add-on
+
+        Returns:
+        (TextIO): the file
+        """
+        return io.TextIOWrapper(self._zip_file.open(self._arcname(name), "w"),
+                                encoding="utf-8")
+
+    def write_text(self, name: str, text: str) -> None:
+        """
+        Writes a text file to the add-on
+
+        Parameters:
+        name (str): path of the file inside the add-on
+        text (str): contents of the file
+        """
+        self._zip_file.writestr(self._arcname(name), text.encode("utf-8"))
+
+    def write_file(self, name: str, path: str, compress: bool = True) -> None:
+        """
+        Copies a file on disk into the add-on
+
+        Parameters:
+        name (str): path of the file inside the add-on
+        path (str): path of the file on disk
+        compress (bool): whether to compress the file, if the archive is
+            compressed
+        """
+        compression = self._compression if compress else zipfile.ZIP_STORED
+        self._zip_file.write(path, self._arcname(name), compression,
+                             self._compression_level)
+
+    def write_image(self, name: str, path: str, file_format: str) -> None:
+        """
+        Copies an image file into the add-on, storing already compressed
+        formats as is
+
+        Parameters:
+        name (str): path of the image inside the add-on
+        path (str): path of the image on disk
+        file_format (str): Blender file format of the image
+        """
+        self.write_file(name, path,
+                        file_format not in COMPRESSED_IMAGE_FORMATS)
+
+    def close(self) -> None:
+        """
+        Finishes the archive
+        """
+        self._zip_file.close()
@@ -0,0 +1,361 @@
+import bpy
+from bpy.types import ColorRamp, CurveMapping, ID, Image, Node, NodeSocket
+from bpy.types import NodeTree, bpy_struct
+
+import hashlib
+import json
+import os
+import tempfile
+
+from .ntp_tree_ir import NO_DEFAULT, NTP_TreeIR, read_all
+
+# Bump whenever the generated code changes, so stale fragments aren't reused
+CACHE_VERSION = 4
+
+# Directory used when no cache directory is set in the options
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "NodeToPython_cache")
+
+# Nested structs deeper than this aren't hashed
+MAX_DEPTH = 8
+
+# Properties that don't affect the generated code
+SKIPPED_PROPERTIES = {
+    "bl_rna",
+    "id_data",
+    "internal_links",
+    "is_editmode",
+    "is_embedded_data",
+    "is_evaluated",
+    "is_library_indirect",
+    "is_missing",
+    "is_runtime_data",
+    "library",
+    "library_weak_reference",
+    "links", # node tree links are hashed separately
+    "name_full",
+    "nodes", # nodes are hashed from the node tree's IR
+    "original",
+    "override_library",
+    "preview",
+    "rna_type",
+    "select",
+    "session_uid",
+    "tag",
+    "use_extra_user",
+    "use_fake_user",
+    "users",
+}
+
+# RNA struct identifier -> (property identifier, property type) pairs
+_rna_properties: dict[str, list[tuple[str, str]]] = {}
+
+def _get_rna_properties(struct: bpy.types.bpy_struct) -> list[tuple[str, str]]:
+    """
+    Returns:
+    (list[tuple[str, str]]): identifier and type of each property of the
+        struct that could affect the generated code
+    """
+    bl_rna = struct.bl_rna
+    properties = _rna_properties.get(bl_rna.identifier)
+    if properties is None:
+        properties = [(prop.identifier, prop.type)
+                      for prop in bl_rna.properties
+                      if prop.identifier not in SKIPPED_PROPERTIES]
+        _rna_properties[bl_rna.identifier] = properties
+    return properties
+
+def _update_value(h, value) -> None:
+    if isinstance(value, set):
+        value = tuple(sorted(value))
+    elif hasattr(value, "__len__") and not isinstance(value, str):
+        value = tuple(value)
+    h.update(repr(value).encode())
+
+def _image_key(img: Image) -> tuple:
+    """
+    Returns:
+    (tuple): the parts of an image that change how the generated code
+        loads it
+    """
+    return (img.name, img.has_data, img.file_format, img.source,
+            img.colorspace_settings.name, img.alpha_mode)
+
+def _update_reference(h, value, visited: set[int], depth: int,
+                      owned: bool) -> None:
+    """
+    Hashes a struct pointed to by another struct. Data blocks, nodes, and
+    sockets only contribute their names unless they're owned by the
+    struct (e.g. the nodes of a node tree)
+    """
+    if value is None:
+        h.update(b"\0")
+    elif isinstance(value, ID):
+        if isinstance(value, Image):
+            h.update(f"Image:{_image_key(value)!r}".encode())
+        else:
+            h.update(f"{value.__class__.__name__}:{value.name}".encode())
+    elif isinstance(value, Node) and not owned:
+        h.update(f"node:{value.name}".encode())
+    elif isinstance(value, NodeSocket) and not owned:
+        h.update(f"socket:{value.node.name}:{value.is_output}:"
+                 f"{value.identifier}".encode())
+    else:
+        _update_struct(h, value, visited, depth + 1)
+
+def _update_struct(h, struct: bpy.types.bpy_struct, visited: set[int],
+                   depth: int) -> None:
+    """
+    Hashes every property of an RNA struct, recursing into nested structs
+    """
+    pointer = struct.as_pointer()
+    if pointer in visited or depth > MAX_DEPTH:
+        h.update(b"^")
+        return
+    visited.add(pointer)
+
+    h.update(struct.bl_rna.identifier.encode())
+    for identifier, prop_type in _get_rna_properties(struct):
+        value = getattr(struct, identifier, None)
+        h.update(identifier.encode())
+        if prop_type == 'POINTER':
+            _update_reference(h, value, visited, depth, False)
+        elif prop_type == 'COLLECTION':
+            if value is None:
+                h.update(b"\0")
+                continue
+            h.update(str(len(value)).encode())
+            for item in value:
+                _update_reference(h, item, visited, depth, True)
+        else:
+            _update_value(h, value)
+
+def _update_color_ramp(h, color_ramp: ColorRamp) -> None:
+    """
+    Hashes the parts of a color ramp the generated code sets, reading its
+    elements in bulk
+    """
+    elements = color_ramp.elements
+    num_elements = len(elements)
+    h.update(repr((color_ramp.color_mode, color_ramp.hue_interpolation,
+                   color_ramp.interpolation, num_elements)).encode())
+    h.update(read_all(elements, "position", num_elements).tobytes())
+    h.update(read_all(elements, "color", 4 * num_elements).tobytes())
+
+def _update_curve_mapping(h, mapping: CurveMapping) -> None:
+    """
+    Hashes the parts of a curve mapping the generated code sets, reading
+    the points of its curves in bulk
+    """
+    h.update(repr((mapping.extend, mapping.tone, tuple(mapping.black_level),
+                   tuple(mapping.white_level), mapping.clip_min_x,
+                   mapping.clip_min_y, mapping.clip_max_x, mapping.clip_max_y,
+                   mapping.use_clip)).encode())
+    for curve in mapping.curves:
+        points = curve.points
+        num_points = len(points)
+        h.update(str(num_points).encode())
+        h.update(read_all(points, "location", 2 * num_points).tobytes())
+        h.update(repr([point.handle_type for point in points]).encode())
+
+def _setting_key(h, value):
+    """
+    Turns a node setting or socket value into a value its repr can be
+    hashed by. Nested structs are hashed right away instead: color ramps
+    and curve mappings by the parts the generated code sets, others (zone
+    items, image users, ...) property by property
+    """
+    if value is NO_DEFAULT:
+        return ...
+    elif isinstance(value, Image):
+        return ("Image",) + _image_key(value)
+    elif isinstance(value, ID):
+        return (value.__class__.__name__, value.name)
+    elif isinstance(value, ColorRamp):
+        _update_color_ramp(h, value)
+    elif isinstance(value, CurveMapping):
+        _update_curve_mapping(h, value)
+    elif isinstance(value, bpy_struct):
+        _update_reference(h, value, set(), 0, True)
+    elif isinstance(value, set):
+        return tuple(sorted(value))
+    elif hasattr(value, "__len__") and not isinstance(value, str):
+        return tuple(value)
+    else:
+        return value
+    return None
+
+def hash_node_tree(node_tree: NodeTree, tree_ir: NTP_TreeIR,
+                   settings: list[tuple]) -> str:
+    """
+    Computes a structural hash of a node tree, covering its properties,
+    interface, nodes, node settings, sockets, and links. Nodes, sockets,
+    and links are hashed from the values already read into the node tree's
+    IR, rather than read from Blender again
+
+    Parameters:
+    node_tree (NodeTree): node tree to hash
+    tree_ir (NTP_TreeIR): the node tree's IR
+    settings (list[tuple]): (setting name, value) pairs of each node in
+        the IR, for the settings the generated code sets
+
+    Returns:
+    (str): hex digest of the hash
+    """
+    h = hashlib.sha256()
+    _update_struct(h, node_tree, set(), 0)
+
+    layout = tree_ir.layout
+    for values in (layout.locations, layout.widths, layout.heights,
+                   layout.mute, layout.hide):
+        h.update(values.tobytes())
+
+    # hashed with a single repr at the end
+    values = []
+    for node, node_settings in zip(tree_ir.nodes, settings):
+        parent = node.parent.name if node.parent is not None else None
+        paired_output = getattr(node.node, "paired_output", None)
+        if paired_output is not None:
+            paired_output = paired_output.name
+        values.append((node.bl_idname, node.name, node.label, node.color,
+                       node.warning_propagation, parent, paired_output,
+                       len(node.inputs), len(node.outputs)))
+        for sockets in (node.inputs, node.outputs):
+            for socket in sockets:
+                values.append((socket.bl_idname, socket.identifier,
+                               socket.name, socket.hide,
+                               _setting_key(h, socket.default_value)))
+        for attr_name, value in node_settings:
+            values.append((attr_name, _setting_key(h, value)))
+
+    for link in tree_ir.links:
+        values.append((link.from_node.name, link.from_index,
+                       link.to_node.name, link.to_index))
+    h.update(repr(values).encode())
+    return h.hexdigest()
+
+def hash_key(*parts) -> str:
+    """
+    Combines the given parts into a cache key
+    """
+    return hashlib.sha256(repr((CACHE_VERSION,) + parts).encode()).hexdigest()
+
+
+class NTP_CacheEntry:
+    """
+    Generated code for a node tree, along with the variable names it
+    allocated and the images it saved
+    """
+    def __init__(self):
+        # Code generated by _process_node_tree
+        self.code: str = ""
+
+        # Variable name of the node tree
+        self.nt_var: str = ""
+
+        # Variable base name -> [usage count before, usage count after]
+        self.vars: dict[str, list[int]] = {}
+
+        # Names of images saved to the add-on
+        self.images: list[str] = []
+
+        # Hash the node group is stamped with, if reusing node groups
+        self.group_hash: str = ""
+
+        # (report type, message) of each report made while generating the
+        # code, to make again when it's reused
+        self.reports: list[tuple[str, str]] = []
+
+    def note_var(self, var: str, count: int) -> None:
+        """
+        Records a variable name allocated while generating the code
+
+        Parameters:
+        var (str): base variable name
+        count (int): usage count of the name before allocation, or None if
+            it hadn't been used yet
+        """
+        if var not in self.vars:
+            self.vars[var] = [count, None]
+
+    def finish(self, used_vars: dict[str, int]) -> None:
+        """
+        Records the usage counts of the allocated names after generation
+        """
+        for var, counts in self.vars.items():
+            counts[1] = used_vars[var]
+
+    def applies_to(self, used_vars: dict[str, int]) -> bool:
+        """
+        The cached code can only be reused if it'd allocate the same
+        variable names it did when it was generated
+
+        Parameters:
+        used_vars (dict[str, int]): current variable usage counts
+        """
+        return all(used_vars.get(var) == before
+                   for var, (before, _) in self.vars.items())
+
+    def apply(self, used_vars: dict[str, int]) -> None:
+        """
+        Allocates the variable names the cached code uses
+        """
+        for var, (_, after) in self.vars.items():
+            used_vars[var] = after
+
+    def to_dict(self) -> dict:
+        return {"code": self.code, "nt_var": self.nt_var, "vars": self.vars,
+                "images": self.images, "group_hash": self.group_hash,
+                "reports": self.reports}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'NTP_CacheEntry':
+        entry = cls()
+        entry.code = data["code"]
+        entry.nt_var = data["nt_var"]
+        entry.vars = data["vars"]
+        entry.images = data["images"]
+        entry.group_hash = data["group_hash"]
+        entry.reports = [tuple(report) for report in data["reports"]]
+        return entry
+
+
+class NTP_ExportCache:
+    """
+    On-disk cache of generated node tree code, keyed by structural hash
+    """
+    def __init__(self, cache_dir: str = ""):
+        if not cache_dir:
+            cache_dir = DEFAULT_CACHE_DIR
+        # Directory the cache is kept in
+        self.cache_dir: str = cache_dir
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> NTP_CacheEntry:
+        """
+        Returns:
+        (NTP_CacheEntry): the cached entry for the key, or None if there
+            isn't a valid one
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as file:
+                return NTP_CacheEntry.from_dict(json.load(file))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, entry: NTP_CacheEntry) -> None:
+        """
+        Stores an entry. Failing to write the cache isn't fatal, the entry
+        is just regenerated next time
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(entry.to_dict(), file)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
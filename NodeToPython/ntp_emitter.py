@@ -0,0 +1,121 @@
+from typing import TextIO
+
+# Number of buffered lines before they're written out to a file in one chunk
+FLUSH_LINES = 4096
+
+class NTP_Emitter:
+    """
+    Writes generated code line by line. Lines are buffered and handed to the
+    file in large chunks, and the whitespace for each indentation level is
+    only built once
+    """
+    def __init__(self, file: TextIO = None, indentation: str = "    ",
+                 indent_level: int = 1):
+        # File the code is written to, or None to keep it all in memory
+        self._file: TextIO = file
+
+        # Indentation string for a single level
+        self._indentation: str = indentation
+
+        # Indentation level used when none is given
+        self.indent_level: int = indent_level
+
+        # Whitespace prefix for each indentation level
+        self._indents: list[str] = [indentation * i for i in range(8)]
+
+        # Lines (with newlines) that haven't been written to the file yet
+        self._lines: list[str] = []
+
+        # Everything already flushed when writing to memory
+        self._chunks: list[str] = []
+
+        # Index into the buffered lines where each active capture starts
+        self._capture_starts: list[int] = []
+
+    def write(self, string: str, indent_level: int = None) -> None:
+        """
+        Writes a line with the given indentation
+
+        Parameters:
+        string (str): the line to write
+        indent_level (int): indentation level of the line, or None for the
+            emitter's default level
+        """
+        if indent_level is None:
+            indent_level = self.indent_level
+        if indent_level >= len(self._indents):
+            self._indents += [self._indentation * i for i in
+                              range(len(self._indents), indent_level + 1)]
+        lines = self._lines
+        lines.append(f"{self._indents[indent_level]}{string}\n")
+        if len(lines) >= FLUSH_LINES and not self._capture_starts:
+            self.flush()
+
+    def write_block(self, block: str) -> None:
+        """
+        Writes already indented lines, e.g. ones returned by end_capture()
+
+        Parameters:
+        block (str): the lines to write, each ending with a newline
+        """
+        self._lines.append(block)
+        if len(self._lines) >= FLUSH_LINES and not self._capture_starts:
+            self.flush()
+
+    def start_capture(self) -> None:
+        """
+        Starts holding back written lines so they can be retrieved with
+        end_capture(). Captures can be nested
+        """
+        self._capture_starts.append(len(self._lines))
+
+    def end_capture(self, keep: bool = True) -> str:
+        """
+        Stops the most recently started capture
+
+        Parameters:
+        keep (bool): whether the captured lines are still written as usual,
+            or removed so they can be written elsewhere
+
+        Returns:
+        (str): all lines written since the matching start_capture()
+        """
+        start = self._capture_starts.pop()
+        captured = "".join(self._lines[start:])
+        if keep:
+            self._lines[start:] = [captured]
+        else:
+            del self._lines[start:]
+        return captured
+
+    def flush(self) -> None:
+        """
+        Hands all buffered lines over in a single chunk
+        """
+        if not self._lines:
+            return
+        chunk = "".join(self._lines)
+        self._lines.clear()
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._chunks.append(chunk)
+
+    def getvalue(self) -> str:
+        """
+        Returns:
+        (str): all code written to memory so far
+        """
+        self.flush()
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def close(self) -> None:
+        """
+        Flushes remaining lines and closes the file, if there is one
+        """
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
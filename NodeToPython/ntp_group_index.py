@@ -0,0 +1,126 @@
+import bpy
+from bpy.types import NodeTree
+
+# Node tree type -> bl_idname of the group nodes used in it
+GROUP_NODE_TYPES = {
+    'CompositorNodeTree': 'CompositorNodeGroup',
+    'GeometryNodeTree': 'GeometryNodeGroup',
+    'ShaderNodeTree': 'ShaderNodeGroup',
+}
+
+class NTP_GroupIndex:
+    """
+    Which node groups each node tree uses, and which node trees use each
+    node group. Built in a single pass over the nodes of every node group
+    of a type, plus any node trees that aren't node groups (e.g. material
+    and scene node trees)
+    """
+    def __init__(self, tree_type: str, extra_trees: list[NodeTree],
+                 node_groups=None):
+        """
+        Parameters:
+        tree_type (str): bl_idname of the node tree type to index
+        extra_trees (list[NodeTree]): node trees to index that may not be
+            in bpy.data.node_groups
+        node_groups (BlendDataNodeTrees): node groups to index, 
+            bpy.data.node_groups by default
+        """
+        # bl_idname of the group nodes of the node tree type
+        self.group_node_type: str = GROUP_NODE_TYPES.get(tree_type)
+
+        # Node tree -> node groups it uses, in node order, without
+        # duplicates
+        self._references: dict[NodeTree, list[NodeTree]] = {}
+
+        # Node group -> node trees using it
+        self._users: dict[NodeTree, list[NodeTree]] = {}
+
+        # Node trees with group nodes that don't have a valid node tree
+        self.invalid_trees: set[NodeTree] = set()
+
+        # Node trees found to (indirectly) contain themselves by sort()
+        self.cycles: list[NodeTree] = []
+
+        if node_groups is None:
+            node_groups = bpy.data.node_groups
+        for node_tree in node_groups:
+            if node_tree.bl_idname == tree_type:
+                self._add(node_tree)
+        for node_tree in extra_trees:
+            if node_tree is not None and node_tree not in self._references:
+                self._add(node_tree)
+
+    def _add(self, node_tree: NodeTree) -> None:
+        references = []
+        seen = set()
+        for node in node_tree.nodes:
+            if node.bl_idname != self.group_node_type:
+                continue
+            group = node.node_tree
+            if group is None:
+                self.invalid_trees.add(node_tree)
+                continue
+            if group in seen:
+                continue
+            seen.add(group)
+            references.append(group)
+            self._users.setdefault(group, []).append(node_tree)
+        self._references[node_tree] = references
+
+    def references(self, node_tree: NodeTree) -> list[NodeTree]:
+        """
+        Returns:
+        (list[NodeTree]): node groups used by the node tree
+        """
+        references = self._references.get(node_tree)
+        if references is None:
+            # e.g. a linked node group of another type
+            self._add(node_tree)
+            references = self._references[node_tree]
+        return references
+
+    def users(self, node_group: NodeTree) -> list[NodeTree]:
+        """
+        Returns:
+        (list[NodeTree]): indexed node trees using the node group
+        """
+        return self._users.get(node_group, [])
+
+    def sort(self, node_trees: list[NodeTree]) -> list[NodeTree]:
+        """
+        Orders the node trees and every node group they depend on so that
+        node groups come before the node trees using them. Iterative, so
+        deeply nested groups can't hit the recursion limit. Node trees that
+        (indirectly) contain themselves are added to cycles, and the link
+        closing each cycle is ignored
+
+        Parameters:
+        node_trees (list[NodeTree]): the node trees to sort
+
+        Returns:
+        (list[NodeTree]): the node trees in order of processing
+        """
+        IN_PROGRESS, DONE = 1, 2
+        states: dict[NodeTree, int] = {}
+        result: list[NodeTree] = []
+
+        for root in node_trees:
+            if root in states:
+                continue
+            states[root] = IN_PROGRESS
+            stack = [(root, iter(self.references(root)))]
+            while stack:
+                node_tree, references = stack[-1]
+                for group in references:
+                    state = states.get(group)
+                    if state is None:
+                        states[group] = IN_PROGRESS
+                        stack.append((group, iter(self.references(group))))
+                        break
+                    elif state == IN_PROGRESS:
+                        self.cycles.append(group)
+                else:
+                    stack.pop()
+                    states[node_tree] = DONE
+                    result.append(node_tree)
+        return result
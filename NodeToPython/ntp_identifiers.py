@@ -0,0 +1,141 @@
+"""
+Allocates the variable names used in generated code. Every node tree, node,
+socket, panel, color ramp, and curve gets a name, so cleaning is memoized
+and collisions are resolved with a per-name counter rather than by
+searching for a free name
+"""
+import re
+
+from .utils import clean_string
+
+# Name used for things with an empty name, or a name without any characters
+# usable in an identifier
+UNNAMED = "unnamed"
+
+# Number of cleaned names kept in memory between runs. The memo is emptied
+# once it's full
+CLEAN_CACHE_SIZE = 1 << 18
+
+# Name -> cleaned name
+_clean_names: dict[str, str] = {}
+
+# String literals, which are left alone, or a variable name as allocated
+# from a cleaned name ("ntp_" prefix, optional "_<n>" suffix). Matches the
+# start of names built from variables too, e.g. "<var>_node_group"
+_STRING_OR_VAR = re.compile(r'"(?:[^"\\\n]|\\.)*"'
+                            r"|'(?:[^'\\\n]|\\.)*'"
+                            r"|\b(ntp__?[A-Za-z0-9]+(?:_[0-9]+)?)")
+
+
+def clean_name(name: str) -> str:
+    """
+    Cleans a name for use as a variable, remembering the result
+
+    Parameters:
+    name (str): name to clean, e.g. a node's name
+
+    Returns:
+    (str): the cleaned name
+    """
+    cleaned = _clean_names.get(name)
+    if cleaned is None:
+        cleaned = clean_string(name) or clean_string(UNNAMED)
+        if len(_clean_names) >= CLEAN_CACHE_SIZE:
+            _clean_names.clear()
+        _clean_names[name] = cleaned
+    return cleaned
+
+
+def clear_clean_names() -> None:
+    """
+    Forgets the cleaned names, e.g. to time cleaning them
+    """
+    _clean_names.clear()
+
+
+def canonical_identifiers(code: str) -> str:
+    """
+    Replaces the variable names in generated code by the order they first
+    appear in, so code that only differs in the names its variables were
+    given, e.g. because of what else was exported with it, compares equal
+
+    Parameters:
+    code (str): generated code
+
+    Returns:
+    (str): the code with canonical variable names
+    """
+    indices: dict[str, str] = {}
+
+    def replace(match: re.Match) -> str:
+        var = match.group(1)
+        if var is None:
+            return match.group(0)
+        index = indices.get(var)
+        if index is None:
+            index = indices[var] = f"\0{len(indices)}"
+        return index
+
+    return _STRING_OR_VAR.sub(replace, code)
+
+
+class NTP_IdentifierAllocator:
+    """
+    Hands out unique variable names. A name that's already been used gets
+    a "_<n>" suffix, which can't collide with a cleaned name since cleaning
+    removes underscores
+    """
+    __slots__ = ("counts",)
+
+    def __init__(self, reserved: set[str] = ()):
+        """
+        Parameters:
+        reserved (set[str]): names that are already taken in the generated
+            code
+        """
+        # Base name -> number of times it's been used after the first
+        self.counts: dict[str, int] = {}
+        for name in reserved:
+            self.reserve(name)
+
+    def reserve(self, name: str) -> None:
+        """
+        Marks a name as taken without cleaning it
+
+        Parameters:
+        name (str): name to reserve
+        """
+        self.counts.setdefault(name, 0)
+
+    def allocate(self, base: str) -> str:
+        """
+        Allocates a variable name from a cleaned base name
+
+        Parameters:
+        base (str): cleaned name, as returned by clean_name()
+
+        Returns:
+        (str): unique variable name
+        """
+        count = self.counts.get(base)
+        if count is None:
+            self.counts[base] = 0
+            return base
+        count += 1
+        self.counts[base] = count
+        return f"{base}_{count}"
+
+    def create(self, name: str) -> str:
+        """
+        Cleans a name and allocates a variable name from it
+
+        Parameters:
+        name (str): name to create the variable name out of
+
+        Returns:
+        (str): unique variable name
+        """
+        base = _clean_names.get(name)
+        if base is None:
+            base = clean_name(name)
+        return self.allocate(base)
@@ -0,0 +1,139 @@
+"""
+Content-addressed store of the image files Blender saved for add-ons, so
+exporting the same image again (in another add-on, or after changing
+something else) copies the stored file instead of encoding it again
+"""
+import bpy
+from bpy.types import Image, Scene
+
+import array
+import hashlib
+import os
+import shutil
+
+# Bump whenever the way images are saved changes, so stale files aren't used
+IMAGE_STORE_VERSION = 2
+
+# Directory of the store inside the cache directory
+IMAGE_STORE_DIR_NAME = "images"
+
+
+def _render_settings(scene: Scene) -> tuple:
+    """
+    Returns:
+    (tuple): the settings of the scene Image.save_render() encodes with
+    """
+    image_settings = scene.render.image_settings
+    view_settings = scene.view_settings
+    return (image_settings.file_format, image_settings.color_mode,
+            image_settings.color_depth, image_settings.compression,
+            image_settings.quality, view_settings.view_transform,
+            view_settings.look, view_settings.exposure,
+            view_settings.gamma, scene.display_settings.display_device)
+
+
+def hash_image(img: Image, scene: Scene) -> str:
+    """
+    Computes a hash of the contents of an image and the settings it would
+    be saved with. Unmodified images are hashed by their packed file, or
+    by the path, size, and modification time of the file they were loaded
+    from. Other images, and ones edited since, are hashed by their pixels
+
+    Parameters:
+    img (Image): image to hash
+    scene (Scene): scene whose render settings the image is saved with
+
+    Returns:
+    (str): hex digest of the hash
+    """
+    h = hashlib.sha256()
+    h.update(repr((IMAGE_STORE_VERSION, img.file_format, tuple(img.size),
+                   img.channels, img.alpha_mode,
+                   img.colorspace_settings.name,
+                   _render_settings(scene))).encode())
+    if not img.is_dirty:
+        if img.packed_file is not None:
+            h.update(b"packed")
+            h.update(img.packed_file.data)
+            return h.hexdigest()
+        if img.source == 'FILE' and img.filepath != "":
+            path = bpy.path.abspath(img.filepath)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                pass
+            else:
+                h.update(repr(("file", path, stat.st_size,
+                               stat.st_mtime_ns)).encode())
+                return h.hexdigest()
+    pixels = array.array('f', bytes(4 * len(img.pixels)))
+    img.pixels.foreach_get(pixels)
+    h.update(b"pixels")
+    h.update(pixels.tobytes())
+    return h.hexdigest()
+
+
+class NTP_ImageStore:
+    """
+    Image files kept on disk by the hash of their contents
+    """
+    def __init__(self, cache_dir: str):
+        """
+        Parameters:
+        cache_dir (str): cache directory to keep the store in
+        """
+        self._store_dir: str = os.path.join(cache_dir, IMAGE_STORE_DIR_NAME)
+
+        # Number of images found in the store, and added to it
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self._store_dir, key[:2], f"{key}{extension}")
+
+    def get(self, key: str, extension: str) -> str:
+        """
+        Finds a stored image file
+
+        Parameters:
+        key (str): hash of the image, from hash_image()
+        extension (str): file extension of the image, e.g. ".png"
+
+        Returns:
+        (str): path of the stored file, or None if it isn't stored
+        """
+        path = self._path(key, extension)
+        if os.path.isfile(path):
+            self.hits += 1
+            return path
+        self.misses += 1
+        return None
+
+    def put(self, key: str, extension: str, src_path: str) -> str:
+        """
+        Adds an image file Blender saved to the store, hard linking it if
+        possible. Failing to write the store isn't fatal, the image is just
+        saved again next time
+
+        Parameters:
+        key (str): hash of the image, from hash_image()
+        extension (str): file extension of the image
+        src_path (str): path of the saved file
+
+        Returns:
+        (str): path of the stored file, or src_path if it couldn't be stored
+        """
+        path = self._path(key, extension)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                os.link(src_path, tmp_path)
+            except OSError:
+                shutil.copyfile(src_path, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return src_path
+        return path
@@ -0,0 +1,209 @@
+"""
+Values nodes start out with when they're created with nodes.new(), so
+generated code can leave out settings and socket values that wouldn't
+change anything. The baselines of all node types of a node tree type are
+read from temporary nodes the first time the node tree type is seen, and
+kept for the rest of the Blender session
+"""
+from contextlib import contextmanager
+from typing import Iterator
+
+import bpy
+from bpy.types import Node, NodeTree
+
+from .node_settings import get_node_settings
+from .ntp_tree_ir import NO_DEFAULT, NTP_NodeIR, read_value
+
+# Name of the temporary node tree baseline nodes are created in
+BASELINE_TREE_NAME = ".NTP Baseline"
+
+# Property types that don't hold values
+_REFERENCE_TYPES = {'POINTER', 'COLLECTION'}
+
+
+class NTP_NodeBaseline:
+    """
+    Settings and socket values of a new node of one type
+    """
+    __slots__ = ("settings", "inputs", "outputs")
+
+    def __init__(self, settings: dict[str, object],
+                 inputs: dict[tuple[int, str, str], object],
+                 outputs: dict[tuple[int, str, str], object]):
+        """
+        Parameters:
+        settings (dict[str, object]): setting name -> value pairs
+        inputs (dict[tuple[int, str, str], object]): (index, identifier,
+            bl_idname) -> default value pairs for the input sockets
+        outputs (dict[tuple[int, str, str], object]): same for the output
+            sockets
+        """
+        self.settings: dict[str, object] = settings
+        self.inputs: dict[tuple[int, str, str], object] = inputs
+        self.outputs: dict[tuple[int, str, str], object] = outputs
+
+    @classmethod
+    def read(cls, node: Node) -> "NTP_NodeBaseline":
+        """
+        Reads the baseline from a new node
+
+        Parameters:
+        node (Node): node to read
+
+        Returns:
+        (NTP_NodeBaseline): the node's baseline
+        """
+        settings = {}
+        for prop in node.bl_rna.properties:
+            if prop.type in _REFERENCE_TYPES:
+                continue
+            value = getattr(node, prop.identifier, NO_DEFAULT)
+            if value is not NO_DEFAULT:
+                settings[prop.identifier] = read_value(value)
+        return cls(settings, _read_sockets(node.inputs),
+                   _read_sockets(node.outputs))
+
+    def is_default(self, attr_name: str, value) -> bool:
+        """
+        Checks whether a setting has the value new nodes start out with
+
+        Parameters:
+        attr_name (str): name of the setting
+        value: value of the setting
+
+        Returns:
+        (bool): whether setting the value can be skipped
+        """
+        return self.settings.get(attr_name, NO_DEFAULT) == read_value(value)
+
+
+def _read_sockets(sockets) -> dict[tuple[int, str, str], object]:
+    values = {}
+    for i, socket in enumerate(sockets):
+        value = getattr(socket, "default_value", NO_DEFAULT)
+        if value is not NO_DEFAULT:
+            values[(i, socket.identifier, socket.bl_idname)] = read_value(value)
+    return values
+
+
+# (node tree type, node bl_idname) -> baseline, or None if there's no
+# baseline for the node type
+_baselines: dict[tuple[str, str], NTP_NodeBaseline] = {}
+
+
+def add_baseline(tree_type: str, bl_idname: str,
+                 baseline: NTP_NodeBaseline) -> None:
+    """
+    Adds a baseline read elsewhere, e.g. when generating code from a
+    snapshot of a node tree without Blender
+
+    Parameters:
+    tree_type (str): bl_idname of the node tree type
+    bl_idname (str): bl_idname of the node type
+    baseline (NTP_NodeBaseline): the baseline
+    """
+    _baselines[(tree_type, bl_idname)] = baseline
+
+
+@contextmanager
+def _baseline_node_tree(tree_type: str) -> Iterator[NodeTree]:
+    """
+    Creates the temporary node tree baseline nodes are created in. It's
+    created in temporary data where Blender has it, so bpy.data and undo
+    aren't touched, and in bpy.data and removed again where it doesn't.
+    None if it can't be created
+    """
+    temp_data = getattr(bpy.data, "temp_data", None)
+    if temp_data is not None:
+        with temp_data() as data:
+            yield _new_node_tree(data, tree_type)
+        return
+
+    node_tree = _new_node_tree(bpy.data, tree_type)
+    try:
+        yield node_tree
+    finally:
+        if node_tree is not None:
+            bpy.data.node_groups.remove(node_tree)
+
+
+def _new_node_tree(data, tree_type: str) -> NodeTree:
+    try:
+        return data.node_groups.new(BASELINE_TREE_NAME, tree_type)
+    except (AttributeError, RuntimeError, TypeError):
+        # nodes can't be created here, so nothing is skipped
+        return None
+
+
+def _build_baselines(tree_type: str, bl_idnames: set[str]) -> None:
+    """
+    Reads the baselines of several node types from nodes created in a
+    temporary node tree
+    """
+    with _baseline_node_tree(tree_type) as node_tree:
+        for bl_idname in bl_idnames:
+            baseline = None
+            if node_tree is not None:
+                try:
+                    node = node_tree.nodes.new(bl_idname)
+                except (AttributeError, RuntimeError, TypeError):
+                    node = None
+                if node is not None:
+                    baseline = NTP_NodeBaseline.read(node)
+            _baselines[(tree_type, bl_idname)] = baseline
+
+
+def get_baselines(tree_type: str, bl_idnames: set[str]
+                  ) -> dict[str, NTP_NodeBaseline]:
+    """
+    Finds the baselines of node types, reading the ones that haven't been
+    read yet
+
+    Parameters:
+    tree_type (str): bl_idname of the node tree type
+    bl_idnames (set[str]): bl_idnames of the node types
+
+    Returns:
+    (dict[str, NTP_NodeBaseline]): bl_idname -> baseline pairs, leaving out
+        node types without a baseline
+    """
+    missing = {bl_idname for bl_idname in bl_idnames
+               if (tree_type, bl_idname) not in _baselines}
+    if missing:
+        # read every node type of the node tree type at once, so the
+        # temporary node tree is only created once per session
+        missing.update(bl_idname for bl_idname in get_node_settings(tree_type)
+                       if (tree_type, bl_idname) not in _baselines)
+        _build_baselines(tree_type, missing)
+
+    baselines = {}
+    for bl_idname in bl_idnames:
+        baseline = _baselines[(tree_type, bl_idname)]
+        if baseline is not None:
+            baselines[bl_idname] = baseline
+    return baselines
+
+
+def skip_socket_defaults(node: NTP_NodeIR, baseline: NTP_NodeBaseline
+                         ) -> None:
+    """
+    Marks the socket values of a read node that new nodes already have as
+    not needing to be set. Settings can change a node's sockets and their
+    values, so this only holds for nodes whose settings are all still the
+    ones new nodes have
+
+    Parameters:
+    node (NTP_NodeIR): the read node
+    baseline (NTP_NodeBaseline): baseline of the node's type
+    """
+    _skip_sockets(node.inputs, baseline.inputs)
+    _skip_sockets(node.outputs, baseline.outputs)
+
+
+def _skip_sockets(sockets, baseline_values: dict) -> None:
+    for i, socket in enumerate(sockets):
+        if socket.default_value is NO_DEFAULT:
+            continue
+        key = (i, socket.identifier, socket.bl_idname)
+        if baseline_values.get(key, NO_DEFAULT) == socket.default_value:
+            socket.default_value = NO_DEFAULT
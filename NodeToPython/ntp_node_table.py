@@ -0,0 +1,209 @@
+from .ntp_emitter import NTP_Emitter
+
+# Functions the generated code uses to build node trees from tables. Written
+# once per script/add-on
+LOADER_CODE = '''\
+def build_nodes(node_tree, rows):
+    nodes = []
+    for bl_idname, name, settings in rows:
+        node = node_tree.nodes.new(bl_idname)
+        node.name = name
+        for attr, value in settings.items():
+            setattr(node, attr, value)
+        nodes.append(node)
+    return nodes
+
+def set_socket_values(nodes, sockets, attr, rows):
+    for node_index, socket_index, value in rows:
+        setattr(getattr(nodes[node_index], sockets)[socket_index], attr, value)
+
+def set_parents(nodes, rows):
+    for node_index, parent_index in rows:
+        nodes[node_index].parent = nodes[parent_index]
+
+def set_locations(nodes, locations):
+    for node, location in zip(nodes, locations):
+        node.location = location
+
+def set_dimensions(nodes, dimensions):
+    for node, (width, height) in zip(nodes, dimensions):
+        node.width, node.height = width, height
+
+def build_links(node_tree, nodes, rows):
+    links = node_tree.links
+    for from_index, from_socket, to_index, to_socket in rows:
+        links.new(nodes[from_index].outputs[from_socket],
+                  nodes[to_index].inputs[to_socket])
+'''
+
+LOADER_NAMES = {"build_nodes", "set_socket_values", "set_parents",
+                "set_locations", "set_dimensions", "build_links"}
+
+# Custom properties generated node groups are stamped with: a hash of the
+# code that built them, and their node, link, and interface item counts
+# once built
+NODE_GROUP_HASH = "ntp_hash"
+NODE_GROUP_COUNTS = "ntp_counts"
+
+# Stands in for the hash while the code for a node group is generated.
+# Blender names can't contain null characters, so it can't clash with them
+GROUP_HASH_PLACEHOLDER = "\0ntp_group_hash\0"
+
+# Functions the generated code uses to find a node group an earlier run
+# built, by its name. Adding or removing nodes, links, or sockets changes
+# the counts it was stamped with, so a node group edited that way since it
+# was built isn't reused
+FIND_NODE_GROUP_CODE = f'''\
+def node_group_counts(node_group):
+    interface = getattr(node_group, "interface", None)
+    if interface is not None:
+        num_items = len(interface.items_tree)
+    else:
+        num_items = len(node_group.inputs) + len(node_group.outputs)
+    return [len(node_group.nodes), len(node_group.links), num_items]
+
+def find_node_group(name, ntp_hash):
+    node_group = bpy.data.node_groups.get(name)
+    if node_group is None or node_group.get("{NODE_GROUP_HASH}") != ntp_hash:
+        return None
+    counts = node_group.get("{NODE_GROUP_COUNTS}")
+    if counts is None or list(counts) != node_group_counts(node_group):
+        return None
+    return node_group
+'''
+
+def write_loader(emitter: NTP_Emitter, code: str = LOADER_CODE) -> None:
+    """
+    Writes the loader functions at the top level of the generated code,
+    using the emitter's indentation
+
+    Parameters:
+    emitter (NTP_Emitter): emitter to write with
+    code (str): the functions, indented with four spaces
+    """
+    for line in code.splitlines():
+        stripped = line.lstrip(" ")
+        emitter.write(stripped, (len(line) - len(stripped)) // 4)
+    emitter.write("", 0)
+
+def write_table(emitter: NTP_Emitter, call: str, rows: list[str],
+                indent_level: int, end: str = ")") -> None:
+    """
+    Writes a call to a loader function with a tuple of rows as its last
+    argument, one row per line
+
+    Parameters:
+    emitter (NTP_Emitter): emitter to write with
+    call (str): loader function and its other arguments, e.g.
+        "set_locations(nodes"
+    rows (list[str]): Python literals for each row
+    indent_level (int): indentation level of the call
+    end (str): what follows the tuple, e.g. "):" to start a loop over the
+        call's result
+    """
+    emitter.write(f"{call}, (", indent_level)
+    for row in rows:
+        emitter.write(f"{row},", indent_level + 1)
+    emitter.write(f"){end}", indent_level)
+
+def write_flat_array(emitter: NTP_Emitter, call: str, values: list[str],
+                     indent_level: int, per_line: int = 8,
+                     end: str = ")") -> None:
+    """
+    Writes a call with a flat tuple of values as its last argument, several
+    values per line, e.g. for foreach_set()
+
+    Parameters:
+    emitter (NTP_Emitter): emitter to write with
+    call (str): function and its other arguments, e.g.
+        "node_tree.nodes.foreach_set(\"width\""
+    values (list[str]): Python literals for each value
+    indent_level (int): indentation level of the call
+    per_line (int): number of values on each line
+    end (str): what follows the tuple
+    """
+    rows = [", ".join(values[i:i + per_line])
+            for i in range(0, len(values), per_line)]
+    write_table(emitter, call, rows, indent_level, end)
+
+
+class NTP_NodeTable:
+    """
+    Rows describing the nodes of a node tree, for the table output format.
+    Nodes are referred to by their index in the list build_nodes() returns
+    """
+    def __init__(self, nodes_var: str):
+        # Variable holding the list of nodes in the generated code
+        self.nodes_var: str = nodes_var
+
+        # Node variable -> index of the node
+        self.indices: dict[str, int] = {}
+
+        # (bl_idname, name, settings) for each node, as Python literals
+        self._rows: list[tuple[str, str, list[str]]] = []
+
+        # (sockets, attribute) -> rows of socket values
+        self._socket_values: dict[tuple[str, str], list[str]] = {}
+
+    def add_node(self, bl_idname: str, name: str) -> str:
+        """
+        Adds a node
+
+        Parameters:
+        bl_idname (str): the node's bl_idname, as a Python literal
+        name (str): the node's name, as a Python literal
+
+        Returns:
+        (str): expression referring to the node in the generated code
+        """
+        index = len(self._rows)
+        node_var = f"{self.nodes_var}[{index}]"
+        self.indices[node_var] = index
+        self._rows.append((bl_idname, name, []))
+        return node_var
+
+    def add_setting(self, node_var: str, attr: str, value: str) -> None:
+        """
+        Adds a setting applied when the node is created
+
+        Parameters:
+        node_var (str): expression referring to the node
+        attr (str): name of the setting
+        value (str): value of the setting, as a Python literal
+        """
+        self._rows[self.indices[node_var]][2].append(f"\"{attr}\": {value}")
+
+    def add_socket_value(self, node_var: str, sockets: str, index: int,
+                         attr: str, value: str) -> None:
+        """
+        Adds a socket attribute to set after the nodes are created
+
+        Parameters:
+        node_var (str): expression referring to the node
+        sockets (str): "inputs" or "outputs"
+        index (int): index of the socket
+        attr (str): attribute of the socket
+        value (str): value of the attribute, as a Python literal
+        """
+        rows = self._socket_values.setdefault((sockets, attr), [])
+        rows.append(f"({self.indices[node_var]}, {index}, {value})")
+
+    def write_nodes(self, emitter: NTP_Emitter, nt_var: str,
+                    indent_level: int) -> None:
+        """
+        Writes the table creating the nodes
+        """
+        rows = [f"({bl_idname}, {name}, {{{', '.join(settings)}}})"
+                for bl_idname, name, settings in self._rows]
+        write_table(emitter, f"{self.nodes_var} = build_nodes({nt_var}",
+                    rows, indent_level)
+
+    def write_socket_values(self, emitter: NTP_Emitter,
+                            indent_level: int) -> None:
+        """
+        Writes the tables setting socket attributes
+        """
+        for (sockets, attr), rows in self._socket_values.items():
+            write_table(emitter, f"set_socket_values({self.nodes_var}, "
+                                 f"\"{sockets}\", \"{attr}\"",
+                        rows, indent_level)
@@ -1,6 +1,8 @@
 from bpy.types import NodeTree
 import bpy
 
+from .ntp_tree_ir import NTP_TreeIR
+
 class NTP_NodeTree:
     def __init__(self, node_tree: NodeTree, var: str):
         # Blender node tree object being copied
@@ -9,6 +11,9 @@ class NTP_NodeTree:
         # The variable named for the regenerated node tree
         self.var: str = var
 
+        # Nodes, sockets, and links read from the node tree
+        self.ir: NTP_TreeIR = None
+
         if bpy.app.version < (4, 0, 0):
             # Keep track of if we need to set the default values for the node
             # tree inputs and outputs
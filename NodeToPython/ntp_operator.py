@@ -1,6 +1,6 @@
 import bpy
 from bpy.types import Context, Operator
-from bpy.types import Node, NodeTree
+from bpy.types import NodeTree
 
 if bpy.app.version < (4, 0, 0):
     from bpy.types import NodeSocketInterface
@@ -10,14 +10,33 @@ else:
 
 from bpy.types import bpy_prop_array
 
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import json
 import os
-import shutil
-from typing import TextIO, Callable
-
-from .license_templates import license_templates
+import tempfile
+from typing import Callable
+
+from .license_templates import create_license
+from .ntp_addon_zip import NTP_AddonZip
+from .ntp_cache import NTP_CacheEntry, NTP_ExportCache
+from .ntp_cache import hash_key, hash_node_tree
+from .ntp_emitter import NTP_Emitter
+from .ntp_group_index import GROUP_NODE_TYPES, NTP_GroupIndex
+from .ntp_identifiers import NTP_IdentifierAllocator, canonical_identifiers
+from .ntp_identifiers import clean_name
+from .ntp_image_store import NTP_ImageStore, hash_image
+from .ntp_node_baseline import NTP_NodeBaseline
+from .ntp_node_baseline import get_baselines, skip_socket_defaults
+from .ntp_node_table import FIND_NODE_GROUP_CODE, GROUP_HASH_PLACEHOLDER
+from .ntp_node_table import NODE_GROUP_COUNTS, NODE_GROUP_HASH
+from .ntp_node_table import NTP_NodeTable, write_flat_array, write_loader
+from .ntp_node_table import write_table
 from .ntp_node_tree import NTP_NodeTree
-from .options import NTPOptions
+from .ntp_profiler import NTP_Profiler
+from .ntp_tree_ir import NTP_LinkIR, NTP_NodeIR, NTP_SocketIR, NTP_TreeIR
+from .ntp_tree_ir import NO_DEFAULT, read_all
+from .options import NTPOptions, options_from_dict
 from .node_settings import NodeInfo, ST
 from .utils import *
 
@@ -26,20 +45,136 @@ IMAGE_DIR_NAME = "imgs"
 IMAGE_PATH = "image_path"
 ITEM = "item"
 BASE_DIR = "base_dir"
+HANDLE_TYPE = "handle_type"
 
 RESERVED_NAMES = {
                   INDEX,
                   IMAGE_DIR_NAME,
                   IMAGE_PATH,
                   ITEM,
-                  BASE_DIR
+                  BASE_DIR,
+                  HANDLE_TYPE
                  }
 
-#node input sockets that are messy to set default values for
-DONT_SET_DEFAULTS = {'NodeSocketGeometry',
-                     'NodeSocketShader',
-                     'NodeSocketMatrix',
-                     'NodeSocketVirtual'}
+# Number of elements new color ramps and points new curve maps start with
+DEFAULT_COLOR_RAMP_ELEMENTS = 2
+DEFAULT_CURVE_MAP_POINTS = 2
+
+# File extensions each image file format is saved with by Blender
+IMAGE_FORMAT_EXTENSIONS = {
+    'BMP': {".bmp"},
+    'IRIS': {".rgb", ".sgi"},
+    'PNG': {".png"},
+    'JPEG': {".jpg", ".jpeg"},
+    'JPEG2000': {".jp2", ".j2c"},
+    'TARGA': {".tga"},
+    'TARGA_RAW': {".tga"},
+    'CINEON': {".cin"},
+    'DPX': {".dpx"},
+    'OPEN_EXR': {".exr"},
+    'OPEN_EXR_MULTILAYER': {".exr"},
+    'HDR': {".hdr"},
+    'TIFF': {".tif", ".tiff"},
+    'WEBP': {".webp"},
+}
+
+# Returned by getattr when a node is missing one of its settings
+_MISSING = object()
+
+def _enum_setting_to_py_str(enum: str) -> str:
+    """
+    Converts an enum setting into a string, or None if it's unset
+    """
+    if enum == '':
+        return None
+    return enum_to_py_str(enum)
+
+# Settings types that are set with a single assignment, and how to
+# format their values
+_SETTING_FORMATTERS: dict[ST, Callable] = {
+    ST.ENUM:     _enum_setting_to_py_str,
+    ST.ENUM_SET: str,
+    ST.STRING:   str_to_py_str,
+    ST.BOOL:     str,
+    ST.INT:      str,
+    ST.FLOAT:    str,
+    ST.VEC1:     vec1_to_py_str,
+    ST.VEC2:     vec2_to_py_str,
+    ST.VEC3:     vec3_to_py_str,
+    ST.VEC4:     vec4_to_py_str,
+    ST.COLOR:    color_to_py_str,
+}
+
+# Settings types that need more than a single assignment. Each is called
+# with (operator, node, node_var, attr_name, attr)
+_SPECIAL_SETTINGS: dict[ST, Callable] = {
+    ST.MATERIAL: lambda op, node, node_var, attr_name, attr:
+        op._in_file_setting(attr, f"{node_var}.{attr_name}", "materials"),
+    ST.OBJECT: lambda op, node, node_var, attr_name, attr:
+        op._in_file_setting(attr, f"{node_var}.{attr_name}", "objects"),
+    ST.COLOR_RAMP: lambda op, node, node_var, attr_name, attr:
+        op._color_ramp_settings(node, attr_name),
+    ST.CURVE_MAPPING: lambda op, node, node_var, attr_name, attr:
+        op._curve_mapping_settings(node, attr_name),
+    ST.NODE_TREE: lambda op, node, node_var, attr_name, attr:
+        op._node_tree_settings(node, attr_name),
+    ST.IMAGE: lambda op, node, node_var, attr_name, attr:
+        op._image_setting(attr, f"{node_var}.{attr_name}"),
+    ST.IMAGE_USER: lambda op, node, node_var, attr_name, attr:
+        op._image_user_settings(attr, f"{node_var}.{attr_name}"),
+    ST.SIM_OUTPUT_ITEMS: lambda op, node, node_var, attr_name, attr:
+        op._output_zone_items(attr, f"{node_var}.{attr_name}", True),
+    ST.REPEAT_OUTPUT_ITEMS: lambda op, node, node_var, attr_name, attr:
+        op._output_zone_items(attr, f"{node_var}.{attr_name}", False),
+    ST.INDEX_SWITCH_ITEMS: lambda op, node, node_var, attr_name, attr:
+        op._index_switch_items(attr, f"{node_var}.{attr_name}"),
+    ST.ENUM_DEFINITION: lambda op, node, node_var, attr_name, attr:
+        op._enum_definition(attr, f"{node_var}.{attr_name}"),
+    ST.BAKE_ITEMS: lambda op, node, node_var, attr_name, attr:
+        op._bake_items(attr, f"{node_var}.{attr_name}"),
+    ST.CAPTURE_ATTRIBUTE_ITEMS: lambda op, node, node_var, attr_name, attr:
+        op._capture_attribute_items(attr, f"{node_var}.{attr_name}"),
+    ST.MENU_SWITCH_ITEMS: lambda op, node, node_var, attr_name, attr:
+        op._menu_switch_items(attr, f"{node_var}.{attr_name}"),
+    ST.FOREACH_GEO_ELEMENT_GENERATION_ITEMS:
+        lambda op, node, node_var, attr_name, attr:
+            op._foreach_geo_element_generation_items(
+                attr, f"{node_var}.{attr_name}"),
+    ST.FOREACH_GEO_ELEMENT_INPUT_ITEMS:
+        lambda op, node, node_var, attr_name, attr:
+            op._foreach_geo_element_input_items(
+                attr, f"{node_var}.{attr_name}"),
+    ST.FOREACH_GEO_ELEMENT_MAIN_ITEMS:
+        lambda op, node, node_var, attr_name, attr:
+            op._foreach_geo_element_main_items(
+                attr, f"{node_var}.{attr_name}"),
+}
+
+# Compiled attribute plans, keyed by NodeInfo key (usually the bl_idname)
+_attr_plans: dict[str, list[tuple[str, Callable, bool]]] = {}
+
+def _compile_attr_plan(node_info: NodeInfo) -> list[tuple[str, Callable, bool]]:
+    """
+    Picks how each of a node's settings should be set. The settings are
+    already just the ones valid for the running version of Blender (see
+    get_node_settings()). Settings types NodeToPython doesn't handle yet are
+    kept without a formatter, so missing attributes are still reported
+
+    Parameters:
+    node_info (NodeInfo): settings info for a node type
+
+    Returns:
+    (list[tuple[str, Callable, bool]]): (attribute name, formatter,
+        is special setting) for each setting, in order
+    """
+    attr_plan = []
+    for attr_info in node_info.attributes_:
+        st = attr_info.st_
+        if st in _SETTING_FORMATTERS:
+            attr_plan.append((attr_info.name_, _SETTING_FORMATTERS[st], False))
+        else:
+            attr_plan.append((attr_info.name_, _SPECIAL_SETTINGS.get(st), True))
+    return attr_plan
 
 class NTP_Operator(Operator):
     """
@@ -50,6 +185,10 @@ class NTP_Operator(Operator):
     bl_idname = ""
     bl_label = ""
 
+    # Reports of the most recently run operator, so headless conversions 
+    # can collect warnings and errors
+    last_reports: list[tuple[str, str]] = []
+
     # node tree input sockets that have default properties
     if bpy.app.version < (4, 0, 0):
         default_sockets_v3 = {'VALUE', 'INT', 'BOOLEAN', 'VECTOR', 'RGBA'}
@@ -67,17 +206,22 @@ class NTP_Operator(Operator):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Reports made while running
+        self._reports: list[tuple[str, str]] = []
+        NTP_Operator.last_reports = self._reports
+
         # Write functions after nodes are mostly initialized and linked up
         self._write_after_links: list[Callable] = []
 
-        # File (TextIO) or string (StringIO) the add-on/script is generated into
-        self._file: TextIO = None
+        # Emitter the add-on/script is generated with, writing to a file
+        # or keeping it in memory
+        self._emitter: NTP_Emitter = None
 
-        # Path to the directory of the zip file
-        self._zip_dir: str = None
+        # Zip archive the generated add-on is written into
+        self._addon_zip: NTP_AddonZip = None
 
-        # Path to the directory for the generated addon
-        self._addon_dir: str = None
+        # Image file name->image pairs to write to the add-on
+        self._images_to_save: dict[str, bpy.types.Image] = {}
 
         # Class named for the generated operator
         self._class_name: str = None
@@ -92,18 +236,12 @@ class NTP_Operator(Operator):
         # Dictionary to keep track of node tree->variable name pairs
         self._node_tree_vars: dict[NodeTree, str] = {}
 
-        # Dictionary to keep track of node->variable name pairs
-        self._node_vars: dict[Node, str] = {}
-
-        # Dictionary to keep track of variables->usage count pairs
-        self._used_vars: dict[str, int] = {}
+        # Allocates variable names, keeping track of how often each is used
+        self._identifiers = NTP_IdentifierAllocator(RESERVED_NAMES)
 
         # Dictionary used for setting node properties
         self._node_infos: dict[str, NodeInfo] = {}
 
-        for name in RESERVED_NAMES:
-            self._used_vars[name] = 0
-
         # Generate socket default, min, and max values
         self._include_group_socket_values = True
 
@@ -113,17 +251,95 @@ class NTP_Operator(Operator):
         # Indentation string (default four spaces)
         self._indentation = "    "
 
+        # Write statements for every property, or tables for a loader
+        self._output_format = 'STATEMENTS'
+
+        # Set node locations and dimensions with foreach_set
+        self._bulk_layout = False
+
+        # Reuse node groups an earlier run of the generated code built
+        self._reuse_node_groups = False
+
+        # Variables of the node groups to stamp once they're built
+        self._stamped_group_vars: set[str] = set()
+
+        # Node tree -> hash the generated node group is stamped with
+        self._group_hashes: dict[NodeTree, str] = {}
+
+        # Leave out values that new nodes already have
+        self._skip_default_values = False
+
+        # Node bl_idname->baseline pairs for the node tree being generated
+        self._baselines: dict[str, NTP_NodeBaseline] = {}
+
+        # IR of the node tree being generated
+        self._tree_ir: NTP_TreeIR = None
+
+        # Table for the node tree being generated in the table output format
+        self._node_table: NTP_NodeTable = None
+
         if bpy.app.version >= (3, 4, 0):
             # Set default values for hidden sockets
             self._set_unavailable_defaults = False
 
-    def _write(self, string: str, indent_level: int = None):
-        if indent_level is None:
-            indent_level = self._inner_indent_level
-        indent_str = indent_level * self._indentation
-        self._file.write(f"{indent_str}{string}\n")
+        # Cache of previously generated node tree code, if enabled
+        self._export_cache: NTP_ExportCache = None
+
+        # Dictionary to keep track of node tree->cache key pairs
+        self._cache_keys: dict[NodeTree, str] = {}
+
+        # Entry recording the node tree currently being generated
+        self._cache_record: NTP_CacheEntry = None
+
+        # Number of node trees reused from the cache
+        self._cache_hits: int = 0
+
+        # Node tree->IR pairs of node trees read for their cache key, so
+        # generating them doesn't read them again
+        self._tree_irs: dict[NodeTree, NTP_TreeIR] = {}
+
+        # Store of saved image files, kept next to the export cache
+        self._image_store: NTP_ImageStore = None
+
+        # Profiler counting reads of Blender data in each phase, if enabled
+        self._profiler: NTP_Profiler = None
+
+        # Directory and name of the profiler's report
+        self._profile_dir: str = None
+        self._profile_name: str = None
+
+    def report(self, type: set[str], message: str) -> None:
+        """
+        Reports a message to the user, keeping a copy in last_reports
+        """
+        for report_type in sorted(type):
+            self._reports.append((report_type, message))
+        super().report(type, message)
+
+    def _get_options(self, context: Context) -> NTPOptions:
+        """
+        Finds the options to use. Options given as JSON through the 
+        operator's options_json property take precedence over the scene's
+
+        Parameters:
+        context (Context): the current scene context
+
+        Returns:
+        (NTPOptions): the options, or None if they couldn't be parsed
+        """
+        options_json = getattr(self, "options_json", "")
+        if not options_json:
+            return context.scene.ntp_options
+        try:
+            return options_from_dict(json.loads(options_json))
+        except (TypeError, ValueError) as e:
+            self.report({'ERROR'}, f"NodeToPython: Invalid options JSON: {e}")
+            return None
 
     def _setup_options(self, options: NTPOptions) -> bool:
+        if options is None:
+            return False
+
         # General
         self._mode = options.mode
         self._include_group_socket_values = options.include_group_socket_values
@@ -141,6 +357,17 @@ class NTP_Operator(Operator):
         if bpy.app.version >= (3, 4, 0):
             self._set_unavailable_defaults = options.set_unavailable_defaults
 
+        self._output_format = options.output_format
+        self._bulk_layout = options.bulk_layout
+        self._reuse_node_groups = options.reuse_node_groups
+        self._skip_default_values = options.skip_default_values
+
+        if options.use_export_cache:
+            cache_dir = bpy.path.abspath(options.cache_dir)
+            self._export_cache = NTP_ExportCache(cache_dir)
+            self._image_store = NTP_ImageStore(
+                self._export_cache.cache_dir)
+
         #Script
         if options.mode == 'SCRIPT':
             self._include_imports = options.include_imports
@@ -156,23 +383,30 @@ class NTP_Operator(Operator):
             self._should_create_license = options.should_create_license
             self._category = options.category
             self._custom_category = options.custom_category
+            self._compression_level = options.compression_level
             if options.menu_id in dir(bpy.types):
                 self._menu_id = options.menu_id
             else:
                 self.report({'ERROR'}, f"{options.menu_id} is not a valid menu")
                 return False
+
+        if options.profile:
+            self._profile_dir = bpy.path.abspath(options.dir_path)
+            self._profiler = NTP_Profiler()
+            self._profiler.instrument(self)
         return True
 
-    def _setup_addon_directories(self, context: Context, nt_var: str) -> bool:
+    def _setup_addon_zip(self, context: Context, nt_var: str) -> bool:
         """
-        Finds/creates directories to save add-on to
+        Finds/creates the directory to save the add-on to and starts its 
+        zip archive
 
         Parameters:
         context (Context): the current scene context
         nt_var (str): variable name of the ndoe tree
 
         Returns:
-        (bool): success of addon directory setup
+        (bool): success of addon zip setup
         """
         if not self._dir_path or self._dir_path == "":
             self.report({'ERROR'},
@@ -180,12 +414,12 @@ class NTP_Operator(Operator):
                          "one in the NodeToPython Options panel"))
             return False
 
-        self._zip_dir = os.path.join(self._dir_path, nt_var)
-        self._addon_dir = os.path.join(self._zip_dir, nt_var)
+        if not os.path.exists(self._dir_path):
+            os.makedirs(self._dir_path)
 
-        if not os.path.exists(self._addon_dir):
-            os.makedirs(self._addon_dir)
-        
+        self._addon_zip = NTP_AddonZip(
+            os.path.join(self._dir_path, f"{nt_var}.zip"), nt_var,
+            self._compression_level)
         return True
 
     def _setup_addon_name(self, name: str) -> str:
@@ -208,25 +442,78 @@ class NTP_Operator(Operator):
         name (str): name of the add-on
         """
 
-        self._write("bl_info = {", 0)
+        self._emitter.write("bl_info = {", 0)
         self._name = name
         if self._name_override and self._name_override != "":
             self._name = self._name_override
-        self._write(f"\"name\" : {str_to_py_str(self._name)},", 1)
+        self._emitter.write(f"\"name\" : {str_to_py_str(self._name)},", 1)
         if self._description and self._description != "":
-            self._write(f"\"description\" : {str_to_py_str(self._description)},", 1)
-        self._write(f"\"author\" : {str_to_py_str(self._author_name)},", 1)
-        self._write(f"\"version\" : {vec3_to_py_str(self._version)},", 1)
-        self._write(f"\"blender\" : {bpy.app.version},", 1)
-        self._write(f"\"location\" : {str_to_py_str(self._location)},", 1)
+            self._emitter.write(f"\"description\" : {str_to_py_str(self._description)},", 1)
+        self._emitter.write(f"\"author\" : {str_to_py_str(self._author_name)},", 1)
+        self._emitter.write(f"\"version\" : {vec3_to_py_str(self._version)},", 1)
+        self._emitter.write(f"\"blender\" : {bpy.app.version},", 1)
+        self._emitter.write(f"\"location\" : {str_to_py_str(self._location)},", 1)
         category = self._category
         if category == "Custom":
             category = self._custom_category
-        self._write(f"\"category\" : {str_to_py_str(category)},", 1)
-        self._write("}\n", 0)
-        self._write("import bpy", 0)
-        self._write("import mathutils", 0)
-        self._write("import os\n", 0)
+        self._emitter.write(f"\"category\" : {str_to_py_str(category)},", 1)
+        self._emitter.write("}\n", 0)
+        self._emitter.write("import bpy", 0)
+        self._emitter.write("import mathutils", 0)
+        self._emitter.write("import os\n", 0)
+
+    def _create_loader(self) -> None:
+        """
+        Writes the functions that build node trees from tables, if using the
+        table output format, and the one that finds node groups to reuse
+        """
+        if self._output_format == 'TABLES':
+            write_loader(self._emitter)
+        if self._reuse_node_groups:
+            write_loader(self._emitter, FIND_NODE_GROUP_CODE)
+
+    def _new_node_group(self, nt_var: str, tree_type: str, name: str
+                        ) -> None:
+        """
+        Writes the creation of a node group inside its function. When reusing
+        node groups, the function first returns the one of that name an
+        earlier run of the generated code built, if it has the same hash and
+        the same node, link, and interface item counts
+
+        Parameters:
+        nt_var (str): variable name of the node group
+        tree_type (str): bl_idname of the node tree type
+        name (str): name of the node group
+        """
+        name_str = str_to_py_str(name)
+        if self._reuse_node_groups:
+            # filled in by _process_node_tree_hashed() once the code for the
+            # whole node tree is known
+            self._emitter.write(f"{nt_var} = find_node_group({name_str}, "
+                                f"\"{GROUP_HASH_PLACEHOLDER}\")")
+            self._emitter.write(f"if {nt_var} is not None:")
+            self._emitter.write(f"return {nt_var}",
+                                self._inner_indent_level + 1)
+            self._stamped_group_vars.add(nt_var)
+        self._emitter.write(f"{nt_var} = bpy.data.node_groups.new("
+                            f"type = \'{tree_type}\', name = {name_str})")
+
+    def _end_node_group(self, nt_var: str) -> None:
+        """
+        Writes the end of a node tree's function. When reusing node groups,
+        a node group it built is stamped with its hash, and its node, link,
+        and interface item counts that tell whether it was edited since
+
+        Parameters:
+        nt_var (str): variable name of the node tree
+        """
+        if nt_var in self._stamped_group_vars:
+            self._emitter.write(f"{nt_var}[{str_to_py_str(NODE_GROUP_HASH)}] "
+                                f"= \"{GROUP_HASH_PLACEHOLDER}\"")
+            self._emitter.write(
+                f"{nt_var}[{str_to_py_str(NODE_GROUP_COUNTS)}] "
+                f"= node_group_counts({nt_var})")
+        self._emitter.write(f"return {nt_var}\n")
 
     def _init_operator(self, idname: str, label: str) -> None:
         """
@@ -240,10 +527,10 @@ class NTP_Operator(Operator):
         """
         self._idname = clean_string(idname, lower=False)
         self._class_name = self._create_var(self._idname)
-        self._write(f"class {self._class_name}(bpy.types.Operator):", 0)
-        self._write(f"bl_idname = \"node.{self._idname}\"", 1)
-        self._write(f"bl_label = {str_to_py_str(label)}", 1)
-        self._write("bl_options = {\'REGISTER\', \'UNDO\'}\n", 1)
+        self._emitter.write(f"class {self._class_name}(bpy.types.Operator):", 0)
+        self._emitter.write(f"bl_idname = \"node.{self._idname}\"", 1)
+        self._emitter.write(f"bl_label = {str_to_py_str(label)}", 1)
+        self._emitter.write("bl_options = {\'REGISTER\', \'UNDO\'}\n", 1)
 
     def _topological_sort(self, node_tree: NodeTree) -> list[NodeTree]:
         """
@@ -256,37 +543,44 @@ class NTP_Operator(Operator):
         Returns:
         (list[NodeTree]): the node trees in order of processing
         """
-        if isinstance(node_tree, bpy.types.CompositorNodeTree):
-            group_node_type = 'CompositorNodeGroup'
-        elif isinstance(node_tree, bpy.types.GeometryNodeTree):
-            group_node_type = 'GeometryNodeGroup'
-        elif isinstance(node_tree, bpy.types.ShaderNodeTree):
-            group_node_type = 'ShaderNodeGroup'
-        
-        visited = set()
-        result: list[NodeTree] = []
+        return self._topological_sort_trees([node_tree])
 
-        def dfs(nt: NodeTree) -> None:
-            """
-            Helper function to perform depth-first search on a NodeTree
+    def _topological_sort_trees(self, node_trees: list[NodeTree]
+                               ) -> list[NodeTree]:
+        """
+        Perform a topological sort on the combined node graph of several base
+        node trees. Subgroups shared between them are only visited once, so
+        each distinct node tree appears exactly once in the result
 
-            Parameters:
-            nt (NodeTree): current node tree in the dependency graph
-            """
-            if nt is None:
-                self.report({'ERROR'}, "NodeToPython: Found an invalid node tree. "
-                            "Are all data blocks valid?")
-                return
-            if nt not in visited:
-                visited.add(nt)
-                for group_node in [node for node in nt.nodes
-                                   if node.bl_idname == group_node_type]:
-                    if group_node.node_tree not in visited:
-                        dfs(group_node.node_tree)
-                result.append(nt)
-        
-        dfs(node_tree)
+        Parameters:
+        node_trees (list[NodeTree]): the base node trees to convert, all of
+            the same type
 
+        Returns:
+        (list[NodeTree]): the node trees in order of processing
+        """
+        if len(node_trees) == 0:
+            return []
+
+        node_groups = None
+        if self._profiler is not None:
+            # read everything through the profiler from here on
+            self._profile_name = clean_string(node_trees[0].name)
+            node_trees = [self._profiler.wrap(node_tree)
+                          for node_tree in node_trees]
+            node_groups = self._profiler.wrap(bpy.data.node_groups,
+                                              "BlendData.node_groups")
+
+        index = NTP_GroupIndex(node_trees[0].bl_idname, node_trees,
+                               node_groups)
+        result = index.sort(node_trees)
+
+        if any(node_tree in index.invalid_trees for node_tree in result):
+            self.report({'ERROR'}, "NodeToPython: Found an invalid node tree. "
+                        "Are all data blocks valid?")
+        for node_tree in index.cycles:
+            self.report({'ERROR'}, (f"NodeToPython: Node group "
+                                    f"\"{node_tree.name}\" contains itself"))
         return result
 
     def _create_var(self, name: str) -> str:
@@ -297,172 +591,219 @@ class NTP_Operator(Operator):
         name (str): basic string we'd like to create the variable name out of
 
         Returns:
-        clean_name (str): variable name for the node tree
-        """
-        if name == "":
-            name = "unnamed"
-        clean_name = clean_string(name)
-        var = clean_name
-        if var in self._used_vars:
-            self._used_vars[var] += 1
-            return f"{clean_name}_{self._used_vars[var]}"
-        else:
-            self._used_vars[var] = 0
-            return clean_name
+        (str): variable name for the node tree
+        """
+        base = clean_name(name)
+        if self._cache_record is not None:
+            self._cache_record.note_var(base,
+                                        self._identifiers.counts.get(base))
+        return self._identifiers.allocate(base)
 
-    def _create_node(self, node: Node, node_tree_var: str) -> str:
+    def _create_node(self, node: NTP_NodeIR, node_tree_var: str) -> str:
         """
         Initializes a new node with location, dimension, and label info
 
         Parameters:
-        node (Node): node to be copied
+        node (NTP_NodeIR): node to be copied
         node_tree_var (str): variable name for the node tree
         Returns:
         node_var (str): variable name for the node
         """
 
-        self._write(f"#node {node.name}")
+        if self._node_table is not None:
+            return self._add_node_row(node)
+
+        self._emitter.write(f"#node {node.name}")
 
         node_var = self._create_var(node.name)
-        self._node_vars[node] = node_var
+        node.var = node_var
 
         idname = str_to_py_str(node.bl_idname)
-        self._write(f"{node_var} = {node_tree_var}.nodes.new({idname})")
-        self._write(f"{node_var}.name = {str_to_py_str(node.name)}")
+        self._emitter.write(f"{node_var} = {node_tree_var}.nodes.new({idname})")
+        self._emitter.write(f"{node_var}.name = {str_to_py_str(node.name)}")
 
         # label
         if node.label:
-            self._write(f"{node_var}.label = {str_to_py_str(node.label)}")
+            self._emitter.write(f"{node_var}.label = {str_to_py_str(node.label)}")
 
         # name
-        self._write(f"{node_var}.name = {str_to_py_str(node.name)}")
+        self._emitter.write(f"{node_var}.name = {str_to_py_str(node.name)}")
 
         # color
-        if node.use_custom_color:
-            self._write(f"{node_var}.use_custom_color = True")
-            self._write(f"{node_var}.color = {vec3_to_py_str(node.color)}")
+        if node.color is not None:
+            self._emitter.write(f"{node_var}.use_custom_color = True")
+            self._emitter.write(f"{node_var}.color = {vec3_to_py_str(node.color)}")
 
         # mute
         if node.mute:
-            self._write(f"{node_var}.mute = True")
+            self._emitter.write(f"{node_var}.mute = True")
 
         # hide
         if node.hide:
-            self._write(f"{node_var}.hide = True")
+            self._emitter.write(f"{node_var}.hide = True")
 
         # Warning propagation
         if bpy.app.version >= (4, 3, 0):
             if node.warning_propagation != 'ALL':
-                self._write(f"{node_var}.warning_propagation = "
-                            f"{enum_to_py_str(node.warning_propagation)}")
+                self._emitter.write(f"{node_var}.warning_propagation = "
+                                    f"{enum_to_py_str(node.warning_propagation)}")
         return node_var
 
-    def _set_settings_defaults(self, node: Node) -> None:
+    def _add_node_row(self, node: NTP_NodeIR) -> str:
         """
-        Sets the defaults for any settings a node may have
+        Adds a node to the node table instead of writing statements creating it
 
         Parameters:
-        node (Node): the node object we're copying settings from
-        node_var (str): name of the variable we're using for the node in our add-on
+        node (NTP_NodeIR): node to be copied
+
+        Returns:
+        node_var (str): expression referring to the node
         """
-        if node.bl_idname not in self._node_infos:
-            self.report({'WARNING'},
-                        (f"NodeToPython: couldn't find {node.bl_idname} in "
-                         f"settings. Your Blender version may not be supported"))
+        table = self._node_table
+        node_var = table.add_node(str_to_py_str(node.bl_idname),
+                                  str_to_py_str(node.name))
+        node.var = node_var
+
+        if node.label:
+            table.add_setting(node_var, "label", str_to_py_str(node.label))
+        if node.color is not None:
+            table.add_setting(node_var, "use_custom_color", "True")
+            table.add_setting(node_var, "color", vec3_to_py_str(node.color))
+        if node.mute:
+            table.add_setting(node_var, "mute", "True")
+        if node.hide:
+            table.add_setting(node_var, "hide", "True")
+        if bpy.app.version >= (4, 3, 0):
+            if node.warning_propagation != 'ALL':
+                table.add_setting(node_var, "warning_propagation",
+                                  enum_to_py_str(node.warning_propagation))
+        return node_var
+
+    def _start_node_table(self, nt_var: str) -> None:
+        """
+        Starts collecting the nodes of a node tree into a table, if using the
+        table output format. Statements written for the nodes until
+        _write_node_table() is called are held back, since they can only run
+        once the table has created the nodes
+
+        Parameters:
+        nt_var (str): variable name of the node tree
+        """
+        if self._output_format != 'TABLES':
+            self._node_table = None
             return
+        self._node_table = NTP_NodeTable(f"{nt_var}_nodes")
+        self._emitter.start_capture()
 
-        node_var = self._node_vars[node]
+    def _write_node_table(self, nt_var: str) -> None:
+        """
+        Writes the node table, followed by the held back statements and the
+        socket value tables
 
-        node_info = self._node_infos[node.bl_idname]
-        for attr_info in node_info.attributes_:
-            attr_name = attr_info.name_
-            st = attr_info.st_
+        Parameters:
+        nt_var (str): variable name of the node tree
+        """
+        if self._node_table is None:
+            return
+        statements = self._emitter.end_capture(keep=False)
+        self._node_table.write_nodes(self._emitter, nt_var, 
+                                     self._inner_indent_level)
+        self._emitter.write_block(statements)
+        self._node_table.write_socket_values(self._emitter, 
+                                             self._inner_indent_level)
+        self._emitter.write("", 0)
 
-            version_gte_min = bpy.app.version >= max(attr_info.min_version_, node_info.min_version_)
-            version_lt_max = bpy.app.version < min(attr_info.max_version_, node_info.max_version_)
-            
-            is_version_valid = version_gte_min and version_lt_max
-            if not hasattr(node, attr_name):
-                if is_version_valid:
-                    self.report({'WARNING'},
-                                f"NodeToPython: Couldn't find attribute "
-                                f"\"{attr_name}\" for node {node.name} of type "
-                                f"{node.bl_idname}")
-                continue
-            elif not is_version_valid:
+    def _set_settings_defaults(self, node: NTP_NodeIR, info_key: str = None
+                              ) -> None:
+        """
+        Sets the defaults for any settings a node may have. When skipping
+        default values, a node whose settings are all still the ones new
+        nodes have gets its socket values skipped too
+
+        Parameters:
+        node (NTP_NodeIR): the node we're copying settings from
+        info_key (str): key of the node's NodeInfo, if it isn't the node's
+            bl_idname
+        """
+        if info_key is None:
+            info_key = node.bl_idname
+
+        attr_plan = _attr_plans.get(info_key)
+        if attr_plan is None:
+            if info_key not in self._node_infos:
+                self.report({'WARNING'},
+                            (f"NodeToPython: couldn't find {node.bl_idname} in "
+                             f"settings. Your Blender version may not be supported"))
+                return
+            attr_plan = _compile_attr_plan(self._node_infos[info_key])
+            _attr_plans[info_key] = attr_plan
+
+        node_var = node.var
+        bl_node = node.node
+        baseline = self._baselines.get(node.bl_idname)
+
+        # whether the node's settings are all still the ones new nodes have
+        is_new = baseline is not None
+
+        for attr_name, formatter, is_special in attr_plan:
+            attr = getattr(bl_node, attr_name, _MISSING)
+            if attr is _MISSING:
+                self.report({'WARNING'},
+                            f"NodeToPython: Couldn't find attribute "
+                            f"\"{attr_name}\" for node {node.name} of type "
+                            f"{node.bl_idname}")
+                is_new = False
                 continue
-            
-            attr = getattr(node, attr_name, None)
-            if attr is None:
+            if attr is None or formatter is None:
                 continue
 
-            setting_str = f"{node_var}.{attr_name}"
-            """
-            A switch statement would've been nice here, 
-            but Blender 3.0 was on Python v3.9
-            """
-            if st == ST.ENUM:
-                if attr != '':
-                    self._write(f"{setting_str} = {enum_to_py_str(attr)}")
-            elif st == ST.ENUM_SET:
-                self._write(f"{setting_str} = {attr}")
-            elif st == ST.STRING:
-                self._write(f"{setting_str} = {str_to_py_str(attr)}")
-            elif st == ST.BOOL or st == ST.INT or st == ST.FLOAT:
-                self._write(f"{setting_str} = {attr}")
-            elif st == ST.VEC1:
-                self._write(f"{setting_str} = {vec1_to_py_str(attr)}")
-            elif st == ST.VEC2:
-                self._write(f"{setting_str} = {vec2_to_py_str(attr)}")
-            elif st == ST.VEC3:
-                self._write(f"{setting_str} = {vec3_to_py_str(attr)}")
-            elif st == ST.VEC4:
-                self._write(f"{setting_str} = {vec4_to_py_str(attr)}")
-            elif st == ST.COLOR:
-                self._write(f"{setting_str} = {color_to_py_str(attr)}")
-            elif st == ST.MATERIAL:
-                name = str_to_py_str(attr.name)
-                self._write(f"if {name} in bpy.data.materials:")
-                self._write(f"{setting_str} = bpy.data.materials[{name}]", 
-                            self._inner_indent_level + 1)
-            elif st == ST.OBJECT:
-                name = str_to_py_str(attr.name)
-                self._write(f"if {name} in bpy.data.objects:")
-                self._write(f"{setting_str} = bpy.data.objects[{name}]",
+            if is_special:
+                formatter(self, node, node_var, attr_name, attr)
+                is_new = False
+            else:
+                if baseline is not None and baseline.is_default(attr_name,
+                                                                attr):
+                    continue
+                is_new = False
+                attr_str = formatter(attr)
+                if attr_str is None:
+                    continue
+                if self._node_table is not None:
+                    self._node_table.add_setting(node_var, attr_name, attr_str)
+                else:
+                    self._emitter.write(f"{node_var}.{attr_name} = {attr_str}")
+
+        if is_new:
+            skip_socket_defaults(node, baseline)
+
+    def _in_file_setting(self, id_data: bpy.types.ID, setting_str: str,
+                         type: str) -> None:
+        """
+        Sets a property to a data block if one already exists in the blend file
+
+        Parameters:
+        id_data (bpy.types.ID): data block the property is set to
+        setting_str (str): string for the generated property
+        type (str): from what section of bpy.data to pull the data block from
+        """
+        name = str_to_py_str(id_data.name)
+        self._emitter.write(f"if {name} in bpy.data.{type}:")
+        self._emitter.write(f"{setting_str} = bpy.data.{type}[{name}]",
                             self._inner_indent_level + 1)
-            elif st == ST.COLOR_RAMP:
-                self._color_ramp_settings(node, attr_name)
-            elif st == ST.CURVE_MAPPING:
-                self._curve_mapping_settings(node, attr_name)
-            elif st == ST.NODE_TREE:
-                self._node_tree_settings(node, attr_name)
-            elif st == ST.IMAGE:
-                if self._addon_dir is not None and attr is not None:
-                    if attr.source in {'FILE', 'GENERATED', 'TILED'}:
-                        if self._save_image(attr):
-                            self._load_image(attr, f"{node_var}.{attr_name}")
-            elif st == ST.IMAGE_USER:
-                self._image_user_settings(attr, f"{node_var}.{attr_name}")
-            elif st == ST.SIM_OUTPUT_ITEMS:
-                self._output_zone_items(attr, f"{node_var}.{attr_name}", True)
-            elif st == ST.REPEAT_OUTPUT_ITEMS:
-                self._output_zone_items(attr, f"{node_var}.{attr_name}", False)
-            elif st == ST.INDEX_SWITCH_ITEMS:
-                self._index_switch_items(attr, f"{node_var}.{attr_name}")
-            elif st == ST.ENUM_DEFINITION:
-                self._enum_definition(attr, f"{node_var}.{attr_name}")
-            elif st == ST.BAKE_ITEMS:
-                self._bake_items(attr, f"{node_var}.{attr_name}")
-            elif st == ST.CAPTURE_ATTRIBUTE_ITEMS:
-                self._capture_attribute_items(attr, f"{node_var}.{attr_name}")
-            elif st == ST.MENU_SWITCH_ITEMS:
-                self._menu_switch_items(attr, f"{node_var}.{attr_name}")
-            elif st == ST.FOREACH_GEO_ELEMENT_GENERATION_ITEMS:
-                self._foreach_geo_element_generation_items(attr, f"{node_var}.{attr_name}")
-            elif st == ST.FOREACH_GEO_ELEMENT_INPUT_ITEMS:
-                self._foreach_geo_element_input_items(attr, f"{node_var}.{attr_name}")
-            elif st == ST.FOREACH_GEO_ELEMENT_MAIN_ITEMS:
-                self._foreach_geo_element_main_items(attr, f"{node_var}.{attr_name}")
+
+    def _image_setting(self, img: bpy.types.Image, img_var: str) -> None:
+        """
+        Saves an image setting's image with the add-on and loads it back in
+
+        Parameters:
+        img (bpy.types.Image): the image the node uses
+        img_var (str): string for the generated image property
+        """
+        if self._addon_zip is None:
+            return
+        if img.source in {'FILE', 'GENERATED', 'TILED'}:
+            if self._save_image(img):
+                self._load_image(img, img_var)
 
     if bpy.app.version < (4, 0, 0):
         def _set_group_socket_defaults(self, socket_interface: NodeSocketInterface,
@@ -488,25 +829,25 @@ class NTP_Operator(Operator):
                 dv = vec3_to_py_str(socket_interface.default_value)
             else:
                 dv = socket_interface.default_value
-            self._write(f"{socket_var}.default_value = {dv}")
+            self._emitter.write(f"{socket_var}.default_value = {dv}")
 
             # min value
             if hasattr(socket_interface, "min_value"):
                 min_val = socket_interface.min_value
-                self._write(f"{socket_var}.min_value = {min_val}")
+                self._emitter.write(f"{socket_var}.min_value = {min_val}")
             # max value
             if hasattr(socket_interface, "min_value"):
                 max_val = socket_interface.max_value
-                self._write(f"{socket_var}.max_value = {max_val}")
+                self._emitter.write(f"{socket_var}.max_value = {max_val}")
 
-        def _group_io_settings(self, node: Node, 
+        def _group_io_settings(self, node: NTP_NodeIR, 
                                io: str,  # TODO: convert to enum
                                ntp_node_tree: NTP_NodeTree) -> None:
             """
             Set the settings for group input and output sockets
 
             Parameters:
-            node (Node) : group input/output node
+            node (NTP_NodeIR) : group input/output node
             io (str): whether we're generating the input or output settings
             ntp_node_tree (NTP_NodeTree): node tree that we're generating 
                 input and output settings for
@@ -521,14 +862,14 @@ class NTP_Operator(Operator):
                 io_sockets = node.inputs
                 io_socket_interfaces = node_tree.outputs
 
-            self._write(f"#{node_tree_var} {io}s")
+            self._emitter.write(f"#{node_tree_var} {io}s")
             for i, inout in enumerate(io_sockets):
                 if inout.bl_idname == 'NodeSocketVirtual':
                     continue
-                self._write(f"#{io} {inout.name}")
+                self._emitter.write(f"#{io} {inout.name}")
                 idname = enum_to_py_str(inout.bl_idname)
                 name = str_to_py_str(inout.name)
-                self._write(f"{node_tree_var}.{io}s.new({idname}, {name})")
+                self._emitter.write(f"{node_tree_var}.{io}s.new({idname}, {name})")
                 socket_interface = io_socket_interfaces[i]
                 socket_var = f"{node_tree_var}.{io}s[{i}]"
 
@@ -538,29 +879,29 @@ class NTP_Operator(Operator):
                 if hasattr(socket_interface, "default_attribute_name"):
                     if socket_interface.default_attribute_name != "":
                         dan = str_to_py_str(socket_interface.default_attribute_name)
-                        self._write(f"{socket_var}.default_attribute_name = {dan}")
+                        self._emitter.write(f"{socket_var}.default_attribute_name = {dan}")
 
                 # attribute domain
                 if hasattr(socket_interface, "attribute_domain"):
                     ad = enum_to_py_str(socket_interface.attribute_domain)
-                    self._write(f"{socket_var}.attribute_domain = {ad}")
+                    self._emitter.write(f"{socket_var}.attribute_domain = {ad}")
 
                 # tooltip
                 if socket_interface.description != "":
                     description = str_to_py_str(socket_interface.description)
-                    self._write(f"{socket_var}.description = {description}")
+                    self._emitter.write(f"{socket_var}.description = {description}")
 
                 # hide_value
                 if socket_interface.hide_value is True:
-                    self._write(f"{socket_var}.hide_value = True")
+                    self._emitter.write(f"{socket_var}.hide_value = True")
 
                 # hide in modifier
                 if hasattr(socket_interface, "hide_in_modifier"):
                     if socket_interface.hide_in_modifier is True:
-                        self._write(f"{socket_var}.hide_in_modifier = True")
+                        self._emitter.write(f"{socket_var}.hide_in_modifier = True")
 
-                self._write("", 0)
-            self._write("", 0)
+                self._emitter.write("", 0)
+            self._emitter.write("", 0)
 
     elif bpy.app.version >= (4, 0, 0):
         def _set_tree_socket_defaults(self, socket_interface: NodeTreeInterfaceSocket,
@@ -577,13 +918,13 @@ class NTP_Operator(Operator):
             """
             if not self._include_group_socket_values:
                 return
-            if type(socket_interface) in self.nondefault_sockets_v4:
+            if socket_interface.__class__ in self.nondefault_sockets_v4:
                 return
 
             dv = socket_interface.default_value
 
             if bpy.app.version >= (4, 1, 0):
-                if type(socket_interface) is bpy.types.NodeTreeInterfaceSocketMenu:
+                if socket_interface.__class__ is bpy.types.NodeTreeInterfaceSocketMenu:
                     if dv == "":
                         self.report({'WARNING'},
                             "NodeToPython: No menu found for socket "
@@ -593,11 +934,11 @@ class NTP_Operator(Operator):
 
                     self._write_after_links.append(
                         lambda _socket_var=socket_var, _dv=enum_to_py_str(dv): (
-                            self._write(f"{_socket_var}.default_value = {_dv}")
+                            self._emitter.write(f"{_socket_var}.default_value = {_dv}")
                         )
                     )
                     return
-            if type(socket_interface) == bpy.types.NodeTreeInterfaceSocketColor:
+            if socket_interface.__class__ == bpy.types.NodeTreeInterfaceSocketColor:
                 dv = vec4_to_py_str(dv)
             elif type(dv) in {mathutils.Vector, mathutils.Euler}:
                 dv = vec3_to_py_str(dv)
@@ -605,16 +946,16 @@ class NTP_Operator(Operator):
                 dv = array_to_py_str(dv)
             elif type(dv) == str:
                 dv = str_to_py_str(dv)
-            self._write(f"{socket_var}.default_value = {dv}")
+            self._emitter.write(f"{socket_var}.default_value = {dv}")
 
             # min value
             if hasattr(socket_interface, "min_value"):
                 min_val = socket_interface.min_value
-                self._write(f"{socket_var}.min_value = {min_val}")
+                self._emitter.write(f"{socket_var}.min_value = {min_val}")
             # max value
             if hasattr(socket_interface, "min_value"):
                 max_val = socket_interface.max_value
-                self._write(f"{socket_var}.max_value = {max_val}")
+                self._emitter.write(f"{socket_var}.max_value = {max_val}")
 
         def _create_socket(self, socket: NodeTreeInterfaceSocket, 
                            parent: NodeTreeInterfacePanel, 
@@ -633,7 +974,7 @@ class NTP_Operator(Operator):
             ntp_nt (NTP_NodeTree): owner of the socket
             """
 
-            self._write(f"#Socket {socket.name}")
+            self._emitter.write(f"#Socket {socket.name}")
             # initialization
             socket_var = self._create_var(socket.name + "_socket") 
             name = str_to_py_str(socket.name)
@@ -658,11 +999,11 @@ class NTP_Operator(Operator):
             else:
                 optional_parent_str = f", parent = {panel_dict[parent]}"
 
-            self._write(f"{socket_var} = "
-                        f"{ntp_nt.var}.interface.new_socket("
-                        f"name = {name}, in_out={in_out_enum}, "
-                        f"socket_type = {socket_type}"
-                        f"{optional_parent_str})")
+            self._emitter.write(f"{socket_var} = "
+                                f"{ntp_nt.var}.interface.new_socket("
+                                f"name = {name}, in_out={in_out_enum}, "
+                                f"socket_type = {socket_type}"
+                                f"{optional_parent_str})")
 
             self._set_tree_socket_defaults(socket, socket_var)
 
@@ -670,36 +1011,36 @@ class NTP_Operator(Operator):
             if hasattr(socket, "subtype"):
                 if socket.subtype != '':
                     subtype = enum_to_py_str(socket.subtype)
-                    self._write(f"{socket_var}.subtype = {subtype}")
+                    self._emitter.write(f"{socket_var}.subtype = {subtype}")
 
             # default attribute name
             if socket.default_attribute_name != "":
                 dan = str_to_py_str(
                     socket.default_attribute_name)
-                self._write(f"{socket_var}.default_attribute_name = {dan}")
+                self._emitter.write(f"{socket_var}.default_attribute_name = {dan}")
 
             # attribute domain
             ad = enum_to_py_str(socket.attribute_domain)
-            self._write(f"{socket_var}.attribute_domain = {ad}")
+            self._emitter.write(f"{socket_var}.attribute_domain = {ad}")
 
             # hide_value
             if socket.hide_value is True:
-                self._write(f"{socket_var}.hide_value = True")
+                self._emitter.write(f"{socket_var}.hide_value = True")
 
             # hide in modifier
             if socket.hide_in_modifier is True:
-                self._write(f"{socket_var}.hide_in_modifier = True")
+                self._emitter.write(f"{socket_var}.hide_in_modifier = True")
 
             # force non field
             if socket.force_non_field is True:
-                self._write(f"{socket_var}.force_non_field = True")
+                self._emitter.write(f"{socket_var}.force_non_field = True")
             
             # tooltip
             if socket.description != "":
                 description = str_to_py_str(socket.description)
-                self._write(f"{socket_var}.description = {description}")
+                self._emitter.write(f"{socket_var}.description = {description}")
 
-            self._write("", 0)
+            self._emitter.write("", 0)
 
         def _create_panel(self, panel: NodeTreeInterfacePanel, 
                           panel_dict: dict[NodeTreeInterfacePanel], 
@@ -720,7 +1061,7 @@ class NTP_Operator(Operator):
             ntp_nt (NTP_NodeTree): owner of the socket
             """
 
-            self._write(f"#Panel {panel.name}")
+            self._emitter.write(f"#Panel {panel.name}")
 
             panel_var = self._create_var(panel.name + "_panel")
             panel_dict[panel] = panel_var
@@ -733,22 +1074,22 @@ class NTP_Operator(Operator):
             if parent is not None and bpy.app.version < (4, 2, 0):
                 parent_str = f", parent = {panel_dict[parent]}"     
 
-            self._write(f"{panel_var} = "
-                        f"{ntp_nt.var}.interface.new_panel("
-                        f"{str_to_py_str(panel.name)}"
-                        f"{closed_str}{parent_str})")
+            self._emitter.write(f"{panel_var} = "
+                                f"{ntp_nt.var}.interface.new_panel("
+                                f"{str_to_py_str(panel.name)}"
+                                f"{closed_str}{parent_str})")
 
             # tooltip
             if panel.description != "":
                 description = str_to_py_str(panel.description)
-                self._write(f"{panel_var}.description = {description}")
+                self._emitter.write(f"{panel_var}.description = {description}")
 
             panel_dict[panel] = panel_var
 
             if len(panel.interface_items) > 0:
                 self._process_items(panel, panel_dict, items_processed, ntp_nt)
             
-            self._write("", 0)
+            self._emitter.write("", 0)
 
         def _process_items(self, parent: NodeTreeInterfacePanel, 
                            panel_dict: dict[NodeTreeInterfacePanel], 
@@ -796,327 +1137,352 @@ class NTP_Operator(Operator):
             ntp_nt (NTP_NodeTree): the node tree to set the interface for
             """
 
-            self._write(f"#{ntp_nt.var} interface")
+            self._emitter.write(f"#{ntp_nt.var} interface")
             panel_dict: dict[NodeTreeInterfacePanel, str] = {}
             items_processed: set[NodeTreeInterfaceItem] = set()
 
             self._process_items(None, panel_dict, items_processed, ntp_nt)
 
-            self._write("", 0)
+            self._emitter.write("", 0)
 
-    def _set_input_defaults(self, node: Node) -> None:
+    def _set_input_defaults(self, node: NTP_NodeIR) -> None:
         """
         Sets defaults for input sockets
 
         Parameters:
-        node (Node): node we're setting inputs for
+        node (NTP_NodeIR): node we're setting inputs for
         """
         if node.bl_idname == 'NodeReroute':
             return
 
-        node_var = self._node_vars[node]
+        node_var = node.var
 
         for i, input in enumerate(node.inputs):
-            if input.bl_idname not in DONT_SET_DEFAULTS and not input.is_linked:
-                if bpy.app.version >= (3, 4, 0):
-                    if (not self._set_unavailable_defaults) and input.is_unavailable:
-                        continue
-                    
-                # TODO: this could be cleaner
-                socket_var = f"{node_var}.inputs[{i}]"
-
-                # colors
-                if input.bl_idname == 'NodeSocketColor':
-                    default_val = vec4_to_py_str(input.default_value)
-
-                # vector types
-                elif "Vector" in input.bl_idname:
-                    default_val = vec3_to_py_str(input.default_value)
-
-                # rotation types
-                elif input.bl_idname == 'NodeSocketRotation':
-                    default_val = vec3_to_py_str(input.default_value)
-
-                # strings
-                elif input.bl_idname == 'NodeSocketString':
-                    default_val = str_to_py_str(input.default_value)
-
-                #menu
-                elif input.bl_idname == 'NodeSocketMenu':
-                    if input.default_value == '':
-                        continue
-                    default_val = enum_to_py_str(input.default_value)
-
-                # images
-                elif input.bl_idname == 'NodeSocketImage':
-                    img = input.default_value
-                    if img is not None and self._addon_dir != None:  # write in a better way
-                        if self._save_image(img):
-                            self._load_image(img, f"{socket_var}.default_value")
-                    default_val = None
-
-                # materials
-                elif input.bl_idname == 'NodeSocketMaterial':
-                    self._in_file_inputs(input, socket_var, "materials")
-                    default_val = None
-
-                # collections
-                elif input.bl_idname == 'NodeSocketCollection':
-                    self._in_file_inputs(input, socket_var, "collections")
-                    default_val = None
-
-                # objects
-                elif input.bl_idname == 'NodeSocketObject':
-                    self._in_file_inputs(input, socket_var, "objects")
-                    default_val = None
-
-                # textures
-                elif input.bl_idname == 'NodeSocketTexture':
-                    self._in_file_inputs(input, socket_var, "textures")
-                    default_val = None
+            if input.default_value is NO_DEFAULT:
+                continue
 
-                else:
-                    default_val = input.default_value
-                if default_val is not None:
-                    self._write(f"#{input.identifier}")
-                    self._write(f"{socket_var}.default_value = {default_val}")
-        self._write("", 0)
+            # TODO: this could be cleaner
+            socket_var = f"{node_var}.inputs[{i}]"
+
+            # colors
+            if input.bl_idname == 'NodeSocketColor':
+                default_val = vec4_to_py_str(input.default_value)
+
+            # vector types
+            elif "Vector" in input.bl_idname:
+                default_val = vec3_to_py_str(input.default_value)
+
+            # rotation types
+            elif input.bl_idname == 'NodeSocketRotation':
+                default_val = vec3_to_py_str(input.default_value)
+
+            # strings
+            elif input.bl_idname == 'NodeSocketString':
+                default_val = str_to_py_str(input.default_value)
+
+            #menu
+            elif input.bl_idname == 'NodeSocketMenu':
+                if input.default_value == '':
+                    continue
+                default_val = enum_to_py_str(input.default_value)
+
+            # images
+            elif input.bl_idname == 'NodeSocketImage':
+                img = input.default_value
+                if img is not None and self._addon_zip != None:  # write in a better way
+                    if self._save_image(img):
+                        self._load_image(img, f"{socket_var}.default_value")
+                default_val = None
+
+            # materials
+            elif input.bl_idname == 'NodeSocketMaterial':
+                self._in_file_inputs(input, socket_var, "materials")
+                default_val = None
+
+            # collections
+            elif input.bl_idname == 'NodeSocketCollection':
+                self._in_file_inputs(input, socket_var, "collections")
+                default_val = None
+
+            # objects
+            elif input.bl_idname == 'NodeSocketObject':
+                self._in_file_inputs(input, socket_var, "objects")
+                default_val = None
+
+            # textures
+            elif input.bl_idname == 'NodeSocketTexture':
+                self._in_file_inputs(input, socket_var, "textures")
+                default_val = None
 
-    def _set_output_defaults(self, node: Node) -> None:
+            else:
+                default_val = input.default_value
+            if default_val is None:
+                continue
+            if self._node_table is not None:
+                self._node_table.add_socket_value(node_var, "inputs", i,
+                                                  "default_value",
+                                                  str(default_val))
+            else:
+                self._emitter.write(f"#{input.identifier}")
+                self._emitter.write(f"{socket_var}.default_value = {default_val}")
+        if self._node_table is None:
+            self._emitter.write("", 0)
+
+    def _set_output_defaults(self, node: NTP_NodeIR) -> None:
         """
         Some output sockets need default values set. It's rather annoying
 
         Parameters:
-        node (Node): node for the output we're setting
+        node (NTP_NodeIR): node for the output we're setting
         """
-        # TODO: probably should define elsewhere
-        output_default_nodes = {'ShaderNodeValue',
-                                'ShaderNodeRGB',
-                                'ShaderNodeNormal',
-                                'CompositorNodeValue',
-                                'CompositorNodeRGB',
-                                'CompositorNodeNormal'}
-
-        if node.bl_idname not in output_default_nodes:
+        if not node.outputs or node.outputs[0].default_value is NO_DEFAULT:
             return
 
-        node_var = self._node_vars[node]
+        node_var = node.var
 
         dv = node.outputs[0].default_value
         if node.bl_idname in {'ShaderNodeRGB', 'CompositorNodeRGB'}:
             dv = vec4_to_py_str(list(dv))
         if node.bl_idname in {'ShaderNodeNormal', 'CompositorNodeNormal'}:
             dv = vec3_to_py_str(dv)
-        self._write(f"{node_var}.outputs[0].default_value = {dv}")
+        if self._node_table is not None:
+            self._node_table.add_socket_value(node_var, "outputs", 0,
+                                              "default_value", str(dv))
+            return
+        self._emitter.write(f"{node_var}.outputs[0].default_value = {dv}")
 
-    def _in_file_inputs(self, input: bpy.types.NodeSocket, socket_var: str,
+    def _in_file_inputs(self, input: NTP_SocketIR, socket_var: str,
                         type: str) -> None:
         """
         Sets inputs for a node input if one already exists in the blend file
 
         Parameters:
-        input (bpy.types.NodeSocket): input socket we're setting the value for
+        input (NTP_SocketIR): input socket we're setting the value for
         socket_var (str): variable name we're using for the socket
         type (str): from what section of bpy.data to pull the default value from
         """
 
         if input.default_value is None:
             return
-        name = str_to_py_str(input.default_value.name)
-        self._write(f"if {name} in bpy.data.{type}:")
-        self._write(f"{socket_var}.default_value = bpy.data.{type}[{name}]",
-                    self._inner_indent_level + 1)
+        self._in_file_setting(input.default_value,
+                              f"{socket_var}.default_value", type)
 
-    def _set_socket_defaults(self, node: Node):
+    def _set_socket_defaults(self, node: NTP_NodeIR):
         """
         Set input and output socket defaults
         """
         self._set_input_defaults(node)
         self._set_output_defaults(node)
 
-    def _color_ramp_settings(self, node: Node, color_ramp_name: str) -> None:
+    def _color_ramp_settings(self, node: NTP_NodeIR,
+                             color_ramp_name: str) -> None:
         """
         Replicate a color ramp node
 
         Parameters
-        node (Node): node object we're copying settings from
+        node (NTP_NodeIR): node we're copying settings from
         color_ramp_name (str): name of the color ramp to be copied
         """
 
-        color_ramp: bpy.types.ColorRamp = getattr(node, color_ramp_name)
+        color_ramp: bpy.types.ColorRamp = getattr(node.node, color_ramp_name)
         if not color_ramp:
             raise ValueError(f"No color ramp named \"{color_ramp_name}\" found")
 
-        node_var = self._node_vars[node]
+        node_var = node.var
 
         # settings
         ramp_str = f"{node_var}.{color_ramp_name}"
 
         #color mode
         color_mode = enum_to_py_str(color_ramp.color_mode)
-        self._write(f"{ramp_str}.color_mode = {color_mode}")
+        self._emitter.write(f"{ramp_str}.color_mode = {color_mode}")
 
         #hue interpolation
         hue_interpolation = enum_to_py_str(color_ramp.hue_interpolation)
-        self._write(f"{ramp_str}.hue_interpolation = {hue_interpolation}")
+        self._emitter.write(f"{ramp_str}.hue_interpolation = {hue_interpolation}")
 
         #interpolation
         interpolation = enum_to_py_str(color_ramp.interpolation)
-        self._write(f"{ramp_str}.interpolation = {interpolation}")
-        self._write("", 0)
-
-        # key points
-        self._write(f"#initialize color ramp elements")
-        self._write((f"{ramp_str}.elements.remove"
-                    f"({ramp_str}.elements[0])"))
-        for i, element in enumerate(color_ramp.elements):
-            element_var = self._create_var(f"{node_var}_cre_{i}")
-            if i == 0:
-                self._write(f"{element_var} = {ramp_str}.elements[{i}]")
-                self._write(f"{element_var}.position = {element.position}")
-            else:
-                self._write(f"{element_var} = {ramp_str}.elements"
-                            f".new({element.position})")
-
-            self._write(f"{element_var}.alpha = {element.alpha}")
-            color_str = vec4_to_py_str(element.color)
-            self._write(f"{element_var}.color = {color_str}\n")
+        self._emitter.write(f"{ramp_str}.interpolation = {interpolation}")
+        self._emitter.write("", 0)
+
+        # key points, read and set in bulk. An element's alpha is the last
+        # component of its color, so it doesn't need setting on its own
+        self._emitter.write(f"#initialize color ramp elements")
+        elements = color_ramp.elements
+        num_elements = len(elements)
+        positions = read_all(elements, "position", num_elements).tolist()
+        colors = read_all(elements, "color", 4 * num_elements).tolist()
+
+        elements_str = f"{ramp_str}.elements"
+        self._set_collection_length(elements_str, num_elements, "0.0",
+                                    DEFAULT_COLOR_RAMP_ELEMENTS)
+        write_flat_array(self._emitter,
+                         f"{elements_str}.foreach_set(\"position\"",
+                         [str(position) for position in positions],
+                         self._inner_indent_level)
+        write_flat_array(self._emitter,
+                         f"{elements_str}.foreach_set(\"color\"",
+                         [str(component) for component in colors],
+                         self._inner_indent_level, per_line=4)
+        self._emitter.write("", 0)
+
+    def _set_collection_length(self, collection_str: str, length: int,
+                               new_args: str, default_length: int) -> None:
+        """
+        Adds or removes items of a collection in the generated code so it
+        has a given number of items, before their values are set in bulk
 
-    def _curve_mapping_settings(self, node: Node,
+        Parameters:
+        collection_str (str): the collection in the generated code
+        length (int): number of items it should have
+        new_args (str): arguments to the collection's new() function
+        default_length (int): number of items the collection starts with,
+            or None if it isn't known
+        """
+        inner_indent_level = self._inner_indent_level + 1
+        if default_length is None or length < default_length:
+            self._emitter.write(f"for {INDEX} in range"
+                                f"(len({collection_str}) - 1, {length - 1}, -1):")
+            self._emitter.write(f"{collection_str}.remove("
+                                f"{collection_str}[{INDEX}])",
+                                inner_indent_level)
+        if default_length is None or length > default_length:
+            self._emitter.write(f"for {INDEX} in range"
+                                f"(len({collection_str}), {length}):")
+            self._emitter.write(f"{collection_str}.new({new_args})",
+                                inner_indent_level)
+
+    def _curve_mapping_settings(self, node: NTP_NodeIR,
                                 curve_mapping_name: str) -> None:
         """
         Sets defaults for Float, Vector, and Color curves
 
         Parameters:
-        node (Node): curve node we're copying settings from
+        node (NTP_NodeIR): curve node we're copying settings from
         curve_mapping_name (str): name of the curve mapping to be set
         """
 
-        mapping = getattr(node, curve_mapping_name)
+        mapping = getattr(node.node, curve_mapping_name)
         if not mapping:
             raise ValueError((f"Curve mapping \"{curve_mapping_name}\" not found "
                               f"in node \"{node.bl_idname}\""))
 
-        node_var = self._node_vars[node]
+        node_var = node.var
 
         # mapping settings
-        self._write(f"#mapping settings")
+        self._emitter.write(f"#mapping settings")
         mapping_var = f"{node_var}.{curve_mapping_name}"
 
         # extend
         extend = enum_to_py_str(mapping.extend)
-        self._write(f"{mapping_var}.extend = {extend}")
+        self._emitter.write(f"{mapping_var}.extend = {extend}")
         # tone
         tone = enum_to_py_str(mapping.tone)
-        self._write(f"{mapping_var}.tone = {tone}")
+        self._emitter.write(f"{mapping_var}.tone = {tone}")
 
         # black level
         b_lvl_str = vec3_to_py_str(mapping.black_level)
-        self._write(f"{mapping_var}.black_level = {b_lvl_str}")
+        self._emitter.write(f"{mapping_var}.black_level = {b_lvl_str}")
         # white level
         w_lvl_str = vec3_to_py_str(mapping.white_level)
-        self._write(f"{mapping_var}.white_level = {w_lvl_str}")
+        self._emitter.write(f"{mapping_var}.white_level = {w_lvl_str}")
 
         # minima and maxima
         min_x = mapping.clip_min_x
-        self._write(f"{mapping_var}.clip_min_x = {min_x}")
+        self._emitter.write(f"{mapping_var}.clip_min_x = {min_x}")
         min_y = mapping.clip_min_y
-        self._write(f"{mapping_var}.clip_min_y = {min_y}")
+        self._emitter.write(f"{mapping_var}.clip_min_y = {min_y}")
         max_x = mapping.clip_max_x
-        self._write(f"{mapping_var}.clip_max_x = {max_x}")
+        self._emitter.write(f"{mapping_var}.clip_max_x = {max_x}")
         max_y = mapping.clip_max_y
-        self._write(f"{mapping_var}.clip_max_y = {max_y}")
+        self._emitter.write(f"{mapping_var}.clip_max_y = {max_y}")
 
         # use_clip
         use_clip = mapping.use_clip
-        self._write(f"{mapping_var}.use_clip = {use_clip}")
+        self._emitter.write(f"{mapping_var}.use_clip = {use_clip}")
 
         # create curves
         for i, curve in enumerate(mapping.curves):
             self._create_curve_map(node, i, curve, curve_mapping_name)
 
         # update curve
-        self._write(f"#update curve after changes")
-        self._write(f"{mapping_var}.update()")
+        self._emitter.write(f"#update curve after changes")
+        self._emitter.write(f"{mapping_var}.update()")
 
-    def _create_curve_map(self, node: Node, i: int, curve: bpy.types.CurveMap,
+    def _create_curve_map(self, node: NTP_NodeIR, i: int,
+                          curve: bpy.types.CurveMap,
                           curve_mapping_name: str) -> None:
         """
         Helper function to create the ith curve of a node's curve mapping
 
         Parameters:
-        node (Node): the node with a curve mapping
+        node (NTP_NodeIR): the node with a curve mapping
         i (int): index of the CurveMap within the mapping
         curve (bpy.types.CurveMap): the curve map to recreate
         curve_mapping_name (str): attribute name of the recreated curve mapping
         """
-        node_var = self._node_vars[node]
+        node_var = node.var
         
-        self._write(f"#curve {i}")
+        self._emitter.write(f"#curve {i}")
         curve_i_var = self._create_var(f"{node_var}_curve_{i}")
-        self._write(f"{curve_i_var} = "
-                    f"{node_var}.{curve_mapping_name}.curves[{i}]")
-
-        # Remove default points when CurveMap is initialized with more than
-        # two points (just CompositorNodeHueCorrect)
-        if (node.bl_idname == 'CompositorNodeHueCorrect'):
-            self._write(f"for {INDEX} in range"
-                        f"(len({curve_i_var}.points.values()) - 1, 1, -1):")
-            self._write(f"{curve_i_var}.points.remove("
-                        f"{curve_i_var}.points[{INDEX}])",
-                        self._inner_indent_level + 1)
-
-        for j, point in enumerate(curve.points):
-            self._create_curve_map_point(j, point, curve_i_var)
-
-    def _create_curve_map_point(self, j: int, point: bpy.types.CurveMapPoint,
-                                curve_i_var: str) -> None:
-        """
-        Helper function to recreate a curve map point
-
-        Parameters:
-        j (int): index of the point within the curve map
-        point (CurveMapPoint): point to recreate
-        curve_i_var (str): variable name of the point's curve map
-        """
-        point_j_var = self._create_var(f"{curve_i_var}_point_{j}")
-
-        loc = point.location
-        loc_str = f"{loc[0]}, {loc[1]}"
-        if j < 2:
-            self._write(f"{point_j_var} = {curve_i_var}.points[{j}]")
-            self._write(f"{point_j_var}.location = ({loc_str})")
-        else:
-            self._write(f"{point_j_var} = {curve_i_var}.points.new({loc_str})")
-
-        handle = enum_to_py_str(point.handle_type)
-        self._write(f"{point_j_var}.handle_type = {handle}")
+        self._emitter.write(f"{curve_i_var} = "
+                            f"{node_var}.{curve_mapping_name}.curves[{i}]")
+
+        # CurveMaps are initialized with a different number of points
+        # depending on their preset (more than two for
+        # CompositorNodeHueCorrect)
+        default_length = DEFAULT_CURVE_MAP_POINTS
+        if node.bl_idname == 'CompositorNodeHueCorrect':
+            default_length = None
+
+        points = curve.points
+        num_points = len(points)
+        locations = read_all(points, "location", 2 * num_points).tolist()
+
+        points_str = f"{curve_i_var}.points"
+        self._set_collection_length(points_str, num_points, "0.0, 0.0",
+                                    default_length)
+        write_flat_array(self._emitter,
+                         f"{points_str}.foreach_set(\"location\"",
+                         [str(value) for value in locations],
+                         self._inner_indent_level)
+
+        # enums can't be set with foreach_set()
+        handles = [enum_to_py_str(point.handle_type) for point in points]
+        write_flat_array(self._emitter,
+                         f"for {ITEM}, {HANDLE_TYPE} in zip({points_str}",
+                         handles, self._inner_indent_level, end="):")
+        self._emitter.write(f"{ITEM}.handle_type = {HANDLE_TYPE}",
+                            self._inner_indent_level + 1)
     
-    def _node_tree_settings(self, node: Node, attr_name: str) -> None:
+    def _node_tree_settings(self, node: NTP_NodeIR, attr_name: str) -> None:
         """
         Processes node tree of group node if one is present
 
         Parameters:
-        node (Node): the group node
+        node (NTP_NodeIR): the group node
         attr_name (str): name of the node tree attribute
         """
-        node_tree = getattr(node, attr_name)
+        node_tree = getattr(node.node, attr_name)
         if node_tree is None:
             return
         if node_tree in self._node_tree_vars:
             nt_var = self._node_tree_vars[node_tree]
-            node_var = self._node_vars[node]
-            self._write(f"{node_var}.{attr_name} = {nt_var}")
+            self._emitter.write(f"{node.var}.{attr_name} = {nt_var}")
         else:
             self.report({'WARNING'}, (f"NodeToPython: Node tree dependency graph " 
                                     f"wasn't properly initialized"))
 
     def _save_image(self, img: bpy.types.Image) -> bool:
         """
-        Saves an image to an image directory of the add-on
+        Adds an image to the ones saved to the add-on's image directory
 
         Parameters:
         img (bpy.types.Image): image to be saved
+
+        Returns:
+        (bool): whether the image will be saved and can be loaded back in
         """
 
         if img is None:
@@ -1128,18 +1494,108 @@ class NTP_Operator(Operator):
             self.report({'WARNING'}, f"{img_str} has no data")
             return False
 
-        # create image dir if one doesn't exist
-        img_dir = os.path.join(self._addon_dir, IMAGE_DIR_NAME)
-        if not os.path.exists(img_dir):
-            os.mkdir(img_dir)
+        if self._cache_record is not None:
+            self._cache_record.images.append(img.name)
 
-        # save the image
-        
-        img_path = f"{img_dir}/{img_str}"
-        if not os.path.exists(img_path):
-            img.save_render(img_path)
+        # images are written all at once by _write_images()
+        saved_img = self._images_to_save.setdefault(img_str, img)
+        if saved_img != img:
+            self.report({'WARNING'}, (f"NodeToPython: Images "
+                                      f"\"{saved_img.name}\" and "
+                                      f"\"{img.name}\" are both saved as "
+                                      f"{img_str}, using the first"))
         return True
 
+    def _copyable_image_path(self, img: bpy.types.Image) -> str:
+        """
+        Finds the file of an image, if it can be copied to the add-on as is
+        instead of being saved again
+
+        Parameters:
+        img (bpy.types.Image): image to be saved
+
+        Returns:
+        (str): absolute path of the image's file, or None if the image has
+            to be saved from Blender
+        """
+        if (img.source != 'FILE' or img.packed_file is not None 
+            or img.is_dirty or img.filepath == ""):
+            return None
+        path = bpy.path.abspath(img.filepath)
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in IMAGE_FORMAT_EXTENSIONS.get(img.file_format, ()):
+            return None
+        if not os.path.isfile(path):
+            return None
+        return path
+
+    def _write_images(self) -> None:
+        """
+        Writes the images collected by _save_image() to the add-on's image 
+        directory. Unmodified images are copied from their files into the 
+        zip archive by a single worker thread, since only one entry of it 
+        can be written at a time, while the rest are saved by Blender on 
+        this thread and added afterwards. The Blender API isn't thread 
+        safe, so the worker is only given paths and file formats read on 
+        this thread
+        """
+        if len(self._images_to_save) == 0:
+            return
+
+        copies: list[tuple[str, str, str]] = []
+        renders: list[tuple[bpy.types.Image, str]] = []
+        for img_str, img in self._images_to_save.items():
+            name = f"{IMAGE_DIR_NAME}/{img_str}"
+            src_path = self._copyable_image_path(img)
+            if src_path is not None:
+                copies.append((src_path, name, img.file_format))
+            else:
+                renders.append((img, name))
+
+        def write_copies() -> None:
+            for src_path, name, file_format in copies:
+                self._addon_zip.write_image(name, src_path, file_format)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(write_copies)
+                rendered = []
+                for i, (img, name) in enumerate(renders):
+                    rendered.append((img, self._render_image(img, name, i,
+                                                             tmp_dir), name))
+                future.result()
+            for img, img_path, name in rendered:
+                self._addon_zip.write_image(name, img_path, img.file_format)
+
+    def _render_image(self, img: bpy.types.Image, name: str, i: int,
+                      tmp_dir: str) -> str:
+        """
+        Saves an image with Blender, or finds the file saved for an
+        identical image in the image store
+
+        Parameters:
+        img (bpy.types.Image): image to be saved
+        name (str): path of the image inside the add-on
+        i (int): index of the image, keeping the file names unique
+        tmp_dir (str): directory to save the image to
+
+        Returns:
+        (str): path of the saved image
+        """
+        key = None
+        extension = os.path.splitext(name)[1]
+        if self._image_store is not None:
+            key = hash_image(img, bpy.context.scene)
+            img_path = self._image_store.get(key, extension)
+            if img_path is not None:
+                return img_path
+
+        img_path = os.path.join(tmp_dir, f"{i}_{os.path.basename(name)}")
+        img.save_render(img_path)
+        if key is not None:
+            img_path = self._image_store.put(key, extension, img_path)
+        return img_path
+
     def _load_image(self, img: bpy.types.Image, img_var: str) -> None:
         """
         Loads an image from the add-on into a blend file and assigns it
@@ -1155,29 +1611,29 @@ class NTP_Operator(Operator):
         img_str = img_to_py_str(img)
 
         # TODO: convert to special variables
-        self._write(f"#load image {img_str}")
-        self._write(f"{BASE_DIR} = "
-                    f"os.path.dirname(os.path.abspath(__file__))")
-        self._write(f"{IMAGE_PATH} = "
-                    f"os.path.join({BASE_DIR}, {str_to_py_str(IMAGE_DIR_NAME)}, "
-                    f"{str_to_py_str(img_str)})")
-        self._write(f"{img_var} = bpy.data.images.load"
-                    f"({IMAGE_PATH}, check_existing = True)")
+        self._emitter.write(f"#load image {img_str}")
+        self._emitter.write(f"{BASE_DIR} = "
+                            f"os.path.dirname(os.path.abspath(__file__))")
+        self._emitter.write(f"{IMAGE_PATH} = "
+                            f"os.path.join({BASE_DIR}, {str_to_py_str(IMAGE_DIR_NAME)}, "
+                            f"{str_to_py_str(img_str)})")
+        self._emitter.write(f"{img_var} = bpy.data.images.load"
+                            f"({IMAGE_PATH}, check_existing = True)")
 
         # copy image settings
-        self._write(f"#set image settings")
+        self._emitter.write(f"#set image settings")
 
         # source
         source = enum_to_py_str(img.source)
-        self._write(f"{img_var}.source = {source}")
+        self._emitter.write(f"{img_var}.source = {source}")
 
         # color space settings
         color_space = enum_to_py_str(img.colorspace_settings.name)
-        self._write(f"{img_var}.colorspace_settings.name = {color_space}")
+        self._emitter.write(f"{img_var}.colorspace_settings.name = {color_space}")
 
         # alpha mode
         alpha_mode = enum_to_py_str(img.alpha_mode)
-        self._write(f"{img_var}.alpha_mode = {alpha_mode}")
+        self._emitter.write(f"{img_var}.alpha_mode = {alpha_mode}")
 
     def _image_user_settings(self, img_user: bpy.types.ImageUser,
                              img_user_var: str) -> None:
@@ -1193,8 +1649,8 @@ class NTP_Operator(Operator):
                          "frame_start", "tile", "use_auto_refresh", "use_cyclic"]
 
         for img_usr_attr in img_usr_attrs:
-            self._write(f"{img_user_var}.{img_usr_attr} = "
-                        f"{getattr(img_user, img_usr_attr)}")
+            self._emitter.write(f"{img_user_var}.{img_usr_attr} = "
+                                f"{getattr(img_user, img_usr_attr)}")
 
     if bpy.app.version >= (3, 6, 0):
         def _output_zone_items(self, output_items, items_str: str, 
@@ -1206,17 +1662,17 @@ class NTP_Operator(Operator):
                 to copy
             items_str (str): 
             """
-            self._write(f"{items_str}.clear()")
+            self._emitter.write(f"{items_str}.clear()")
             for i, item in enumerate(output_items):
                 socket_type = enum_to_py_str(item.socket_type)
                 name = str_to_py_str(item.name)
-                self._write(f"# Create item {name}")
-                self._write(f"{items_str}.new({socket_type}, {name})")
+                self._emitter.write(f"# Create item {name}")
+                self._emitter.write(f"{items_str}.new({socket_type}, {name})")
 
                 if is_sim:
                     item_var = f"{items_str}[{i}]"
                     ad = enum_to_py_str(item.attribute_domain)
-                    self._write(f"{item_var}.attribute_domain = {ad}")
+                    self._emitter.write(f"{item_var}.attribute_domain = {ad}")
 
     if bpy.app.version >= (4, 1, 0):
         def _index_switch_items(self, switch_items: bpy.types.NodeIndexSwitchItems,   
@@ -1229,9 +1685,9 @@ class NTP_Operator(Operator):
             items_str (str): string for the generated switch items attribute
             """
             num_items = len(switch_items)
-            self._write(f"{items_str}.clear()")
+            self._emitter.write(f"{items_str}.clear()")
             for i in range(num_items):
-                self._write(f"{items_str}.new()")
+                self._emitter.write(f"{items_str}.new()")
 
         def _bake_items(self, bake_items: bpy.types.NodeGeometryBakeItems,
                         bake_items_str: str) -> None:
@@ -1242,17 +1698,17 @@ class NTP_Operator(Operator):
             bake_items (bpy.types.NodeGeometryBakeItems): bake items to replicate
             bake_items_str (str): string for the generated bake items
             """
-            self._write(f"{bake_items_str}.clear()")
+            self._emitter.write(f"{bake_items_str}.clear()")
             for i, bake_item in enumerate(bake_items):
                 socket_type = enum_to_py_str(bake_item.socket_type)
                 name = str_to_py_str(bake_item.name)
-                self._write(f"{bake_items_str}.new({socket_type}, {name})")
+                self._emitter.write(f"{bake_items_str}.new({socket_type}, {name})")
                 
                 ad = enum_to_py_str(bake_item.attribute_domain)
-                self._write(f"{bake_items_str}[{i}].attribute_domain = {ad}")
+                self._emitter.write(f"{bake_items_str}[{i}].attribute_domain = {ad}")
 
                 if bake_item.is_attribute:
-                    self._write(f"{bake_items_str}[{i}].is_attribute = True")
+                    self._emitter.write(f"{bake_items_str}[{i}].is_attribute = True")
 
     if bpy.app.version >= (4, 1, 0) and bpy.app.version < (4, 2, 0):
         def _enum_definition(self, enum_def: bpy.types.NodeEnumDefinition, 
@@ -1264,282 +1720,523 @@ class NTP_Operator(Operator):
             enum_def (bpy.types.NodeEnumDefinition): enum definition to replicate
             enum_def_str (str): string for the generated enum definition
             """
-            self._write(f"{enum_def_str}.enum_items.clear()")
+            self._emitter.write(f"{enum_def_str}.enum_items.clear()")
             for i, enum_item in enumerate(enum_def.enum_items):
                 name = str_to_py_str(enum_item.name)
-                self._write(f"{enum_def_str}.enum_items.new({name})")
+                self._emitter.write(f"{enum_def_str}.enum_items.new({name})")
                 if enum_item.description != "":
-                    self._write(f"{enum_def_str}.enum_items[{i}].description = "
-                                f"{str_to_py_str(enum_item.description)}")
+                    self._emitter.write(f"{enum_def_str}.enum_items[{i}].description = "
+                                        f"{str_to_py_str(enum_item.description)}")
 
     if bpy.app.version >= (4, 2, 0):
         def _capture_attribute_items(self, capture_attribute_items: bpy.types.NodeGeometryCaptureAttributeItems, capture_attrs_str: str) -> None:
             """
             Sets capture attribute items
             """
-            self._write(f"{capture_attrs_str}.clear()")
+            self._emitter.write(f"{capture_attrs_str}.clear()")
             for item in capture_attribute_items:
                 name = str_to_py_str(item.name)
-                self._write(f"{capture_attrs_str}.new('FLOAT', {name})")
+                self._emitter.write(f"{capture_attrs_str}.new('FLOAT', {name})")
 
                 # Need to initialize capture attribute item with a socket,
                 # which has a slightly different enum to the attribute type
                 data_type = enum_to_py_str(item.data_type)
-                self._write(f"{capture_attrs_str}[{name}].data_type = {data_type}")
+                self._emitter.write(f"{capture_attrs_str}[{name}].data_type = {data_type}")
 
         def _menu_switch_items(self, menu_switch_items: bpy.types.NodeMenuSwitchItems, menu_switch_items_str: str) -> None:
-            self._write(f"{menu_switch_items_str}.clear()")
+            self._emitter.write(f"{menu_switch_items_str}.clear()")
             for i, item in enumerate(menu_switch_items):
                 name_str = str_to_py_str(item.name)
-                self._write(f"{menu_switch_items_str}.new({name_str})")
+                self._emitter.write(f"{menu_switch_items_str}.new({name_str})")
                 desc_str = str_to_py_str(item.description)
-                self._write(f"{menu_switch_items_str}[{i}].description = {desc_str}")
+                self._emitter.write(f"{menu_switch_items_str}[{i}].description = {desc_str}")
 
     if bpy.app.version >= (4, 3, 0):
         def _foreach_geo_element_generation_items(self,
             generation_items: bpy.types.NodeGeometryForeachGeometryElementGenerationItems,
             generation_items_str: str
         ) -> None:
-            self._write(f"{generation_items_str}.clear()")
+            self._emitter.write(f"{generation_items_str}.clear()")
             for i, item in enumerate(generation_items):
                 socket_type = enum_to_py_str(item.socket_type)
                 name_str = str_to_py_str(item.name)
-                self._write(f"{generation_items_str}.new({socket_type}, {name_str})")
+                self._emitter.write(f"{generation_items_str}.new({socket_type}, {name_str})")
                 
                 item_str = f"{generation_items_str}[{i}]"
                 
                 ad = enum_to_py_str(item.domain)
-                self._write(f"{item_str}.domain = {ad}")
+                self._emitter.write(f"{item_str}.domain = {ad}")
 
         def _foreach_geo_element_input_items(self,
             input_items: bpy.types.NodeGeometryForeachGeometryElementInputItems,
             input_items_str: str
         ) -> None:
-            self._write(f"{input_items_str}.clear()")
+            self._emitter.write(f"{input_items_str}.clear()")
             for i, item in enumerate(input_items):
                 socket_type = enum_to_py_str(item.socket_type)
                 name_str = str_to_py_str(item.name)
-                self._write(f"{input_items_str}.new({socket_type}, {name_str})")
+                self._emitter.write(f"{input_items_str}.new({socket_type}, {name_str})")
 
         def _foreach_geo_element_main_items(self,
             main_items: bpy.types.NodeGeometryForeachGeometryElementMainItems,
             main_items_str: str
         ) -> None:
-            self._write(f"{main_items_str}.clear()")
+            self._emitter.write(f"{main_items_str}.clear()")
             for i, item in enumerate(main_items):
                 socket_type = enum_to_py_str(item.socket_type)
                 name_str = str_to_py_str(item.name)
-                self._write(f"{main_items_str}.new({socket_type}, {name_str})")
+                self._emitter.write(f"{main_items_str}.new({socket_type}, {name_str})")
 
 
-    def _set_parents(self, node_tree: NodeTree) -> None:
+    def _set_parents(self, ntp_nt: NTP_NodeTree) -> None:
         """
         Sets parents for all nodes, mostly used to put nodes in frames
 
         Parameters:
-        node_tree (NodeTree): node tree we're obtaining nodes from
-        """
+        ntp_nt (NTP_NodeTree): node tree we're obtaining nodes from
+        """
+        if self._node_table is not None:
+            table = self._node_table
+            rows = [f"({table.indices[node.var]}, "
+                    f"{table.indices[node.parent.var]})"
+                    for node in ntp_nt.ir.nodes if node.parent is not None]
+            if rows:
+                self._emitter.write(f"#Set parents")
+                write_table(self._emitter, f"set_parents({table.nodes_var}",
+                            rows, self._inner_indent_level)
+            self._emitter.write("", 0)
+            return
+
         parent_comment = False
-        for node in node_tree.nodes:
-            if node is not None and node.parent is not None:
+        for node in ntp_nt.ir.nodes:
+            if node.parent is not None:
                 if not parent_comment:
-                    self._write(f"#Set parents")
+                    self._emitter.write(f"#Set parents")
                     parent_comment = True
-                node_var = self._node_vars[node]
-                parent_var = self._node_vars[node.parent]
-                self._write(f"{node_var}.parent = {parent_var}")
-        self._write("", 0)
+                self._emitter.write(f"{node.var}.parent = {node.parent.var}")
+        self._emitter.write("", 0)
 
-    def _set_locations(self, node_tree: NodeTree) -> None:
+    def _set_locations(self, ntp_nt: NTP_NodeTree) -> None:
         """
         Set locations for all nodes
 
         Parameters:
-        node_tree (NodeTree): node tree we're obtaining nodes from
-        """
-
-        self._write(f"#Set locations")
-        for node in node_tree.nodes:
-            node_var = self._node_vars[node]
-            self._write(f"{node_var}.location "
-                        f"= ({node.location.x}, {node.location.y})")
-        self._write("", 0)
+        ntp_nt (NTP_NodeTree): node tree we're obtaining nodes from
+        """
+
+        self._emitter.write(f"#Set locations")
+        if self._bulk_layout:
+            # the nodes are set in the order they were created in. Node
+            # groups start empty and base node trees are cleared first, so
+            # there are no others
+            locations = [str(value) for value
+                         in ntp_nt.ir.layout.locations.tolist()]
+            write_flat_array(self._emitter,
+                             f"{ntp_nt.var}.nodes.foreach_set(\"location\"",
+                             locations, self._inner_indent_level)
+            self._emitter.write("", 0)
+            return
+        if self._node_table is not None:
+            rows = [f"({x}, {y})"
+                    for x, y in ntp_nt.ir.layout.iter_locations()]
+            write_table(self._emitter, 
+                        f"set_locations({self._node_table.nodes_var}", rows,
+                        self._inner_indent_level)
+            self._emitter.write("", 0)
+            return
+        for node, (x, y) in zip(ntp_nt.ir.nodes,
+                                ntp_nt.ir.layout.iter_locations()):
+            self._emitter.write(f"{node.var}.location = ({x}, {y})")
+        self._emitter.write("", 0)
 
-    def _set_dimensions(self, node_tree: NodeTree) -> None:
+    def _set_dimensions(self, ntp_nt: NTP_NodeTree) -> None:
         """
         Set dimensions for all nodes
 
         Parameters:
-        node_tree (NodeTree): node tree we're obtaining nodes from
+        ntp_nt (NTP_NodeTree): node tree we're obtaining nodes from
         """
         if not self._should_set_dimensions:
             return
 
-        self._write(f"#Set dimensions")
-        for node in node_tree.nodes:
-            node_var = self._node_vars[node]
-            self._write(f"{node_var}.width, {node_var}.height "
-                        f"= {node.width}, {node.height}")
-        self._write("", 0)
+        self._emitter.write(f"#Set dimensions")
+        if self._bulk_layout:
+            layout = ntp_nt.ir.layout
+            for attr, values in (("width", layout.widths),
+                                 ("height", layout.heights)):
+                write_flat_array(self._emitter,
+                                 f"{ntp_nt.var}.nodes.foreach_set(\"{attr}\"",
+                                 [str(value) for value in values.tolist()],
+                                 self._inner_indent_level)
+            self._emitter.write("", 0)
+            return
+        if self._node_table is not None:
+            rows = [f"({width}, {height})" 
+                    for width, height in ntp_nt.ir.layout.iter_dimensions()]
+            write_table(self._emitter, 
+                        f"set_dimensions({self._node_table.nodes_var}", rows,
+                        self._inner_indent_level)
+            self._emitter.write("", 0)
+            return
+        for node, (width, height) in zip(ntp_nt.ir.nodes,
+                                         ntp_nt.ir.layout.iter_dimensions()):
+            node_var = node.var
+            self._emitter.write(f"{node_var}.width, {node_var}.height "
+                                f"= {width}, {height}")
+        self._emitter.write("", 0)
 
-    def _init_links(self, node_tree: NodeTree) -> None:
+    def _init_links(self, ntp_nt: NTP_NodeTree) -> None:
         """
         Create all the links between nodes
 
         Parameters:
-        node_tree (NodeTree): node tree to copy, with variable
+        ntp_nt (NTP_NodeTree): node tree to copy, with variable
         """
 
-        nt_var = self._node_tree_vars[node_tree]
+        nt_var = ntp_nt.var
 
-        links = node_tree.links
+        links = ntp_nt.ir.links
         if links:
-            self._write(f"#initialize {nt_var} links")
-            if hasattr(links[0], "multi_input_sort_id"):
-                # generate links in the correct order for multi input sockets
-                links = sorted(links, key=lambda link: link.multi_input_sort_id)
+            self._emitter.write(f"#initialize {nt_var} links")
+
+        if self._node_table is not None:
+            self._link_table(nt_var, links)
+            links = []
 
         for link in links:
-            in_node_var = self._node_vars[link.from_node]
-            input_socket = link.from_socket
+            in_node_var = link.from_node.var
+            out_node_var = link.to_node.var
 
-            """
-            Blender's socket dictionary doesn't guarantee 
-            unique keys, which has caused much wailing and
-            gnashing of teeth. This is a quick fix that
-            doesn't run quick
-            """
-            # TODO: try using index() method
-            for i, item in enumerate(link.from_node.outputs.items()):
-                if item[1] == input_socket:
-                    input_idx = i
-                    break
-
-            out_node_var = self._node_vars[link.to_node]
-            output_socket = link.to_socket
-
-            for i, item in enumerate(link.to_node.inputs.items()):
-                if item[1] == output_socket:
-                    output_idx = i
-                    break
-
-            self._write(f"#{in_node_var}.{input_socket.name} "
-                        f"-> {out_node_var}.{output_socket.name}")
-            self._write(f"{nt_var}.links.new({in_node_var}"
-                        f".outputs[{input_idx}], "
-                        f"{out_node_var}.inputs[{output_idx}])")
+            self._emitter.write(f"#{in_node_var}.{link.from_socket.name} "
+                                f"-> {out_node_var}.{link.to_socket.name}")
+            self._emitter.write(f"{nt_var}.links.new({in_node_var}"
+                                f".outputs[{link.from_index}], "
+                                f"{out_node_var}.inputs[{link.to_index}])")
 
         for _func in self._write_after_links:
             _func()
         self._write_after_links = []
             
 
+    def _link_table(self, nt_var: str, links: list[NTP_LinkIR]) -> None:
+        """
+        Writes the table creating the links of a node tree
+
+        Parameters:
+        nt_var (str): variable name of the node tree
+        links (list[NTP_LinkIR]): the links, in the order they're created
+        """
+        table = self._node_table
+        rows = [f"({table.indices[link.from_node.var]}, {link.from_index}, "
+                f"{table.indices[link.to_node.var]}, {link.to_index})"
+                for link in links]
+        if rows:
+            write_table(self._emitter, 
+                        f"build_links({nt_var}, {table.nodes_var}", rows,
+                        self._inner_indent_level)
+
     def _set_node_tree_properties(self, node_tree: NodeTree) -> None:
         nt_var = self._node_tree_vars[node_tree]
 
         if bpy.app.version >= (4, 2, 0):
             color_tag_str = enum_to_py_str(node_tree.color_tag)
-            self._write(f"{nt_var}.color_tag = {color_tag_str}")
+            self._emitter.write(f"{nt_var}.color_tag = {color_tag_str}")
             desc_str = str_to_py_str(node_tree.description)
-            self._write(f"{nt_var}.description = {desc_str}")
+            self._emitter.write(f"{nt_var}.description = {desc_str}")
         if bpy.app.version >= (4, 3, 0):
             default_width = node_tree.default_group_node_width
-            self._write(f"{nt_var}.default_group_node_width = {default_width}")
-        self._write("\n")
+            self._emitter.write(f"{nt_var}.default_group_node_width = {default_width}")
+        self._emitter.write("\n")
 
-    def _hide_hidden_sockets(self, node: Node) -> None:
+    def _hide_hidden_sockets(self, node: NTP_NodeIR) -> None:
         """
         Hide hidden sockets
 
         Parameters:
-        node (Node): node object we're copying socket settings from
+        node (NTP_NodeIR): node we're copying socket settings from
         """
-        node_var = self._node_vars[node]
+        node_var = node.var
+
+        if self._node_table is not None:
+            for sockets in ("inputs", "outputs"):
+                for i, socket in enumerate(getattr(node, sockets)):
+                    if socket.hide:
+                        self._node_table.add_socket_value(node_var, sockets,
+                                                          i, "hide", "True")
+            return
 
         for i, socket in enumerate(node.inputs):
-            if socket.hide is True:
-                self._write(f"{node_var}.inputs[{i}].hide = True")
+            if socket.hide:
+                self._emitter.write(f"{node_var}.inputs[{i}].hide = True")
         for i, socket in enumerate(node.outputs):
-            if socket.hide is True:
-                self._write(f"{node_var}.outputs[{i}].hide = True")
+            if socket.hide:
+                self._emitter.write(f"{node_var}.outputs[{i}].hide = True")
 
     def _create_menu_func(self) -> None:
         """
         Creates the menu function
         """
-        self._write("def menu_func(self, context):", 0)
-        self._write(f"self.layout.operator({self._class_name}.bl_idname)\n", 1)
+        self._emitter.write("def menu_func(self, context):", 0)
+        self._emitter.write(f"self.layout.operator({self._class_name}.bl_idname)\n", 1)
 
     def _create_register_func(self) -> None:
         """
         Creates the register function
         """
-        self._write("def register():", 0)
-        self._write(f"bpy.utils.register_class({self._class_name})", 1)
-        self._write(f"bpy.types.{self._menu_id}.append(menu_func)\n", 1)
+        self._emitter.write("def register():", 0)
+        self._emitter.write(f"bpy.utils.register_class({self._class_name})", 1)
+        self._emitter.write(f"bpy.types.{self._menu_id}.append(menu_func)\n", 1)
 
     def _create_unregister_func(self) -> None:
         """
         Creates the unregister function
         """
-        self._write("def unregister():", 0)
-        self._write(f"bpy.utils.unregister_class({self._class_name})", 1)
-        self._write(f"bpy.types.{self._menu_id}.remove(menu_func)\n", 1)
+        self._emitter.write("def unregister():", 0)
+        self._emitter.write(f"bpy.utils.unregister_class({self._class_name})", 1)
+        self._emitter.write(f"bpy.types.{self._menu_id}.remove(menu_func)\n", 1)
 
     def _create_main_func(self) -> None:
         """
         Creates the main function
         """
-        self._write("if __name__ == \"__main__\":", 0)
-        self._write("register()", 1)
+        self._emitter.write("if __name__ == \"__main__\":", 0)
+        self._emitter.write("register()", 1)
 
     def _create_license(self) -> None:
         if not self._should_create_license:
             return
         if self._license == 'OTHER':
             return
-        license_file = open(f"{self._addon_dir}/LICENSE", "w")
         year = datetime.date.today().year
-        license_txt = license_templates[self._license](year, self._author_name)
-        license_file.write(license_txt)
-        license_file.close()
+        try:
+            license_txt = create_license(self._license, year,
+                                         self._author_name)
+        except OSError as e:
+            self.report({'WARNING'},
+                        f"NodeToPython: couldn't read the license text for "
+                        f"{self._license}, no LICENSE file was added: {e}")
+            return
+        self._addon_zip.write_text("LICENSE", license_txt)
 
     if bpy.app.version >= (4, 2, 0):
         def _create_manifest(self) -> None:
-            manifest = open(f"{self._addon_dir}/blender_manifest.toml", "w")
-            manifest.write("schema_version = \"1.0.0\"\n\n")
-            manifest.write(f"id = {str_to_py_str(clean_string(self._idname, lower=False))}\n")
+            manifest = []
+            manifest.append("schema_version = \"1.0.0\"\n\n")
+            manifest.append(f"id = {str_to_py_str(clean_string(self._idname, lower=False))}\n")
 
-            manifest.write(f"version = {version_to_manifest_str(self._version)}\n")
-            manifest.write(f"name = {str_to_py_str(self._name)}\n")
+            manifest.append(f"version = {version_to_manifest_str(self._version)}\n")
+            manifest.append(f"name = {str_to_py_str(self._name)}\n")
             if self._description == "":
                 self._description = self._name
-            manifest.write(f"tagline = {str_to_py_str(self._description)}\n")
-            manifest.write(f"maintainer = {str_to_py_str(self._author_name)}\n")
-            manifest.write("type = \"add-on\"\n")
-            manifest.write(f"blender_version_min = {version_to_manifest_str(bpy.app.version)}\n")
+            manifest.append(f"tagline = {str_to_py_str(self._description)}\n")
+            manifest.append(f"maintainer = {str_to_py_str(self._author_name)}\n")
+            manifest.append("type = \"add-on\"\n")
+            manifest.append(f"blender_version_min = {version_to_manifest_str(bpy.app.version)}\n")
             if self._license != 'OTHER':
-                manifest.write(f"license = [{str_to_py_str(self._license)}]\n")
+                manifest.append(f"license = [{str_to_py_str(self._license)}]\n")
             else:
                 self.report({'WARNING'}, "No license selected. Please add a license to the manifest file")
 
-            manifest.close()
+            self._addon_zip.write_text("blender_manifest.toml", "".join(manifest))
 
     def _zip_addon(self) -> None:
         """
-        Zips up the addon and removes the directory
+        Finishes the add-on's zip archive
+        """
+        self._addon_zip.close()
+
+    def _read_tree_ir(self, node_tree: NodeTree) -> NTP_TreeIR:
+        """
+        Reads a node tree into an IR
+
+        Parameters:
+        node_tree (NodeTree): node tree to read
+
+        Returns:
+        (NTP_TreeIR): the node tree's IR
+        """
+        read_unavailable = True
+        if bpy.app.version >= (3, 4, 0):
+            read_unavailable = self._set_unavailable_defaults
+        return NTP_TreeIR(node_tree, read_unavailable)
+
+    def _read_node_tree(self, ntp_nt: NTP_NodeTree) -> None:
+        """
+        Reads the nodes, sockets, and links of a node tree into its IR, so
+        each of their properties is only read from Blender once
+
+        Parameters:
+        ntp_nt (NTP_NodeTree): node tree to read
         """
-        shutil.make_archive(self._zip_dir, "zip", self._zip_dir)
-        shutil.rmtree(self._zip_dir)
+        ntp_nt.ir = self._tree_irs.pop(ntp_nt.node_tree, None)
+        if ntp_nt.ir is None:
+            ntp_nt.ir = self._read_tree_ir(ntp_nt.node_tree)
+        self._tree_ir = ntp_nt.ir
+
+        self._baselines = {}
+        if self._skip_default_values:
+            bl_idnames = {node.bl_idname for node in ntp_nt.ir.nodes}
+            self._baselines = get_baselines(ntp_nt.node_tree.bl_idname,
+                                            bl_idnames)
 
     # ABSTRACT
-    def _process_node(self, node: Node, ntp_node_tree: NTP_NodeTree) -> None:
+    def _process_node(self, node: NTP_NodeIR,
+                      ntp_node_tree: NTP_NodeTree) -> None:
         return
 
     # ABSTRACT
     def _process_node_tree(self, node_tree: NodeTree) -> None:
         return
 
+    def _cache_key_context(self, node_tree: NodeTree) -> tuple:
+        """
+        Operator state besides the node tree itself that affects the code 
+        generated for it
+
+        Parameters:
+        node_tree (NodeTree): node tree being generated
+
+        Returns:
+        (tuple): values to include in the node tree's cache key
+        """
+        return ()
+
+    def _setting_values(self, node: NTP_NodeIR) -> tuple:
+        """
+        Reads the settings of a node the generated code sets, for its node
+        tree's cache key
+
+        Parameters:
+        node (NTP_NodeIR): node to read
+
+        Returns:
+        (tuple): (setting name, value) pairs
+        """
+        attr_plan = _attr_plans.get(node.bl_idname)
+        if attr_plan is None:
+            if node.bl_idname not in self._node_infos:
+                return ()
+            attr_plan = _compile_attr_plan(self._node_infos[node.bl_idname])
+            _attr_plans[node.bl_idname] = attr_plan
+
+        bl_node = node.node
+        return tuple((attr_name, getattr(bl_node, attr_name, None))
+                     for attr_name, _, _ in attr_plan)
+
+    def _get_cache_key(self, node_tree: NodeTree, tree_ir: NTP_TreeIR
+                       ) -> str:
+        """
+        Creates the cache key for a node tree. Subgroups are processed first,
+        so their keys (and with it any changes to them) are part of the key
+
+        Parameters:
+        node_tree (NodeTree): node tree being generated
+        tree_ir (NTP_TreeIR): the node tree's IR
+
+        Returns:
+        (str): the cache key
+        """
+        subgroups = []
+        settings = []
+        for node in tree_ir.nodes:
+            settings.append(self._setting_values(node))
+            subgroup = getattr(node.node, "node_tree", None)
+            if subgroup in self._cache_keys:
+                subgroups.append((self._cache_keys[subgroup], 
+                                  self._node_tree_vars[subgroup]))
+
+        options = (self._mode, self._indentation, self._outer_indent_level,
+                   self._inner_indent_level, self._include_group_socket_values,
+                   self._should_set_dimensions, self._output_format,
+                   self._bulk_layout, self._skip_default_values,
+                   self._reuse_node_groups)
+        if bpy.app.version >= (3, 4, 0):
+            options += (self._set_unavailable_defaults,)
+
+        return hash_key(type(self).__name__, tuple(bpy.app.version), options,
+                        self._cache_key_context(node_tree),
+                        hash_node_tree(node_tree, tree_ir, settings),
+                        tuple(subgroups))
+
+    def _process_node_tree_cached(self, node_tree: NodeTree) -> None:
+        """
+        Generates the code for a node tree, reusing the code from the export
+        cache if neither the node tree, its subgroups, nor the options 
+        changed since it was generated
+
+        Parameters:
+        node_tree (NodeTree): node tree to be recreated
+        """
+        if self._export_cache is None:
+            self._process_node_tree_hashed(node_tree)
+            return
+
+        tree_ir = self._read_tree_ir(node_tree)
+        key = self._get_cache_key(node_tree, tree_ir)
+        self._cache_keys[node_tree] = key
+
+        entry = self._export_cache.get(key)
+        if entry is not None and entry.applies_to(self._identifiers.counts):
+            entry.apply(self._identifiers.counts)
+            self._node_tree_vars[node_tree] = entry.nt_var
+            self._emitter.write_block(entry.code)
+            for img_name in entry.images:
+                self._save_image(bpy.data.images.get(img_name))
+            if self._reuse_node_groups:
+                self._group_hashes[node_tree] = entry.group_hash
+            for report_type, message in entry.reports:
+                self.report({report_type}, message)
+            self._cache_hits += 1
+            return
+
+        self._tree_irs[node_tree] = tree_ir
+        self._cache_record = NTP_CacheEntry()
+        num_reports = len(self._reports)
+        self._emitter.start_capture()
+        self._process_node_tree_hashed(node_tree)
+        entry = self._cache_record
+        self._cache_record = None
+        entry.reports = self._reports[num_reports:]
+
+        entry.code = self._emitter.end_capture()
+        entry.nt_var = self._node_tree_vars[node_tree]
+        entry.group_hash = self._group_hashes.get(node_tree, "")
+        entry.finish(self._identifiers.counts)
+        self._export_cache.put(key, entry)
+
+    def _process_node_tree_hashed(self, node_tree: NodeTree) -> None:
+        """
+        Generates the code for a node tree and, when reusing node groups,
+        stamps it with a hash of that code. Variable names depend on what
+        else is exported, so they're left out of the hash. Subgroups are
+        processed first, so their hashes are part of it
+
+        Parameters:
+        node_tree (NodeTree): node tree to be recreated
+        """
+        if not self._reuse_node_groups:
+            self._process_node_tree(node_tree)
+            return
+
+        self._emitter.start_capture()
+        self._process_node_tree(node_tree)
+        code = self._emitter.end_capture(keep=False)
+
+        # group nodes are found in the node tree's IR, so only they are
+        # read from Blender again
+        group_node_type = GROUP_NODE_TYPES.get(node_tree.bl_idname)
+        subgroups = []
+        for node in self._tree_ir.nodes:
+            if node.bl_idname != group_node_type:
+                continue
+            subgroup = node.node.node_tree
+            if subgroup in self._group_hashes:
+                subgroups.append(self._group_hashes[subgroup])
+        group_hash = hash_key(canonical_identifiers(code), tuple(subgroups))
+        self._group_hashes[node_tree] = group_hash
+        self._emitter.write_block(code.replace(GROUP_HASH_PLACEHOLDER,
+                                               group_hash))
+
     def _report_finished(self, object: str):
         """
         Alert user that NTP is finished
@@ -1553,6 +2250,43 @@ class NTP_Operator(Operator):
         else:
             location = self._dir_path
         self.report({'INFO'}, f"NodeToPython: Saved {object} to {location}")
+        if self._export_cache is not None:
+            self.report({'INFO'}, 
+                        f"NodeToPython: Reused {self._cache_hits} of "
+                        f"{len(self._cache_keys)} node trees from the export "
+                        f"cache")
+        if self._image_store is not None and self._image_store.hits > 0:
+            self.report({'INFO'},
+                        f"NodeToPython: Reused {self._image_store.hits} of "
+                        f"{self._image_store.hits + self._image_store.misses} "
+                        f"saved images from the export cache")
+        if self._profiler is not None:
+            self._report_profile()
+
+    def _report_profile(self) -> None:
+        """
+        Reports the time and Blender data reads of each phase, and saves
+        them as JSON next to the output
+        """
+        self._profiler.finish()
+        for line in self._profiler.report_lines():
+            self.report({'INFO'}, f"NodeToPython: {line}")
+
+        if self._addon_zip is not None:
+            path = f"{os.path.splitext(self._addon_zip.zip_path)[0]}_profile.json"
+        elif self._profile_dir:
+            if not os.path.exists(self._profile_dir):
+                os.makedirs(self._profile_dir)
+            path = os.path.join(self._profile_dir,
+                                f"{self._profile_name}_profile.json")
+        else:
+            self.report({'WARNING'},
+                        "NodeToPython: No save location found for the "
+                        "profile. Please select one in the NodeToPython "
+                        "Options panel")
+            return
+        self._profiler.write(path)
+        self.report({'INFO'}, f"NodeToPython: Saved profile to {path}")
 
     # ABSTRACT
     def execute(self, context):
@@ -0,0 +1,360 @@
+"""
+Opt-in profiler for finding where conversions spend their time. Splits a
+run into phases and, for each one, counts and times the attribute reads
+made on Blender data, so RNA access can be told apart from the rest of the
+work (formatting code, writing files, ...)
+"""
+import bpy
+from bpy.types import bpy_prop_collection, bpy_struct
+
+import functools
+import json
+import time
+
+# Operator method name -> phase it's timed under. Methods that don't exist
+# for the running version of Blender are skipped
+PROFILED_METHODS = {
+    "_topological_sort_trees": "sort",
+    "_read_node_tree": "read tree",
+    "_read_tree_ir": "read tree",
+    "_get_cache_key": "cache key",
+    "_create_node": "create nodes",
+    "_set_settings_defaults": "settings",
+    "_set_socket_defaults": "socket defaults",
+    "_hide_hidden_sockets": "socket defaults",
+    "_group_io_settings": "interface",
+    "_tree_interface_settings": "interface",
+    "_set_parents": "layout",
+    "_set_locations": "layout",
+    "_set_dimensions": "layout",
+    "_init_links": "links",
+    "_write_images": "images",
+    "_create_license": "zip",
+    "_create_manifest": "zip",
+    "_zip_addon": "zip",
+}
+
+# Phase everything outside of the profiled methods is counted under
+OTHER_PHASE = "other"
+
+# Number of attributes listed for each phase in the JSON report
+TOP_ATTRIBUTES = 20
+
+_perf_counter = time.perf_counter
+
+
+class NTP_PhaseStats:
+    """
+    Time and attribute reads spent in one phase
+    """
+    __slots__ = ("calls", "seconds", "self_seconds", "reads", "read_seconds",
+                 "attributes")
+
+    def __init__(self):
+        # Number of times the phase was entered
+        self.calls: int = 0
+
+        # Time spent in the phase, including phases nested in it
+        self.seconds: float = 0.0
+
+        # Time spent in the phase, not counting nested phases
+        self.self_seconds: float = 0.0
+
+        # Attribute reads made on Blender data, and the time they took
+        self.reads: int = 0
+        self.read_seconds: float = 0.0
+
+        # "Type.attribute" -> [reads, seconds]
+        self.attributes: dict[str, list] = {}
+
+    def to_dict(self) -> dict:
+        top = sorted(self.attributes.items(),
+                     key=lambda item: item[1][1], reverse=True)
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "self_seconds": self.self_seconds,
+            "reads": self.reads,
+            "read_seconds": self.read_seconds,
+            "attributes": {name: {"reads": reads, "seconds": seconds}
+                           for name, (reads, seconds)
+                           in top[:TOP_ATTRIBUTES]},
+        }
+
+
+class NTP_Profiler:
+    """
+    Times the phases of a conversion, and the Blender data reads in each.
+    Reads are only counted on data wrapped with wrap()
+    """
+    def __init__(self):
+        # Phase name -> stats
+        self.phases: dict[str, NTP_PhaseStats] = {}
+
+        # Phases currently running, innermost last, as
+        # [stats, start time, time spent in nested phases]
+        self._stack: list[list] = []
+
+        self._start = _perf_counter()
+        self._seconds: float = None
+        self._enter(OTHER_PHASE)
+
+    def _enter(self, name: str) -> None:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = NTP_PhaseStats()
+            self.phases[name] = stats
+        stats.calls += 1
+        self._stack.append([stats, _perf_counter(), 0.0])
+
+    def _exit(self) -> None:
+        stats, start, nested = self._stack.pop()
+        seconds = _perf_counter() - start
+        stats.self_seconds += seconds - nested
+        if self._stack:
+            self._stack[-1][2] += seconds
+        if stats not in (frame[0] for frame in self._stack):
+            # only count recursive phases once
+            stats.seconds += seconds
+
+    def instrument(self, op, methods: dict[str, str] = PROFILED_METHODS
+                   ) -> None:
+        """
+        Times methods of an operator under their phases. Only affects this
+        instance of the operator
+
+        Parameters:
+        op (NTP_Operator): operator to instrument
+        methods (dict[str, str]): method name -> phase name pairs
+        """
+        for method_name, phase_name in methods.items():
+            method = getattr(op, method_name, None)
+            if method is None:
+                continue
+            setattr(op, method_name, self._timed(method, phase_name))
+
+    def _timed(self, method, phase_name: str):
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            self._enter(phase_name)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._exit()
+        return timed
+
+    def count_read(self, name: str, seconds: float) -> None:
+        """
+        Records an attribute read under the current phase
+
+        Parameters:
+        name (str): "Type.attribute" that was read
+        seconds (float): time the read took
+        """
+        stats = self._stack[-1][0] if self._stack else self.phases[OTHER_PHASE]
+        stats.reads += 1
+        stats.read_seconds += seconds
+        attribute = stats.attributes.get(name)
+        if attribute is None:
+            stats.attributes[name] = [1, seconds]
+        else:
+            attribute[0] += 1
+            attribute[1] += seconds
+
+    def wrap(self, value, path: str = None):
+        """
+        Wraps Blender data so reads made through it are counted. Other
+        values are returned as is
+
+        Parameters:
+        value: value to wrap
+        path (str): "Type.attribute" the value was read from, naming the
+            items of collections
+
+        Returns:
+        the wrapped value
+        """
+        if isinstance(value, (_RNAProxy, _CollectionProxy)):
+            return value
+        if isinstance(value, bpy_struct):
+            return _RNAProxy(value, self)
+        if isinstance(value, bpy_prop_collection):
+            return _CollectionProxy(value, self,
+                                    path or type(value).__name__)
+        return value
+
+    def finish(self) -> None:
+        """
+        Stops timing. Phases still running are ended
+        """
+        while self._stack:
+            self._exit()
+        self._seconds = _perf_counter() - self._start
+
+    def sorted_phases(self) -> list[tuple[str, NTP_PhaseStats]]:
+        """
+        Returns:
+        (list[tuple[str, NTP_PhaseStats]]): phases, slowest first
+        """
+        return sorted(self.phases.items(),
+                      key=lambda item: item[1].self_seconds, reverse=True)
+
+    def report_lines(self) -> list[str]:
+        """
+        Formats the phases as a table, one line per row
+
+        Returns:
+        (list[str]): the lines of the table
+        """
+        lines = [f"{'phase':<16} {'seconds':>9} {'reads':>10} "
+                 f"{'read seconds':>13}"]
+        for name, stats in self.sorted_phases():
+            lines.append(f"{name:<16} {stats.self_seconds:>9.3f} "
+                         f"{stats.reads:>10} {stats.read_seconds:>13.3f}")
+        reads = sum(stats.reads for stats in self.phases.values())
+        read_seconds = sum(stats.read_seconds
+                           for stats in self.phases.values())
+        lines.append(f"{'total':<16} {self._seconds:>9.3f} {reads:>10} "
+                     f"{read_seconds:>13.3f}")
+        return lines
+
+    def to_dict(self) -> dict:
+        return {
+            "blender_version": list(bpy.app.version),
+            "seconds": self._seconds,
+            "reads": sum(stats.reads for stats in self.phases.values()),
+            "read_seconds": sum(stats.read_seconds
+                                for stats in self.phases.values()),
+            "phases": {name: stats.to_dict()
+                       for name, stats in self.sorted_phases()},
+        }
+
+    def write(self, path: str) -> None:
+        """
+        Writes the profile as JSON
+
+        Parameters:
+        path (str): file to write
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+
+class _RNAProxy:
+    """
+    Stands in for an RNA struct, counting the attributes read from it.
+    Passes isinstance() checks for the struct's type, and compares and
+    hashes like the struct
+    """
+    __slots__ = ("_ntp_struct", "_ntp_profiler", "_ntp_type_name")
+
+    def __init__(self, struct: bpy_struct, profiler: NTP_Profiler):
+        object.__setattr__(self, "_ntp_struct", struct)
+        object.__setattr__(self, "_ntp_profiler", profiler)
+        object.__setattr__(self, "_ntp_type_name", type(struct).__name__)
+
+    @property
+    def __class__(self):
+        return type(self._ntp_struct)
+
+    def __getattr__(self, name: str):
+        start = _perf_counter()
+        value = getattr(self._ntp_struct, name)
+        path = f"{self._ntp_type_name}.{name}"
+        self._ntp_profiler.count_read(path, _perf_counter() - start)
+        return self._ntp_profiler.wrap(value, path)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._ntp_struct, name, _unwrap(value))
+
+    def __eq__(self, other) -> bool:
+        return self._ntp_struct == _unwrap(other)
+
+    def __ne__(self, other) -> bool:
+        return self._ntp_struct != _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(self._ntp_struct)
+
+    def __repr__(self) -> str:
+        return repr(self._ntp_struct)
+
+    def __dir__(self):
+        return dir(self._ntp_struct)
+
+
+class _CollectionProxy:
+    """
+    Stands in for an RNA collection, counting the items read from it
+    """
+    __slots__ = ("_ntp_collection", "_ntp_profiler", "_ntp_path")
+
+    def __init__(self, collection: bpy_prop_collection,
+                 profiler: NTP_Profiler, path: str):
+        self._ntp_collection = collection
+        self._ntp_profiler = profiler
+        self._ntp_path = path
+
+    @property
+    def __class__(self):
+        return type(self._ntp_collection)
+
+    def _read(self, read, *args):
+        start = _perf_counter()
+        value = read(*args)
+        self._ntp_profiler.count_read(f"{self._ntp_path}[]",
+                                      _perf_counter() - start)
+        return self._ntp_profiler.wrap(value)
+
+    def __getattr__(self, name: str):
+        start = _perf_counter()
+        value = getattr(self._ntp_collection, name)
+        path = f"{self._ntp_path}.{name}"
+        self._ntp_profiler.count_read(path, _perf_counter() - start)
+        return self._ntp_profiler.wrap(value, path)
+
+    def __iter__(self):
+        iterator = iter(self._ntp_collection)
+        while True:
+            try:
+                yield self._read(next, iterator)
+            except StopIteration:
+                return
+
+    def __len__(self) -> int:
+        return len(self._ntp_collection)
+
+    def __bool__(self) -> bool:
+        return bool(self._ntp_collection)
+
+    def __contains__(self, key) -> bool:
+        return _unwrap(key) in self._ntp_collection
+
+    def __getitem__(self, key):
+        return self._read(self._ntp_collection.__getitem__, key)
+
+    def get(self, key, default=None):
+        return self._read(self._ntp_collection.get, key, default)
+
+    def values(self) -> list:
+        return list(self)
+
+    def items(self) -> list:
+        return list(zip(self._ntp_collection.keys(), self))
+
+    def __eq__(self, other) -> bool:
+        return self._ntp_collection == _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(self._ntp_collection)
+
+    def __repr__(self) -> str:
+        return repr(self._ntp_collection)
+
+
+def _unwrap(value):
+    if isinstance(value, _RNAProxy):
+        return object.__getattribute__(value, "_ntp_struct")
+    if isinstance(value, _CollectionProxy):
+        return object.__getattribute__(value, "_ntp_collection")
+    return value
@@ -0,0 +1,304 @@
+"""
+Compact intermediate representation of a node tree. Everything generation
+needs from a tree's nodes, sockets, and links is read from RNA once, up
+front, into __slots__ objects, instead of going back to the live structs
+each time a part of the generated code needs a value.
+
+Memory budget: reading a tree should take at most MEMORY_BUDGET_PER_NODE
+bytes per node, including its sockets and links, i.e. about 100 MB for a
+50,000 node tree. tools/benchmarks/tree_ir_memory.py checks this.
+"""
+import bpy
+from bpy.types import Node, NodeSocket, NodeTree
+from bpy.types import bpy_prop_array
+
+import array
+import mathutils
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MEMORY_BUDGET_PER_NODE = 2048
+
+# Node input sockets that are messy to set default values for
+DONT_SET_DEFAULTS = {'NodeSocketGeometry',
+                     'NodeSocketShader',
+                     'NodeSocketMatrix',
+                     'NodeSocketVirtual'}
+
+# Nodes whose first output socket holds the node's value
+OUTPUT_DEFAULT_NODES = {'ShaderNodeValue',
+                        'ShaderNodeRGB',
+                        'ShaderNodeNormal',
+                        'CompositorNodeValue',
+                        'CompositorNodeRGB',
+                        'CompositorNodeNormal'}
+
+# Default value of sockets whose default doesn't need to be set
+NO_DEFAULT = object()
+
+# Array values, copied when read so formatting them doesn't go back to RNA
+_ARRAY_TYPES = (bpy_prop_array, mathutils.Color, mathutils.Euler,
+                mathutils.Vector)
+
+_intern = sys.intern
+
+
+def read_value(value):
+    """
+    Copies array values into tuples, so they can be compared and formatted
+    without going back to RNA. Other values are returned as is
+    """
+    if isinstance(value, _ARRAY_TYPES):
+        return tuple(value)
+    return value
+
+
+def read_all(collection, attr: str, length: int, is_bool: bool = False):
+    """
+    Reads a property of every item of a collection with a single
+    foreach_get, instead of going through RNA once per item
+
+    Parameters:
+    collection (bpy_prop_collection): collection to read
+    attr (str): name of the property
+    length (int): number of values to read, e.g. twice the number of items
+        for 2D vectors
+    is_bool (bool): whether the property is a boolean, otherwise it's
+        read as 32 bit floats
+
+    Returns:
+    flat NumPy array of the values, or an array.array if NumPy isn't
+        available
+    """
+    if numpy is not None:
+        values = numpy.zeros(length, dtype=bool if is_bool else numpy.float32)
+    elif is_bool:
+        values = array.array('b', bytes(length))
+    else:
+        values = array.array('f', bytes(4 * length))
+    collection.foreach_get(attr, values)
+    return values
+
+
+class NTP_LayoutIR:
+    """
+    Locations and dimensions of every node of a tree, read in bulk and kept
+    in flat arrays in node order
+    """
+    __slots__ = ("locations", "widths", "heights", "mute", "hide")
+
+    def __init__(self, nodes):
+        """
+        Parameters:
+        nodes (Nodes): nodes of the node tree
+        """
+        num_nodes = len(nodes)
+
+        # x and y of each node's location, one after the other
+        self.locations = read_all(nodes, "location", 2 * num_nodes)
+
+        self.widths = read_all(nodes, "width", num_nodes)
+        self.heights = read_all(nodes, "height", num_nodes)
+        self.mute = read_all(nodes, "mute", num_nodes, True)
+        self.hide = read_all(nodes, "hide", num_nodes, True)
+
+    def iter_locations(self):
+        """
+        Returns:
+        iterator of the (x, y) location of each node, as Python floats
+        """
+        locations = self.locations.tolist()
+        return zip(locations[0::2], locations[1::2])
+
+    def iter_dimensions(self):
+        """
+        Returns:
+        iterator of the (width, height) of each node, as Python floats
+        """
+        return zip(self.widths.tolist(), self.heights.tolist())
+
+
+class NTP_SocketIR:
+    """
+    Input or output socket of a node
+    """
+    __slots__ = ("bl_idname", "identifier", "name", "hide", "default_value")
+
+    def __init__(self, socket: NodeSocket):
+        # Socket identifiers and names repeat across nodes of the same type,
+        # so share one copy of each
+        self.bl_idname: str = _intern(socket.bl_idname)
+        self.identifier: str = _intern(socket.identifier)
+        self.name: str = _intern(socket.name)
+        self.hide: bool = socket.hide is True
+
+        # Value to set the generated socket's default to, if any
+        self.default_value = NO_DEFAULT
+
+
+class NTP_NodeIR:
+    """
+    Node with its cosmetic settings and sockets. Node type specific settings
+    are still read from the node itself, through the node's settings plan
+    """
+    __slots__ = ("node", "var", "bl_idname", "name", "label", "color",
+                 "mute", "hide", "warning_propagation", "parent", "inputs",
+                 "outputs")
+
+    def __init__(self, node: Node, mute: bool, hide: bool):
+        # Blender node, for node type specific settings
+        self.node: Node = node
+
+        # Variable name of the generated node, once it's created
+        self.var: str = None
+
+        self.bl_idname: str = _intern(node.bl_idname)
+        self.name: str = node.name
+        self.label: str = node.label
+
+        # Custom color, or None if the node doesn't use one
+        self.color = tuple(node.color) if node.use_custom_color else None
+
+        # Read in bulk with the rest of the layout
+        self.mute: bool = mute
+        self.hide: bool = hide
+
+        if bpy.app.version >= (4, 3, 0):
+            self.warning_propagation: str = _intern(node.warning_propagation)
+        else:
+            self.warning_propagation: str = None
+
+        # Parent node (usually a frame), set once every node has been read
+        self.parent: NTP_NodeIR = None
+
+        self.inputs: tuple[NTP_SocketIR, ...] = ()
+        self.outputs: tuple[NTP_SocketIR, ...] = ()
+
+
+class NTP_LinkIR:
+    """
+    Link between an output socket of one node and an input socket of another
+    """
+    __slots__ = ("from_node", "from_index", "to_node", "to_index")
+
+    def __init__(self, from_node: NTP_NodeIR, from_index: int,
+                 to_node: NTP_NodeIR, to_index: int):
+        self.from_node: NTP_NodeIR = from_node
+        self.from_index: int = from_index
+        self.to_node: NTP_NodeIR = to_node
+        self.to_index: int = to_index
+
+    @property
+    def from_socket(self) -> NTP_SocketIR:
+        return self.from_node.outputs[self.from_index]
+
+    @property
+    def to_socket(self) -> NTP_SocketIR:
+        return self.to_node.inputs[self.to_index]
+
+
+class NTP_TreeIR:
+    """
+    Nodes and links of a node tree, in the order they're generated
+    """
+    __slots__ = ("nodes", "layout", "links", "_nodes_by_pointer")
+
+    def __init__(self, node_tree: NodeTree, read_unavailable: bool = True):
+        """
+        Reads a node tree
+
+        Parameters:
+        node_tree (NodeTree): node tree to read
+        read_unavailable (bool): whether to read default values of sockets
+            that are unavailable
+        """
+        self.nodes: list[NTP_NodeIR] = []
+
+        nodes = node_tree.nodes
+        self.layout: NTP_LayoutIR = NTP_LayoutIR(nodes)
+        mute = self.layout.mute.tolist()
+        hide = self.layout.hide.tolist()
+
+        # Node pointer->node IR pairs, to resolve references between nodes
+        self._nodes_by_pointer: dict[int, NTP_NodeIR] = {}
+
+        # Socket pointer->(node IR, index) pairs, to resolve links. Blender's
+        # socket dictionary doesn't guarantee unique keys, so sockets are
+        # identified by pointer
+        sockets: dict[int, tuple[NTP_NodeIR, int]] = {}
+
+        check_available = (bpy.app.version >= (3, 4, 0)
+                           and not read_unavailable)
+
+        parents: list[tuple[NTP_NodeIR, Node]] = []
+        for i, node in enumerate(nodes):
+            node_ir = NTP_NodeIR(node, bool(mute[i]), bool(hide[i]))
+            self.nodes.append(node_ir)
+            self._nodes_by_pointer[node.as_pointer()] = node_ir
+
+            parent = node.parent
+            if parent is not None:
+                parents.append((node_ir, parent))
+
+            read_defaults = node_ir.bl_idname != 'NodeReroute'
+            inputs = []
+            for i, input in enumerate(node.inputs):
+                input_ir = NTP_SocketIR(input)
+                inputs.append(input_ir)
+                sockets[input.as_pointer()] = (node_ir, i)
+                if (not read_defaults
+                        or input_ir.bl_idname in DONT_SET_DEFAULTS
+                        or input.is_linked
+                        or check_available and input.is_unavailable):
+                    continue
+                input_ir.default_value = read_value(input.default_value)
+            node_ir.inputs = tuple(inputs)
+
+            outputs = []
+            for i, output in enumerate(node.outputs):
+                outputs.append(NTP_SocketIR(output))
+                sockets[output.as_pointer()] = (node_ir, i)
+            if outputs and node_ir.bl_idname in OUTPUT_DEFAULT_NODES:
+                outputs[0].default_value = read_value(
+                    node.outputs[0].default_value)
+            node_ir.outputs = tuple(outputs)
+
+        for node_ir, parent in parents:
+            node_ir.parent = self.find(parent)
+
+        self.links: list[NTP_LinkIR] = self._read_links(node_tree, sockets)
+
+    def _read_links(self, node_tree: NodeTree,
+                    sockets: dict[int, tuple[NTP_NodeIR, int]]
+                    ) -> list[NTP_LinkIR]:
+        """
+        Reads the links of the node tree, sorted so links into multi input
+        sockets are created in the right order
+        """
+        links = node_tree.links
+        if links and hasattr(links[0], "multi_input_sort_id"):
+            links = sorted(links, key=lambda link: link.multi_input_sort_id)
+
+        link_irs = []
+        for link in links:
+            from_node, from_index = sockets[link.from_socket.as_pointer()]
+            to_node, to_index = sockets[link.to_socket.as_pointer()]
+            link_irs.append(NTP_LinkIR(from_node, from_index,
+                                       to_node, to_index))
+        return link_irs
+
+    def find(self, node: Node) -> NTP_NodeIR:
+        """
+        Finds the IR of one of the tree's nodes
+
+        Parameters:
+        node (Node): Blender node
+
+        Returns:
+        (NTP_NodeIR): the node's IR
+        """
+        return self._nodes_by_pointer[node.as_pointer()]
@@ -1,5 +1,7 @@
 import bpy
 
+from types import SimpleNamespace
+
 class NTPOptions(bpy.types.PropertyGroup):
     """
     Property group used during conversion of node group to python
@@ -35,6 +37,37 @@ class NTPOptions(bpy.types.PropertyGroup):
         default = 'SPACES_4'
     )
 
+    output_format: bpy.props.EnumProperty(
+        name = "Output Format",
+        description = "How the generated code builds node trees",
+        items = [
+            ('STATEMENTS', "Statements", 
+             "Set every node property with its own statement"),
+            ('TABLES', "Tables", 
+             "Describe nodes, settings, defaults, and links with compact data "
+             "tables built by a small loader")
+        ],
+        default = 'STATEMENTS'
+    )
+
+    bulk_layout : bpy.props.BoolProperty(
+        name = "Bulk layout",
+        description = "Set the locations and dimensions of all nodes of a "
+                      "node tree with one foreach_set call each, which runs "
+                      "faster for large node trees",
+        default = False
+    )
+
+    reuse_node_groups : bpy.props.BoolProperty(
+        name = "Reuse node groups",
+        description = "Stamp generated node groups with a hash of their "
+                      "contents, and reuse ones already built by an earlier "
+                      "run of the generated code instead of building copies, "
+                      "unless they were renamed or had nodes, links, or "
+                      "sockets added or removed since",
+        default = False
+    )
+
     if bpy.app.version >= (3, 4, 0):
         set_unavailable_defaults : bpy.props.BoolProperty(
             name = "Set unavailable defaults",
@@ -42,6 +75,34 @@ class NTPOptions(bpy.types.PropertyGroup):
             default = False
         )
 
+    skip_default_values : bpy.props.BoolProperty(
+        name = "Skip default values",
+        description = "Leave out settings and socket values that new nodes "
+                      "already have",
+        default = False
+    )
+    use_export_cache : bpy.props.BoolProperty(
+        name = "Use export cache",
+        description = "Reuse code generated for node trees, and image files "
+                      "saved for add-ons, that haven't changed since a "
+                      "previous export",
+        default = False
+    )
+    cache_dir : bpy.props.StringProperty(
+        name = "Cache Location",
+        subtype='DIR_PATH',
+        description="Directory to keep the export cache in. Uses the "
+                    "system's temporary directory if empty",
+        default = ""
+    )
+    profile : bpy.props.BoolProperty(
+        name = "Profile",
+        description = "Time each phase of the export and count the Blender "
+                      "data it reads. Reported in the Info editor and saved "
+                      "as JSON to the save location",
+        default = False
+    )
+
     #Script properties
     include_imports : bpy.props.BoolProperty(
         name = "Include imports",
@@ -161,6 +222,43 @@ class NTPOptions(bpy.types.PropertyGroup):
         description="Custom category",
         default = ""
     )
+    compression_level: bpy.props.IntProperty(
+        name = "Compression Level",
+        description = "Zip compression level of the add-on, from 1 (fastest) "
+                      "to 9 (smallest). 0 stores files without compressing "
+                      "them",
+        default = 6,
+        min = 0,
+        max = 9
+    )
+
+def options_from_dict(values: dict) -> SimpleNamespace:
+    """
+    Creates options from a dictionary instead of the scene's property group,
+    e.g. for headless conversions. Options that aren't given keep their
+    default values
+
+    Parameters:
+    values (dict): option name -> value pairs
+
+    Returns:
+    (SimpleNamespace): object with an attribute for every option
+    """
+    options = {}
+    for prop in NTPOptions.bl_rna.properties:
+        if prop.identifier == "rna_type":
+            continue
+        if getattr(prop, "is_array", False):
+            options[prop.identifier] = tuple(prop.default_array)
+        else:
+            options[prop.identifier] = prop.default
+
+    unknown = [name for name in values if name not in options]
+    if unknown:
+        raise ValueError(f"Unknown options {', '.join(sorted(unknown))}")
+
+    options.update(values)
+    return SimpleNamespace(**options)
 
 class NTPOptionsPanel(bpy.types.Panel):
     bl_label = "Options"
@@ -182,15 +280,25 @@ class NTPOptionsPanel(bpy.types.Panel):
             "mode",
             "include_group_socket_values",
             "set_dimensions", 
-            "indentation_type"
+            "indentation_type",
+            "output_format",
+            "bulk_layout",
+            "reuse_node_groups"
         ]
         if bpy.app.version >= (3, 4, 0):
             option_list.append("set_unavailable_defaults")
+        option_list.append("skip_default_values")
+        option_list.append("use_export_cache")
+        if ntp_options.use_export_cache:
+            option_list.append("cache_dir")
+        option_list.append("profile")
         
         if ntp_options.mode == 'SCRIPT':
             script_options = [
                 "include_imports"
             ]
+            if ntp_options.profile:
+                script_options.append("dir_path")
             option_list += script_options
         elif ntp_options.mode == 'ADDON':
             addon_options = [
@@ -208,6 +316,7 @@ class NTPOptionsPanel(bpy.types.Panel):
             option_list += addon_options
             if ntp_options.category == 'CUSTOM':
                 option_list.append("custom_category")
+            option_list.append("compression_level")
 
         for option in option_list:
             layout.prop(ntp_options, option)
\ No newline at end of file
@@ -1,13 +1,12 @@
 import bpy
-from bpy.types import Node
 from bpy.types import ShaderNodeTree
 
-from io import StringIO
-
 from ..utils import *
+from ..ntp_emitter import NTP_Emitter
 from ..ntp_operator import NTP_Operator
 from ..ntp_node_tree import NTP_NodeTree
-from ..node_settings import node_settings
+from ..ntp_tree_ir import NTP_NodeIR
+from ..node_settings import get_node_settings
 
 MAT_VAR = "mat"
 NODE = "node"
@@ -20,12 +19,18 @@ class NTPShaderOperator(NTP_Operator):
     
     #TODO: add option for general shader node groups
     material_name: bpy.props.StringProperty(name="Node Group")
+    options_json: bpy.props.StringProperty(
+        name="Options JSON",
+        description="Options as a JSON object, used instead of the scene's "
+                    "NodeToPython options",
+        options={'HIDDEN', 'SKIP_SAVE'}
+    )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._node_infos = node_settings
+        self._node_infos = get_node_settings('ShaderNodeTree')
         for name in SHADER_OP_RESERVED_NAMES:
-            self._used_vars[name] = 0
+            self._identifiers.reserve(name)
 
     def _setup_addon_zip_name(self, name: str) -> str:
         """
@@ -34,9 +39,9 @@ class NTPShaderOperator(NTP_Operator):
         return name
     
     def _create_material(self, indent_level: int):
-        self._write(f"{MAT_VAR} = bpy.data.materials.new("
-                    f"name = {str_to_py_str(self.material_name)})", indent_level)
-        self._write(f"{MAT_VAR}.use_nodes = True", indent_level)
+        self._emitter.write(f"{MAT_VAR} = bpy.data.materials.new("
+                            f"name = {str_to_py_str(self.material_name)})", indent_level)
+        self._emitter.write(f"{MAT_VAR}.use_nodes = True", indent_level)
 
     def _initialize_shader_node_tree(self, ntp_node_tree: NTP_NodeTree, 
                                     nt_name: str) -> None:
@@ -48,26 +53,24 @@ class NTPShaderOperator(NTP_Operator):
             variable to use
         nt_name (str): name to use for the node tree
         """
-        self._write(f"#initialize {nt_name} node group", self._outer_indent_level)
-        self._write(f"def {ntp_node_tree.var}_node_group():\\n", self._outer_indent_level)
+        self._emitter.write(f"#initialize {nt_name} node group", self._outer_indent_level)
+        self._emitter.write(f"def {ntp_node_tree.var}_node_group():\n", self._outer_indent_level)
 
         if ntp_node_tree.node_tree == self._base_node_tree:
-            self._write(f"{ntp_node_tree.var} = {MAT_VAR}.node_tree")
-            self._write(f"#start with a clean node tree")
-            self._write(f"for {NODE} in {ntp_node_tree.var}.nodes:")
-            self._write(f"{ntp_node_tree.var}.nodes.remove({NODE})", self._inner_indent_level + 1)
+            self._emitter.write(f"{ntp_node_tree.var} = {MAT_VAR}.node_tree")
+            self._emitter.write(f"#start with a clean node tree")
+            self._emitter.write(f"{ntp_node_tree.var}.nodes.clear()")
         else:
-            self._write((f"{ntp_node_tree.var} = bpy.data.node_groups.new("
-                         f"type = \'ShaderNodeTree\', "
-                         f"name = {str_to_py_str(nt_name)})"))
-            self._write("", 0)
+            self._new_node_group(ntp_node_tree.var, 'ShaderNodeTree',
+                                 nt_name)
+            self._emitter.write("", 0)
 
-    def _process_node(self, node: Node, ntp_nt: NTP_NodeTree) -> None:
+    def _process_node(self, node: NTP_NodeIR, ntp_nt: NTP_NodeTree) -> None:
         """
         Create node and set settings, defaults, and cosmetics
 
         Parameters:
-        node (Node): node to process
+        node (NTP_NodeIR): node to process
         ntp_nt (NTP_NodeTree): the node tree that node belongs to
         """
         node_var: str = self._create_node(node, ntp_nt.var)
@@ -85,6 +88,10 @@ class NTPShaderOperator(NTP_Operator):
         self._hide_hidden_sockets(node)
         self._set_socket_defaults(node)
 
+    def _cache_key_context(self, node_tree: ShaderNodeTree) -> tuple:
+        # the material's node tree is generated under the material's name
+        return (node_tree == self._base_node_tree, self.material_name)
+
     def _process_node_tree(self, node_tree: ShaderNodeTree) -> None:
         """
         Generates a Python function to recreate a node tree
@@ -105,6 +112,7 @@ class NTPShaderOperator(NTP_Operator):
         self._node_tree_vars[node_tree] = nt_var
 
         ntp_nt = NTP_NodeTree(node_tree, nt_var)
+        self._read_node_tree(ntp_nt)
 
         self._initialize_shader_node_tree(ntp_nt, nt_name)
 
@@ -114,27 +122,30 @@ class NTPShaderOperator(NTP_Operator):
             self._tree_interface_settings(ntp_nt)
 
         #initialize nodes
-        self._write(f"#initialize {nt_var} nodes")
+        self._emitter.write(f"#initialize {nt_var} nodes")
+        self._start_node_table(nt_var)
 
-        for node in node_tree.nodes:
+        for node in ntp_nt.ir.nodes:
             self._process_node(node, ntp_nt)
 
+        self._write_node_table(nt_var)
+
         #set look of nodes
-        self._set_parents(node_tree)
-        self._set_locations(node_tree)
-        self._set_dimensions(node_tree)
+        self._set_parents(ntp_nt)
+        self._set_locations(ntp_nt)
+        self._set_dimensions(ntp_nt)
 
         #create connections
-        self._init_links(node_tree)
+        self._init_links(ntp_nt)
         
-        self._write(f"return {nt_var}\\n")
+        self._end_node_group(nt_var)
 
         #create node group
-        self._write(f"{nt_var} = {nt_var}_node_group()\\n", self._outer_indent_level)
+        self._emitter.write(f"{nt_var} = {nt_var}_node_group()\n", self._outer_indent_level)
         
 
     def execute(self, context):
-        if not self._setup_options(context.scene.ntp_options):
+        if not self._setup_options(self._get_options(context)):
             return {'CANCELLED'}
         
         #find node group to replicate
@@ -151,20 +162,25 @@ class NTPShaderOperator(NTP_Operator):
             self._outer_indent_level = 2
             self._inner_indent_level = 3
 
-            if not self._setup_addon_directories(context, mat_var):
+            if not self._setup_addon_zip(context, mat_var):
                 return {'CANCELLED'}
 
-            self._file = open(f"{self._addon_dir}/__init__.py", "w")
+            file = self._addon_zip.open_text("__init__.py")
+            self._emitter = NTP_Emitter(file, self._indentation,
+                                        self._inner_indent_level)
 
-            self._create_header(mat_var)
+            self._create_header(self.material_name)
+            self._create_loader()
             self._class_name = clean_string(mat_var, lower=False)
             self._init_operator(mat_var, mat_var)
 
-            self._write("def execute(self, context):", 1)
+            self._emitter.write("def execute(self, context):", 1)
         else:
-            self._file = StringIO("")
+            self._emitter = NTP_Emitter(None, self._indentation,
+                                        self._inner_indent_level)
             if self._include_imports:
-                self._file.write("import bpy, mathutils\\n\\n")
+                self._emitter.write("import bpy, mathutils\n", 0)
+            self._create_loader()
 
         if self._mode == 'ADDON':
             self._create_material(2)
@@ -174,64 +190,26 @@ class NTPShaderOperator(NTP_Operator):
         node_trees_to_process = self._topological_sort(self._base_node_tree)
 
         for node_tree in node_trees_to_process:
-            self._process_node_tree(node_tree)
+            self._process_node_tree_cached(node_tree)
 
         if self._mode == 'ADDON':
-            self._write("return {'FINISHED'}", self._outer_indent_level)
+            self._emitter.write("return {'FINISHED'}", self._outer_indent_level)
             self._create_menu_func()
             self._create_register_func()
             self._create_unregister_func()
             self._create_main_func()
-            self._create_license()
-            if bpy.app.version >= (4, 2, 0):
-                self._create_manifest()
         else:
-            context.window_manager.clipboard = self._file.getvalue()
+            context.window_manager.clipboard = self._emitter.getvalue()
 
-        self._file.close()
+        self._emitter.close()
         
         if self._mode == 'ADDON':
+            self._write_images()
+            self._create_license()
+            if bpy.app.version >= (4, 2, 0):
+                self._create_manifest()
             self._zip_addon()
 
         self._report_finished("material")
 
         return {'FINISHED'}
-    
-    def _create_var(self, name: str) -> str:
-        """
-        Creates a variable name
-        """
-        if name in self._used_vars:
-            self._used_vars[name] += 1
-            var = f"{name}_{self._used_vars[name]}"
-        else:
-            self._used_vars[name] = 0
-            var = name
-        return var
-
-    def _create_header(self, name: str):
-        """
-        Creates the header for the add-on
-        """
-        self._write("bl_info = {", 0)
-        self._write(f'    "name" : {str_to_py_str(name)},', 1)
-        self._write(f'    "description" : {str_to_py_str(name)},', 1)
-        self._write('    "author" : "Rexami",', 1)
-        self._write('    "version" : (1, 0, 0),', 1)
-        self._write('    "blender" : (4, 4, 0),', 1)
-        self._write('    "location" : "Node",', 1)
-        self._write('    "category" : "Node",', 1)
-        self._write("}", 0)
-        self._write("", 0)
-        self._write("import bpy", 0)
-        self._write("import mathutils", 0)
-        self._write("import os", 0)
-        self._write("", 0)
-
-    def _write(self, string: str, indent_level: int = 0):
-        """
-        Writes a string to the file with the correct indentation
-        """
-        if not string.endswith("\\n"):
-            string += "\\n"
-        self._file.write(f"{'    ' * indent_level}{string}")
\ No newline at end of file
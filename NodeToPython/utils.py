@@ -7,6 +7,8 @@ from bpy.types import bpy_prop_array
 import keyword
 import re
 
+# Characters that can't be used in a variable or file name
+_INVALID_CHARS = re.compile(r"[^a-zA-Z0-9]")
 
 def clean_string(string: str, lower: bool = True) -> str:
     """
@@ -21,16 +23,16 @@ def clean_string(string: str, lower: bool = True) -> str:
 
     if lower:
         string = string.lower()
-    string = re.sub(r"[^a-zA-Z0-9]", '', string)
+    string = _INVALID_CHARS.sub('', string)
+    if not string:
+        return string
 
     if keyword.iskeyword(string):
         string = "_" + string
     elif not (string[0].isalpha() or string[0] == '_') and not string[0].isdigit():
         string = "_" + string
 
-    if string:
-        string = "ntp_" + string
-    return string
+    return "ntp_" + string
 
 def enum_to_py_str(enum: str) -> str:
     """
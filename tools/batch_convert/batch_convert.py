@@ -0,0 +1,181 @@
+"""
+Converts the node trees of many .blend files into add-ons, running several
+background Blender processes at once
+
+usage: python batch_convert.py [-h] [--blender BLENDER] [--jobs JOBS] ...
+    files [files ...]
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKER = os.path.join(TOOLS_DIR, "worker.py")
+REPO_DIR = os.path.dirname(os.path.dirname(TOOLS_DIR))
+
+TREE_TYPES = ["geometry", "shader", "compositor"]
+
+
+def find_blend_files(paths: list[str]) -> list[str]:
+    """
+    Expands directories into the .blend files they contain
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files += [os.path.join(root, name) for name in sorted(names)
+                          if name.endswith(".blend")]
+        else:
+            files.append(path)
+    return [os.path.abspath(file) for file in files]
+
+
+def output_dirs(files: list[str], output_dir: str) -> list[str]:
+    """
+    Gives each file its own output directory, named after the file
+    """
+    dirs = []
+    used: dict[str, int] = {}
+    for file in files:
+        name = os.path.splitext(os.path.basename(file))[0]
+        if name in used:
+            used[name] += 1
+            name = f"{name}_{used[name]}"
+        else:
+            used[name] = 0
+        dirs.append(os.path.join(output_dir, name))
+    return dirs
+
+
+def convert(file: str, file_output_dir: str, args: argparse.Namespace,
+            options: dict) -> dict:
+    """
+    Converts a single file in a new Blender process
+
+    Returns:
+    (dict): the file's manifest
+    """
+    os.makedirs(file_output_dir, exist_ok=True)
+    manifest_path = os.path.join(file_output_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    job = {
+        "file": file,
+        "output_dir": file_output_dir,
+        "manifest": manifest_path,
+        "options": options,
+        "types": args.types,
+        "library": args.library,
+        "module": args.module,
+        "addon_dir": args.addon_dir,
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False,
+                                     encoding="utf-8") as job_file:
+        json.dump(job, job_file)
+
+    command = [args.blender, "--background", file, "--python-exit-code", "1",
+               "--python", WORKER, "--", job_file.name]
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(command, capture_output=True, text=True,
+                                 timeout=args.timeout)
+        returncode = process.returncode
+        log = process.stdout + process.stderr
+    except subprocess.TimeoutExpired:
+        returncode = None
+        log = f"Timed out after {args.timeout} seconds"
+    finally:
+        os.remove(job_file.name)
+    seconds = time.perf_counter() - start
+
+    manifest = {"file": file, "exports": []}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as file_manifest:
+            manifest = json.load(file_manifest)
+    manifest["returncode"] = returncode
+    manifest["process_seconds"] = seconds
+    manifest["output_dir"] = file_output_dir
+    if returncode != 0:
+        manifest["log"] = log[-4000:]
+    return manifest
+
+
+def succeeded(manifest: dict) -> bool:
+    return (manifest["returncode"] == 0 and
+            all(export["result"] == ['FINISHED']
+                for export in manifest["exports"]))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert the node trees of many .blend files into add-ons")
+    parser.add_argument("files", nargs="+",
+                        help=".blend files, or directories to search for them")
+    parser.add_argument("-o", "--output-dir", default="ntp_output",
+                        help="directory to write the add-ons and manifests to")
+    parser.add_argument("--blender", default="blender",
+                        help="Blender executable")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of Blender processes to run at once")
+    parser.add_argument("--options",
+                        help="JSON file with NodeToPython options, using the "
+                             "names of the options property group")
+    parser.add_argument("--types", nargs="+", choices=TREE_TYPES,
+                        default=TREE_TYPES, help="node tree types to convert")
+    parser.add_argument("--library", action="store_true",
+                        help="convert all geometry node groups of a file "
+                             "into a single add-on")
+    parser.add_argument("--module", default="NodeToPython",
+                        help="module name NodeToPython is enabled under")
+    parser.add_argument("--addon-dir", default=REPO_DIR,
+                        help="directory to import NodeToPython from if it "
+                             "isn't installed")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="seconds before a Blender process is stopped")
+    args = parser.parse_args()
+
+    options = {}
+    if args.options:
+        with open(args.options, "r", encoding="utf-8") as file:
+            options = json.load(file)
+
+    files = find_blend_files(args.files)
+    output_dir = os.path.abspath(args.output_dir)
+    dirs = output_dirs(files, output_dir)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        manifests = list(pool.map(
+            lambda file_dir: convert(*file_dir, args, options),
+            zip(files, dirs)))
+    seconds = time.perf_counter() - start
+
+    failed = [manifest["file"] for manifest in manifests
+              if not succeeded(manifest)]
+    summary = {
+        "seconds": seconds,
+        "jobs": args.jobs,
+        "files": manifests,
+        "failed": failed,
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "manifest.json"), "w",
+              encoding="utf-8") as file:
+        json.dump(summary, file, indent=4)
+
+    print(f"Converted {len(files) - len(failed)} of {len(files)} files in "
+          f"{seconds:.1f} seconds")
+    for file in failed:
+        print(f"Failed: {file}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Converts the node trees of one .blend file inside a background Blender
+process, writing a manifest with the results. Started by batch_convert.py:
+
+    blender --background <file> --python worker.py -- <job.json>
+"""
+import bpy
+import addon_utils
+
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+
+
+def setup_addon(job: dict) -> None:
+    """
+    Makes sure NodeToPython is registered in this Blender process
+    """
+    if hasattr(bpy.types, "NODE_OT_ntp_geo_nodes"):
+        return
+    if job["addon_dir"] and job["addon_dir"] not in sys.path:
+        sys.path.insert(0, job["addon_dir"])
+    addon_utils.enable(job["module"], default_set=False, persistent=True)
+    if not hasattr(bpy.types, "NODE_OT_ntp_geo_nodes"):
+        raise RuntimeError(f"Couldn't enable NodeToPython as {job['module']}")
+
+
+def list_exports(job: dict) -> list[tuple[str, str, dict]]:
+    """
+    Finds what to convert in the open file
+
+    Returns:
+    (list[tuple[str, str, dict]]): (tree type, name, operator properties)
+        for each conversion
+    """
+    exports = []
+    if "geometry" in job["types"]:
+        geo_names = [node_tree.name for node_tree in bpy.data.node_groups
+                     if node_tree.bl_idname == 'GeometryNodeTree']
+        if job["library"]:
+            if geo_names:
+                name = os.path.splitext(os.path.basename(job["file"]))[0]
+                exports.append(("geometry", name,
+                                {"library_name": name}))
+        else:
+            exports += [("geometry", name, {"geo_nodes_group_name": name})
+                        for name in geo_names]
+    if "shader" in job["types"]:
+        exports += [("shader", mat.name, {"material_name": mat.name})
+                    for mat in bpy.data.materials
+                    if mat.use_nodes and mat.node_tree is not None]
+    if "compositor" in job["types"]:
+        exports += [("compositor", scene.name,
+                     {"compositor_name": scene.name, "is_scene": True})
+                    for scene in bpy.data.scenes
+                    if scene.use_nodes and scene.node_tree is not None]
+    return exports
+
+
+def get_operator(tree_type: str, library: bool):
+    if tree_type == "geometry":
+        if library:
+            return bpy.ops.node.ntp_geo_nodes_batch
+        return bpy.ops.node.ntp_geo_nodes
+    elif tree_type == "shader":
+        return bpy.ops.node.ntp_material
+    return bpy.ops.node.ntp_compositor
+
+
+def list_outputs(dir_path: str) -> set[str]:
+    outputs = set()
+    for root, _, files in os.walk(dir_path):
+        for file in files:
+            outputs.add(os.path.relpath(os.path.join(root, file), dir_path))
+    return outputs
+
+
+def run(job: dict) -> dict:
+    """
+    Runs every conversion of a job
+
+    Returns:
+    (dict): the manifest for the file
+    """
+    setup_addon(job)
+    ntp_operator = importlib.import_module(f"{job['module']}.ntp_operator")
+
+    manifest = {
+        "file": job["file"],
+        "blender_version": list(bpy.app.version),
+        "exports": [],
+    }
+    for tree_type, name, props in list_exports(job):
+        dir_path = os.path.join(job["output_dir"], tree_type)
+        options = dict(job["options"], mode='ADDON', dir_path=dir_path)
+        os.makedirs(dir_path, exist_ok=True)
+        before = list_outputs(dir_path)
+
+        start = time.perf_counter()
+        try:
+            operator = get_operator(tree_type, job["library"])
+            result = sorted(operator(options_json=json.dumps(options),
+                                     **props))
+        except RuntimeError:
+            # operators that report an error raise, the report is kept
+            result = ["ERROR"]
+        except Exception:
+            result = ["EXCEPTION"]
+            ntp_operator.NTP_Operator.last_reports.append(
+                ('ERROR', traceback.format_exc()))
+        seconds = time.perf_counter() - start
+
+        manifest["exports"].append({
+            "type": tree_type,
+            "name": name,
+            "result": result,
+            "seconds": seconds,
+            "outputs": sorted(os.path.join(tree_type, output) for output in
+                              list_outputs(dir_path) - before),
+            "reports": [list(report) for report in
+                        ntp_operator.NTP_Operator.last_reports],
+        })
+        ntp_operator.NTP_Operator.last_reports = []
+    return manifest
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:]
+    with open(argv[0], "r", encoding="utf-8") as file:
+        job = json.load(file)
+
+    start = time.perf_counter()
+    manifest = run(job)
+    manifest["seconds"] = time.perf_counter() - start
+
+    with open(job["manifest"], "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Reports how many statements leaving out default values saves on the node
+trees of a .blend file: each geometry node group, material, and compositor
+node tree is exported as an add-on with Skip default values off and on, and
+the statements in the generated code are counted.
+
+Run from Blender with NodeToPython enabled:
+    blender --background file.blend \
+        --python tools/benchmarks/default_values.py -- [module] [--json file]
+
+where module is the add-on's module name (default "NodeToPython"; extensions
+are installed as e.g. "bl_ext.user_default.node_to_python").
+"""
+import bpy
+
+import argparse
+import ast
+import json
+import os
+import sys
+import tempfile
+import zipfile
+
+import addon_utils
+
+
+def list_exports() -> list[tuple[str, str, dict]]:
+    """
+    Returns:
+    (list[tuple[str, str, dict]]): (operator, name, operator properties) for
+        each node tree in the file
+    """
+    exports = [("ntp_geo_nodes", node_tree.name,
+                {"geo_nodes_group_name": node_tree.name})
+               for node_tree in bpy.data.node_groups
+               if node_tree.bl_idname == 'GeometryNodeTree']
+    exports += [("ntp_material", mat.name, {"material_name": mat.name})
+                for mat in bpy.data.materials if mat.node_tree is not None]
+    exports += [("ntp_compositor", scene.name,
+                 {"compositor_name": scene.name, "is_scene": True})
+                for scene in bpy.data.scenes
+                if getattr(scene, "node_tree", None) is not None]
+    return exports
+
+
+def export(operator: str, props: dict, skip_default_values: bool) -> str:
+    """
+    Returns:
+    (str): the generated __init__.py, or None if the export failed
+    """
+    with tempfile.TemporaryDirectory() as dir_path:
+        options = {"mode": 'ADDON', "dir_path": dir_path,
+                   "skip_default_values": skip_default_values}
+        try:
+            result = getattr(bpy.ops.node, operator)(
+                options_json=json.dumps(options), **props)
+        except RuntimeError as e:
+            print(e)
+            return None
+        if result != {'FINISHED'}:
+            return None
+        zip_path = [os.path.join(dir_path, file)
+                    for file in os.listdir(dir_path)
+                    if file.endswith(".zip")][0]
+        with zipfile.ZipFile(zip_path) as zip_file:
+            init_name = [name for name in zip_file.namelist()
+                         if name.endswith("__init__.py")][0]
+            return zip_file.read(init_name).decode()
+
+
+def count_statements(source: str) -> int:
+    return sum(isinstance(node, ast.stmt)
+               for node in ast.walk(ast.parse(source)))
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="default_values.py")
+    parser.add_argument("module", nargs="?", default="NodeToPython")
+    parser.add_argument("--json", help="file to save the results to")
+    args = parser.parse_args(argv)
+    addon_utils.enable(args.module)
+
+    results = []
+    print(f"{'node tree':<32} {'statements':>10} {'skipped':>10} "
+          f"{'saved':>7}")
+    for operator, name, props in list_exports():
+        full_source = export(operator, props, False)
+        skipped_source = export(operator, props, True)
+        if full_source is None or skipped_source is None:
+            print(f"{name[:32]:<32} failed")
+            continue
+        full = count_statements(full_source)
+        skipped = count_statements(skipped_source)
+        saved = 1 - skipped / full if full else 0.0
+        results.append({"operator": operator, "name": name,
+                        "statements": full, "skipped": skipped})
+        print(f"{name[:32]:<32} {full:>10} {skipped:>10} {saved:>7.1%}")
+
+    full = sum(result["statements"] for result in results)
+    skipped = sum(result["skipped"] for result in results)
+    if full:
+        print(f"{'total':<32} {full:>10} {skipped:>10} "
+              f"{1 - skipped / full:>7.1%}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"blend_file": bpy.data.filepath,
+                       "blender_version": list(bpy.app.version),
+                       "node_trees": results}, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
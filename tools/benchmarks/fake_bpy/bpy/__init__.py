@@ -0,0 +1,41 @@
+"""
+Minimal stand-in for Blender's bpy module, sufficient to drive the
+NodeToPython operators outside Blender
+"""
+import os
+import sys
+import types as _pytypes
+
+from . import types
+from . import props
+
+app = _pytypes.SimpleNamespace(version=(4, 3, 0), background=True)
+
+path = _pytypes.SimpleNamespace(abspath=lambda p: os.path.abspath(p))
+
+utils = _pytypes.SimpleNamespace(
+    register_class=lambda cls: None,
+    unregister_class=lambda cls: None,
+)
+
+
+class _Data:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.node_groups = types.BlendDataNodeTrees()
+        self.materials = types.bpy_prop_collection()
+        self.scenes = types.bpy_prop_collection()
+        self.objects = types.bpy_prop_collection()
+        self.images = types.bpy_prop_collection()
+        self.collections = types.bpy_prop_collection()
+        self.textures = types.bpy_prop_collection()
+
+
+data = _Data()
+
+context = _pytypes.SimpleNamespace(
+    scene=None,
+    window_manager=_pytypes.SimpleNamespace(clipboard=""),
+)
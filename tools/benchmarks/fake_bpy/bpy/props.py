@@ -0,0 +1,27 @@
+"""
+Property definitions only need to exist; they're never evaluated
+"""
+
+
+class _DeferredProperty:
+    def __init__(self, function, **keywords):
+        self.function = function
+        self.keywords = keywords
+
+
+def _make(name):
+    def prop(**keywords):
+        return _DeferredProperty(name, **keywords)
+    prop.__name__ = name
+    return prop
+
+
+BoolProperty = _make("BoolProperty")
+IntProperty = _make("IntProperty")
+FloatProperty = _make("FloatProperty")
+StringProperty = _make("StringProperty")
+EnumProperty = _make("EnumProperty")
+IntVectorProperty = _make("IntVectorProperty")
+FloatVectorProperty = _make("FloatVectorProperty")
+PointerProperty = _make("PointerProperty")
+CollectionProperty = _make("CollectionProperty")
@@ -0,0 +1,546 @@
+"""
+Stand-ins for the bpy.types structs NodeToPython touches. Any other
+attribute of this module is created on demand as an empty struct subclass,
+so version-gated imports and isinstance checks keep working
+"""
+import sys
+
+import mathutils
+
+
+class bpy_struct:
+    def as_pointer(self) -> int:
+        return id(self)
+
+    def get(self, key, default=None):
+        return getattr(self, "_id_props", {}).get(key, default)
+
+    def __getitem__(self, key):
+        return self._id_props[key]
+
+    def __setitem__(self, key, value):
+        if not hasattr(self, "_id_props"):
+            self._id_props = {}
+        self._id_props[key] = value
+
+    @property
+    def bl_rna(self):
+        keys = tuple(k for k in self.__dict__ if not k.startswith("_"))
+        props = []
+        for k in keys:
+            v = self.__dict__[k]
+            if isinstance(v, bpy_prop_collection):
+                t = 'COLLECTION'
+            elif isinstance(v, bpy_struct):
+                t = 'POINTER'
+            else:
+                t = 'FLOAT'
+            props.append(_Prop(k, t))
+        return _Prop(f"{type(self).__name__}:{hash(tuple(props))}", None,
+                     props)
+
+
+class _Prop:
+    def __init__(self, identifier, type, properties=()):
+        self.identifier = identifier
+        self.type = type
+        self.properties = properties
+        self.is_readonly = False
+
+    def __hash__(self):
+        return hash((self.identifier, self.type))
+
+    def __eq__(self, other):
+        return (self.identifier, self.type) == (other.identifier, other.type)
+
+
+class bpy_prop_array(tuple):
+    def foreach_get(self, seq) -> None:
+        for i, value in enumerate(self):
+            seq[i] = value
+
+
+class bpy_prop_collection:
+    def __init__(self, items=None):
+        self._items = list(items) if items else []
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return len(self._items) > 0
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for item in self._items:
+                if item.name == key:
+                    return item
+            raise KeyError(key)
+        return self._items[key]
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return any(item.name == key for item in self._items)
+        return key in self._items
+
+    def get(self, key, default=None):
+        for item in self._items:
+            if item.name == key:
+                return item
+        return default
+
+    def items(self):
+        return [(getattr(item, "name", ""), item) for item in self._items]
+
+    def keys(self):
+        return [getattr(item, "name", "") for item in self._items]
+
+    def values(self):
+        return list(self._items)
+
+    def find(self, key) -> int:
+        for i, item in enumerate(self._items):
+            if item.name == key:
+                return i
+        return -1
+
+    def append(self, item):
+        self._items.append(item)
+        return item
+
+    def remove(self, item):
+        self._items.remove(item)
+
+    def clear(self):
+        self._items.clear()
+
+    def foreach_get(self, attr: str, seq) -> None:
+        i = 0
+        for item in self._items:
+            value = getattr(item, attr)
+            if isinstance(value, (tuple, list)):
+                for component in value:
+                    seq[i] = component
+                    i += 1
+            else:
+                seq[i] = value
+                i += 1
+
+    def foreach_set(self, attr: str, seq) -> None:
+        i = 0
+        for item in self._items:
+            current = getattr(item, attr)
+            if isinstance(current, (tuple, list)):
+                n = len(current)
+                value = type(current)(seq[i:i + n])
+                i += n
+            else:
+                value = seq[i]
+                i += 1
+            setattr(item, attr, value)
+
+
+class ID(bpy_struct):
+    def __init__(self, name: str = ""):
+        self.name = name
+        self.use_fake_user = False
+
+
+class Operator(bpy_struct):
+    def __init__(self, *args, **kwargs):
+        self.reports: list[tuple[set, str]] = []
+
+    def report(self, type, message):
+        self.reports.append((type, message))
+
+
+class PropertyGroup(bpy_struct):
+    pass
+
+
+class Panel(bpy_struct):
+    pass
+
+
+class Menu(bpy_struct):
+    pass
+
+
+class Context(bpy_struct):
+    pass
+
+
+class Image(ID):
+    def __init__(self, name: str = "Image"):
+        super().__init__(name)
+        self.file_format = 'PNG'
+        self.source = 'FILE'
+        self.has_data = True
+        self.filepath = ""
+        self.filepath_raw = ""
+        self.packed_file = None
+        self.is_dirty = False
+        self.alpha_mode = 'STRAIGHT'
+        self.colorspace_settings = _Namespace(name='sRGB')
+        self.size = (4, 4)
+        self.channels = 4
+        self.pixels = bpy_prop_array([0.0] * 64)
+        self.saved_to: list[str] = []
+
+    def save_render(self, filepath: str, scene=None, quality=0):
+        with open(filepath, "wb") as file:
+            file.write(b"\x89PNG fake " + self.name.encode())
+        self.saved_to.append(filepath)
+
+
+class _Namespace(bpy_struct):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class NodeSocket(bpy_struct):
+    def __init__(self, node, bl_idname: str, name: str, identifier: str,
+                 is_output: bool, default_value=None):
+        self.node = node
+        self.bl_idname = bl_idname
+        self.type = 'VALUE'
+        self.name = name
+        self.identifier = identifier
+        self.is_output = is_output
+        self.default_value = default_value
+        self.is_linked = False
+        self.hide = False
+        self.enabled = True
+        self.is_unavailable = False
+        self.is_multi_input = False
+
+
+class NodeSockets(bpy_prop_collection):
+    def __init__(self, node, is_output: bool):
+        super().__init__()
+        self._node = node
+        self._is_output = is_output
+
+    def new(self, type: str, name: str, identifier: str = ""):
+        socket = NodeSocket(self._node, type, name, identifier or name,
+                            self._is_output, _SOCKET_DEFAULTS.get(type))
+        return self.append(socket)
+
+
+_SOCKET_DEFAULTS = {
+    'NodeSocketFloat': 0.0,
+    'NodeSocketFloatFactor': 0.5,
+    'NodeSocketInt': 0,
+    'NodeSocketBool': False,
+    'NodeSocketVector': mathutils.Vector((0.0, 0.0, 0.0)),
+    'NodeSocketColor': bpy_prop_array((0.8, 0.8, 0.8, 1.0)),
+    'NodeSocketString': "",
+    'NodeSocketRotation': mathutils.Euler((0.0, 0.0, 0.0)),
+    'NodeSocketMenu': "",
+}
+
+
+class Node(bpy_struct):
+    def __init__(self, name: str = ""):
+        self.bl_idname = type(self).__name__
+        self.name = name
+        self.label = ""
+        self.location = mathutils.Vector((0.0, 0.0))
+        self.width = 140.0
+        self.height = 100.0
+        self.dimensions = mathutils.Vector((140.0, 100.0))
+        self.parent = None
+        self.mute = False
+        self.hide = False
+        self.use_custom_color = False
+        self.color = mathutils.Color((0.6, 0.6, 0.6))
+        self.warning_propagation = 'ALL'
+        self.select = False
+        self.inputs = NodeSockets(self, False)
+        self.outputs = NodeSockets(self, True)
+
+
+class GeometryNode(Node):
+    pass
+
+
+class NodeLink(bpy_struct):
+    def __init__(self, from_socket, to_socket, sort_id: int):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+        self.multi_input_sort_id = sort_id
+        self.is_valid = True
+        self.is_muted = False
+
+
+class Nodes(bpy_prop_collection):
+    def __init__(self, tree):
+        super().__init__()
+        self._tree = tree
+        # names in use, and the next suffix to try for each base name, so
+        # large trees can be built in linear time
+        self._names = set()
+        self._suffixes = {}
+
+    def new(self, type: str):
+        node_cls = getattr(sys.modules[__name__], type)
+        base = type
+        name = base
+        if name in self._names:
+            i = self._suffixes.get(base, 1)
+            name = f"{base}.{i:03d}"
+            while name in self._names:
+                i += 1
+                name = f"{base}.{i:03d}"
+            self._suffixes[base] = i + 1
+        node = node_cls(name)
+        node.id_data = self._tree
+        return self.append(node)
+
+    def append(self, item):
+        self._names.add(item.name)
+        return super().append(item)
+
+    def remove(self, item):
+        self._names.discard(item.name)
+        super().remove(item)
+
+    def clear(self):
+        self._names.clear()
+        super().clear()
+
+
+class NodeLinks(bpy_prop_collection):
+    def __init__(self, items=None):
+        super().__init__(items)
+        # socket id->number of links into the socket
+        self._sort_ids = {}
+
+    def new(self, input, output, verify_limits=True):
+        sort_id = self._sort_ids.get(id(output), 0)
+        self._sort_ids[id(output)] = sort_id + 1
+        link = NodeLink(input, output, sort_id)
+        input.is_linked = True
+        output.is_linked = True
+        return self.append(link)
+
+
+class NodeTreeInterfaceItem(bpy_struct):
+    def __init__(self, name: str = "", parent=None):
+        self.name = name
+        self.parent = parent
+        self.index = 0
+        self.position = 0
+        self.description = ""
+
+
+class NodeTreeInterfacePanel(NodeTreeInterfaceItem):
+    def __init__(self, name: str = "", parent=None):
+        super().__init__(name, parent)
+        self.item_type = 'PANEL'
+        self.default_closed = False
+        self.interface_items = bpy_prop_collection()
+
+
+class NodeTreeInterfaceSocket(NodeTreeInterfaceItem):
+    def __init__(self, name: str = "", parent=None):
+        super().__init__(name, parent)
+        self.item_type = 'SOCKET'
+        self.in_out = 'INPUT'
+        self.bl_socket_idname = type(self).__name__.replace(
+            "NodeTreeInterfaceSocket", "NodeSocket")
+        self.socket_type = self.bl_socket_idname
+        self.default_attribute_name = ""
+        self.attribute_domain = 'POINT'
+        self.hide_value = False
+        self.hide_in_modifier = False
+        self.force_non_field = False
+        self.identifier = ""
+
+
+class NodeTreeInterface(bpy_struct):
+    def __init__(self):
+        self.root = NodeTreeInterfacePanel("")
+        self.root.index = -1
+        self.items_tree = bpy_prop_collection()
+
+    def _add(self, item, parent):
+        item.parent = parent if parent is not None else self.root
+        item.index = len(self.items_tree)
+        self.items_tree.append(item)
+        if parent is not None:
+            parent.interface_items.append(item)
+        return item
+
+    def new_socket(self, name: str, description: str = "",
+                   in_out: str = 'INPUT', socket_type: str = 'NodeSocketFloat',
+                   parent=None):
+        cls_name = socket_type.replace("NodeSocket", "NodeTreeInterfaceSocket")
+        socket = getattr(sys.modules[__name__], cls_name)(name)
+        socket.in_out = in_out
+        socket.description = description
+        socket.identifier = f"Socket_{len(self.items_tree)}"
+        default = _SOCKET_DEFAULTS.get(socket_type)
+        if default is not None:
+            socket.default_value = default
+            if socket_type in {'NodeSocketFloat', 'NodeSocketInt',
+                               'NodeSocketVector'}:
+                socket.min_value = -10000.0
+                socket.max_value = 10000.0
+                socket.subtype = 'NONE'
+        return self._add(socket, parent)
+
+    def new_panel(self, name: str, description: str = "",
+                  default_closed: bool = False, parent=None):
+        panel = NodeTreeInterfacePanel(name)
+        panel.description = description
+        panel.default_closed = default_closed
+        return self._add(panel, parent)
+
+
+class NodeTree(ID):
+    def __init__(self, name: str = ""):
+        super().__init__(name)
+        self.bl_idname = type(self).__name__
+        self.nodes = Nodes(self)
+        self.links = NodeLinks()
+        self.interface = NodeTreeInterface()
+        self.color_tag = 'NONE'
+        self.description = ""
+        self.default_group_node_width = 140
+        self.asset_data = None
+        self.users = 0
+
+
+class GeometryNodeTree(NodeTree):
+    def __init__(self, name: str = ""):
+        super().__init__(name)
+        self.is_modifier = False
+        self.is_tool = False
+
+
+class ShaderNodeTree(NodeTree):
+    pass
+
+
+class CompositorNodeTree(NodeTree):
+    pass
+
+
+class BlendDataNodeTrees(bpy_prop_collection):
+    def new(self, name: str, type: str):
+        base = name
+        i = 1
+        while name in self:
+            name = f"{base}.{i:03d}"
+            i += 1
+        tree = getattr(sys.modules[__name__], type)(name)
+        return self.append(tree)
+
+
+class ColorRampElement(bpy_struct):
+    def __init__(self, position: float, color=(0.0, 0.0, 0.0, 1.0)):
+        self.position = position
+        self.color = bpy_prop_array(color)
+        self.alpha = color[3]
+
+
+class ColorRampElements(bpy_prop_collection):
+    def new(self, position: float):
+        element = ColorRampElement(position)
+        self.append(element)
+        self._items.sort(key=lambda e: e.position)
+        return element
+
+
+class ColorRamp(bpy_struct):
+    def __init__(self):
+        self.color_mode = 'RGB'
+        self.hue_interpolation = 'NEAR'
+        self.interpolation = 'LINEAR'
+        self.elements = ColorRampElements([
+            ColorRampElement(0.0, (0.0, 0.0, 0.0, 1.0)),
+            ColorRampElement(1.0, (1.0, 1.0, 1.0, 1.0)),
+        ])
+
+
+class CurveMapPoint(bpy_struct):
+    def __init__(self, x: float, y: float):
+        self.location = mathutils.Vector((x, y))
+        self.handle_type = 'AUTO'
+        self.select = False
+
+
+class CurveMapPoints(bpy_prop_collection):
+    def new(self, position: float, value: float):
+        return self.append(CurveMapPoint(position, value))
+
+
+class CurveMap(bpy_struct):
+    def __init__(self):
+        self.points = CurveMapPoints([CurveMapPoint(0.0, 0.0),
+                                     CurveMapPoint(1.0, 1.0)])
+
+
+class CurveMapping(bpy_struct):
+    def __init__(self, num_curves: int = 1):
+        self.extend = 'EXTRAPOLATED'
+        self.tone = 'STANDARD'
+        self.black_level = mathutils.Color((0.0, 0.0, 0.0))
+        self.white_level = mathutils.Color((1.0, 1.0, 1.0))
+        self.clip_min_x = 0.0
+        self.clip_min_y = 0.0
+        self.clip_max_x = 1.0
+        self.clip_max_y = 1.0
+        self.use_clip = True
+        self.curves = bpy_prop_collection([CurveMap()
+                                           for _ in range(num_curves)])
+
+    def update(self):
+        pass
+
+
+class ImageUser(bpy_struct):
+    def __init__(self):
+        self.frame_current = 1
+        self.frame_duration = 1
+        self.frame_offset = 0
+        self.frame_start = 1
+        self.tile = 0
+        self.use_auto_refresh = False
+        self.use_cyclic = False
+
+
+def __getattr__(name: str):
+    """
+    Creates any struct type that isn't explicitly modelled above
+    """
+    if name.startswith("__"):
+        raise AttributeError(name)
+    if name.startswith("NodeTreeInterfaceSocket"):
+        base = NodeTreeInterfaceSocket
+    elif name.endswith("NodeTree"):
+        base = NodeTree
+    elif name.startswith("GeometryNode"):
+        base = GeometryNode
+    elif (name.startswith(("ShaderNode", "CompositorNode", "FunctionNode",
+                           "TextureNode"))
+          or name in {"NodeFrame", "NodeGroupInput", "NodeGroupOutput",
+                      "NodeReroute", "NodeGroup"}):
+        base = Node
+    elif name.startswith(("NODE_MT_", "VIEW3D_MT_", "TOPBAR_MT_")):
+        base = Menu
+    else:
+        base = bpy_struct
+    cls = type(name, (base,), {})
+    setattr(sys.modules[__name__], name, cls)
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | {"NODE_MT_add", "VIEW3D_MT_object"})
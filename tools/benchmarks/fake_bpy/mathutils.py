@@ -0,0 +1,37 @@
+class _Seq(tuple):
+    def __new__(cls, values=(0.0, 0.0, 0.0)):
+        return super().__new__(cls, tuple(values))
+
+    @property
+    def x(self):
+        return self[0]
+
+    @property
+    def y(self):
+        return self[1]
+
+    @property
+    def z(self):
+        return self[2]
+
+
+class Vector(_Seq):
+    pass
+
+
+class Euler(_Seq):
+    pass
+
+
+class Color(_Seq):
+    @property
+    def r(self):
+        return self[0]
+
+    @property
+    def g(self):
+        return self[1]
+
+    @property
+    def b(self):
+        return self[2]
@@ -0,0 +1,106 @@
+"""
+Times allocating variable names for generated code, the way NodeToPython did
+before names were allocated by NTP_IdentifierAllocator (cleaning every name
+with an uncompiled regex) versus with it. Doesn't need Blender:
+
+    python tools/benchmarks/identifiers.py [--names 100000] [--repeat 5]
+
+The names mimic those of a large node tree: node names with Blender's
+".001" suffixes, and socket, panel, and curve names that repeat often.
+"""
+import argparse
+import keyword
+import os
+import re
+import sys
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "fake_bpy"))
+sys.path.insert(0, REPO_DIR)
+
+from NodeToPython.ntp_identifiers import NTP_IdentifierAllocator
+from NodeToPython.ntp_identifiers import clear_clean_names
+
+NODE_NAMES = ["Math", "Vector Math", "Group Input", "Group Output",
+              "Set Position", "Mix", "Float Curve", "Color Ramp", "Frame",
+              "Reroute", "Join Geometry", "Store Named Attribute"]
+REPEATED_NAMES = ["Geometry", "Value", "Vector", "Color", "Settings_panel",
+                  "Offset_socket", "curve_0", "curve_1", "cre_0"]
+
+
+def make_names(num_names: int) -> list[str]:
+    names = []
+    for i in range(num_names):
+        if i % 3 == 0:
+            names.append(REPEATED_NAMES[i % len(REPEATED_NAMES)])
+        else:
+            base = NODE_NAMES[i % len(NODE_NAMES)]
+            suffix = i // len(NODE_NAMES)
+            names.append(f"{base}.{suffix:03d}" if suffix else base)
+    return names
+
+
+def allocate_uncached(names: list[str]) -> list[str]:
+    """
+    Allocation as previously done by NTP_Operator._create_var()
+    """
+    used_vars = {}
+    allocated = []
+    for name in names:
+        string = re.sub(r"[^a-zA-Z0-9]", '', name.lower())
+        if keyword.iskeyword(string):
+            string = "_" + string
+        var = "ntp_" + string
+        if var in used_vars:
+            used_vars[var] += 1
+            allocated.append(f"{var}_{used_vars[var]}")
+        else:
+            used_vars[var] = 0
+            allocated.append(var)
+    return allocated
+
+
+def allocate(names: list[str]) -> list[str]:
+    identifiers = NTP_IdentifierAllocator()
+    return [identifiers.create(name) for name in names]
+
+
+def best_time(function, names: list[str], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(names)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time variable name allocation")
+    parser.add_argument("--names", type=int, default=100000,
+                        help="names to allocate")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs to take the fastest of")
+    args = parser.parse_args()
+
+    names = make_names(args.names)
+    if allocate(names) != allocate_uncached(names):
+        print("Allocated names differ")
+        return 1
+
+    uncached = best_time(allocate_uncached, names, args.repeat)
+    clear_clean_names()
+    cold = best_time(allocate, names, 1)
+    warm = best_time(allocate, names, args.repeat)
+    print(f"{'names':>8} {'uncached s':>11} {'cold s':>10} {'warm s':>10} "
+          f"{'speedup':>8}")
+    print(f"{args.names:>8} {uncached:>11.4f} {cold:>10.4f} {warm:>10.4f} "
+          f"{uncached / warm:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Times reading the layout of geometry node trees of increasing size (node
+locations, dimensions, and mute/hide flags), one node at a time through RNA
+versus in bulk with foreach_get, and generating the location and dimension
+statements from it, one statement per node or with the Bulk layout option.
+
+Run from Blender with NodeToPython enabled:
+    blender --background --python tools/benchmarks/layout_extraction.py \
+        [-- module]
+
+where module is the add-on's module name (default "NodeToPython"; extensions
+are installed as e.g. "bl_ext.user_default.node_to_python").
+"""
+import bpy
+
+import sys
+import time
+import types
+
+import addon_utils
+
+NODE_COUNTS = [1000, 5000, 20000]
+
+
+def build_tree(num_nodes: int) -> bpy.types.NodeTree:
+    node_tree = bpy.data.node_groups.new("ntp_layout_bench",
+                                         'GeometryNodeTree')
+    for i in range(num_nodes):
+        node = node_tree.nodes.new('ShaderNodeMath')
+        node.location = ((i % 100) * 200.0, (i // 100) * -200.0)
+        node.width = 140.0 + (i % 3) * 20.0
+        node.mute = i % 7 == 0
+        node.hide = i % 11 == 0
+    return node_tree
+
+
+def time_per_node(node_tree: bpy.types.NodeTree) -> float:
+    """
+    Reads the layout the way NodeToPython did before reading it in bulk
+    """
+    start = time.perf_counter()
+    layout = []
+    for node in node_tree.nodes:
+        location = node.location
+        layout.append((location.x, location.y, node.width, node.height,
+                       node.mute, node.hide))
+    return time.perf_counter() - start
+
+
+def time_bulk(ntp_operator, node_tree: bpy.types.NodeTree
+              ) -> tuple[float, float, float]:
+    """
+    Registered operators can't be instantiated directly, so the unbound
+    methods are run against a stand-in holding just the state they need
+
+    Returns:
+    (tuple[float, float, float]): seconds to read the layout, and seconds
+        to generate the statements setting it without and with Bulk layout
+    """
+    op_cls = ntp_operator.NTP_Operator
+    module = sys.modules[op_cls.__module__]
+    tree_ir_module = sys.modules[module.NTP_TreeIR.__module__]
+
+    start = time.perf_counter()
+    layout = tree_ir_module.NTP_LayoutIR(node_tree.nodes)
+    read_time = time.perf_counter() - start
+
+    harness = types.SimpleNamespace()
+    harness._emitter = module.NTP_Emitter()
+    harness._node_table = None
+    harness._should_set_dimensions = True
+    harness._bulk_layout = False
+    ntp_nt = module.NTP_NodeTree(node_tree, "nt")
+    ntp_nt.ir = types.SimpleNamespace(
+        nodes=[types.SimpleNamespace(var=f"node_{i}")
+               for i in range(len(node_tree.nodes))],
+        layout=layout)
+
+    generate_times = []
+    for bulk_layout in (False, True):
+        harness._bulk_layout = bulk_layout
+        start = time.perf_counter()
+        op_cls._set_locations(harness, ntp_nt)
+        op_cls._set_dimensions(harness, ntp_nt)
+        generate_times.append(time.perf_counter() - start)
+    return read_time, *generate_times
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    module_name = argv[0] if argv else "NodeToPython"
+    addon_utils.enable(module_name)
+    ntp_operator = sys.modules[f"{module_name}.ntp_operator"]
+    tree_ir_module = sys.modules[f"{module_name}.ntp_tree_ir"]
+    arrays = "NumPy" if tree_ir_module.numpy is not None else "array"
+
+    print(f"Bulk reads into {arrays} arrays")
+    print(f"{'nodes':>8} {'per node s':>11} {'bulk s':>10} {'speedup':>8} "
+          f"{'generate s':>11} {'bulk gen s':>11}")
+    for num_nodes in NODE_COUNTS:
+        node_tree = build_tree(num_nodes)
+        per_node = time_per_node(node_tree)
+        bulk, generate, generate_bulk = time_bulk(ntp_operator, node_tree)
+        print(f"{num_nodes:>8} {per_node:>11.4f} {bulk:>10.4f} "
+              f"{per_node / bulk:>8.1f} {generate:>11.4f} "
+              f"{generate_bulk:>11.4f}")
+        bpy.data.node_groups.remove(node_tree)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Times reading and generating the links of geometry node trees of increasing
+size.
+
+Run from Blender with NodeToPython enabled:
+    blender --background --python tools/benchmarks/link_emission.py [-- module]
+
+where module is the add-on's module name (default "NodeToPython"; extensions
+are installed as e.g. "bl_ext.user_default.node_to_python").
+
+Each tree is a chain of Math nodes where every node links both of its
+first two inputs, so the link count grows with the node count. Time per link
+should stay roughly constant as the tree grows.
+"""
+import bpy
+
+import sys
+import time
+import types
+
+import addon_utils
+
+LINK_COUNTS = [1000, 2000, 5000, 10000, 20000]
+
+
+def build_tree(num_links: int) -> bpy.types.NodeTree:
+    node_tree = bpy.data.node_groups.new("ntp_link_bench", 'GeometryNodeTree')
+    prev = node_tree.nodes.new('ShaderNodeValue')
+    for _ in range(num_links // 2):
+        node = node_tree.nodes.new('ShaderNodeMath')
+        node_tree.links.new(prev.outputs[0], node.inputs[0])
+        node_tree.links.new(prev.outputs[0], node.inputs[1])
+        prev = node
+    return node_tree
+
+
+def time_init_links(ntp_operator, node_tree: bpy.types.NodeTree) -> float:
+    """
+    Registered operators can't be instantiated directly, so the unbound
+    methods are run against a stand-in holding just the state they need.
+    Links are resolved while reading the node tree, so reading it is timed
+    too
+    """
+    op_cls = ntp_operator.NTP_Operator
+    module = sys.modules[op_cls.__module__]
+    harness = types.SimpleNamespace()
+    harness._emitter = module.NTP_Emitter()
+    harness._write_after_links = []
+    harness._node_table = None
+
+    start = time.perf_counter()
+    ntp_nt = module.NTP_NodeTree(node_tree, "nt")
+    ntp_nt.ir = module.NTP_TreeIR(node_tree)
+    for i, node in enumerate(ntp_nt.ir.nodes):
+        node.var = f"node_{i}"
+    op_cls._init_links(harness, ntp_nt)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    module_name = argv[0] if argv else "NodeToPython"
+    addon_utils.enable(module_name)
+    ntp_operator = sys.modules[f"{module_name}.ntp_operator"]
+
+    print(f"{'links':>8} {'seconds':>10} {'us/link':>10}")
+    for num_links in LINK_COUNTS:
+        node_tree = build_tree(num_links)
+        elapsed = time_init_links(ntp_operator, node_tree)
+        print(f"{len(node_tree.links):>8} {elapsed:>10.4f} "
+              f"{elapsed / len(node_tree.links) * 1e6:>10.2f}")
+        bpy.data.node_groups.remove(node_tree)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Times and memory-profiles each NodeToPython operator's execute() end to end
+on synthetic node trees, without Blender. The add-on runs against the bpy
+stand-in in fake_bpy, so the numbers cover NodeToPython's own work, not the
+cost of Blender's RNA
+
+usage: python tools/benchmarks/operator_execute.py [-h] [--nodes N [N ...]]
+    [--depth DEPTH] [--breadth BREADTH] [--repeat REPEAT] [--mode MODE]
+    [--operators OPERATOR [OPERATOR ...]] [--option NAME=VALUE ...]
+"""
+import argparse
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "fake_bpy"))
+sys.path.insert(0, BENCHMARKS_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import bpy
+from NodeToPython.options import NTPOptions
+from NodeToPython.geometry.operator import NTPGeoNodesOperator
+from NodeToPython.shader.operator import NTPShaderOperator
+from NodeToPython.compositor.operator import NTPCompositorOperator
+
+import synthetic_trees
+
+OPERATORS = ["geometry", "shader", "compositor"]
+
+
+def default_options() -> dict:
+    """
+    Reads the default of every option from the options property group.
+    The stand-in's bpy.props keeps the keywords the properties were
+    declared with
+    """
+    options = {}
+    for name, prop in NTPOptions.__annotations__.items():
+        keywords = prop.keywords
+        if "default" in keywords:
+            value = keywords["default"]
+        elif prop.function == "EnumProperty":
+            value = keywords["items"][0][0]
+        elif prop.function == "BoolProperty":
+            value = False
+        else:
+            value = ""
+        options[name] = value
+    return options
+
+
+def build(operator: str, num_nodes: int, depth: int, breadth: int
+          ) -> tuple[type, dict]:
+    """
+    Builds a synthetic tree for an operator
+
+    Returns:
+    (tuple[type, dict]): operator class and the properties to run it with
+    """
+    bpy.data.reset()
+    if operator == "geometry":
+        tree = synthetic_trees.build_geometry(num_nodes, depth, breadth)
+        return NTPGeoNodesOperator, {"geo_nodes_group_name": tree.name}
+    elif operator == "shader":
+        material = synthetic_trees.build_material(num_nodes, depth, breadth)
+        return NTPShaderOperator, {"material_name": material.name}
+    scene = synthetic_trees.build_compositor(num_nodes, depth, breadth)
+    return NTPCompositorOperator, {"compositor_name": scene.name,
+                                   "is_scene": True}
+
+
+def execute(op_cls: type, props: dict, options: dict) -> float:
+    """
+    Runs the operator once
+
+    Returns:
+    (float): seconds execute() took
+    """
+    op = op_cls()
+    for name, value in props.items():
+        setattr(op, name, value)
+    context = types.SimpleNamespace(
+        scene=types.SimpleNamespace(
+            ntp_options=types.SimpleNamespace(**options)),
+        window_manager=types.SimpleNamespace(clipboard=""),
+        object=None,
+    )
+
+    start = time.perf_counter()
+    result = op.execute(context)
+    elapsed = time.perf_counter() - start
+    if result != {'FINISHED'}:
+        raise RuntimeError(f"{op_cls.__name__} returned {result}: "
+                           f"{op.reports}")
+    return elapsed
+
+
+def count() -> int:
+    """
+    Returns:
+    (int): number of nodes across every node tree that was built
+    """
+    return sum(len(tree.nodes) for tree in bpy.data.node_groups) + sum(
+        len(owner.node_tree.nodes) for owner in
+        list(bpy.data.materials) + list(bpy.data.scenes))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark NodeToPython's operators on synthetic trees")
+    parser.add_argument("--nodes", type=int, nargs="+",
+                        default=[100, 1000, 5000],
+                        help="nodes in each root tree")
+    parser.add_argument("--depth", type=int, default=2,
+                        help="levels of nested node groups")
+    parser.add_argument("--breadth", type=int, default=2,
+                        help="node groups used by each tree")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per tree; the fastest is reported")
+    parser.add_argument("--mode", choices=["SCRIPT", "ADDON"],
+                        default="ADDON")
+    parser.add_argument("--operators", nargs="+", choices=OPERATORS,
+                        default=OPERATORS)
+    parser.add_argument("--option", action="append", default=[],
+                        metavar="NAME=VALUE",
+                        help="override an option, the value given as JSON")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    dir_path = tempfile.mkdtemp(prefix="ntp_bench_")
+    options = dict(default_options(), mode=args.mode, dir_path=dir_path)
+    for option in args.option:
+        name, value = option.split("=", 1)
+        if name not in options:
+            parser.error(f"unknown option {name}")
+        options[name] = json.loads(value)
+
+    results = []
+    failures = []
+    print(f"{'operator':>10} {'nodes':>8} {'total':>8} {'seconds':>10} "
+          f"{'us/node':>10} {'peak MiB':>10}")
+    try:
+        for operator in args.operators:
+            for num_nodes in args.nodes:
+                op_cls, props = build(operator, num_nodes, args.depth,
+                                      args.breadth)
+                total = count()
+
+                try:
+                    times = []
+                    for _ in range(args.repeat):
+                        gc.collect()
+                        times.append(execute(op_cls, props, options))
+                        shutil.rmtree(dir_path, ignore_errors=True)
+
+                    # tracemalloc slows things down, so memory gets its own run
+                    gc.collect()
+                    tracemalloc.start()
+                    try:
+                        execute(op_cls, props, options)
+                        _, peak = tracemalloc.get_traced_memory()
+                    finally:
+                        tracemalloc.stop()
+                        shutil.rmtree(dir_path, ignore_errors=True)
+                except Exception as e:
+                    # keep going so every failure is listed, but fail the run
+                    print(f"{operator:>10} {num_nodes:>8} {total:>8} "
+                          f"failed: {type(e).__name__}: {e}")
+                    failures.append({"operator": operator, "nodes": num_nodes,
+                                     "error": f"{type(e).__name__}: {e}"})
+                    continue
+
+                seconds = min(times)
+                results.append({"operator": operator, "nodes": num_nodes,
+                                "total_nodes": total, "seconds": seconds,
+                                "peak_bytes": peak})
+                print(f"{operator:>10} {num_nodes:>8} {total:>8} "
+                      f"{seconds:>10.4f} {seconds / total * 1e6:>10.1f} "
+                      f"{peak / 2 ** 20:>10.1f}")
+    finally:
+        shutil.rmtree(dir_path, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"args": vars(args), "results": results,
+                       "failures": failures}, file, indent=4)
+
+    if failures:
+        print(f"{len(failures)} run(s) failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
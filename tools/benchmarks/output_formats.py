@@ -0,0 +1,115 @@
+"""
+Compares the statement and table output formats, each with and without Bulk
+layout, on geometry node trees of increasing size: size of the generated
+add-on, time to compile it, and time for it to rebuild the node tree.
+
+Run from Blender with NodeToPython enabled:
+    blender --background --python tools/benchmarks/output_formats.py [-- module]
+
+where module is the add-on's module name (default "NodeToPython"; extensions
+are installed as e.g. "bl_ext.user_default.node_to_python").
+"""
+import bpy
+
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+import addon_utils
+
+NODE_COUNTS = [1000, 5000, 20000]
+# Label -> options the add-on is exported with
+VARIANTS = {
+    "STATEMENTS": {"output_format": 'STATEMENTS'},
+    "TABLES": {"output_format": 'TABLES'},
+    "STATEMENTS+BULK": {"output_format": 'STATEMENTS', "bulk_layout": True},
+    "TABLES+BULK": {"output_format": 'TABLES', "bulk_layout": True},
+}
+OPERATIONS = ['ADD', 'MULTIPLY', 'SUBTRACT', 'POWER']
+
+
+def build_tree(num_nodes: int) -> bpy.types.NodeTree:
+    """
+    Chain of Math nodes with settings, default values, locations and links
+    """
+    node_tree = bpy.data.node_groups.new("ntp_format_bench", 'GeometryNodeTree')
+    prev = node_tree.nodes.new('ShaderNodeValue')
+    for i in range(num_nodes - 1):
+        node = node_tree.nodes.new('ShaderNodeMath')
+        node.operation = OPERATIONS[i % len(OPERATIONS)]
+        node.use_clamp = i % 3 == 0
+        node.inputs[1].default_value = i * 0.5
+        node.location = ((i % 100) * 200.0, (i // 100) * -200.0)
+        node_tree.links.new(prev.outputs[0], node.inputs[0])
+        prev = node
+    return node_tree
+
+
+def export(node_tree: bpy.types.NodeTree, variant_options: dict,
+           dir_path: str) -> str:
+    """
+    Returns:
+    (str): the generated __init__.py
+    """
+    options = {"mode": 'ADDON', "dir_path": dir_path, **variant_options}
+    bpy.ops.node.ntp_geo_nodes(geo_nodes_group_name=node_tree.name,
+                               options_json=json.dumps(options))
+    zip_paths = [os.path.join(dir_path, file) for file in os.listdir(dir_path)
+                 if file.endswith(".zip")]
+    with zipfile.ZipFile(zip_paths[0]) as zip_file:
+        init_name = [name for name in zip_file.namelist()
+                     if name.endswith("__init__.py")][0]
+        return zip_file.read(init_name).decode()
+
+
+def time_build(code: object) -> float:
+    """
+    Runs the generated add-on's operator, which rebuilds the node tree
+    """
+    namespace = {"__name__": "ntp_format_bench_addon"}
+    exec(code, namespace)
+    op_cls = [value for value in namespace.values()
+              if isinstance(value, type) and
+              issubclass(value, bpy.types.Operator) and
+              value is not bpy.types.Operator][0]
+    bpy.utils.register_class(op_cls)
+    if bpy.context.view_layer.objects.active is None:
+        bpy.ops.mesh.primitive_cube_add()
+
+    module, name = op_cls.bl_idname.split(".")
+    start = time.perf_counter()
+    getattr(getattr(bpy.ops, module), name)()
+    elapsed = time.perf_counter() - start
+    bpy.utils.unregister_class(op_cls)
+    return elapsed
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    module_name = argv[0] if argv else "NodeToPython"
+    addon_utils.enable(module_name)
+
+    print(f"{'nodes':>8} {'format':>16} {'bytes':>10} {'compile s':>10} "
+          f"{'build s':>10}")
+    for num_nodes in NODE_COUNTS:
+        node_tree = build_tree(num_nodes)
+        for label, variant_options in VARIANTS.items():
+            with tempfile.TemporaryDirectory() as dir_path:
+                source = export(node_tree, variant_options, dir_path)
+
+            start = time.perf_counter()
+            code = compile(source, "__init__.py", "exec")
+            compile_time = time.perf_counter() - start
+
+            build_time = time_build(code)
+            print(f"{num_nodes:>8} {label:>16} "
+                  f"{len(source.encode()):>10} {compile_time:>10.4f} "
+                  f"{build_time:>10.4f}")
+        bpy.data.node_groups.remove(node_tree)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Measures how long importing NodeToPython takes and how much memory it holds
+afterwards, and what loading the node settings of each tree type adds on top.
+Each measurement runs in a fresh interpreter against the bpy stand-in in
+fake_bpy, so nothing is already imported. Doesn't need Blender:
+
+    python tools/benchmarks/settings_import.py [--repeat 5]
+"""
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(BENCHMARKS_DIR))
+
+TREE_TYPES = ['GeometryNodeTree', 'ShaderNodeTree', 'CompositorNodeTree']
+
+# Run in the child interpreter. Prints the measurements as JSON
+MEASURE_CODE = """
+import json, resource, sys, time, tracemalloc
+sys.path.insert(0, {fake_bpy!r})
+sys.path.insert(0, {repo!r})
+import bpy, mathutils
+if {trace!r}:
+    tracemalloc.start()
+start = time.perf_counter()
+import NodeToPython
+from NodeToPython import node_settings
+import_seconds = time.perf_counter() - start
+import_bytes = tracemalloc.get_traced_memory()[0]
+tree_type = {tree_type!r}
+start = time.perf_counter()
+if tree_type is not None:
+    get_node_settings = getattr(node_settings, "get_node_settings", None)
+    if get_node_settings is not None:
+        num_nodes = len(get_node_settings(tree_type))
+    else:
+        num_nodes = len(node_settings.node_settings)
+load_seconds = time.perf_counter() - start
+print(json.dumps({{
+    "import_seconds": import_seconds,
+    "import_bytes": import_bytes,
+    "load_seconds": load_seconds,
+    "total_bytes": tracemalloc.get_traced_memory()[0],
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def measure(tree_type: str, trace: bool) -> dict:
+    """
+    tracemalloc slows imports down a lot, so times and traced memory are
+    measured in separate runs
+    """
+    code = MEASURE_CODE.format(fake_bpy=os.path.join(BENCHMARKS_DIR,
+                                                     "fake_bpy"),
+                               repo=REPO_DIR, tree_type=tree_type,
+                               trace=trace)
+    result = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def best_of(tree_type: str, repeat: int) -> dict:
+    runs = [measure(tree_type, False) for _ in range(repeat)]
+    result = {key: min(run[key] for run in runs) for key in runs[0]}
+    traced = measure(tree_type, True)
+    result["import_bytes"] = traced["import_bytes"]
+    result["total_bytes"] = traced["total_bytes"]
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure add-on import time and memory")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs to take the smallest numbers of")
+    args = parser.parse_args()
+
+    # Imports should read cached bytecode, as they do in Blender after the
+    # add-on's first import, even if writing it is turned off
+    compileall.compile_dir(os.path.join(REPO_DIR, "NodeToPython"), quiet=1)
+
+    print(f"{'loaded':<20} {'import s':>9} {'load s':>8} {'import KiB':>11} "
+          f"{'total KiB':>10} {'max RSS KiB':>12}")
+    for tree_type in [None, *TREE_TYPES]:
+        result = best_of(tree_type, args.repeat)
+        print(f"{tree_type or 'nothing':<20} "
+              f"{result['import_seconds']:>9.4f} "
+              f"{result['load_seconds']:>8.4f} "
+              f"{result['import_bytes'] / 1024:>11.0f} "
+              f"{result['total_bytes'] / 1024:>10.0f} "
+              f"{result['max_rss_kb']:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
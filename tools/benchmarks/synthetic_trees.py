@@ -0,0 +1,263 @@
+"""
+Builds synthetic geometry, shader, and compositor node trees of configurable
+size and nesting depth on top of the bpy stand-in in fake_bpy. Every node
+gets a value for each setting NodeToPython knows about, so the trees
+exercise the same code paths real ones do
+"""
+import random
+
+import bpy
+import mathutils
+
+from NodeToPython.node_settings import node_settings, ST
+
+_ST_VALUES = {
+    ST.BOOL: True,
+    ST.ENUM: 'DEFAULT',
+    ST.ENUM_SET: {'X'},
+    ST.FLOAT: 0.5,
+    ST.INT: 2,
+    ST.STRING: "attr",
+    ST.VEC1: bpy.types.bpy_prop_array((0.5,)),
+    ST.VEC2: bpy.types.bpy_prop_array((0.5, 0.25)),
+    ST.VEC3: mathutils.Vector((0.5, 0.25, 0.125)),
+    ST.VEC4: bpy.types.bpy_prop_array((0.5, 0.25, 0.125, 1.0)),
+    ST.COLOR: mathutils.Color((0.5, 0.25, 0.125)),
+}
+
+GEO_NODE_TYPES = [
+    'ShaderNodeMath', 'ShaderNodeVectorMath', 'FunctionNodeCompare',
+    'GeometryNodeSetPosition', 'GeometryNodeInputPosition',
+    'ShaderNodeMix', 'FunctionNodeRandomValue', 'ShaderNodeFloatCurve',
+    'ShaderNodeValToRGB', 'GeometryNodeMeshGrid',
+]
+
+SHADER_NODE_TYPES = [
+    'ShaderNodeMath', 'ShaderNodeMix', 'ShaderNodeBsdfPrincipled',
+    'ShaderNodeTexNoise', 'ShaderNodeValToRGB', 'ShaderNodeRGBCurve',
+    'ShaderNodeMapping', 'ShaderNodeValue', 'ShaderNodeRGB',
+]
+
+COMPOSITOR_NODE_TYPES = [
+    'CompositorNodeBlur', 'CompositorNodeMixRGB', 'CompositorNodeCurveRGB',
+    'CompositorNodeValToRGB', 'CompositorNodeColorBalance',
+    'CompositorNodeValue', 'CompositorNodeHueCorrect',
+]
+
+
+def _is_valid(info, attr) -> bool:
+    version = bpy.app.version
+    return (version >= max(attr.min_version_, info.min_version_)
+            and version < min(attr.max_version_, info.max_version_))
+
+
+def _fill_settings(node, rng: random.Random) -> None:
+    info = node_settings.get(node.bl_idname)
+    if info is None:
+        return
+    for attr in info.attributes_:
+        if not _is_valid(info, attr):
+            continue
+        st = attr.st_
+        if st in _ST_VALUES:
+            value = _ST_VALUES[st]
+            if st == ST.FLOAT:
+                value = round(rng.uniform(-4.0, 4.0), 3)
+            setattr(node, attr.name_, value)
+        elif st == ST.COLOR_RAMP:
+            ramp = bpy.types.ColorRamp()
+            for i in range(rng.randint(0, 3)):
+                element = ramp.elements.new(rng.random())
+                element.color = bpy.types.bpy_prop_array(
+                    (rng.random(), rng.random(), rng.random(), 1.0))
+            setattr(node, attr.name_, ramp)
+        elif st == ST.CURVE_MAPPING:
+            num_curves = 4 if "RGB" in node.bl_idname else (
+                3 if "Hue" in node.bl_idname else 1)
+            mapping = bpy.types.CurveMapping(num_curves)
+            for curve in mapping.curves:
+                for _ in range(rng.randint(0, 4)):
+                    curve.points.new(rng.random(), rng.random())
+            setattr(node, attr.name_, mapping)
+        elif st == ST.IMAGE_USER:
+            setattr(node, attr.name_, bpy.types.ImageUser())
+        else:
+            setattr(node, attr.name_, None)
+    if node.bl_idname == 'CompositorNodeColorBalance':
+        node.correction_method = 'LIFT_GAMMA_GAIN'
+        node.lift = node.gamma = node.gain = mathutils.Color((1.0, 1.0, 1.0))
+
+
+def _add_sockets(node, rng: random.Random) -> None:
+    node.inputs.new('NodeSocketFloat', "Value", "Value")
+    node.inputs.new('NodeSocketFloat', "Value", "Value_001")
+    node.inputs.new('NodeSocketVector', "Vector", "Vector")
+    node.inputs.new('NodeSocketColor', "Color", "Color")
+    node.outputs.new('NodeSocketFloat', "Value", "Value")
+    node.outputs.new('NodeSocketVector', "Vector", "Vector")
+    node.outputs.new('NodeSocketColor', "Color", "Color")
+    for socket in node.inputs:
+        if socket.bl_idname == 'NodeSocketFloat':
+            socket.default_value = round(rng.uniform(-2.0, 2.0), 3)
+    if rng.random() < 0.1:
+        node.inputs[2].hide = True
+    if node.bl_idname in {'ShaderNodeValue', 'CompositorNodeValue'}:
+        node.outputs[0].default_value = 0.5
+    elif node.bl_idname in {'ShaderNodeRGB', 'CompositorNodeRGB'}:
+        node.outputs[0].default_value = (0.5, 0.5, 0.5, 1.0)
+
+
+def _add_interface(tree) -> None:
+    if bpy.app.version < (4, 0, 0):
+        return
+    panel = tree.interface.new_panel("Settings")
+    tree.interface.new_socket("Value", in_out='INPUT',
+                              socket_type='NodeSocketFloat')
+    tree.interface.new_socket("Offset", in_out='INPUT',
+                              socket_type='NodeSocketVector', parent=panel)
+    tree.interface.new_socket("Result", in_out='OUTPUT',
+                              socket_type='NodeSocketFloat')
+    if tree.bl_idname == 'GeometryNodeTree':
+        tree.interface.new_socket("Geometry", in_out='OUTPUT',
+                                  socket_type='NodeSocketGeometry')
+
+
+def _build_tree(tree, node_types: list[str], group_type: str, num_nodes: int,
+                subgroups: list, rng: random.Random) -> None:
+    _add_interface(tree)
+    group_in = tree.nodes.new('NodeGroupInput')
+    group_in.outputs.new('NodeSocketFloat', "Value", "Socket_0")
+    group_in.outputs.new('NodeSocketVector', "Offset", "Socket_1")
+    group_in.outputs.new('NodeSocketVirtual', "", "__extend__")
+    group_out = tree.nodes.new('NodeGroupOutput')
+    group_out.inputs.new('NodeSocketFloat', "Result", "Socket_2")
+    group_out.inputs.new('NodeSocketVirtual', "", "__extend__")
+
+    frame = tree.nodes.new('NodeFrame')
+    frame.label = "Frame"
+    for node in (group_in, group_out, frame):
+        _fill_settings(node, rng)
+
+    created = [group_in]
+    spacing = max(1, num_nodes // (len(subgroups) + 1))
+    for i in range(num_nodes):
+        if subgroups and i > 0 and i % spacing == 0 \
+                and i // spacing <= len(subgroups):
+            node = tree.nodes.new(group_type)
+            _fill_settings(node, rng)
+            node.node_tree = subgroups[i // spacing - 1]
+            node.inputs.new('NodeSocketFloat', "Value", "Socket_0")
+            node.inputs.new('NodeSocketVector', "Offset", "Socket_1")
+            node.outputs.new('NodeSocketFloat', "Result", "Socket_2")
+        else:
+            node = tree.nodes.new(node_types[i % len(node_types)])
+            _fill_settings(node, rng)
+            _add_sockets(node, rng)
+        node.location = mathutils.Vector((i * 200.0, rng.uniform(-500, 500)))
+        node.width = 140.0 + (i % 3) * 20.0
+        if rng.random() < 0.05:
+            node.parent = frame
+        if rng.random() < 0.03:
+            node.mute = True
+        if rng.random() < 0.1:
+            node.label = f"Label {i}"
+
+        # link from a random earlier node
+        source = created[rng.randrange(len(created))]
+        if source.outputs and node.inputs:
+            tree.links.new(source.outputs[0], node.inputs[0])
+        if len(created) > 2 and len(node.inputs) > 2:
+            other = created[rng.randrange(1, len(created))]
+            if len(other.outputs) > 1:
+                tree.links.new(other.outputs[1], node.inputs[2])
+        created.append(node)
+
+    if len(created) > 1:
+        tree.links.new(created[-1].outputs[0], group_out.inputs[0])
+
+
+def build_geometry(num_nodes: int = 100, depth: int = 1, breadth: int = 1,
+                   seed: int = 0, name: str = "Synthetic Geometry"):
+    """
+    Builds a geometry node group with nested subgroups
+
+    Parameters:
+    num_nodes (int): number of nodes in the root group. Each level of
+        subgroups has half as many
+    depth (int): levels of nested subgroups below the root group
+    breadth (int): number of subgroups referenced by each group
+    seed (int): seed for the random settings, values, and links
+    name (str): name of the root group
+
+    Returns:
+    (GeometryNodeTree): the root group
+    """
+    rng = random.Random(seed)
+
+    def build(level: int, tree_name: str):
+        subgroups = []
+        if level < depth:
+            subgroups = [build(level + 1, f"{tree_name} {i}")
+                         for i in range(breadth)]
+        tree = bpy.data.node_groups.new(tree_name, 'GeometryNodeTree')
+        tree.is_modifier = level == 0
+        _build_tree(tree, GEO_NODE_TYPES, 'GeometryNodeGroup',
+                    max(4, num_nodes >> level), subgroups, rng)
+        return tree
+
+    return build(0, name)
+
+
+def build_material(num_nodes: int = 100, depth: int = 1, breadth: int = 1,
+                   seed: int = 0, name: str = "Synthetic Material"):
+    """
+    Builds a material whose node tree has nested shader node groups,
+    taking the same parameters as build_geometry()
+    """
+    rng = random.Random(seed)
+
+    def build(level: int, tree_name: str):
+        subgroups = []
+        if level < depth:
+            subgroups = [build(level + 1, f"{tree_name} {i}")
+                         for i in range(breadth)]
+        if level == 0:
+            tree = bpy.types.ShaderNodeTree(tree_name)
+        else:
+            tree = bpy.data.node_groups.new(tree_name, 'ShaderNodeTree')
+        _build_tree(tree, SHADER_NODE_TYPES, 'ShaderNodeGroup',
+                    max(4, num_nodes >> level), subgroups, rng)
+        return tree
+
+    material = bpy.types.ID(name)
+    material.node_tree = build(0, f"{name} Tree")
+    material.use_nodes = True
+    bpy.data.materials.append(material)
+    return material
+
+
+def build_compositor(num_nodes: int = 100, depth: int = 1, breadth: int = 1,
+                     seed: int = 0, name: str = "Synthetic Scene"):
+    """
+    Builds a scene whose compositor node tree has nested node groups,
+    taking the same parameters as build_geometry()
+    """
+    rng = random.Random(seed)
+
+    def build(level: int, tree_name: str):
+        subgroups = []
+        if level < depth:
+            subgroups = [build(level + 1, f"{tree_name} {i}")
+                         for i in range(breadth)]
+        if level == 0:
+            tree = bpy.types.CompositorNodeTree(tree_name)
+        else:
+            tree = bpy.data.node_groups.new(tree_name, 'CompositorNodeTree')
+        _build_tree(tree, COMPOSITOR_NODE_TYPES, 'CompositorNodeGroup',
+                    max(4, num_nodes >> level), subgroups, rng)
+        return tree
+
+    scene = bpy.types.ID(name)
+    scene.node_tree = build(0, f"{name} Tree")
+    bpy.data.scenes.append(scene)
+    return scene
@@ -0,0 +1,79 @@
+"""
+Measures the memory taken by the intermediate representation NodeToPython
+reads node trees into, and checks it against the documented budget
+(MEMORY_BUDGET_PER_NODE in ntp_tree_ir.py). Doesn't need Blender:
+
+    python tools/benchmarks/tree_ir_memory.py [--nodes 50000 ...]
+
+Exits with a non-zero status if any tree goes over the budget.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "fake_bpy"))
+sys.path.insert(0, BENCHMARKS_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import bpy
+from NodeToPython.ntp_tree_ir import MEMORY_BUDGET_PER_NODE, NTP_TreeIR
+
+import synthetic_trees
+
+
+def measure(num_nodes: int) -> tuple[int, int, float]:
+    """
+    Reads a synthetic geometry node tree
+
+    Returns:
+    (tuple[int, int, float]): number of links, bytes still allocated by
+        the IR once read, and seconds taken to read it
+    """
+    bpy.data.reset()
+    node_tree = synthetic_trees.build_geometry(num_nodes, depth=0)
+
+    gc.collect()
+    start = time.perf_counter()
+    NTP_TreeIR(node_tree)
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tree_ir = NTP_TreeIR(node_tree)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return len(tree_ir.links), after - before, seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure the memory of the node tree IR")
+    parser.add_argument("--nodes", type=int, nargs="+",
+                        default=[1000, 10000, 50000],
+                        help="nodes in each tree")
+    args = parser.parse_args()
+
+    over_budget = False
+    print(f"{'nodes':>8} {'links':>8} {'seconds':>10} {'MiB':>8} "
+          f"{'bytes/node':>11} {'budget':>8}")
+    for num_nodes in args.nodes:
+        num_links, size, seconds = measure(num_nodes)
+        per_node = size / num_nodes
+        over_budget |= per_node > MEMORY_BUDGET_PER_NODE
+        print(f"{num_nodes:>8} {num_links:>8} {seconds:>10.4f} "
+              f"{size / 2 ** 20:>8.1f} {per_node:>11.0f} "
+              f"{MEMORY_BUDGET_PER_NODE:>8}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
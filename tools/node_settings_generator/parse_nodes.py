@@ -39,6 +39,107 @@ log_file = None
 
 NTP_MIN_VERSION = (3, 0)
 
+# Node bl_idname prefix -> settings table (module of the node_settings
+# package) it's written to. Longest prefixes first
+TABLE_PREFIXES = [
+    ("FunctionNode", "function"),
+    ("GeometryNode", "geometry"),
+    ("ShaderNode", "shader"),
+    ("CompositorNode", "compositor"),
+    ("Node", "common"),
+]
+
+# Loads the tables lazily, per node tree type and Blender version. Written
+# after the classes in node_settings/__init__.py
+LOADER_CODE = """\
+# Settings tables each node tree type uses, by module. Geometry node trees
+# also use shader and function nodes, e.g. Math and Compare
+TREE_TYPE_TABLES : dict[str, tuple[str, ...]] = {
+\t'GeometryNodeTree' : ("common", "function", "geometry", "shader"),
+\t'ShaderNodeTree' : ("common", "shader"),
+\t'CompositorNodeTree' : ("common", "compositor"),
+}
+
+# Node tree type -> settings of the nodes it can contain
+_tree_type_settings : dict[str, dict[str, NodeInfo]] = {}
+
+def filter_settings(settings: list[NTPNodeSetting], version: tuple
+\t\t\t\t   ) -> list[NTPNodeSetting]:
+\t\"\"\"
+\tKeeps the settings that are valid in a version of Blender
+
+\tParameters:
+\tsettings (list[NTPNodeSetting]): settings to filter
+\tversion (tuple): version of Blender, e.g. bpy.app.version
+
+\tReturns:
+\t(list[NTPNodeSetting]): the valid settings, in order
+\t\"\"\"
+\treturn [setting for setting in settings
+\t\t\tif setting.min_version_ <= version < setting.max_version_]
+
+def _load_table(table: str, version: tuple) -> dict[str, NodeInfo]:
+\t\"\"\"
+\tLoads the settings of a table valid in a version of Blender: the table
+\twritten for that version if there is one, otherwise the table of all
+\tversions filtered down
+
+\tParameters:
+\ttable (str): table module, e.g. "shader"
+\tversion (tuple): version of Blender
+
+\tReturns:
+\t(dict[str, NodeInfo]): node bl_idname -> settings
+\t\"\"\"
+\tif tuple(version[:2]) in SETTINGS_VERSIONS:
+\t\tmodule = importlib.import_module(
+\t\t\tf".v{version[0]}_{version[1]}.{table}", __name__)
+\t\treturn module.node_settings
+
+\tmodule = importlib.import_module(f".{table}", __name__)
+\tsettings = {}
+\tfor name, node_info in module.node_settings.items():
+\t\tif node_info.min_version_ <= version < node_info.max_version_:
+\t\t\tsettings[name] = NodeInfo(filter_settings(node_info.attributes_,
+\t\t\t\t\t\t\t\t\t\t\t\t\t  version))
+\t\telse:
+\t\t\tsettings[name] = NodeInfo([])
+\treturn settings
+
+def get_node_settings(tree_type: str) -> dict[str, NodeInfo]:
+\t\"\"\"
+\tGets the settings of the nodes a node tree type can contain that are
+\tvalid in the running version of Blender, importing their tables the
+\tfirst time they're needed
+
+\tParameters:
+\ttree_type (str): bl_idname of the node tree type, e.g. 'ShaderNodeTree'
+
+\tReturns:
+\t(dict[str, NodeInfo]): node bl_idname -> settings. Shared between calls,
+\t\tso copy it before changing it
+\t\"\"\"
+\tsettings = _tree_type_settings.get(tree_type)
+\tif settings is None:
+\t\tsettings = {}
+\t\tfor table in TREE_TYPE_TABLES[tree_type]:
+\t\t\tsettings.update(_load_table(table, bpy.app.version))
+\t\t_tree_type_settings[tree_type] = settings
+\treturn settings
+
+def __getattr__(name: str):
+\t# The settings of every node in every version, for tools that don't work
+\t# on one tree type
+\tif name == "node_settings":
+\t\tsettings = {}
+\t\tfor tables in TREE_TYPE_TABLES.values():
+\t\t\tfor table in tables:
+\t\t\t\tmodule = importlib.import_module(f".{table}", __name__)
+\t\t\t\tsettings.update(module.node_settings)
+\t\treturn settings
+\traise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+"""
+
 def process_attr(attr, section, node: str, version: Version) -> None:
     name_section = attr.find(["code", "span"], class_="sig-name descname")
     
@@ -215,6 +316,9 @@ def get_max_version(versions: list[Version], blender_versions: list[Version]
         return None
 
 def write_imports(file: TextIOWrapper):
+    file.write("import bpy\n")
+    file.write("\n")
+    file.write("import importlib\n")
     file.write("from enum import Enum, auto\n")
     file.write("from typing import NamedTuple\n")
     file.write("\n")
@@ -243,6 +347,24 @@ def write_node_info_class(file: TextIOWrapper):
     file.write(f"\tmax_version_: tuple = {subminor(NTP_MAX_VERSION_EXC)}\n")
     file.write("\n")
 
+def write_loader(file: TextIOWrapper):
+    file.write(LOADER_CODE)
+
+def write_settings_versions(file: TextIOWrapper, 
+                            table_versions: list[Version]):
+    file.write("# Blender versions (major, minor) with tables of just the "
+               "settings valid in\n# them, in the v<major>_<minor> packages\n")
+    file.write("SETTINGS_VERSIONS : tuple[tuple[int, int], ...] = (\n")
+    for version in table_versions:
+        file.write(f"\t{version.tuple_str()},\n")
+    file.write(")\n\n")
+
+def get_table(name: str) -> str:
+    for prefix, table in TABLE_PREFIXES:
+        if name.startswith(prefix):
+            return table
+    raise ValueError(f"Don't know which settings table {name} belongs in")
+
 def write_ntp_node_settings(node_info: NodeInfo, file: TextIOWrapper,
                             node_min_v: Version, node_max_v: Version):
     attr_dict = node_info.attributes_
@@ -284,6 +406,43 @@ def write_node(name: str, node_info: NodeInfo, file: TextIOWrapper):
 
     file.write("\n\t),\n\n")
 
+def setting_var(setting: NTPNodeSetting) -> str:
+    return f"_{setting.name_}_{setting.type_.name.lower()}"
+
+def write_version_table(nodes: dict[str, list[NTPNodeSetting]], 
+                        file: TextIOWrapper):
+    """
+    Writes the settings of a table valid in one Blender version, without
+    version ranges. Each setting is created once and shared by the nodes
+    that have it
+    """
+    file.write("from .. import NTPNodeSetting, NodeInfo, ST\n\n")
+
+    settings = sorted({setting for attrs in nodes.values() 
+                       for setting in attrs},
+                      key=lambda setting: (setting.name_, setting.type_.name))
+    for setting in settings:
+        file.write(f"{setting_var(setting)} = NTPNodeSetting("
+                   f"\"{setting.name_}\", ST.{setting.type_.name})\n")
+    if settings:
+        file.write("\n")
+
+    file.write("node_settings : dict[str, NodeInfo] = {\n")
+    for name, attrs in nodes.items():
+        line = f"\t'{name}' : NodeInfo(("
+        for setting in attrs:
+            var = f"{setting_var(setting)}, "
+            if len(f"{line}{var}".expandtabs(4).rstrip()) > 79:
+                file.write(f"{line.rstrip()}\n")
+                line = "\t\t"
+            line += var
+        if len(attrs) == 1:
+            line = line.rstrip()
+        else:
+            line = line.rstrip(", ")
+        file.write(f"{line})),\n")
+    file.write("}\n")
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('max_major_version', type=int, 
@@ -315,10 +474,17 @@ if __name__ == "__main__":
 
     sorted_nodes = dict(sorted(nodes_dict.items()))
 
-    output_filepath = os.path.join(output_dir_path, "node_settings.py")
+    # The last version is the exclusive maximum
+    table_versions = versions[:-1]
+
+    package_path = os.path.join(output_dir_path, "node_settings")
+    if not os.path.exists(package_path):
+        os.makedirs(package_path)
+
+    output_filepath = os.path.join(package_path, "__init__.py")
 
     with open(output_filepath, 'w') as file:
-        print(f"Writing settings to {output_filepath}")
+        print(f"Writing settings types to {output_filepath}")
 
         write_imports(file)
 
@@ -328,14 +494,55 @@ if __name__ == "__main__":
        
         write_node_info_class(file)
 
-        file.write("node_settings : dict[str, NodeInfo] = {\n")
-        
-        for name, node_info in sorted_nodes.items():
-            write_node(name, node_info, file)
+        write_settings_versions(file, table_versions)
+
+        write_loader(file)
+
+    tables : dict[str, dict[str, NodeInfo]] = {
+        table: {} for _, table in TABLE_PREFIXES
+    }
+    for name, node_info in sorted_nodes.items():
+        tables[get_table(name)][name] = node_info
+
+    for table, table_nodes in tables.items():
+        output_filepath = os.path.join(package_path, f"{table}.py")
+
+        with open(output_filepath, 'w') as file:
+            print(f"Writing settings to {output_filepath}")
+
+            file.write("from . import NTPNodeSetting, NodeInfo, ST\n\n")
+
+            file.write("node_settings : dict[str, NodeInfo] = {\n")
+
+            for name, node_info in table_nodes.items():
+                write_node(name, node_info, file)
+
+            file.write("}")
+
+    for version in table_versions:
+        version_path = os.path.join(package_path, 
+                                    f"v{version.major_}_{version.minor_}")
+        if not os.path.exists(version_path):
+            os.makedirs(version_path)
+        open(os.path.join(version_path, "__init__.py"), 'w').close()
+
+        for table, table_nodes in tables.items():
+            output_filepath = os.path.join(version_path, f"{table}.py")
+
+            version_nodes = {
+                name: [attr for attr, attr_versions 
+                       in sorted(node_info.attributes_.items())
+                       if version in attr_versions]
+                for name, node_info in table_nodes.items()
+                if version in node_info.versions_
+            }
 
-        file.write("}")
+            with open(output_filepath, 'w') as file:
+                print(f"Writing {version.point_str()} settings to "
+                      f"{output_filepath}")
+                write_version_table(version_nodes, file)
 
-        print("Successfully finished")
+    print("Successfully finished")
 
     sorted_types = dict(sorted(types_dict.items()))
     log_file.write("\nTypes encountered:\n")
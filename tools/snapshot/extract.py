@@ -0,0 +1,361 @@
+"""
+Saves a snapshot of the node trees of a .blend file as JSON, so code can be
+generated from them later without Blender by generate.py. Run from Blender:
+
+    blender --background <file> --python tools/snapshot/extract.py -- \
+        <snapshot.json> [--types geometry shader compositor] [--no-images]
+
+Every node tree is walked once through RNA: each struct is stored once with
+its properties, and references between structs (links to sockets, group
+nodes to node groups, nodes to images, ...) are stored as indices, so the
+snapshot keeps the same object graph the add-on sees in Blender.
+"""
+import bpy
+
+import argparse
+import json
+import os
+import sys
+
+SNAPSHOT_VERSION = 1
+
+TREE_TYPES = ["geometry", "shader", "compositor"]
+
+# Properties that aren't needed to generate code, or are too big to store
+SKIPPED_PROPERTIES = {
+    "bl_rna",
+    "id_data",
+    "internal_links",
+    "original",
+    "pixels",
+    "preview",
+    "rna_type",
+}
+
+# Value types that are stored along with their items
+SEQUENCE_TYPES = {"Color", "Euler", "Matrix", "Quaternion", "Vector",
+                  "bpy_prop_array"}
+
+# bpy.data collections that snapshots can refer to, by ID type
+DATA_COLLECTIONS = {
+    "NodeTree": "node_groups",
+    "Material": "materials",
+    "Scene": "scenes",
+    "Image": "images",
+    "Object": "objects",
+    "Collection": "collections",
+    "Texture": "textures",
+}
+
+# How much of a struct is stored, from least to most
+STUB = 0     # just the name of a data block
+NESTED = 1   # values, but no references to other structs
+SHALLOW = 2  # values, and nested structs that aren't data blocks
+ROOT = 3     # like SHALLOW, also following the node tree of the data block
+DEEP = 4     # everything, e.g. node trees and their nodes
+
+
+class Extractor:
+    """
+    Walks RNA structs into a list of plain-Python snapshot entries
+    """
+    def __init__(self):
+        # Snapshot entry of each struct
+        self.structs: list[dict] = []
+
+        # Pointer of each struct
+        self._pointers: list[int] = []
+
+        # Depth each struct is walked to
+        self._depths: list[int] = []
+
+        # (pointer, type) -> index into structs
+        self._indices: dict[tuple[int, str], int] = {}
+
+        # Structs that still have to be walked
+        self._queue: list[tuple[bpy.types.bpy_struct, int, int]] = []
+
+        # Type -> base type, for every type in the snapshot
+        self.bases: dict[str, str] = {}
+
+        # Type -> identifiers of its properties
+        self._properties: dict[str, list[str]] = {}
+
+        # Indices of the data blocks of each bpy.data collection
+        self.data: dict[str, list[int]] = {}
+
+        # Images in the snapshot, by index
+        self.images: dict[int, bpy.types.Image] = {}
+
+    def add(self, struct: bpy.types.bpy_struct, depth: int) -> int:
+        """
+        Adds a struct to the snapshot, walking it later
+
+        Returns:
+        (int): index of the struct in the snapshot
+        """
+        type_name = type(struct).__name__
+        key = (struct.as_pointer(), type_name)
+        index = self._indices.get(key)
+        if index is None:
+            index = len(self.structs)
+            self._indices[key] = index
+            self.structs.append({"type": type_name, "props": {}})
+            self._pointers.append(key[0])
+            self._depths.append(-1)
+            self._add_type(type(struct))
+            self._add_data_block(struct, index)
+        if depth > self._depths[index]:
+            self._depths[index] = depth
+            self._queue.append((struct, index, depth))
+        return index
+
+    def _add_type(self, cls: type) -> None:
+        for sub, base in zip(cls.__mro__, cls.__mro__[1:]):
+            if sub.__name__ in self.bases or base.__name__ in {"bpy_struct",
+                                                              "object"}:
+                return
+            self.bases[sub.__name__] = base.__name__
+
+    def _add_data_block(self, struct: bpy.types.bpy_struct,
+                        index: int) -> None:
+        if not isinstance(struct, bpy.types.ID):
+            return
+        if isinstance(struct, bpy.types.Image):
+            self.images[index] = struct
+        if getattr(struct, "is_embedded_data", False):
+            return
+        for cls in type(struct).__mro__:
+            collection = DATA_COLLECTIONS.get(cls.__name__)
+            if collection is not None:
+                self.data.setdefault(collection, []).append(index)
+                return
+
+    def walk(self) -> None:
+        """
+        Walks every struct added so far, and the ones they refer to
+        """
+        while self._queue:
+            struct, index, depth = self._queue.pop()
+            if depth < self._depths[index]:
+                # walked deeper since it was queued
+                continue
+            self.structs[index]["props"] = self._walk_struct(struct, depth)
+
+    def sort_data(self) -> None:
+        """
+        Orders the data blocks of each collection the way bpy.data does
+        """
+        for name, indices in self.data.items():
+            order = {data_block.as_pointer(): i for i, data_block in
+                     enumerate(getattr(bpy.data, name))}
+            indices.sort(key=lambda index: order.get(self._pointers[index],
+                                                     len(order)))
+
+    def _get_properties(self, struct: bpy.types.bpy_struct) -> list[str]:
+        type_name = type(struct).__name__
+        properties = self._properties.get(type_name)
+        if properties is None:
+            properties = [prop.identifier
+                          for prop in struct.bl_rna.properties
+                          if prop.identifier not in SKIPPED_PROPERTIES
+                          and getattr(prop, "subtype", None) != 'BYTE_STRING']
+            self._properties[type_name] = properties
+        return properties
+
+    def _walk_struct(self, struct: bpy.types.bpy_struct, depth: int) -> dict:
+        if depth == STUB:
+            return {"name": struct.name}
+
+        props = {}
+        for identifier in self._get_properties(struct):
+            try:
+                value = getattr(struct, identifier)
+            except (AttributeError, RuntimeError, TypeError, ValueError):
+                continue
+
+            if isinstance(value, bpy.types.bpy_struct):
+                if depth == NESTED:
+                    continue
+                if isinstance(value, bpy.types.ID):
+                    if isinstance(value, bpy.types.NodeTree) and (
+                            depth == DEEP or depth == ROOT and
+                            identifier == "node_tree"):
+                        value_depth = DEEP
+                    elif depth == DEEP:
+                        value_depth = SHALLOW
+                    else:
+                        value_depth = STUB
+                else:
+                    value_depth = DEEP if depth == DEEP else NESTED
+                props[identifier] = {"$": self.add(value, value_depth)}
+            elif isinstance(value, bpy.types.bpy_prop_collection):
+                if depth != DEEP:
+                    continue
+                props[identifier] = {"$c": [self.add(item, DEEP)
+                                            for item in value]}
+            else:
+                props[identifier] = self._encode_value(value)
+        return props
+
+    def _encode_value(self, value):
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, set):
+            return {"$t": "set", "v": sorted(value)}
+        if type(value).__name__ in SEQUENCE_TYPES:
+            return {"$t": type(value).__name__,
+                    "v": [self._encode_value(item) for item in value]}
+        if isinstance(value, (tuple, list)):
+            return [self._encode_value(item) for item in value]
+        return None
+
+
+def find_roots(types: list[str]) -> list[tuple[bpy.types.ID, int]]:
+    """
+    Finds the data blocks to snapshot, and how deep to walk them
+    """
+    roots = []
+    if "geometry" in types:
+        roots += [(node_tree, DEEP) for node_tree in bpy.data.node_groups
+                  if node_tree.bl_idname == 'GeometryNodeTree']
+    if "shader" in types:
+        roots += [(mat, ROOT) for mat in bpy.data.materials
+                  if mat.node_tree is not None]
+    if "compositor" in types:
+        roots += [(scene, ROOT) for scene in bpy.data.scenes
+                  if scene.node_tree is not None]
+    return roots
+
+
+def node_types(types: list[str]) -> dict[str, set[str]]:
+    """
+    Finds the node types used by the node trees in the snapshot
+
+    Returns:
+    (dict[str, set[str]]): node tree type -> bl_idnames of its node types
+    """
+    node_trees = list(bpy.data.node_groups)
+    if "shader" in types:
+        node_trees += [mat.node_tree for mat in bpy.data.materials]
+    if "compositor" in types:
+        node_trees += [scene.node_tree for scene in bpy.data.scenes]
+
+    found = {}
+    for node_tree in node_trees:
+        if node_tree is None:
+            continue
+        bl_idnames = found.setdefault(node_tree.bl_idname, set())
+        bl_idnames.update(node.bl_idname for node in node_tree.nodes)
+    return found
+
+
+def extract_baselines(extractor: Extractor, types: list[str]) -> dict:
+    """
+    Records the settings and socket values new nodes of each node type in
+    the snapshot start out with, so code generated from the snapshot can
+    leave them out the same way it does in Blender
+    """
+    baselines = {}
+    for tree_type, bl_idnames in node_types(types).items():
+        node_tree = bpy.data.node_groups.new(".NTP Baseline", tree_type)
+        tree_baselines = {}
+        for bl_idname in sorted(bl_idnames):
+            try:
+                node = node_tree.nodes.new(bl_idname)
+            except RuntimeError:
+                continue
+            settings = {}
+            for prop in node.bl_rna.properties:
+                if prop.type in {'POINTER', 'COLLECTION'}:
+                    continue
+                try:
+                    value = getattr(node, prop.identifier)
+                except (AttributeError, RuntimeError):
+                    continue
+                settings[prop.identifier] = extractor._encode_value(value)
+            tree_baselines[bl_idname] = {
+                "settings": settings,
+                "inputs": [[i, socket.identifier, socket.bl_idname,
+                            extractor._encode_value(socket.default_value)]
+                           for i, socket in enumerate(node.inputs)
+                           if hasattr(socket, "default_value")],
+                "outputs": [[i, socket.identifier, socket.bl_idname,
+                             extractor._encode_value(socket.default_value)]
+                            for i, socket in enumerate(node.outputs)
+                            if hasattr(socket, "default_value")],
+            }
+        bpy.data.node_groups.remove(node_tree)
+        baselines[tree_type] = tree_baselines
+    return baselines
+
+
+def save_images(extractor: Extractor, images_dir: str,
+                snapshot_dir: str) -> None:
+    """
+    Saves the images the snapshot refers to, so generated add-ons can
+    include them
+    """
+    for index, img in extractor.images.items():
+        if not img.has_data or img.source not in {'FILE', 'GENERATED',
+                                                  'TILED'}:
+            continue
+        os.makedirs(images_dir, exist_ok=True)
+        path = os.path.join(images_dir,
+                            f"{index}.{img.file_format.lower()}")
+        img.save_render(path)
+        extractor.structs[index]["file"] = os.path.relpath(path, snapshot_dir)
+
+
+def extract(types: list[str]) -> tuple[dict, Extractor]:
+    """
+    Snapshots the node trees of the open file
+
+    Returns:
+    (tuple[dict, Extractor]): the snapshot, and the extractor that made it
+    """
+    extractor = Extractor()
+    for root, depth in find_roots(types):
+        extractor.add(root, depth)
+    extractor.walk()
+
+    extractor.sort_data()
+    baselines = extract_baselines(extractor, types)
+
+    snapshot = {
+        "format": "NodeToPython snapshot",
+        "version": SNAPSHOT_VERSION,
+        "blender_version": list(bpy.app.version),
+        "filepath": bpy.data.filepath,
+        "types": extractor.bases,
+        "menus": [name for name in dir(bpy.types) if "_MT_" in name],
+        "data": extractor.data,
+        "structs": extractor.structs,
+        "baselines": baselines,
+    }
+    return snapshot, extractor
+
+
+def main() -> None:
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(
+        prog="extract.py",
+        description="Save a snapshot of the node trees of a .blend file")
+    parser.add_argument("output", help="JSON file to write")
+    parser.add_argument("--types", nargs="+", choices=TREE_TYPES,
+                        default=TREE_TYPES, help="node tree types to save")
+    parser.add_argument("--no-images", action="store_true",
+                        help="don't save the images the node trees use")
+    args = parser.parse_args(argv)
+
+    snapshot, extractor = extract(args.types)
+    output = os.path.abspath(args.output)
+    if not args.no_images:
+        save_images(extractor, f"{os.path.splitext(output)[0]}_images",
+                    os.path.dirname(output))
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(snapshot, file, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Generates code from node tree snapshots made by extract.py, without Blender.
+Each snapshot is generated in its own Python process, several at once
+
+usage: python generate.py [-h] [--jobs JOBS] [--mode {SCRIPT,ADDON}] ...
+    snapshots [snapshots ...]
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SNAPSHOT_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKER = os.path.join(SNAPSHOT_DIR, "generate_worker.py")
+REPO_DIR = os.path.dirname(os.path.dirname(SNAPSHOT_DIR))
+
+TREE_TYPES = ["geometry", "shader", "compositor"]
+
+
+def find_snapshots(paths: list[str]) -> list[str]:
+    """
+    Expands directories into the snapshots they contain
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files += [os.path.join(root, name) for name in sorted(names)
+                          if name.endswith(".json")]
+        else:
+            files.append(path)
+    return [os.path.abspath(file) for file in files]
+
+
+def output_dirs(files: list[str], output_dir: str) -> list[str]:
+    """
+    Gives each snapshot its own output directory, named after the snapshot
+    """
+    dirs = []
+    used: dict[str, int] = {}
+    for file in files:
+        name = os.path.splitext(os.path.basename(file))[0]
+        if name in used:
+            used[name] += 1
+            name = f"{name}_{used[name]}"
+        else:
+            used[name] = 0
+        dirs.append(os.path.join(output_dir, name))
+    return dirs
+
+
+def generate(snapshot: str, snapshot_output_dir: str,
+             args: argparse.Namespace, options: dict) -> dict:
+    """
+    Generates code for a single snapshot in a new Python process
+
+    Returns:
+    (dict): the snapshot's manifest
+    """
+    os.makedirs(snapshot_output_dir, exist_ok=True)
+    manifest_path = os.path.join(snapshot_output_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    job = {
+        "snapshot": snapshot,
+        "output_dir": snapshot_output_dir,
+        "manifest": manifest_path,
+        "options": options,
+        "types": args.types,
+        "library": args.library,
+        "module": args.module,
+        "addon_dir": args.addon_dir,
+    }
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False,
+                                     encoding="utf-8") as job_file:
+        json.dump(job, job_file)
+
+    command = [sys.executable, WORKER, job_file.name]
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(command, capture_output=True, text=True,
+                                 timeout=args.timeout)
+        returncode = process.returncode
+        log = process.stdout + process.stderr
+    except subprocess.TimeoutExpired:
+        returncode = None
+        log = f"Timed out after {args.timeout} seconds"
+    finally:
+        os.remove(job_file.name)
+    seconds = time.perf_counter() - start
+
+    manifest = {"snapshot": snapshot, "exports": []}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as file_manifest:
+            manifest = json.load(file_manifest)
+    manifest["returncode"] = returncode
+    manifest["process_seconds"] = seconds
+    manifest["output_dir"] = snapshot_output_dir
+    if returncode != 0:
+        manifest["log"] = log[-4000:]
+    return manifest
+
+
+def succeeded(manifest: dict) -> bool:
+    return (manifest["returncode"] == 0 and
+            all(export["result"] == ['FINISHED']
+                for export in manifest["exports"]))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate code from node tree snapshots without Blender")
+    parser.add_argument("snapshots", nargs="+",
+                        help="snapshots, or directories to search for them")
+    parser.add_argument("-o", "--output-dir", default="ntp_output",
+                        help="directory to write the code and manifests to")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of processes to run at once")
+    parser.add_argument("--mode", choices=["SCRIPT", "ADDON"],
+                        default="SCRIPT",
+                        help="write scripts, or zipped add-ons")
+    parser.add_argument("--options",
+                        help="JSON file with NodeToPython options, using the "
+                             "names of the options property group")
+    parser.add_argument("--types", nargs="+", choices=TREE_TYPES,
+                        default=TREE_TYPES, help="node tree types to generate")
+    parser.add_argument("--library", action="store_true",
+                        help="generate all geometry node groups of a "
+                             "snapshot as a single add-on")
+    parser.add_argument("--module", default="NodeToPython",
+                        help="package name of NodeToPython")
+    parser.add_argument("--addon-dir", default=REPO_DIR,
+                        help="directory to import NodeToPython from")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="seconds before a process is stopped")
+    args = parser.parse_args()
+
+    options = {}
+    if args.options:
+        with open(args.options, "r", encoding="utf-8") as file:
+            options = json.load(file)
+    options["mode"] = args.mode
+
+    snapshots = find_snapshots(args.snapshots)
+    output_dir = os.path.abspath(args.output_dir)
+    dirs = output_dirs(snapshots, output_dir)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        manifests = list(pool.map(
+            lambda snapshot_dir: generate(*snapshot_dir, args, options),
+            zip(snapshots, dirs)))
+    seconds = time.perf_counter() - start
+
+    failed = [manifest["snapshot"] for manifest in manifests
+              if not succeeded(manifest)]
+    summary = {
+        "seconds": seconds,
+        "jobs": args.jobs,
+        "snapshots": manifests,
+        "failed": failed,
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "manifest.json"), "w",
+              encoding="utf-8") as file:
+        json.dump(summary, file, indent=4)
+
+    print(f"Generated {len(snapshots) - len(failed)} of {len(snapshots)} "
+          f"snapshots in {seconds:.1f} seconds")
+    for snapshot in failed:
+        print(f"Failed: {snapshot}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
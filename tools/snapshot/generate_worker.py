@@ -0,0 +1,187 @@
+"""
+Generates code for every node tree of one snapshot, running NodeToPython on
+the snapshot stand-in for bpy. Started by generate.py:
+
+    python generate_worker.py <job.json>
+"""
+import json
+import os
+import sys
+import time
+import traceback
+import types
+
+SNAPSHOT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(SNAPSHOT_DIR))
+
+
+def load(job: dict):
+    """
+    Loads the snapshot into the stand-in for bpy, then imports NodeToPython
+    against it
+
+    Returns:
+    (module): the stand-in bpy module
+    """
+    sys.path.insert(0, os.path.join(SNAPSHOT_DIR, "snapshot_bpy"))
+    sys.path.insert(0, job["addon_dir"])
+    import bpy
+
+    with open(job["snapshot"], "r", encoding="utf-8") as file:
+        snapshot = json.load(file)
+    bpy.load_snapshot(snapshot, os.path.dirname(job["snapshot"]))
+
+    __import__(job["module"])
+    add_baselines(bpy, job, snapshot.get("baselines", {}))
+    return bpy
+
+
+def add_baselines(bpy, job: dict, baselines: dict) -> None:
+    """
+    Gives NodeToPython the values new nodes start out with, which it would
+    otherwise read from nodes it creates in Blender
+    """
+    ntp_node_baseline = sys.modules[f"{job['module']}.ntp_node_baseline"]
+    read_value = sys.modules[f"{job['module']}.ntp_tree_ir"].read_value
+
+    def decode(value):
+        return read_value(bpy.decode_value(value))
+
+    for tree_type, tree_baselines in baselines.items():
+        for bl_idname, baseline in tree_baselines.items():
+            ntp_node_baseline.add_baseline(
+                tree_type, bl_idname, ntp_node_baseline.NTP_NodeBaseline(
+                    {name: decode(value)
+                     for name, value in baseline["settings"].items()},
+                    {(i, identifier, socket_type): decode(value)
+                     for i, identifier, socket_type, value
+                     in baseline["inputs"]},
+                    {(i, identifier, socket_type): decode(value)
+                     for i, identifier, socket_type, value
+                     in baseline["outputs"]}))
+
+
+def list_exports(bpy, job: dict) -> list[tuple[str, str, dict]]:
+    """
+    Finds what to generate code for in the snapshot
+
+    Returns:
+    (list[tuple[str, str, dict]]): (tree type, name, operator properties)
+        for each export
+    """
+    exports = []
+    if "geometry" in job["types"]:
+        geo_names = [node_tree.name for node_tree in bpy.data.node_groups
+                     if node_tree.bl_idname == 'GeometryNodeTree']
+        if job["library"]:
+            if geo_names:
+                name = os.path.splitext(os.path.basename(job["snapshot"]))[0]
+                exports.append(("geometry", name, {"library_name": name,
+                                                   "geo_nodes_group_names": []}))
+        else:
+            exports += [("geometry", name, {"geo_nodes_group_name": name})
+                        for name in geo_names]
+    if "shader" in job["types"]:
+        exports += [("shader", mat.name, {"material_name": mat.name})
+                    for mat in bpy.data.materials
+                    if getattr(mat, "node_tree", None) is not None]
+    if "compositor" in job["types"]:
+        exports += [("compositor", scene.name,
+                     {"compositor_name": scene.name, "is_scene": True})
+                    for scene in bpy.data.scenes
+                    if getattr(scene, "node_tree", None) is not None]
+    return exports
+
+
+def get_operator(job: dict, tree_type: str) -> type:
+    module = job["module"]
+    if tree_type == "geometry":
+        geometry = sys.modules[f"{module}.geometry.operator"]
+        if job["library"]:
+            return geometry.NTPGeoNodesBatchOperator
+        return geometry.NTPGeoNodesOperator
+    elif tree_type == "shader":
+        return sys.modules[f"{module}.shader.operator"].NTPShaderOperator
+    return sys.modules[f"{module}.compositor.operator"].NTPCompositorOperator
+
+
+def list_outputs(dir_path: str) -> set[str]:
+    outputs = set()
+    for root, _, files in os.walk(dir_path):
+        for file in files:
+            outputs.add(os.path.relpath(os.path.join(root, file), dir_path))
+    return outputs
+
+
+def run(job: dict) -> dict:
+    """
+    Runs every export of a job
+
+    Returns:
+    (dict): the manifest for the snapshot
+    """
+    bpy = load(job)
+    options_module = sys.modules[f"{job['module']}.options"]
+    ntp_operator = sys.modules[f"{job['module']}.ntp_operator"]
+    clean_string = sys.modules[f"{job['module']}.utils"].clean_string
+
+    manifest = {
+        "snapshot": job["snapshot"],
+        "blender_version": list(bpy.app.version),
+        "exports": [],
+    }
+    for tree_type, name, props in list_exports(bpy, job):
+        dir_path = os.path.join(job["output_dir"], tree_type)
+        os.makedirs(dir_path, exist_ok=True)
+        before = list_outputs(dir_path)
+
+        start = time.perf_counter()
+        try:
+            options = options_module.options_from_dict(
+                dict(job["options"], dir_path=dir_path))
+            context = types.SimpleNamespace(
+                scene=types.SimpleNamespace(ntp_options=options),
+                window_manager=types.SimpleNamespace(clipboard=""),
+            )
+            op = get_operator(job, tree_type)()
+            for prop, value in props.items():
+                setattr(op, prop, value)
+            result = sorted(op.execute(context))
+            if options.mode == 'SCRIPT' and result == ['FINISHED']:
+                path = os.path.join(dir_path, f"{clean_string(name)}.py")
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write(context.window_manager.clipboard)
+        except Exception:
+            result = ["EXCEPTION"]
+            ntp_operator.NTP_Operator.last_reports.append(
+                ('ERROR', traceback.format_exc()))
+        seconds = time.perf_counter() - start
+
+        manifest["exports"].append({
+            "type": tree_type,
+            "name": name,
+            "result": result,
+            "seconds": seconds,
+            "outputs": sorted(os.path.join(tree_type, output) for output in
+                              list_outputs(dir_path) - before),
+            "reports": [list(report) for report in
+                        ntp_operator.NTP_Operator.last_reports],
+        })
+        ntp_operator.NTP_Operator.last_reports = []
+    return manifest
+
+
+def main() -> None:
+    with open(sys.argv[1], "r", encoding="utf-8") as file:
+        job = json.load(file)
+
+    start = time.perf_counter()
+    manifest = run(job)
+    manifest["seconds"] = time.perf_counter() - start
+
+    with open(job["manifest"], "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Stand-in for Blender's bpy module, backed by a node tree snapshot written by
+extract.py. It only provides what NodeToPython reads while generating code,
+so the add-on's own generator can run in plain CPython.
+
+load_snapshot() has to be called before NodeToPython is imported, since the
+add-on checks bpy.app.version and the bpy.types hierarchy at import time
+"""
+import os
+import types as _pytypes
+
+import mathutils
+
+from . import props
+from . import types
+
+app = _pytypes.SimpleNamespace(version=(0, 0, 0), background=True)
+
+# Collections of bpy.data that snapshots can hold
+DATA_COLLECTIONS = ["node_groups", "materials", "scenes", "images", "objects",
+                    "collections", "textures"]
+
+
+class _Data:
+    def __init__(self):
+        self.filepath = ""
+        for name in DATA_COLLECTIONS:
+            setattr(self, name, types.bpy_prop_collection())
+
+
+data = _Data()
+
+context = _pytypes.SimpleNamespace(
+    scene=None,
+    window_manager=_pytypes.SimpleNamespace(clipboard=""),
+)
+
+
+def _abspath(path: str) -> str:
+    """
+    Resolves paths relative to the blend file the snapshot was taken from
+    """
+    if path.startswith("//"):
+        base_dir = os.path.dirname(data.filepath) or os.getcwd()
+        path = os.path.join(base_dir, path[2:])
+    return os.path.abspath(path)
+
+
+path = _pytypes.SimpleNamespace(abspath=_abspath)
+
+utils = _pytypes.SimpleNamespace(
+    register_class=lambda cls: None,
+    unregister_class=lambda cls: None,
+)
+
+
+def _decode(value, structs: list):
+    if isinstance(value, dict):
+        if "$" in value:
+            return structs[value["$"]]
+        if "$c" in value:
+            return types.bpy_prop_collection(structs[i] for i in value["$c"])
+        items = [_decode(item, structs) for item in value["v"]]
+        value_type = value["$t"]
+        if value_type == "set":
+            return set(items)
+        if value_type == "bpy_prop_array":
+            return types.bpy_prop_array(items)
+        return getattr(mathutils, value_type)(items)
+    if isinstance(value, list):
+        return tuple(_decode(item, structs) for item in value)
+    return value
+
+
+def decode_value(value):
+    """
+    Decodes a value stored by extract.py that doesn't refer to any structs
+    """
+    return _decode(value, [])
+
+
+def load_snapshot(snapshot: dict, snapshot_dir: str = "") -> None:
+    """
+    Fills bpy.app, bpy.types and bpy.data from a snapshot
+
+    Parameters:
+    snapshot (dict): the snapshot, as loaded from its JSON file
+    snapshot_dir (str): directory of the snapshot file, which saved image
+        paths are relative to
+    """
+    app.version = tuple(snapshot["blender_version"])
+    types.set_hierarchy(snapshot["types"], snapshot.get("menus", []))
+    data.filepath = snapshot.get("filepath", "")
+
+    structs = []
+    for entry in snapshot["structs"]:
+        cls = getattr(types, entry["type"])
+        structs.append(cls.__new__(cls))
+    for struct, entry in zip(structs, snapshot["structs"]):
+        struct.__dict__.update((name, _decode(value, structs))
+                               for name, value in entry["props"].items())
+        if "file" in entry:
+            struct._saved_file = os.path.join(snapshot_dir, entry["file"])
+
+    for name, indices in snapshot["data"].items():
+        setattr(data, name, types.bpy_prop_collection(structs[i]
+                                                      for i in indices))
+
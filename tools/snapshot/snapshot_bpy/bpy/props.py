@@ -0,0 +1,28 @@
+"""
+Property definitions keep the keywords they were declared with, so option
+defaults can be read back from them
+"""
+
+
+class _DeferredProperty:
+    def __init__(self, function: str, **keywords):
+        self.function = function
+        self.keywords = keywords
+
+
+def _make(name: str):
+    def prop(**keywords) -> _DeferredProperty:
+        return _DeferredProperty(name, **keywords)
+    prop.__name__ = name
+    return prop
+
+
+BoolProperty = _make("BoolProperty")
+IntProperty = _make("IntProperty")
+FloatProperty = _make("FloatProperty")
+StringProperty = _make("StringProperty")
+EnumProperty = _make("EnumProperty")
+IntVectorProperty = _make("IntVectorProperty")
+FloatVectorProperty = _make("FloatVectorProperty")
+PointerProperty = _make("PointerProperty")
+CollectionProperty = _make("CollectionProperty")
@@ -0,0 +1,204 @@
+"""
+Struct types of the snapshot stand-in. Types are created on first use, with
+the base type the snapshot recorded for them, so isinstance() and type()
+checks behave like they do in Blender
+"""
+import shutil
+import sys
+
+# Type -> base type, as recorded in the snapshot
+_bases: dict[str, str] = {}
+
+# Menu types that existed in Blender when the snapshot was taken
+_menus: set[str] = set()
+
+
+def set_hierarchy(bases: dict[str, str], menus: list[str]) -> None:
+    _bases.update(bases)
+    _menus.update(menus)
+
+
+class bpy_struct:
+    def as_pointer(self) -> int:
+        return id(self)
+
+    @property
+    def bl_rna(self):
+        """
+        Properties of the struct, as far as the snapshot recorded them
+        """
+        properties = []
+        for identifier, value in self.__dict__.items():
+            if identifier.startswith("_"):
+                continue
+            if isinstance(value, bpy_prop_collection):
+                prop_type = 'COLLECTION'
+            elif isinstance(value, bpy_struct) or value is None:
+                prop_type = 'POINTER'
+            else:
+                prop_type = 'FLOAT'
+            properties.append(_Property(identifier, prop_type))
+        return _RNA(type(self).__name__, properties)
+
+
+class _Property:
+    def __init__(self, identifier: str, type: str, default=None):
+        self.identifier = identifier
+        self.type = type
+        self.default = default
+        self.is_array = isinstance(default, tuple)
+        self.default_array = default
+
+
+class _RNA:
+    def __init__(self, identifier: str, properties: list[_Property]):
+        self.identifier = identifier
+        self.properties = properties
+
+
+class bpy_prop_array(tuple):
+    pass
+
+
+class bpy_prop_collection:
+    def __init__(self, items=()):
+        self._items = list(items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return len(self._items) > 0
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            item = self.get(key)
+            if item is None:
+                raise KeyError(key)
+            return item
+        return self._items[key]
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return self.get(key) is not None
+        return key in self._items
+
+    def get(self, key: str, default=None):
+        for item in self._items:
+            if getattr(item, "name", None) == key:
+                return item
+        return default
+
+    def find(self, key: str) -> int:
+        for i, item in enumerate(self._items):
+            if getattr(item, "name", None) == key:
+                return i
+        return -1
+
+    def keys(self) -> list[str]:
+        return [getattr(item, "name", "") for item in self._items]
+
+    def values(self) -> list:
+        return list(self._items)
+
+    def items(self) -> list[tuple]:
+        return [(getattr(item, "name", ""), item) for item in self._items]
+
+    def foreach_get(self, attr: str, seq) -> None:
+        """
+        Copies a property of every item into seq, flattening arrays
+        """
+        i = 0
+        for item in self._items:
+            value = getattr(item, attr)
+            if isinstance(value, tuple):
+                for component in value:
+                    seq[i] = component
+                    i += 1
+            else:
+                seq[i] = value
+                i += 1
+
+
+class ID(bpy_struct):
+    pass
+
+
+class Image(ID):
+    def save_render(self, filepath: str, scene=None, **kwargs) -> None:
+        """
+        Copies the image file extract.py saved alongside the snapshot
+        """
+        saved_file = getattr(self, "_saved_file", None)
+        if saved_file is None:
+            raise RuntimeError(f"Snapshot has no saved copy of image "
+                               f"\"{self.name}\"")
+        shutil.copyfile(saved_file, filepath)
+
+
+class Operator(bpy_struct):
+    def __init__(self, *args, **kwargs):
+        self.reports: list[tuple[set[str], str]] = []
+
+    def report(self, type: set[str], message: str) -> None:
+        self.reports.append((type, message))
+
+
+class _PropertyGroupMeta(type):
+    @property
+    def bl_rna(cls) -> _RNA:
+        """
+        Properties declared by the group's annotations, with their defaults
+        """
+        properties = []
+        for identifier, prop in getattr(cls, "__annotations__", {}).items():
+            default = prop.keywords.get("default")
+            if default is None:
+                if prop.function == "EnumProperty":
+                    default = prop.keywords["items"][0][0]
+                elif prop.function == "BoolProperty":
+                    default = False
+                elif prop.function in {"IntProperty", "FloatProperty"}:
+                    default = 0
+                elif prop.function == "StringProperty":
+                    default = ""
+            properties.append(_Property(identifier, prop.function, default))
+        return _RNA(cls.__name__, properties)
+
+
+class PropertyGroup(bpy_struct, metaclass=_PropertyGroupMeta):
+    pass
+
+
+class Panel(bpy_struct):
+    pass
+
+
+class Menu(bpy_struct):
+    pass
+
+
+class Context(bpy_struct):
+    pass
+
+
+def __getattr__(name: str) -> type:
+    if name.startswith("__"):
+        raise AttributeError(name)
+    base_name = _bases.get(name)
+    if base_name is not None:
+        base = getattr(sys.modules[__name__], base_name)
+    elif name in _menus or "_MT_" in name:
+        base = Menu
+    else:
+        base = bpy_struct
+    cls = type(name, (base,), {})
+    setattr(sys.modules[__name__], name, cls)
+    return cls
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _menus)
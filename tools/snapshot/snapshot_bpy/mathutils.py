@@ -0,0 +1,65 @@
+"""
+Math types of the snapshot stand-in, holding the values extract.py recorded
+"""
+
+
+class _Sequence(tuple):
+    @property
+    def x(self):
+        return self[0]
+
+    @property
+    def y(self):
+        return self[1]
+
+    @property
+    def z(self):
+        return self[2]
+
+    @property
+    def w(self):
+        return self[3]
+
+
+class Vector(_Sequence):
+    pass
+
+
+class Euler(_Sequence):
+    pass
+
+
+class Quaternion(tuple):
+    @property
+    def w(self):
+        return self[0]
+
+    @property
+    def x(self):
+        return self[1]
+
+    @property
+    def y(self):
+        return self[2]
+
+    @property
+    def z(self):
+        return self[3]
+
+
+class Color(tuple):
+    @property
+    def r(self):
+        return self[0]
+
+    @property
+    def g(self):
+        return self[1]
+
+    @property
+    def b(self):
+        return self[2]
+
+
+class Matrix(tuple):
+    pass